@@ -419,6 +419,162 @@ SUPPORT_SSH_TUNNEL = True
 # Set to False to disable password saving.
 ALLOW_SAVE_TUNNEL_PASSWORD = False
 
+##########################################################################
+# Background process settings
+##########################################################################
+# BG_PROCESS_RETENTION_DAYS is the interval in Days. Information, and the log
+# files of the finished background processes older than the specified number
+# of *days* will be removed, even if the user has not acknowledged them.
+# Set it to 0 to keep them until acknowledged by the user.
+BG_PROCESS_RETENTION_DAYS = 0
+
+# BG_PROCESS_PRUNE_INTERVAL is interval in Hours. Application will check
+# for the old background processes after specified number of *hours*.
+BG_PROCESS_PRUNE_INTERVAL = 1
+
+# Maximum number of the background processes (backup, restore, maintenance,
+# import/export, etc.) allowed to run concurrently in total, and against a
+# single server. Processes exceeding these limits are queued, and started
+# when one of the running processes finishes.
+# Set to 0 for no limit.
+BG_PROCESS_MAX_JOBS = 0
+BG_PROCESS_MAX_JOBS_PER_SERVER = 0
+
+# Default number of the pg_dump worker connections used in total while
+# backing up all the databases of a server, unless specified by the user.
+BACKUP_DATABASES_PARALLELISM = 4
+
+##########################################################################
+# Server status settings
+##########################################################################
+# The recovery state (and, WAL replay pause state) of the connected servers
+# is cached for SERVER_STATUS_CACHE_TTL *seconds*, while listing the servers.
+# The stale state is shown immediately, while it is updated in the background.
+SERVER_STATUS_CACHE_TTL = 10
+
+# Servers are checked in parallel using SERVER_STATUS_CHECK_WORKERS threads,
+# and the list waits at most SERVER_STATUS_CHECK_TIMEOUT *seconds* for the
+# servers, which have not been checked before.
+SERVER_STATUS_CHECK_WORKERS = 8
+SERVER_STATUS_CHECK_TIMEOUT = 2
+
+##########################################################################
+# Role dependents settings
+##########################################################################
+# The dependents of a role are searched in all the databases of the server
+# in parallel using at most ROLE_DEPENDENTS_WORKERS connections at a time,
+# and we wait at most ROLE_DEPENDENTS_TIMEOUT *seconds* for them. The
+# databases, which could not be searched within that time (or, could not be
+# connected), are reported along with the dependents found in the others.
+ROLE_DEPENDENTS_WORKERS = 8
+ROLE_DEPENDENTS_TIMEOUT = 30
+
+# The dependents found in a database are cached for
+# ROLE_DEPENDENTS_CACHE_TTL *seconds*.
+ROLE_DEPENDENTS_CACHE_TTL = 30
+
+##########################################################################
+# Browser catalog cache settings
+##########################################################################
+# Cache the nodes, properties and reverse engineered SQL of the database
+# objects shown in the browser tree. The cached responses of a database are
+# validated using a cheap query on the statistics of its catalogs, which is
+# run at most once in CATALOG_CACHE_PROBE_INTERVAL seconds, hence - the
+# changes made outside of pgAdmin may not be reflected for that duration (plus
+# the delay of the statistics, which is usually less than a second).
+CATALOG_CACHE_ENABLED = False
+
+# Maximum total size of the cached responses in *MB*.
+CATALOG_CACHE_MAX_SIZE = 32
+
+# CATALOG_CACHE_PROBE_INTERVAL is the interval in *seconds*.
+CATALOG_CACHE_PROBE_INTERVAL = 2
+
+##########################################################################
+# Schema/Database DDL settings
+##########################################################################
+# The reverse engineered SQL of the objects is extracted in parallel over
+# DDL_EXTRACTION_WORKERS separate connections to the database, while
+# generating the DDL of a whole schema or database.
+DDL_EXTRACTION_WORKERS = 4
+
+##########################################################################
+# Dependency graph settings
+##########################################################################
+# The transitive dependencies/dependents of an object (requested using the
+# 'depth' argument) are found using a graph of all the dependencies of the
+# database, which is cached, and refreshed with the newly added rows of
+# pg_depend/pg_shdepend at most once in DEPENDENCY_GRAPH_REFRESH_INTERVAL
+# seconds. It is rebuilt from scratch, when the rows have been removed, or
+# it is older than DEPENDENCY_GRAPH_MAX_AGE seconds.
+DEPENDENCY_GRAPH_REFRESH_INTERVAL = 2
+DEPENDENCY_GRAPH_MAX_AGE = 300
+
+# Maximum number of the databases, whose graphs are kept in the cache.
+DEPENDENCY_GRAPH_CACHE_SIZE = 8
+
+##########################################################################
+# Extended statistics settings
+##########################################################################
+# The names of the extensions installed in a database (i.e. to find out,
+# whether pgstattuple is available for the extended statistics) are cached
+# for EXTENSIONS_CACHE_TTL *seconds*.
+EXTENSIONS_CACHE_TTL = 60
+
+# The extended statistics of a table (using pgstattuple, which scans the
+# whole table) are computed in the background, and the results are kept for
+# BACKGROUND_QUERY_RESULT_TTL *seconds*.
+BACKGROUND_QUERY_RESULT_TTL = 60
+
+##########################################################################
+# Generated scripts, and stylesheets settings
+##########################################################################
+# The scripts, and stylesheets generated by the browser (i.e. utils.js,
+# browser.css) are rendered once for the same preferences, and language, and
+# served with the ETags (along with their gzip compressed copies). At most
+# RENDERED_CACHE_SIZE of them are cached.
+RENDERED_CACHE_SIZE = 512
+
+##########################################################################
+# Preferences settings
+##########################################################################
+# The values of the preferences of a user are loaded at once, and cached for
+# PREFERENCES_CACHE_TTL *seconds*. The cached values are removed, when the
+# preferences are changed, but the changes made by the other processes
+# (i.e. when running multiple web server processes) are reflected only after
+# they expire.
+PREFERENCES_CACHE_TTL = 60
+
+##########################################################################
+# Template settings
+##########################################################################
+# Directory for the bytecode of the compiled templates, so that they are not
+# compiled again by every process after the application is restarted. The
+# templates of the queries can be compiled in advance by running
+# 'setup.py --compile-templates'. Set to None to disable the cache.
+TEMPLATE_BYTECODE_CACHE_DIR = None
+
+##########################################################################
+# Profiling settings
+##########################################################################
+# Record the wall time, the CPU time, the number, and the time of the queries,
+# and the time spent in rendering the templates of every request. The
+# measurements aggregated per endpoint can be retrieved as JSON from
+# '/misc/profiling'. This adds some overhead to every request, so it should
+# be enabled only when looking for the slow endpoints.
+PROFILING_ENABLED = False
+
+# The requests executing more than PROFILING_QUERIES_THRESHOLD queries are
+# logged as warnings (these are usually running one query per object, instead
+# of one query for all of them).
+PROFILING_QUERIES_THRESHOLD = 20
+
+# A fraction of the requests (between 0 and 1) to be profiled using cProfile.
+# The statistics are written to PROFILING_DIR (one file per request), from
+# where they can be loaded using pstats, or converted to the flame graphs.
+PROFILING_SAMPLE_RATE = 0
+PROFILING_DIR = os.path.join(DATA_DIR, 'profiles')
+
 ##########################################################################
 # Master password is used to encrypt/decrypt saved server passwords
 # Applicable for desktop mode only
@@ -0,0 +1,33 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Added the queued time of the utility process
+
+Revision ID: c6974f64df08
+Revises: 35f29b1701bd
+Create Date: 2019-05-20 11:05:32.487513
+
+"""
+from pgadmin.model import db
+
+# revision identifiers, used by Alembic.
+revision = 'c6974f64df08'
+down_revision = '35f29b1701bd'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    db.engine.execute(
+        'ALTER TABLE process ADD COLUMN queue_time TEXT'
+    )
+
+
+def downgrade():
+    pass
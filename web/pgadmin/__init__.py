@@ -30,10 +30,11 @@ from werkzeug.utils import find_modules
 
 from pgadmin.model import db, Role, Server, ServerGroup, \
     User, Keys, Version, SCHEMA_VERSION as CURRENT_SCHEMA_VERSION
-from pgadmin.utils import PgAdminModule, driver, KeyManager
+from pgadmin.utils import PgAdminModule, driver, KeyManager, profiler
 from pgadmin.utils.preferences import Preferences
 from pgadmin.utils.session import create_session_interface, pga_unauthorised
-from pgadmin.utils.versioned_template_loader import VersionedTemplateLoader
+from pgadmin.utils.versioned_template_loader import \
+    VersionedTemplateLoader, TemplateBytecodeCache
 from datetime import timedelta
 from pgadmin.setup import get_version, set_version
 from pgadmin.utils.ajax import internal_server_error
@@ -54,10 +55,22 @@ elif os.name == 'nt':
 class PgAdmin(Flask):
     def __init__(self, *args, **kwargs):
         # Set the template loader to a postgres-version-aware loader
-        self.jinja_options = ImmutableDict(
+        jinja_options = dict(
             extensions=['jinja2.ext.autoescape', 'jinja2.ext.with_'],
             loader=VersionedTemplateLoader(self)
         )
+
+        # Cache the bytecode of the compiled templates on the disk (if
+        # configured)
+        import config
+        if config.TEMPLATE_BYTECODE_CACHE_DIR:
+            if not os.path.exists(config.TEMPLATE_BYTECODE_CACHE_DIR):
+                os.makedirs(config.TEMPLATE_BYTECODE_CACHE_DIR)
+            jinja_options['bytecode_cache'] = TemplateBytecodeCache(
+                config.TEMPLATE_BYTECODE_CACHE_DIR
+            )
+
+        self.jinja_options = ImmutableDict(**jinja_options)
         self.logout_hooks = []
 
         super(PgAdmin, self).__init__(*args, **kwargs)
@@ -605,11 +618,23 @@ def create_app(app_name=None):
     ##########################################################################
     # Load plugin modules
     ##########################################################################
+
+    # The modules register their preferences just before the first request,
+    # and all of them are registered in a single transaction.
+    app.before_first_request(Preferences.begin_registration)
+
     for module in app.find_submodules('pgadmin'):
         app.logger.info('Registering blueprint module: %s' % module)
         app.register_blueprint(module)
         app.register_logout_hook(module)
 
+    app.before_first_request(Preferences.end_registration)
+
+    ##########################################################################
+    # Profile the requests (if enabled)
+    ##########################################################################
+    profiler.init_app(app)
+
     ##########################################################################
     # Handle the desktop login
     ##########################################################################
@@ -30,6 +30,7 @@ from flask_security.signals import reset_password_instructions_sent
 from flask_security.utils import config_value, do_flash, get_url, \
     get_message, slash_url_suffix, login_user, send_mail
 from flask_security.views import _security, _commit, _render_json, _ctx
+from flask_wtf.csrf import generate_csrf
 from werkzeug.datastructures import MultiDict
 
 import config
@@ -40,6 +41,7 @@ from pgadmin.utils.ajax import make_json_response
 from pgadmin.utils.csrf import pgCSRFProtect
 from pgadmin.utils.preferences import Preferences
 from pgadmin.utils.menu import MenuItem
+from pgadmin.utils.rendered_cache import render_cached
 from pgadmin.browser.register_browser_preferences import \
     register_browser_preferences
 from pgadmin.utils.master_password import validate_master_password, \
@@ -649,34 +651,49 @@ def utils():
     except Exception as e:
         pg_libpq_version = 0
 
-    for submodule in current_blueprint.submodules:
-        snippets.extend(submodule.jssnippets)
-    return make_response(
-        render_template(
-            'browser/js/utils.js',
-            layout=layout,
-            jssnippets=snippets,
-            pg_help_path=pg_help_path,
-            edbas_help_path=edbas_help_path,
-            editor_tab_size=editor_tab_size,
-            editor_use_spaces=editor_use_spaces,
-            editor_wrap_code=editor_wrap_code,
-            editor_brace_matching=brace_matching,
-            editor_insert_pair_brackets=insert_pair_brackets,
-            editor_indent_with_tabs=editor_indent_with_tabs,
-            app_name=config.APP_NAME,
-            pg_libpq_version=pg_libpq_version,
-            support_ssh_tunnel=config.SUPPORT_SSH_TUNNEL
-        ),
-        200, {'Content-Type': 'application/javascript'})
+    params = dict(
+        layout=layout,
+        pg_help_path=pg_help_path,
+        edbas_help_path=edbas_help_path,
+        editor_tab_size=editor_tab_size,
+        editor_use_spaces=editor_use_spaces,
+        editor_wrap_code=editor_wrap_code,
+        editor_brace_matching=brace_matching,
+        editor_insert_pair_brackets=insert_pair_brackets,
+        editor_indent_with_tabs=editor_indent_with_tabs,
+        app_name=config.APP_NAME,
+        pg_libpq_version=pg_libpq_version,
+        support_ssh_tunnel=config.SUPPORT_SSH_TUNNEL
+    )
+
+    def render():
+        for submodule in current_blueprint.submodules:
+            snippets.extend(submodule.jssnippets)
+        return render_template(
+            'browser/js/utils.js', jssnippets=snippets, **params
+        )
+
+    # The CSRF token included in the script is bound to the session, and
+    # expires after the time limit (if any), hence - the script is cached
+    # per session, and is rendered again before the token expires.
+    generate_csrf()
+    csrf_time_limit = current_app.config.get('WTF_CSRF_TIME_LIMIT', None)
+
+    return render_cached(
+        'browser/js/utils.js', 'application/javascript', render,
+        key=[params, session.get(
+            current_app.config.get('WTF_CSRF_FIELD_NAME', 'csrf_token')
+        )],
+        max_age=csrf_time_limit / 2 if csrf_time_limit else None
+    )
 
 
 @blueprint.route("/js/endpoints.js")
 @pgCSRFProtect.exempt
 def exposed_urls():
-    return make_response(
-        render_template('browser/js/endpoints.js'),
-        200, {'Content-Type': 'application/javascript'}
+    return render_cached(
+        'browser/js/endpoints.js', 'application/javascript',
+        lambda: render_template('browser/js/endpoints.js')
     )
 
 
@@ -684,17 +701,19 @@ def exposed_urls():
 @pgCSRFProtect.exempt
 @login_required
 def error_js():
-    return make_response(
-        render_template('browser/js/error.js', _=gettext),
-        200, {'Content-Type': 'application/javascript'})
+    return render_cached(
+        'browser/js/error.js', 'application/javascript',
+        lambda: render_template('browser/js/error.js', _=gettext)
+    )
 
 
 @blueprint.route("/js/messages.js")
 @pgCSRFProtect.exempt
 def messages_js():
-    return make_response(
-        render_template('browser/js/messages.js', _=gettext),
-        200, {'Content-Type': 'application/javascript'})
+    return render_cached(
+        'browser/js/messages.js', 'application/javascript',
+        lambda: render_template('browser/js/messages.js', _=gettext)
+    )
 
 
 @blueprint.route("/browser.css")
@@ -702,15 +721,16 @@ def messages_js():
 @login_required
 def browser_css():
     """Render and return CSS snippets from the nodes and modules."""
-    snippets = []
+    def render():
+        snippets = []
 
-    for submodule in blueprint.submodules:
-        snippets.extend(submodule.csssnippets)
-    return make_response(
-        render_template(
+        for submodule in blueprint.submodules:
+            snippets.extend(submodule.csssnippets)
+        return render_template(
             'browser/css/browser.css', snippets=snippets, _=gettext
-        ),
-        200, {'Content-Type': 'text/css'})
+        )
+
+    return render_cached('browser/css/browser.css', 'text/css', render)
 
 
 @blueprint.route("/nodes/", endpoint="nodes")
@@ -724,6 +744,14 @@ def get_nodes():
     return make_json_response(data=nodes)
 
 
+@blueprint.route("/catalog_cache", endpoint="catalog_cache_stats")
+@login_required
+def get_catalog_cache_stats():
+    """Returns the statistics (i.e. hit rate, size) of the catalog cache."""
+    from pgadmin.browser.catalog_cache import catalog_cache
+    return make_json_response(data=catalog_cache.stats())
+
+
 def form_master_password_response(existing=True, present=False, errmsg=None):
     content_new = (
         gettext("Set Master Password"),
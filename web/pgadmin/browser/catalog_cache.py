@@ -0,0 +1,196 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Cache for the responses of the browser tree nodes (i.e. nodes, properties,
+and reverse engineered SQL) of the database objects.
+
+The cached responses of a database are validated against the version of its
+catalogs, which is found using a cheap probe (numbers of the inserted,
+updated, and deleted rows of the important catalogs kept by the statistics,
+or the number of rows, and maximum transaction id of the rows in them, when
+the statistics are not collected). The probe runs at most once in
+CATALOG_CACHE_PROBE_INTERVAL seconds for a database, and all the cached
+responses of a server are removed, when an object is created, modified, or
+removed using pgAdmin.
+
+NOTE: The changes in the shared objects (i.e. roles, tablespaces) made outside
+      of pgAdmin are not detected by the probe, and the changes made outside
+      of pgAdmin may not be reflected until the next probe, after they have
+      been reported to the statistics (usually within a second).
+"""
+
+import time
+from collections import OrderedDict
+from threading import Lock
+
+from flask import render_template, Response
+
+import config
+
+# Catalogs to be looked at for finding out the version of a database
+CATALOGS = [
+    'pg_namespace', 'pg_class', 'pg_attribute', 'pg_attrdef',
+    'pg_constraint', 'pg_index', 'pg_inherits', 'pg_trigger', 'pg_rewrite',
+    'pg_proc', 'pg_type', 'pg_description'
+]
+
+
+class CatalogCache(object):
+    """
+    class CatalogCache(object)
+
+    A thread safe cache of the responses bounded by the total size of the
+    response bodies (in bytes). Least recently used responses are evicted,
+    when it exceeds the limit.
+
+    Keys of the responses must be tuples starting with the server id, and the
+    database id.
+    """
+
+    def __init__(self, max_size, probe_interval):
+        self.max_size = max_size
+        self.probe_interval = probe_interval
+
+        self._lock = Lock()
+        # key => (catalog version, (body, status, headers))
+        self._responses = OrderedDict()
+        self._size = 0
+        # (sid, did) => (catalog version, time of the probe)
+        self._versions = dict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def catalog_version(self, sid, did, conn):
+        """
+        Returns the version of the catalogs of the database, running the
+        probe only if it has not been run in the last 'probe_interval'
+        seconds.
+
+        Returns None, if the version could not be found.
+        """
+        now = time.time()
+
+        with self._lock:
+            version = self._versions.get((sid, did))
+            if version is not None and \
+                    now - version[1] < self.probe_interval:
+                return version[0]
+
+        SQL = render_template(
+            "browser/sql/catalog_version.sql", catalogs=CATALOGS
+        )
+        status, res = conn.execute_scalar(SQL)
+        if not status:
+            return None
+
+        with self._lock:
+            self._versions[(sid, did)] = (res, now)
+
+        return res
+
+    def get(self, key, version):
+        """
+        Returns the cached response for the given key, if it was cached for
+        the given version of the catalogs.
+        """
+        with self._lock:
+            item = self._responses.get(key)
+
+            if item is None or item[0] != version:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            # Mark it as the most recently used
+            del self._responses[key]
+            self._responses[key] = item
+
+        body, status, headers = item[1]
+        return Response(body, status=status, headers=headers)
+
+    def set(self, key, version, response):
+        """
+        Cache the successful (non-streamed) response for the given key, and
+        version of the catalogs.
+        """
+        if response.status_code != 200 or response.is_streamed:
+            return
+
+        body = response.get_data()
+        size = len(body)
+        if size > self.max_size:
+            return
+
+        headers = [(k, v) for k, v in response.headers
+                   if k.lower() not in ('content-length', 'set-cookie')]
+
+        with self._lock:
+            self._remove(key)
+            self._responses[key] = (
+                version, (body, response.status_code, headers)
+            )
+            self._size += size
+
+            while self._size > self.max_size:
+                self._remove(next(iter(self._responses)))
+                self.evictions += 1
+
+    def _remove(self, key):
+        item = self._responses.pop(key, None)
+        if item is not None:
+            self._size -= len(item[1][0])
+
+    def invalidate(self, sid, did=None):
+        """
+        Remove the cached responses, and the catalog versions of the given
+        server (or, only of the given database).
+        """
+        with self._lock:
+            self.invalidations += 1
+
+            for key in [k for k in self._responses if k[0] == sid and (
+                    did is None or k[1] == did)]:
+                self._remove(key)
+
+            for key in [k for k in self._versions if k[0] == sid and (
+                    did is None or k[1] == did)]:
+                del self._versions[key]
+
+    def clear(self):
+        with self._lock:
+            self._responses.clear()
+            self._versions.clear()
+            self._size = 0
+
+    def stats(self):
+        """Returns the statistics of the cache"""
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                'enabled': config.CATALOG_CACHE_ENABLED,
+                'entries': len(self._responses),
+                'size': self._size,
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(float(self.hits) / requests, 4)
+                if requests else 0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations
+            }
+
+
+catalog_cache = CatalogCache(
+    max_size=config.CATALOG_CACHE_MAX_SIZE * 1024 * 1024,
+    probe_interval=config.CATALOG_CACHE_PROBE_INTERVAL
+)
@@ -0,0 +1,484 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Graph of the dependencies among the objects of a database, used for finding
+the transitive dependencies, and dependents of an object.
+
+The graph is built from a single scan of pg_depend, and pg_shdepend (for the
+rows of the current database), and is cached per database. It is refreshed
+at most once in DEPENDENCY_GRAPH_REFRESH_INTERVAL seconds by fetching only
+the rows added after the previous scan (i.e. the rows with a greater xmin).
+The graph is rebuilt from scratch, when the number of rows in the catalogs
+shows that some of the rows have been removed, or when it is older than
+DEPENDENCY_GRAPH_MAX_AGE seconds.
+
+The graph of a database is removed, when the database (or, the server) is
+disconnected, or the database is dropped.
+
+NOTE: The rows added by a transaction, which was still in progress during the
+      previous scan, may not be found by the incremental refresh, and will
+      be reflected only after the graph is rebuilt.
+"""
+
+import time
+from collections import OrderedDict
+from threading import Lock
+
+from flask import render_template, request
+
+import config
+
+# Dependency types (pg_depend, and 's' + pg_shdepend.deptype) => field shown
+DEPENDENCY_TYPES = {
+    'n': 'normal',
+    'a': 'auto',
+    'i': 'internal',
+    'e': 'extension',
+    'x': 'auto extension',
+    'P': 'partition',
+    'S': 'partition',
+    'so': 'Owner',
+    'sa': 'ACL',
+    'sr': 'policy'
+}
+
+# Dependency types, which make the dependent object a part of the referenced
+# object (i.e. it is removed along with the referenced object).
+PART_TYPES = ('a', 'i', 'P', 'S')
+
+# Dependency types, which make the referenced object own the dependent object
+# (i.e. the referenced object is removed along with the dependent object).
+OWNER_TYPES = ('i', 'P', 'S')
+
+# Object types (returned by pg_identify_object) => node types
+OBJECT_TYPES = {
+    'table': 'table',
+    'table column': 'column',
+    'index': 'index',
+    'sequence': 'sequence',
+    'view': 'view',
+    'materialized view': 'mview',
+    'foreign table': 'foreign_table',
+    'composite type': 'type',
+    'type': 'type',
+    'domain': 'domain',
+    'function': 'function',
+    'aggregate': 'function',
+    'procedure': 'procedure',
+    'trigger': 'trigger',
+    'rule': 'rule',
+    'schema': 'schema',
+    'role': 'role',
+    'language': 'language',
+    'extension': 'extension',
+    'foreign-data wrapper': 'foreign_data_wrapper',
+    'server': 'foreign_server',
+    'user mapping': 'user_mapping',
+    'collation': 'collation',
+    'cast': 'cast',
+    'event trigger': 'event_trigger',
+    'text search configuration': 'fts_configuration',
+    'text search dictionary': 'fts_dictionary',
+    'text search parser': 'fts_parser',
+    'text search template': 'fts_template'
+}
+
+# Node types => OIDs of the system catalogs of their objects (i.e. classid in
+# pg_depend). The OIDs of the system catalogs are fixed.
+NODE_TYPE_CATALOGS = {
+    'table': 1259,
+    'partition': 1259,
+    'index': 1259,
+    'sequence': 1259,
+    'view': 1259,
+    'mview': 1259,
+    'foreign_table': 1259,
+    'external_table': 1259,
+    'type': 1247,
+    'domain': 1247,
+    'function': 1255,
+    'procedure': 1255,
+    'trigger_function': 1255,
+    'edbfunc': 1255,
+    'edbproc': 1255,
+    'trigger': 2620,
+    'rule': 2618,
+    'schema': 2615,
+    'language': 2612,
+    'extension': 3079,
+    'foreign_data_wrapper': 2328,
+    'foreign_server': 1417,
+    'user_mapping': 1418,
+    'collation': 3456,
+    'cast': 2605,
+    'event_trigger': 3466,
+    'fts_configuration': 3602,
+    'fts_dictionary': 3600,
+    'fts_parser': 3601,
+    'fts_template': 3764,
+    'primary_key': 2606,
+    'unique_constraint': 2606,
+    'check_constraint': 2606,
+    'foreign_key': 2606,
+    'exclusion_constraint': 2606,
+    'domain_constraints': 2606,
+    'role': 1260,
+    'database': 1262,
+    'tablespace': 1213
+}
+
+
+def requested_depth():
+    """
+    Returns the depth of the transitive dependencies/dependents requested
+    using the 'depth' argument of the request, i.e. None (not requested),
+    0 (unlimited, 'depth=all'), or a positive number.
+    """
+    depth = request.args.get('depth', None)
+    if depth is None:
+        return None
+
+    if depth == 'all':
+        return 0
+
+    try:
+        depth = int(depth)
+    except ValueError:
+        return None
+
+    return depth if depth > 0 else None
+
+
+class DependencyGraph(object):
+    """
+    class DependencyGraph(object)
+
+    Dependencies among the objects of a database. The objects (nodes) are
+    identified by (classid, objid, objsubid), and the dependencies on, and of
+    the sub-objects (i.e. the columns of a table) are also attributed to the
+    objects owning them.
+    """
+
+    def __init__(self):
+        self.lock = Lock()
+        self.clear()
+
+    def clear(self):
+        # node => {referenced node: dependency type}
+        self._depends_on = dict()
+        # referenced node => {node: dependency type}
+        self._depended_by = dict()
+        # objid => set of the nodes (excluding the sub-objects)
+        self._objects = dict()
+        # shared => (number of the rows, maximum xmin of the rows)
+        self.versions = dict()
+        self.built = None
+        self.refreshed = None
+
+    def add(self, row):
+        """Add a row of pg_depend (or, pg_shdepend) to the graph"""
+        node = (row['classid'], row['objid'], row['objsubid'])
+        ref = (row['refclassid'], row['refobjid'], row['refobjsubid'])
+        deptype = row['deptype']
+
+        self._depends_on.setdefault(node, dict())[ref] = deptype
+        self._depended_by.setdefault(ref, dict())[node] = deptype
+
+        # Attribute the dependencies of the sub-objects to their owners
+        if node[:2] != ref[:2]:
+            if node[2] != 0:
+                self._depends_on.setdefault(
+                    node[:2] + (0,), dict()
+                ).setdefault(ref, deptype)
+            if ref[2] != 0:
+                self._depended_by.setdefault(
+                    ref[:2] + (0,), dict()
+                ).setdefault(node, deptype)
+
+        for obj in (node, ref):
+            if obj[2] == 0:
+                self._objects.setdefault(obj[1], set()).add(obj)
+
+    def nodes(self, objid, classid=None):
+        """
+        Returns the nodes of the given object id, and the catalog (i.e. the
+        nodes of all the catalogs having an object with that id, when the
+        catalog is not known).
+        """
+        nodes = self._objects.get(objid, set())
+        if classid is None:
+            return nodes
+        return set(node for node in nodes if node[0] == classid)
+
+    def _parts(self, node):
+        return [
+            other for other, deptype in self._depended_by.get(
+                node, dict()
+            ).items() if deptype in PART_TYPES
+        ]
+
+    def _owners(self, node):
+        return [
+            other for other, deptype in self._depends_on.get(
+                node, dict()
+            ).items() if deptype in OWNER_TYPES
+        ]
+
+    def dependencies(self, nodes, depth=None):
+        """
+        Returns the objects, which the given nodes depend on (directly, or
+        transitively up to the given depth) including the dependencies of
+        their parts (i.e. the indexes, triggers, rules, etc. of a table), and
+        the objects owning the sub-objects depended on (i.e. the table of a
+        column).
+
+        Returns:
+            List of (node, dependency type, depth) in the order of the depth
+        """
+        def companions(node):
+            result = [(part, False) for part in self._parts(node)]
+            if node[2] != 0:
+                result.append((node[:2] + (0,), True))
+            return result
+
+        return self._walk(nodes, depth, self._depends_on, companions)
+
+    def dependents(self, nodes, depth=None):
+        """
+        Returns the objects, which depend on the given nodes (directly, or
+        transitively up to the given depth) including the objects owning
+        them (i.e. the view of a rewrite rule).
+
+        Returns:
+            List of (node, dependency type, depth) in the order of the depth
+        """
+        return self._walk(
+            nodes, depth, self._depended_by,
+            lambda node: [(owner, True) for owner in self._owners(node)]
+        )
+
+    def _walk(self, nodes, depth, edges, companions):
+        """
+        Breadth first walk of the graph from the given nodes up to the given
+        depth (unlimited, if not specified). Every node is visited only
+        once, hence - the cycles are not followed.
+
+        The companions of a visited node (i.e. its parts, or owners) are
+        visited at the same depth, and are included in the result (with the
+        dependency type of the visited node), if asked for.
+        """
+        visited = set(nodes)
+        result = []
+
+        def visit(node, deptype, level, next_level):
+            stack = [node]
+            while len(stack):
+                node = stack.pop()
+                next_level.append(node)
+
+                for other, report in companions(node):
+                    if other in visited:
+                        continue
+                    visited.add(other)
+                    if report and deptype is not None:
+                        result.append((other, deptype, level))
+                    stack.append(other)
+
+        current = []
+        for node in nodes:
+            visit(node, None, 0, current)
+
+        level = 0
+        while len(current) and (not depth or level < depth):
+            level += 1
+            next_level = []
+
+            for node in current:
+                for other, deptype in sorted(
+                        edges.get(node, dict()).items()
+                ):
+                    if other not in visited:
+                        visited.add(other)
+                        result.append((other, deptype, level))
+                        visit(other, deptype, level, next_level)
+
+            current = next_level
+
+        return result
+
+    def refresh(self, conn, sql_path, max_age):
+        """
+        Refresh the graph with the rows added to the catalogs after the
+        previous scan, rebuilding it, when required.
+
+        Returns:
+            (status, error message)
+        """
+        now = time.time()
+
+        if self.built is not None and now - self.built < max_age:
+            status, res = self._fetch(conn, sql_path, incremental=True)
+            if not status:
+                return False, res
+            if res:
+                self.refreshed = now
+                return True, None
+
+        # Rebuild the graph from scratch
+        self.clear()
+        status, res = self._fetch(conn, sql_path, incremental=False)
+        if not status:
+            self.clear()
+            return False, res
+
+        self.built = self.refreshed = now
+        return True, None
+
+    def _fetch(self, conn, sql_path, incremental):
+        """
+        Fetch, and add the rows of pg_depend, and pg_shdepend (only the rows
+        added after the previous scan for the incremental fetch).
+
+        Returns:
+            (status, whether the rows were added) or (False, error message)
+        """
+        fetched = dict()
+
+        for shared in (False, True):
+            total, xid = self.versions.get(shared, (0, 0)) \
+                if incremental else (0, 0)
+
+            SQL = render_template(
+                "/".join([sql_path, 'dependency_graph.sql']),
+                shared=shared, xid=xid if incremental else None
+            )
+            status, res = conn.execute_dict(SQL)
+            if not status:
+                return False, res
+
+            rows = [row for row in res['rows'] if row['deptype'] is not None]
+            version = (res['rows'][0]['total'], res['rows'][0]['max_xid'])
+
+            # Some of the rows have been removed (or, were not found), hence
+            # - the graph can not be refreshed incrementally.
+            if incremental and total + len(rows) != version[0]:
+                return True, False
+
+            fetched[shared] = (rows, version)
+
+        for shared in fetched:
+            rows, version = fetched[shared]
+            for row in rows:
+                self.add(row)
+            self.versions[shared] = version
+
+        return True, True
+
+
+class DependencyGraphCache(object):
+    """
+    class DependencyGraphCache(object)
+
+    A thread safe cache of the dependency graphs of at most 'max_graphs'
+    databases. The graph of the least recently used database is evicted,
+    when it exceeds the limit.
+    """
+
+    def __init__(self, max_graphs, refresh_interval, max_age):
+        self.max_graphs = max_graphs
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age
+
+        self._lock = Lock()
+        # (sid, did) => graph
+        self._graphs = OrderedDict()
+
+    def _graph(self, sid, did):
+        with self._lock:
+            graph = self._graphs.pop((sid, did), None)
+            if graph is None:
+                graph = DependencyGraph()
+            self._graphs[(sid, did)] = graph
+
+            while len(self._graphs) > self.max_graphs:
+                self._graphs.popitem(last=False)
+
+        return graph
+
+    def walk(self, sid, did, conn, sql_path, object_id, depth, dependents,
+             classid=None):
+        """
+        Returns the transitive dependents (or, dependencies) of the given
+        object (of the given catalog), refreshing the graph of the database,
+        if required.
+
+        Returns:
+            (status, list of (node, dependency type, depth)), or
+            (False, error message)
+        """
+        graph = self._graph(sid, did)
+
+        with graph.lock:
+            if graph.refreshed is None or \
+                    time.time() - graph.refreshed >= self.refresh_interval:
+                status, msg = graph.refresh(conn, sql_path, self.max_age)
+                if not status:
+                    return False, msg
+
+            nodes = graph.nodes(object_id, classid)
+            if dependents:
+                return True, graph.dependents(nodes, depth)
+            return True, graph.dependencies(nodes, depth)
+
+    def invalidate(self, sid, did=None):
+        """
+        Remove the graphs of the given server (or, only of the given
+        database).
+        """
+        with self._lock:
+            for key in [k for k in self._graphs if k[0] == sid and (
+                    did is None or k[1] == did)]:
+                del self._graphs[key]
+
+
+def describe_objects(conn, sql_path, nodes):
+    """
+    Returns the type, and the identity of the given nodes.
+
+    Returns:
+        (status, dictionary of node => (node type, identity)), or
+        (False, error message)
+    """
+    descriptions = dict()
+    if len(nodes) == 0:
+        return True, descriptions
+
+    SQL = render_template(
+        "/".join([sql_path, 'describe_objects.sql']), objects=sorted(nodes)
+    )
+    status, res = conn.execute_dict(SQL)
+    if not status:
+        return False, res
+
+    for row in res['rows']:
+        obj_type = row['type'] or ''
+        descriptions[(row['classid'], row['objid'], row['objsubid'])] = (
+            OBJECT_TYPES.get(obj_type, obj_type.replace(' ', '_')),
+            row['identity']
+        )
+
+    return True, descriptions
+
+
+dependency_graph_cache = DependencyGraphCache(
+    max_graphs=config.DEPENDENCY_GRAPH_CACHE_SIZE,
+    refresh_interval=config.DEPENDENCY_GRAPH_REFRESH_INTERVAL,
+    max_age=config.DEPENDENCY_GRAPH_MAX_AGE
+)
@@ -0,0 +1,143 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Paging of the nodes in the huge collections (i.e. the tables of a schema, or
+the partitions of a table), so that the browser tree does not have to load
+all of them at once.
+
+The nodes are paged using the following arguments of the request:
+ * limit  - Maximum number of the nodes returned
+ * after  - Cursor returned with the previous page
+ * prefix - Prefix of the names of the nodes returned
+
+The nodes are ordered by their names, and oids, and the cursor identifies
+the last node of the page, so that the next page starts right after it even
+when the nodes have been added, or removed in between. The templates of the
+nodes apply the paging using the 'macros/paging.macros'.
+"""
+
+import base64
+import json
+
+from flask import render_template, request
+from flask_babelex import gettext
+
+
+def encode_cursor(name, oid):
+    """Returns the cursor pointing to the node of the given name, and oid"""
+    return base64.urlsafe_b64encode(
+        json.dumps([name, oid]).encode('utf-8')
+    ).decode('utf-8')
+
+
+def decode_cursor(cursor):
+    """
+    Returns the name, and the oid of the node pointed by the cursor.
+
+    Raises:
+        ValueError, if the cursor is not valid
+    """
+    try:
+        name, oid = json.loads(
+            base64.urlsafe_b64decode(cursor.encode('utf-8')).decode('utf-8')
+        )
+    except Exception:
+        raise ValueError(gettext('Invalid cursor.'))
+
+    if not isinstance(oid, int) or oid < 0:
+        raise ValueError(gettext('Invalid cursor.'))
+
+    return name, oid
+
+
+def requested_paging():
+    """
+    Returns the paging requested using the 'limit', 'after', and 'prefix'
+    arguments of the request, or None (when the 'limit' is not given, or is
+    not a positive number).
+
+    Raises:
+        ValueError, if the cursor is not valid
+    """
+    try:
+        limit = int(request.args.get('limit', None))
+    except (TypeError, ValueError):
+        return None
+
+    if limit <= 0:
+        return None
+
+    after = request.args.get('after', None)
+    prefix = request.args.get('prefix', None)
+
+    return {
+        'limit': limit,
+        'after': decode_cursor(after) if after else None,
+        # The wildcards in the prefix are matched literally
+        'prefix': prefix.replace('\\', '\\\\').replace(
+            '%', '\\%'
+        ).replace('_', '\\_') + '%' if prefix else None,
+        'count': False
+    }
+
+
+def fetch_nodes(conn, template, name_column='name', paged=True, **kwargs):
+    """
+    Fetch the rows of the nodes using the given template (rendered with the
+    given arguments, and the requested paging as 'paging').
+
+    When the paging is requested, only the rows of the requested page are
+    returned along with the total number of the nodes (matching the prefix),
+    and the cursor of the next page (None, if this is the last page).
+
+    Args:
+        conn: Connection to the database
+        template: Template of the nodes
+        name_column: Column of the name the nodes are ordered by
+        paged: Whether the paging applies (i.e. not for a single node)
+        **kwargs: Arguments of the template
+
+    Returns:
+        (status, rows, {'total': ..., 'next': ...} or None), or
+        (False, error message, None)
+    """
+    try:
+        paging = requested_paging() if paged else None
+    except ValueError as e:
+        return False, str(e), None
+
+    SQL = render_template(template, paging=paging, **kwargs)
+    status, rset = conn.execute_2darray(SQL)
+    if not status:
+        return False, rset, None
+
+    rows = rset['rows']
+    if paging is None:
+        return True, rows, None
+
+    page = {'total': None, 'next': None}
+    if len(rows) > paging['limit']:
+        rows = rows[:paging['limit']]
+        page['next'] = encode_cursor(
+            rows[-1][name_column], rows[-1]['oid']
+        )
+
+    SQL = render_template(
+        template, paging=dict(paging, count=True), **kwargs
+    )
+    status, total = conn.execute_scalar(
+        "SELECT count(*) FROM ({0}) nodes".format(SQL.strip().rstrip(';'))
+    )
+    if not status:
+        return False, total, None
+
+    page['total'] = int(total)
+
+    return True, rows, page
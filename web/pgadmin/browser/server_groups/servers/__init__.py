@@ -9,17 +9,22 @@
 
 import simplejson as json
 import re
+import time
+from threading import Lock, Thread
+
 import pgadmin.browser.server_groups as sg
-from flask import render_template, request, make_response, jsonify, \
-    current_app, url_for
+from flask import render_template, request, jsonify, current_app, \
+    url_for, copy_current_request_context
 from flask_babelex import gettext
 from flask_security import current_user, login_required
 from pgadmin.browser.server_groups.servers.types import ServerType
+from pgadmin.browser.dependency_graph import dependency_graph_cache
 from pgadmin.browser.utils import PGChildNodeView
 from pgadmin.utils.ajax import make_json_response, bad_request, forbidden, \
     make_response as ajax_response, internal_server_error, unauthorized, gone
 from pgadmin.utils.crypto import encrypt, decrypt, pqencryptpassword
 from pgadmin.utils.menu import MenuItem
+from pgadmin.utils.rendered_cache import render_cached
 from pgadmin.tools.sqleditor.utils.query_history import QueryHistory
 
 import config
@@ -47,6 +52,13 @@ def has_any(data, keys):
     return False
 
 
+# Recovery state of the servers (server id => (in_recovery, wal_paused, time
+# of the check)), and the servers being checked at the moment.
+RECOVERY_STATE_CACHE = dict()
+RECOVERY_STATE_CHECKS = set()
+RECOVERY_STATE_LOCK = Lock()
+
+
 def recovery_state(connection, postgres_version):
     recovery_check_sql = render_template(
         "connect/sql/#{0}#/check_recovery.sql".format(postgres_version))
@@ -55,12 +67,108 @@ def recovery_state(connection, postgres_version):
     if status and 'rows' in result and len(result['rows']) > 0:
         in_recovery = result['rows'][0]['inrecovery']
         wal_paused = result['rows'][0]['isreplaypaused']
+
+        with RECOVERY_STATE_LOCK:
+            RECOVERY_STATE_CACHE[connection.manager.sid] = (
+                in_recovery, wal_paused, time.time()
+            )
     else:
         in_recovery = None
         wal_paused = None
     return in_recovery, wal_paused
 
 
+def invalidate_recovery_state(sid):
+    """
+    Remove the cached recovery state of the server
+    """
+    with RECOVERY_STATE_LOCK:
+        RECOVERY_STATE_CACHE.pop(sid, None)
+
+
+def recovery_states(managers):
+    """
+    Returns the recovery state of the given connected servers as a dictionary
+    (server id => (in_recovery, wal_paused)).
+
+    The recovery state is cached for SERVER_STATUS_CACHE_TTL seconds. The
+    servers without a fresh cached state are checked in parallel (using at
+    most SERVER_STATUS_CHECK_WORKERS threads), but - we do not wait for the
+    check, if the server has a stale cached state, which is returned instead
+    (and, updated in the background). For the servers without any cached
+    state, we wait for the check, at most for SERVER_STATUS_CHECK_TIMEOUT
+    seconds.
+
+    Args:
+        managers: Connection managers of the connected servers
+
+    Returns:
+        Dictionary of the recovery state of the servers
+    """
+    now = time.time()
+    states = dict()
+    pending = []
+
+    with RECOVERY_STATE_LOCK:
+        for manager in managers:
+            state = RECOVERY_STATE_CACHE.get(manager.sid)
+            if state is not None:
+                states[manager.sid] = state[:2]
+                if now - state[2] < config.SERVER_STATUS_CACHE_TTL:
+                    continue
+
+            if manager.sid not in RECOVERY_STATE_CHECKS:
+                RECOVERY_STATE_CHECKS.add(manager.sid)
+                pending.append(manager)
+
+    missing = [m.sid for m in managers if m.sid not in states]
+    if not pending:
+        for sid in missing:
+            states[sid] = (None, None)
+        return states
+
+    lock = Lock()
+    pending.reverse()
+
+    def check():
+        while True:
+            with lock:
+                if not pending:
+                    return
+                manager = pending.pop()
+
+            try:
+                recovery_state(manager.connection(), manager.version)
+            except Exception as e:
+                current_app.logger.exception(e)
+            finally:
+                with RECOVERY_STATE_LOCK:
+                    RECOVERY_STATE_CHECKS.discard(manager.sid)
+
+    threads = []
+    for _ in range(
+        min(max(1, config.SERVER_STATUS_CHECK_WORKERS), len(pending))
+    ):
+        # Each thread requires its own copy of the request context.
+        t = Thread(target=copy_current_request_context(check))
+        t.daemon = True
+        t.start()
+        threads.append(t)
+
+    if missing:
+        deadline = now + config.SERVER_STATUS_CHECK_TIMEOUT
+        for t in threads:
+            t.join(max(0, deadline - time.time()))
+
+        with RECOVERY_STATE_LOCK:
+            for sid in missing:
+                state = RECOVERY_STATE_CACHE.get(sid)
+                states[sid] = state[:2] if state is not None else \
+                    (None, None)
+
+    return states
+
+
 def server_icon_and_background(is_connected, manager, server):
     """
 
@@ -118,6 +226,7 @@ class ServerModule(sg.ServerGroupPluginModule):
 
         driver = get_driver(PG_DEFAULT_DRIVER)
 
+        server_list = []
         for server in servers:
             connected = False
             manager = None
@@ -128,12 +237,16 @@ class ServerModule(sg.ServerGroupPluginModule):
             except CryptKeyMissing:
                 # show the nodes at least even if not able to connect.
                 pass
+            server_list.append((server, manager, connected))
 
-            in_recovery = None
-            wal_paused = None
+        # Check the recovery state of the connected servers in parallel
+        states = recovery_states(
+            [manager for _, manager, connected in server_list if connected]
+        )
+
+        for server, manager, connected in server_list:
+            in_recovery, wal_paused = states.get(server.id, (None, None))
 
-            if connected:
-                in_recovery, wal_paused = recovery_state(conn, manager.version)
             yield self.generate_browser_node(
                 "%d" % (server.id),
                 gid,
@@ -348,16 +461,19 @@ class ServerNode(PGChildNodeView):
 
         driver = get_driver(PG_DEFAULT_DRIVER)
 
+        server_list = []
         for server in servers:
             manager = driver.connection_manager(server.id)
             conn = manager.connection()
-            connected = conn.connected()
+            server_list.append((server, manager, conn.connected()))
 
-            if connected:
-                in_recovery, wal_paused = recovery_state(conn, manager.version)
-            else:
-                in_recovery = None
-                wal_paused = None
+        # Check the recovery state of the connected servers in parallel
+        states = recovery_states(
+            [manager for _, manager, connected in server_list if connected]
+        )
+
+        for server, manager, connected in server_list:
+            in_recovery, wal_paused = states.get(server.id, (None, None))
 
             res.append(
                 self.blueprint.generate_browser_node(
@@ -411,7 +527,9 @@ class ServerNode(PGChildNodeView):
         connected = conn.connected()
 
         if connected:
-            in_recovery, wal_paused = recovery_state(conn, manager.version)
+            in_recovery, wal_paused = recovery_states([manager]).get(
+                server.id, (None, None)
+            )
         else:
             in_recovery = None
             wal_paused = None
@@ -939,12 +1057,12 @@ class ServerNode(PGChildNodeView):
         Override this property for your own logic.
         """
 
-        return make_response(
-            render_template(
+        return render_cached(
+            'servers/supported_servers.js', 'application/javascript',
+            lambda: render_template(
                 "servers/supported_servers.js",
                 server_types=ServerType.types()
-            ),
-            200, {'Content-Type': 'application/javascript'}
+            )
         )
 
     def connect_status(self, gid, sid):
@@ -1158,6 +1276,8 @@ class ServerNode(PGChildNodeView):
         manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(sid)
 
         status = manager.release()
+        invalidate_recovery_state(sid)
+        dependency_graph_cache.invalidate(sid)
 
         if not status:
             return unauthorized(gettext("Server could not be disconnected."))
@@ -1409,6 +1529,7 @@ class ServerNode(PGChildNodeView):
                         return internal_server_error(
                             errormsg=str(res)
                         )
+                invalidate_recovery_state(sid)
                 return make_json_response(
                     success=1,
                     info=gettext('WAL replay paused'),
@@ -20,6 +20,8 @@ from flask_security import current_user
 import pgadmin.browser.server_groups.servers as servers
 from config import PG_DEFAULT_DRIVER
 from pgadmin.browser.collection import CollectionNodeModule
+from pgadmin.browser.dependency_graph import dependency_graph_cache
+from pgadmin.browser.server_groups.servers.databases.ddl import ddl_response
 from pgadmin.browser.server_groups.servers.databases.utils import \
     parse_sec_labels_from_db, parse_variables_from_db
 from pgadmin.browser.server_groups.servers.utils import parse_priv_from_db, \
@@ -153,6 +155,9 @@ class DatabaseView(PGChildNodeView):
         ],
         'vopts': [
             {}, {'get': 'variable_options'}
+        ],
+        'ddl': [
+            {'get': 'ddl'}
         ]
     })
 
@@ -480,6 +485,7 @@ class DatabaseView(PGChildNodeView):
         manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(sid)
 
         status = manager.release(did=did)
+        dependency_graph_cache.invalidate(sid, did)
 
         if not status:
             return unauthorized(_("Database could not be disconnected."))
@@ -779,6 +785,7 @@ class DatabaseView(PGChildNodeView):
             else:
 
                 status = self.manager.release(did=did)
+                dependency_graph_cache.invalidate(sid, did)
 
                 SQL = render_template(
                     "/".join([self.template_path, 'delete.sql']),
@@ -995,6 +1002,22 @@ class DatabaseView(PGChildNodeView):
             status=200
         )
 
+    @check_precondition(action="ddl")
+    def ddl(self, gid, sid, did):
+        """
+        This function will stream the DDL of the database, and all the
+        objects in it.
+        """
+        response = self.sql(gid=gid, sid=sid, did=did)
+        if response.status_code != 200:
+            return response
+
+        return ddl_response(
+            self.manager, self.conn, did, self,
+            json.loads(response.get_data(as_text=True)),
+            gid=gid, sid=sid, did=did
+        )
+
     @check_precondition(action="sql")
     def sql(self, gid, sid, did):
         """
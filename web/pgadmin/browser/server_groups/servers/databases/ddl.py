@@ -0,0 +1,471 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Generate the DDL of a whole schema, or database.
+
+The objects are found by walking the child nodes of the schema (or, the
+database) using their existing views, i.e. the 'nodes' view lists all the
+objects of a collection in one query. The dependencies among all the objects
+are fetched in a single query, and the objects are sorted in the dependency
+order.
+
+The reverse engineered SQL of the tables, views, functions and sequences is
+generated in batches (see BULK_FETCH_SIZE) by the 'bulk_sql' method of their
+view, which fetches the catalogs of all the objects of a batch at once (i.e.
+the number of the queries does not grow with the number of the objects). The
+SQL of the other objects (or, when the server does not support the bulk
+fetching) is generated by the 'sql' view of each object.
+
+The reverse engineered SQL of the objects is extracted in parallel over a few
+separate connections to the database (see DDL_EXTRACTION_WORKERS), and is
+streamed to the client in the dependency order as it becomes available.
+"""
+
+import heapq
+import random
+from collections import deque
+from threading import Thread, Condition
+
+import simplejson as json
+from flask import Response, current_app, render_template, \
+    stream_with_context, copy_current_request_context
+from flask_babelex import gettext
+
+import config
+from pgadmin.browser.utils import PGChildModule
+from pgadmin.utils.ajax import internal_server_error
+
+# Types of the nodes, whose reverse engineered SQL does not include their
+# child objects.
+CONTAINER_NODE_TYPES = ['schema', 'foreign_data_wrapper', 'foreign_server']
+
+# Order of the objects of different types, when they do not depend on each
+# other.
+NODE_TYPES_ORDER = [
+    'extension', 'language', 'foreign_data_wrapper', 'foreign_server',
+    'user_mapping', 'schema', 'collation', 'type', 'domain', 'fts_parser',
+    'fts_template', 'fts_dictionary', 'fts_configuration', 'sequence',
+    'function', 'procedure', 'trigger_function', 'table', 'foreign_table',
+    'external_table', 'view', 'mview', 'synonym', 'package', 'cast',
+    'event_trigger'
+]
+
+# Maximum number of the objects of a type, whose catalogs are fetched at once
+BULK_FETCH_SIZE = 100
+
+
+def _view_class(module, cmd):
+    view_func = current_app.view_functions.get(
+        '{0}.{1}'.format(module.name, cmd), None
+    )
+    return getattr(view_func, 'view_class', None)
+
+
+def _response_data(response):
+    """
+    Returns the (status, data) from the response of a view.
+    """
+    if not isinstance(response, Response):
+        return False, response
+
+    data = json.loads(response.get_data(as_text=True))
+    if response.status_code != 200:
+        return False, data.get('errormsg', None) \
+            if isinstance(data, dict) else data
+
+    return True, data
+
+
+def get_objects(manager, conn, view, parent=None, **kwargs):
+    """
+    Returns the objects under the given node (i.e. the view of the node), in
+    the order of NODE_TYPES_ORDER and their names.
+
+    Args:
+        manager: Server manager
+        conn: Connection to the database
+        view: View instance of the node
+        parent: Key of the parent object of the node (if any)
+        **kwargs: Identifiers of the node
+
+    Returns:
+        List of the objects as dictionary with 'key' (node type, id),
+        'node_type', 'id', 'label', 'parent' (key of the parent object),
+        'view' (view class of the node), and 'ids' (identifiers of the
+        object).
+    """
+    keywords = view.backend_support_keywords(manager, conn, **kwargs)
+    modules = [
+        module for module in view.blueprint.submodules
+        if module.node_type in NODE_TYPES_ORDER and (
+            not isinstance(module, PGChildModule) or
+            module.BackendSupported(manager, **keywords)
+        )
+    ]
+    modules.sort(key=lambda m: NODE_TYPES_ORDER.index(m.node_type))
+
+    objects = []
+    for module in modules:
+        nodes_view = _view_class(module, 'nodes')
+        sql_view = _view_class(module, 'sql_id')
+        if nodes_view is None or sql_view is None:
+            continue
+
+        ids = dict(
+            (p['id'], kwargs[p['id']]) for p in nodes_view.parent_ids
+        )
+        status, res = _response_data(
+            nodes_view(cmd='nodes').dispatch_request(**ids)
+        )
+        if not status:
+            raise Exception(res)
+
+        id_name = sql_view.ids[0]['id']
+
+        for node in res['data']:
+            obj_ids = dict(ids)
+            obj_ids[id_name] = node['_id']
+            obj = {
+                'key': (module.node_type, node['_id']),
+                'node_type': module.node_type,
+                'id': node['_id'],
+                'label': node['label'],
+                'parent': parent,
+                'view': sql_view,
+                'ids': obj_ids
+            }
+            objects.append(obj)
+
+            if module.node_type in CONTAINER_NODE_TYPES:
+                objects.extend(get_objects(
+                    manager, conn, sql_view(cmd='children'),
+                    parent=obj['key'], **obj_ids
+                ))
+
+    return objects
+
+
+def get_dependencies(manager, conn, objects):
+    """
+    Returns the dependencies among the objects, and the keys of the objects
+    created by an extension.
+
+    Returns:
+        Tuple of a dictionary (key => set of the keys, which it depends on),
+        and a set of the keys of the extension members.
+    """
+    dependencies = dict()
+    members = set()
+
+    by_oid = dict()
+    for obj in objects:
+        if obj['parent'] is not None:
+            dependencies.setdefault(obj['key'], set()).add(obj['parent'])
+        if isinstance(obj['id'], int):
+            by_oid.setdefault(obj['id'], []).append(obj['key'])
+
+    if len(by_oid) == 0:
+        return dependencies, members
+
+    SQL = render_template(
+        "/".join([
+            'databases/sql/#{0}#'.format(manager.version),
+            'ddl_dependencies.sql'
+        ]),
+        oids=sorted(by_oid)
+    )
+    status, res = conn.execute_dict(SQL)
+    if not status:
+        raise Exception(res)
+
+    for row in res['rows']:
+        for key in by_oid.get(row['objid'], []):
+            if row['deptype'] == 'e':
+                members.add(key)
+                continue
+            for refkey in by_oid.get(row['refobjid'], []):
+                dependencies.setdefault(key, set()).add(refkey)
+
+    return dependencies, members
+
+
+def dependency_order(objects, dependencies):
+    """
+    Sort the objects, so that every object comes after the objects it depends
+    on, keeping the given order of the objects otherwise. The cycles (if any)
+    are broken using the given order.
+
+    Args:
+        objects: List of the objects (with 'key')
+        dependencies: Dictionary of the key => set of the keys, which it
+                      depends on
+
+    Returns:
+        Sorted list of the objects
+    """
+    position = dict((obj['key'], idx) for idx, obj in enumerate(objects))
+    waiting = dict()
+    dependents = dict()
+
+    for obj in objects:
+        deps = [
+            key for key in dependencies.get(obj['key'], [])
+            if key in position and key != obj['key']
+        ]
+        waiting[obj['key']] = len(deps)
+        for key in deps:
+            dependents.setdefault(key, []).append(obj['key'])
+
+    heap = [position[key] for key in waiting if waiting[key] == 0]
+    heapq.heapify(heap)
+
+    result = []
+    done = set()
+
+    while len(result) < len(objects):
+        if len(heap) == 0:
+            # Cyclic dependencies, continue with the first remaining object
+            heapq.heappush(heap, min(
+                position[key] for key in waiting if key not in done
+            ))
+
+        obj = objects[heapq.heappop(heap)]
+        if obj['key'] in done:
+            continue
+
+        done.add(obj['key'])
+        result.append(obj)
+
+        for key in dependents.get(obj['key'], []):
+            waiting[key] -= 1
+            if waiting[key] == 0 and key not in done:
+                heapq.heappush(heap, position[key])
+
+    return result
+
+
+def get_object_sql(obj):
+    """
+    Returns the reverse engineered SQL of the object using its 'sql' view.
+    """
+    try:
+        status, res = _response_data(
+            obj['view'](cmd='sql').dispatch_request(**obj['ids'])
+        )
+    except Exception as e:
+        current_app.logger.exception(e)
+        status, res = False, str(e)
+
+    if not status:
+        return u"-- {0}\n".format(gettext(
+            "Could not generate the SQL for the {0} '{1}': {2}"
+        ).format(obj['node_type'], obj['label'], res))
+
+    return u"{0}\n".format(res.strip('\n'))
+
+
+def get_bulk_sql(objects):
+    """
+    Returns the reverse engineered SQL of the objects of a type (under the
+    same parent) using the 'bulk_sql' method of their view, which fetches the
+    catalogs of all the objects at once.
+
+    The SQL of an object, which could not be generated in bulk, is generated
+    by its 'sql' view.
+    """
+    if len(objects) == 1:
+        return [get_object_sql(objects[0])]
+
+    view = objects[0]['view']
+    ids = dict(objects[0]['ids'])
+    ids.pop(view.ids[0]['id'])
+
+    try:
+        res = view(cmd='sql').bulk_sql(
+            oids=[obj['id'] for obj in objects], **ids
+        )
+    except Exception as e:
+        current_app.logger.exception(e)
+        res = None
+
+    if not isinstance(res, dict):
+        if res is not None:
+            current_app.logger.error(_response_data(res)[1])
+        res = dict()
+
+    return [
+        u"{0}\n".format(res[obj['id']].strip('\n')) if obj['id'] in res
+        else get_object_sql(obj)
+        for obj in objects
+    ]
+
+
+def get_tasks(objects):
+    """
+    Returns the objects (with their index) grouped into the tasks of the
+    extraction, i.e. the objects of the same type under the same parent are
+    extracted together (in batches of BULK_FETCH_SIZE), when their view
+    supports it, and the other objects are extracted one by one.
+    """
+    tasks = []
+    batches = dict()
+
+    for idx, obj in enumerate(objects):
+        view = obj.get('view', None)
+        if view is None or not hasattr(view, 'bulk_sql'):
+            tasks.append([(idx, obj)])
+            continue
+
+        id_name = view.ids[0]['id']
+        key = (view, tuple(sorted(
+            (name, value) for name, value in obj['ids'].items()
+            if name != id_name
+        )))
+        batch = batches.get(key, None)
+        if batch is None or len(batch) >= BULK_FETCH_SIZE:
+            batch = batches[key] = []
+            tasks.append(batch)
+        batch.append((idx, obj))
+
+    return tasks
+
+
+def get_task_sql(task):
+    """
+    Returns the reverse engineered SQL of the objects of the task by their
+    index.
+    """
+    return dict(zip(
+        [idx for idx, obj in task],
+        get_bulk_sql([obj for idx, obj in task])
+    ))
+
+
+def extract_ddl(manager, did, objects, workers):
+    """
+    Generator of the reverse engineered SQL of the objects (in the given
+    order), which are extracted in parallel over at most 'workers' separate
+    connections to the database.
+
+    It must be run within a request context.
+    """
+    conn_ids = []
+    prefix = 'ddl-{0}'.format(random.randint(1, 9999999))
+    tasks = get_tasks(objects)
+
+    for idx in range(min(workers, len(tasks))):
+        conn_id = '{0}-{1}'.format(prefix, idx)
+        conn = manager.connection(
+            did=did, conn_id=conn_id, auto_reconnect=False, async_=False
+        )
+        status, msg = conn.connect()
+        if not status:
+            current_app.logger.error(msg)
+            manager.release(conn_id=conn_id)
+            break
+        conn_ids.append(conn_id)
+
+    if len(conn_ids) == 0:
+        # Extract using the default connection of the database
+        pending = deque(tasks)
+        results = dict()
+        for idx in range(len(objects)):
+            while idx not in results:
+                results.update(get_task_sql(pending.popleft()))
+            yield results.pop(idx)
+        return
+
+    pending = deque(tasks)
+    results = dict()
+    lock = Condition()
+    stopped = []
+
+    def worker(conn_id):
+        @copy_current_request_context
+        def run():
+            with manager.pin_connection(conn_id, did):
+                while True:
+                    with lock:
+                        if stopped or len(pending) == 0:
+                            break
+                        task = pending.popleft()
+
+                    sqls = get_task_sql(task)
+
+                    with lock:
+                        results.update(sqls)
+                        lock.notify_all()
+
+        return Thread(target=run)
+
+    threads = [worker(conn_id) for conn_id in conn_ids]
+    try:
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+
+        for idx in range(len(objects)):
+            with lock:
+                while idx not in results and \
+                        any(thread.is_alive() for thread in threads):
+                    lock.wait(1)
+                sql = results.pop(idx, None)
+
+            # The workers have stopped unexpectedly, extract it using the
+            # default connection of the database
+            if sql is None:
+                sql = get_object_sql(objects[idx])
+
+            yield sql
+    finally:
+        with lock:
+            stopped.append(True)
+        for thread in threads:
+            thread.join()
+        for conn_id in conn_ids:
+            manager.release(conn_id=conn_id)
+
+
+def ddl_response(manager, conn, did, view, header, **kwargs):
+    """
+    Returns the streamed (chunked) response of the DDL of the given node (i.e.
+    schema, or database) including all the objects under it.
+
+    Args:
+        manager: Server manager
+        conn: Connection to the database
+        did: Database ID
+        view: View instance of the node
+        header: Reverse engineered SQL of the node itself
+        **kwargs: Identifiers of the node
+    """
+    try:
+        objects = get_objects(manager, conn, view, **kwargs)
+        dependencies, members = get_dependencies(manager, conn, objects)
+    except Exception as e:
+        current_app.logger.exception(e)
+        return internal_server_error(errormsg=str(e))
+
+    objects = dependency_order(
+        [obj for obj in objects if obj['key'] not in members],
+        dependencies
+    )
+
+    def generate():
+        yield u"{0}\n".format(header.strip('\n'))
+        for sql in extract_ddl(
+            manager, did, objects, config.DDL_EXTRACTION_WORKERS
+        ):
+            yield u"\n{0}".format(sql)
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/plain'
+    )
@@ -17,6 +17,8 @@ from flask import render_template, request, jsonify
 from flask_babelex import gettext
 from pgadmin.browser.collection import CollectionNodeModule
 from pgadmin.browser.utils import PGChildNodeView
+from pgadmin.browser.server_groups.servers.databases.extensions.utils import \
+    invalidate_installed_extensions
 from pgadmin.utils.ajax import make_json_response, \
     make_response as ajax_response, internal_server_error, gone
 from pgadmin.utils.driver import get_driver
@@ -154,7 +156,13 @@ class ExtensionView(PGChildNodeView):
             self.conn = self.manager.connection(did=kwargs['did'])
             self.template_path = 'extensions/sql'
 
-            return f(*args, **kwargs)
+            response = f(*args, **kwargs)
+
+            # The installed extensions may have been changed
+            if request.method != 'GET':
+                invalidate_installed_extensions(kwargs['sid'], kwargs['did'])
+
+            return response
 
         return wrap
 
@@ -0,0 +1,2 @@
+{# ======================Fetch installed extensions names=====================#}
+SELECT extname FROM pg_extension
@@ -0,0 +1,68 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Cache of the extensions installed in the databases"""
+
+import time
+from threading import Lock
+
+from flask import render_template
+
+import config
+
+# (server id, database id) => (time, set of the installed extensions)
+INSTALLED_EXTENSIONS = dict()
+INSTALLED_EXTENSIONS_LOCK = Lock()
+
+
+def is_extension_installed(conn, sid, did, name):
+    """
+    Returns whether the given extension is installed in the database.
+
+    The names of the installed extensions are fetched in one query, and are
+    cached for EXTENSIONS_CACHE_TTL seconds (or, until an extension is
+    created, updated, or dropped using pgAdmin).
+
+    Args:
+        conn: Connection to the database
+        sid: Server ID
+        did: Database ID
+        name: Name of the extension
+
+    Returns:
+        (status, whether installed) or (False, error message)
+    """
+    now = time.time()
+
+    with INSTALLED_EXTENSIONS_LOCK:
+        cached = INSTALLED_EXTENSIONS.get((sid, did))
+
+    if cached is None or now - cached[0] >= config.EXTENSIONS_CACHE_TTL:
+        status, res = conn.execute_2darray(
+            render_template("extensions/sql/installed.sql")
+        )
+        if not status:
+            return False, res
+
+        cached = (now, set(row[0] for row in res['rows']))
+        with INSTALLED_EXTENSIONS_LOCK:
+            INSTALLED_EXTENSIONS[(sid, did)] = cached
+
+    return True, name in cached[1]
+
+
+def invalidate_installed_extensions(sid, did=None):
+    """
+    Remove the cached extensions of the given server (or, only of the given
+    database).
+    """
+    with INSTALLED_EXTENSIONS_LOCK:
+        for key in [k for k in INSTALLED_EXTENSIONS if k[0] == sid and (
+                did is None or k[1] == did)]:
+            del INSTALLED_EXTENSIONS[key]
@@ -17,6 +17,7 @@ from flask_babelex import gettext
 import pgadmin.browser.server_groups.servers as servers
 from config import PG_DEFAULT_DRIVER
 from pgadmin.browser.collection import CollectionNodeModule, PGChildModule
+from pgadmin.browser.server_groups.servers.databases.ddl import ddl_response
 from pgadmin.browser.server_groups.servers.utils import parse_priv_from_db, \
     parse_priv_to_db
 from pgadmin.browser.utils import PGChildNodeView
@@ -139,13 +140,7 @@ def check_precondition(f):
 
         self.conn = self.manager.connection(did=kwargs['did'])
         # Set the template path for the SQL scripts
-        if self.manager.server_type == 'gpdb':
-            _temp = self.gpdb_template_path(self.manager.version)
-        elif self.manager.server_type == 'ppas':
-            _temp = self.ppas_template_path(self.manager.version)
-        else:
-            _temp = self.pg_template_path(self.manager.version)
-        self.template_path = self.template_initial + '/' + _temp
+        self.template_path = self.get_template_path(self.manager)
 
         return f(*args, **kwargs)
 
@@ -224,7 +219,8 @@ class SchemaView(PGChildNodeView):
         'dependency': [{'get': 'dependencies'}],
         'dependent': [{'get': 'dependents'}],
         'delete': [{'delete': 'delete'},
-                   {'delete': 'delete'}]
+                   {'delete': 'delete'}],
+        'ddl': [{'get': 'ddl'}]
     })
 
     def __init__(self, *args, **kwargs):
@@ -239,6 +235,18 @@ class SchemaView(PGChildNodeView):
         self.template_path = None
         self.template_initial = 'schemas'
 
+    def get_template_path(self, manager):
+        """
+        Returns the template path for the SQL scripts of the server.
+        """
+        if manager.server_type == 'gpdb':
+            _temp = self.gpdb_template_path(manager.version)
+        elif manager.server_type == 'ppas':
+            _temp = self.ppas_template_path(manager.version)
+        else:
+            _temp = self.pg_template_path(manager.version)
+        return self.template_initial + '/' + _temp
+
     @staticmethod
     def ppas_template_path(ver):
         """
@@ -896,11 +904,9 @@ Could not find the schema in the database.
 It may have been removed by another user.
 """))
 
-        data = res['rows'][0]
-        backend_support_keywords = kwargs.copy()
-        backend_support_keywords['is_catalog'] = data['is_catalog']
-        backend_support_keywords['db_support'] = data['db_support']
-        backend_support_keywords['schema_name'] = data['schema_name']
+        backend_support_keywords = self.backend_support_keywords(
+            self.manager, self.conn, catalog_info=res['rows'][0], **kwargs
+        )
 
         nodes = []
         for module in self.blueprint.submodules:
@@ -917,6 +923,67 @@ It may have been removed by another user.
 
         return make_json_response(data=nodes)
 
+    def backend_support_keywords(self, manager, conn, catalog_info=None,
+                                 **kwargs):
+        """
+        Returns the keywords to be passed to the BackendSupported(...) method
+        of the child modules, i.e. whether it is a catalog, and the name of
+        the schema.
+
+        Args:
+            manager: Server connection manager
+            conn: Connection object
+            catalog_info: Result of is_catalog.sql (if already fetched)
+            **kwargs: Identifiers of the node
+        """
+        if catalog_info is None:
+            SQL = render_template(
+                "/".join([self.get_template_path(manager),
+                          'sql/is_catalog.sql']),
+                scid=kwargs['scid'], _=gettext
+            )
+
+            status, res = conn.execute_dict(SQL)
+            if not status:
+                raise Exception(res)
+
+            if len(res['rows']) == 0:
+                raise Exception(gettext(
+                    'Could not find the schema in the database.'
+                    ' It may have been removed by another user.'))
+
+            catalog_info = res['rows'][0]
+
+        backend_support_keywords = kwargs.copy()
+        backend_support_keywords['is_catalog'] = catalog_info['is_catalog']
+        backend_support_keywords['db_support'] = catalog_info['db_support']
+        backend_support_keywords['schema_name'] = \
+            catalog_info['schema_name']
+
+        return backend_support_keywords
+
+    @check_precondition
+    def ddl(self, gid, sid, did, scid):
+        """
+        This function will stream the DDL of the schema, and all the objects
+        in it.
+
+         Args:
+           gid: Server Group ID
+           sid: Server ID
+           did: Database ID
+           scid: Schema ID
+        """
+        response = self.sql(gid=gid, sid=sid, did=did, scid=scid)
+        if response.status_code != 200:
+            return response
+
+        return ddl_response(
+            self.manager, self.conn, did, self,
+            json.loads(response.get_data(as_text=True)),
+            gid=gid, sid=sid, did=did, scid=scid
+        )
+
 
 class CatalogView(SchemaView):
     """
@@ -21,18 +21,24 @@ from flask import render_template, make_response, request, jsonify, \
     current_app
 from flask_babelex import gettext
 from pgadmin.browser.server_groups.servers.databases.schemas.utils import \
-    SchemaChildModule, DataTypeReader
+    SchemaChildModule, DataTypeReader, CatalogPrefetch
 from pgadmin.browser.server_groups.servers.databases.utils import \
     parse_sec_labels_from_db, parse_variables_from_db
 from pgadmin.browser.server_groups.servers.utils import parse_priv_from_db, \
     parse_priv_to_db
+from pgadmin.browser.paging import fetch_nodes
 from pgadmin.browser.utils import PGChildNodeView
 from pgadmin.utils.ajax import make_json_response, internal_server_error, \
     make_response as ajax_response, gone
 from pgadmin.utils.driver import get_driver
+from pgadmin.utils import IS_PY2
 
 from config import PG_DEFAULT_DRIVER
 
+# If we are in Python3
+if not IS_PY2:
+    unicode = str
+
 
 class FunctionModule(SchemaChildModule):
     """
@@ -157,6 +163,10 @@ class FunctionView(PGChildNodeView, DataTypeReader):
     * sql(gid, sid, did, scid, fnid):
       - Returns the SQL for the Functions object.
 
+    * bulk_sql(gid, sid, did, scid, oids):
+      - Returns the SQL for the given Functions objects, fetching their
+        catalogs in bulk.
+
     * msql(gid, sid, did, scid, fnid=None):
       - Returns the modified SQL.
 
@@ -373,24 +383,25 @@ class FunctionView(PGChildNodeView, DataTypeReader):
         """
 
         res = []
-        SQL = render_template(
-            "/".join([self.sql_template_path, 'node.sql']),
+        status, rows, page = fetch_nodes(
+            self.conn, "/".join([self.sql_template_path, 'node.sql']),
+            name_column='sort_name',
+            paged=fnid is None,
             scid=scid,
             fnid=fnid
         )
-        status, rset = self.conn.execute_2darray(SQL)
 
         if not status:
-            return internal_server_error(errormsg=rset)
+            return internal_server_error(errormsg=rows)
 
         if fnid is not None:
-            if len(rset['rows']) == 0:
+            if len(rows) == 0:
                 return gone(
                     _("Could not find the specified %s.").format(
                         self.node_type)
                 )
 
-            row = rset['rows'][0]
+            row = rows[0]
             return make_json_response(
                 data=self.blueprint.generate_browser_node(
                     row['oid'],
@@ -402,7 +413,7 @@ class FunctionView(PGChildNodeView, DataTypeReader):
                 )
             )
 
-        for row in rset['rows']:
+        for row in rows:
             res.append(
                 self.blueprint.generate_browser_node(
                     row['oid'],
@@ -415,6 +426,7 @@ class FunctionView(PGChildNodeView, DataTypeReader):
 
         return make_json_response(
             data=res,
+            result=page,
             status=200
         )
 
@@ -446,12 +458,14 @@ class FunctionView(PGChildNodeView, DataTypeReader):
             status=200
         )
 
-    def _format_arguments_from_db(self, data):
+    def _format_arguments_from_db(self, data, prefetch=None):
         """
         Create Argument list of the Function.
 
         Args:
             data: Function Data
+            prefetch: CatalogPrefetch with the types of the OUT arguments
+                      (if fetched in bulk)
 
         Returns:
             Function Arguments in the following format.
@@ -511,12 +525,22 @@ class FunctionView(PGChildNodeView, DataTypeReader):
         cnt = 0
         for m in proargmodes:
             if m == 'o':  # Out Mode
-                SQL = render_template("/".join([self.sql_template_path,
-                                                'get_out_types.sql']),
-                                      out_arg_oid=proallargtypes[cnt])
-                status, out_arg_type = self.conn.execute_scalar(SQL)
-                if not status:
-                    return internal_server_error(errormsg=out_arg_type)
+                out_types = prefetch.rows(
+                    'out_types', proallargtypes[cnt]
+                ) if prefetch is not None else None
+
+                if out_types is not None:
+                    out_arg_type = out_types['rows'][0]['out_arg_type'] \
+                        if len(out_types['rows']) > 0 else None
+                else:
+                    SQL = render_template(
+                        "/".join([self.sql_template_path,
+                                  'get_out_types.sql']),
+                        out_arg_oid=proallargtypes[cnt]
+                    )
+                    status, out_arg_type = self.conn.execute_scalar(SQL)
+                    if not status:
+                        return internal_server_error(errormsg=out_arg_type)
 
                 # Insert out parameter datatype
                 proargtypes.insert(cnt, out_arg_type)
@@ -928,6 +952,106 @@ class FunctionView(PGChildNodeView, DataTypeReader):
         if not isinstance(resp_data, dict):
             return resp_data
 
+        SQL = self._get_reverse_engineered_sql(scid, fnid, resp_data)
+        # Most probably this is due to error
+        if not isinstance(SQL, (str, unicode)):
+            return SQL
+
+        return ajax_response(response=SQL)
+
+    @check_precondition
+    def bulk_sql(self, gid, sid, did, scid, oids):
+        """
+        Returns the SQL for the given Function objects of the schema,
+        fetching their catalogs in bulk.
+
+        Args:
+            gid: Server Group Id
+            sid: Server Id
+            did: Database Id
+            scid: Schema Id
+            oids: List of the Function Ids
+
+        Returns:
+            Dictionary of the Function Id => SQL, None when the server does
+            not support the bulk fetching, or the error response
+        """
+        if not CatalogPrefetch.is_supported(self.manager):
+            return None
+
+        prefetch = CatalogPrefetch(self.conn)
+
+        error = prefetch.fetch(
+            'properties',
+            "/".join([self.sql_template_path, 'properties.sql']),
+            'fnid', oids, scid=scid
+        )
+        if error is not None:
+            return error
+
+        out_arg_oids = []
+        for fnid in oids:
+            for row in prefetch.rows('properties', fnid)['rows']:
+                proargmodes = row['proargmodes'] or []
+                proallargtypes = row['proallargtypes'] or []
+                out_arg_oids.extend(
+                    proallargtypes[idx] for idx, mode in enumerate(
+                        proargmodes
+                    ) if mode == 'o'
+                )
+
+        for name, template, param, keys, kwargs in [
+            ('out_types', 'get_out_types.sql', 'out_arg_oid', out_arg_oids,
+             {}),
+            ('acl', 'acl.sql', 'fnid', oids, {}),
+            ('schema', 'get_schema.sql', 'scid', [scid], {}),
+            ('definition', 'get_definition.sql', 'fnid', oids,
+             {'scid': scid})
+        ]:
+            error = prefetch.fetch(
+                name, "/".join([self.sql_template_path, template]),
+                param, keys, **kwargs
+            )
+            if error is not None:
+                return error
+
+        result = dict()
+        for fnid in oids:
+            if len(prefetch.rows('properties', fnid)['rows']) == 0 or \
+                    len(prefetch.rows('definition', fnid)['rows']) == 0:
+                continue
+
+            resp_data = self._fetch_properties(
+                gid=gid, sid=sid, did=did, scid=scid, fnid=fnid,
+                prefetch=prefetch
+            )
+            if not isinstance(resp_data, dict):
+                return resp_data
+
+            SQL = self._get_reverse_engineered_sql(
+                scid, fnid, resp_data, prefetch
+            )
+            if not isinstance(SQL, (str, unicode)):
+                return SQL
+
+            result[fnid] = SQL
+
+        return result
+
+    def _get_reverse_engineered_sql(self, scid, fnid, resp_data,
+                                    prefetch=None):
+        """
+        Returns the SQL (with the header) for the Function object from its
+        properties.
+
+        Args:
+            scid: Schema Id
+            fnid: Function Id
+            resp_data: Properties of the Function
+            prefetch: CatalogPrefetch with the schema, and the definition
+                      of the Function (if fetched in bulk)
+        """
+
         # Fetch the function definition.
         args = u''
         args_without_name = []
@@ -975,16 +1099,11 @@ class FunctionView(PGChildNodeView, DataTypeReader):
             # Get Schema Name from its OID.
             if 'pronamespace' in resp_data:
                 resp_data['pronamespace'] = self._get_schema(
-                    resp_data['pronamespace'])
+                    resp_data['pronamespace'], prefetch)
 
-            SQL = render_template("/".join([self.sql_template_path,
-                                            'get_definition.sql']
-                                           ), data=resp_data,
-                                  fnid=fnid, scid=scid)
-
-            status, res = self.conn.execute_2darray(SQL)
-            if not status:
-                return internal_server_error(errormsg=res)
+            res = self._get_definition(scid, fnid, resp_data, prefetch)
+            if not isinstance(res, dict):
+                return res
 
             name_with_default_args = self.qtIdent(
                 self.conn,
@@ -1017,7 +1136,7 @@ class FunctionView(PGChildNodeView, DataTypeReader):
             # Get Schema Name from its OID.
             if 'pronamespace' in resp_data:
                 resp_data['pronamespace'] = self._get_schema(
-                    resp_data['pronamespace']
+                    resp_data['pronamespace'], prefetch
                 )
 
             # Parse privilege data
@@ -1028,14 +1147,9 @@ class FunctionView(PGChildNodeView, DataTypeReader):
                 resp_data['revoke_all'] = self._set_revoke_all(
                     resp_data['acl'])
 
-            SQL = render_template("/".join([self.sql_template_path,
-                                            'get_definition.sql']
-                                           ), data=resp_data,
-                                  fnid=fnid, scid=scid)
-
-            status, res = self.conn.execute_2darray(SQL)
-            if not status:
-                return internal_server_error(errormsg=res)
+            res = self._get_definition(scid, fnid, resp_data, prefetch)
+            if not isinstance(res, dict):
+                return res
 
             name_with_default_args = self.qtIdent(
                 self.conn,
@@ -1071,7 +1185,26 @@ class FunctionView(PGChildNodeView, DataTypeReader):
         SQL = sql_header + func_def
         SQL = re.sub('\n{2,}', '\n\n', SQL)
 
-        return ajax_response(response=SQL)
+        return SQL
+
+    def _get_definition(self, scid, fnid, data, prefetch=None):
+        """
+        Returns the result of the definition query of the Function (i.e.
+        nspname, proname and func_args), or the error response.
+        """
+        SQL = render_template("/".join([self.sql_template_path,
+                                        'get_definition.sql']
+                                       ), data=data,
+                              fnid=fnid, scid=scid)
+
+        if prefetch is not None:
+            status, res = prefetch.execute_dict('definition', fnid, SQL)
+        else:
+            status, res = self.conn.execute_2darray(SQL)
+        if not status:
+            return internal_server_error(errormsg=res)
+
+        return res
 
     @check_precondition
     @validate_request
@@ -1290,7 +1423,8 @@ class FunctionView(PGChildNodeView, DataTypeReader):
                                   data=data, is_sql=is_sql)
         return True, SQL.strip('\n')
 
-    def _fetch_properties(self, gid, sid, did, scid, fnid=None):
+    def _fetch_properties(self, gid, sid, did, scid, fnid=None,
+                          prefetch=None):
         """
         Return Function Properties which will be used in properties,
         msql function.
@@ -1301,14 +1435,19 @@ class FunctionView(PGChildNodeView, DataTypeReader):
             did: Database Id
             scid: Schema Id
             fnid: Function Id
+            prefetch: CatalogPrefetch with the properties, and the
+                      privileges of the Function (if fetched in bulk)
         """
 
         resp_data = {}
 
+        if prefetch is None:
+            prefetch = CatalogPrefetch(self.conn)
+
         SQL = render_template("/".join([self.sql_template_path,
                                         'properties.sql']),
                               scid=scid, fnid=fnid)
-        status, res = self.conn.execute_dict(SQL)
+        status, res = prefetch.execute_dict('properties', fnid, SQL)
         if not status:
             return internal_server_error(errormsg=res)
 
@@ -1320,14 +1459,16 @@ class FunctionView(PGChildNodeView, DataTypeReader):
         resp_data = res['rows'][0]
 
         # Get formatted Arguments
-        frmtd_params, frmtd_proargs = self._format_arguments_from_db(resp_data)
+        frmtd_params, frmtd_proargs = self._format_arguments_from_db(
+            resp_data, prefetch
+        )
         resp_data.update(frmtd_params)
         resp_data.update(frmtd_proargs)
 
         # Fetch privileges
         SQL = render_template("/".join([self.sql_template_path, 'acl.sql']),
                               fnid=fnid)
-        status, proaclres = self.conn.execute_dict(SQL)
+        status, proaclres = prefetch.execute_dict('acl', fnid, SQL)
         if not status:
             return internal_server_error(errormsg=res)
 
@@ -1360,13 +1501,18 @@ class FunctionView(PGChildNodeView, DataTypeReader):
 
         return resp_data
 
-    def _get_schema(self, scid):
+    def _get_schema(self, scid, prefetch=None):
         """
         Returns Schema Name from its OID.
 
         Args:
             scid: Schema Id
+            prefetch: CatalogPrefetch with the schema (if fetched in bulk)
         """
+        res = prefetch.rows('schema', scid) if prefetch is not None else None
+        if res is not None and len(res['rows']) > 0:
+            return res['rows'][0]['nspname']
+
         SQL = render_template("/".join([self.sql_template_path,
                                         'get_schema.sql']), scid=scid)
 
@@ -1,5 +1,6 @@
+{% import 'macros/paging.macros' as PAGING %}
 SELECT
-    pr.oid,
+    pr.oid, pr.proname AS sort_name,
     CASE WHEN
         pg_catalog.pg_get_function_identity_arguments(pr.oid) <> ''
     THEN
@@ -25,5 +26,5 @@ WHERE
     AND pronamespace = {{scid}}::oid
 {% endif %}
     AND typname NOT IN ('trigger', 'event_trigger')
-ORDER BY
-    proname;
+{{ PAGING.FILTER('pr.proname', 'pr.oid', paging) }}
+{{ PAGING.ORDER('pr.proname', 'pr.oid', paging) }};
@@ -1,5 +1,6 @@
+{% import 'macros/paging.macros' as PAGING %}
 SELECT
-    pr.oid, pr.proname || '()' as name,
+    pr.oid, pr.proname AS sort_name, pr.proname || '()' as name,
     lanname, pg_get_userbyid(proowner) as funcowner, description
 FROM
     pg_proc pr
@@ -19,5 +20,5 @@ WHERE
     AND pronamespace = {{scid}}::oid
 {% endif %}
     AND lanname NOT IN ('edbspl', 'sql', 'internal')
-ORDER BY
-    proname;
+{{ PAGING.FILTER('pr.proname', 'pr.oid', paging) }}
+{{ PAGING.ORDER('pr.proname', 'pr.oid', paging) }};
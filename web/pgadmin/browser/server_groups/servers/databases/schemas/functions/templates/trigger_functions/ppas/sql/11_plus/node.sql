@@ -1,5 +1,6 @@
+{% import 'macros/paging.macros' as PAGING %}
 SELECT
-    pr.oid, pr.proname || '()' AS name,
+    pr.oid, pr.proname AS sort_name, pr.proname || '()' AS name,
     lanname, pg_get_userbyid(proowner) AS funcowner, description
 FROM
     pg_proc pr
@@ -18,5 +19,5 @@ WHERE
     AND pronamespace = {{scid}}::oid
 {% endif %}
     AND typname IN ('trigger', 'event_trigger') AND lanname != 'edbspl'
-ORDER BY
-    proname;
+{{ PAGING.FILTER('pr.proname', 'pr.oid', paging) }}
+{{ PAGING.ORDER('pr.proname', 'pr.oid', paging) }};
@@ -15,9 +15,10 @@ import pgadmin.browser.server_groups.servers.databases as database
 from flask import render_template, make_response, request, jsonify
 from flask_babelex import gettext as _
 from pgadmin.browser.server_groups.servers.databases.schemas.utils \
-    import SchemaChildModule
+    import SchemaChildModule, CatalogPrefetch
 from pgadmin.browser.server_groups.servers.utils import parse_priv_from_db, \
     parse_priv_to_db
+from pgadmin.browser.paging import fetch_nodes
 from pgadmin.browser.utils import PGChildNodeView
 from pgadmin.utils.ajax import make_json_response, internal_server_error, \
     make_response as ajax_response, gone
@@ -193,19 +194,20 @@ class SequenceView(PGChildNodeView):
 
         """
         res = []
-        SQL = render_template(
-            "/".join([self.template_path, 'nodes.sql']),
+        status, rows, page = fetch_nodes(
+            self.conn, "/".join([self.template_path, 'nodes.sql']),
+            paged=seid is None,
             scid=scid,
-            seid=seid
+            seid=seid,
+            show_system_objects=self.blueprint.show_system_objects
         )
-        status, rset = self.conn.execute_dict(SQL)
         if not status:
-            return internal_server_error(errormsg=rset)
+            return internal_server_error(errormsg=rows)
 
         if seid is not None:
-            if len(rset['rows']) == 0:
+            if len(rows) == 0:
                 return gone(errormsg=_("Could not find the sequence."))
-            row = rset['rows'][0]
+            row = rows[0]
             return make_json_response(
                 data=self.blueprint.generate_browser_node(
                     row['oid'],
@@ -216,8 +218,9 @@ class SequenceView(PGChildNodeView):
                 status=200
             )
 
-        sequence_nodes = self._get_sequence_nodes(rset['rows'])
-        for row in sequence_nodes:
+        # The sequences created as part of an IDENTITY column have already
+        # been hidden by the query, before paging.
+        for row in rows:
             res.append(
                 self.blueprint.generate_browser_node(
                     row['oid'],
@@ -228,6 +231,7 @@ class SequenceView(PGChildNodeView):
 
         return make_json_response(
             data=res,
+            result=page,
             status=200
         )
 
@@ -688,16 +692,103 @@ class SequenceView(PGChildNodeView):
             if not status:
                 return internal_server_error(errormsg=rset1)
 
-            row['current_value'] = rset1['rows'][0]['last_value']
-            row['minimum'] = rset1['rows'][0]['min_value']
-            row['maximum'] = rset1['rows'][0]['max_value']
-            row['increment'] = rset1['rows'][0]['increment_by']
-            row['cache'] = rset1['rows'][0]['cache_value']
-            row['cycled'] = rset1['rows'][0]['is_cycled']
+            self._set_definition(row, rset1['rows'][0])
 
         result = res['rows'][0]
         result = self._formatter(result, scid, seid)
-        SQL, name = self.getSQL(gid, sid, did, result, scid)
+        SQL = self._get_reverse_engineered_sql(gid, sid, did, scid, result)
+        # Most probably this is due to error
+        if not isinstance(SQL, (str, unicode)):
+            return SQL
+
+        return ajax_response(response=SQL)
+
+    @check_precondition(action="sql")
+    def bulk_sql(self, gid, sid, did, scid, oids):
+        """
+        This function will generate the reverse engineered SQL of the given
+        sequences of the schema, fetching their catalogs in bulk.
+
+        Args:
+            gid: Server Group ID
+            sid: Server ID
+            did: Database ID
+            scid: Schema ID
+            oids: List of the sequence IDs
+
+        Returns:
+            Dictionary of the sequence ID => SQL, None when the server does
+            not support the bulk fetching, or the error response
+        """
+        if not CatalogPrefetch.is_supported(self.manager):
+            return None
+
+        prefetch = CatalogPrefetch(self.conn)
+
+        error = prefetch.fetch(
+            'properties', "/".join([self.template_path, 'properties.sql']),
+            'seid', oids, scid=scid
+        )
+        if error is not None:
+            return error
+
+        rows = [
+            row for seid in oids
+            for row in prefetch.rows('properties', seid)['rows']
+        ]
+
+        # The definition of each sequence is read from its own relation
+        error = prefetch.fetch_union('definition', dict(
+            (row['oid'], render_template(
+                "/".join([self.template_path, 'get_def.sql']),
+                data=row
+            )) for row in rows
+        ))
+        if error is not None:
+            return error
+
+        error = prefetch.fetch(
+            'acl', "/".join([self.template_path, 'acl.sql']),
+            'seid', [row['oid'] for row in rows], scid=scid
+        )
+        if error is not None:
+            return error
+
+        result = dict()
+        for row in rows:
+            definition = prefetch.rows('definition', row['oid'])['rows']
+            if len(definition) == 0:
+                continue
+
+            self._set_definition(row, definition[0])
+            row = self._formatter(row, scid, row['oid'], prefetch)
+            SQL = self._get_reverse_engineered_sql(gid, sid, did, scid, row)
+            if not isinstance(SQL, (str, unicode)):
+                return SQL
+
+            result[row['oid']] = SQL
+
+        return result
+
+    @staticmethod
+    def _set_definition(data, definition):
+        """
+        This function will set the definition (i.e. result of get_def.sql)
+        of the sequence in its properties.
+        """
+        data['current_value'] = definition['last_value']
+        data['minimum'] = definition['min_value']
+        data['maximum'] = definition['max_value']
+        data['increment'] = definition['increment_by']
+        data['cache'] = definition['cache_value']
+        data['cycled'] = definition['is_cycled']
+
+    def _get_reverse_engineered_sql(self, gid, sid, did, scid, data):
+        """
+        This function will generate the reverse engineered SQL (with the
+        header) of the sequence from its formatted properties.
+        """
+        SQL, name = self.getSQL(gid, sid, did, data, scid)
         # Most probably this is due to error
         if not isinstance(SQL, (str, unicode)):
             return SQL
@@ -707,18 +798,18 @@ class SequenceView(PGChildNodeView):
 
 -- DROP SEQUENCE {0};
 
-""".format(self.qtIdent(self.conn, result['schema'], result['name']))
+""".format(self.qtIdent(self.conn, data['schema'], data['name']))
 
-        SQL = sql_header + SQL
+        return sql_header + SQL
 
-        return ajax_response(response=SQL)
-
-    def _formatter(self, data, scid, seid):
+    def _formatter(self, data, scid, seid, prefetch=None):
         """
         Args:
             data: dict of query result
             scid: Schema ID
             seid: Sequence ID
+            prefetch: CatalogPrefetch with the privileges of the sequence
+                      (if fetched in bulk)
 
         Returns:
             It will return formatted output of sequence
@@ -734,9 +825,12 @@ class SequenceView(PGChildNodeView):
             data['securities'] = seclabels
 
         # We need to parse & convert ACL coming from database to json format
+        if prefetch is None:
+            prefetch = CatalogPrefetch(self.conn)
+
         SQL = render_template("/".join([self.template_path, 'acl.sql']),
                               scid=scid, seid=seid)
-        status, acl = self.conn.execute_dict(SQL)
+        status, acl = prefetch.execute_dict('acl', seid, SQL)
         if not status:
             return internal_server_error(errormsg=acl)
 
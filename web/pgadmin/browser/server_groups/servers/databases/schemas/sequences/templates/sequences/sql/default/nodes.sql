@@ -1,3 +1,4 @@
+{% import 'macros/paging.macros' as PAGING %}
 SELECT cl.oid as oid, relname as name, relnamespace as schema
 FROM pg_class cl
 WHERE
@@ -7,5 +8,14 @@ WHERE
 {% endif %}
 {% if seid %}
     AND cl.oid = {{seid|qtLiteral}}::oid
+{% elif not show_system_objects %}
+{# Hide the sequences created as part of an IDENTITY column #}
+    AND NOT EXISTS (
+        SELECT 1 FROM pg_depend dep
+        WHERE dep.classid = 'pg_class'::regclass AND dep.objid = cl.oid
+            AND dep.refclassid = 'pg_class'::regclass
+            AND dep.refobjsubid <> 0 AND dep.deptype = 'i'
+    )
 {% endif %}
-ORDER BY relname
+{{ PAGING.FILTER('relname', 'cl.oid', paging) }}
+{{ PAGING.ORDER('relname', 'cl.oid', paging) }}
@@ -0,0 +1,66 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import os
+
+from jinja2 import Environment, FileSystemLoader
+
+from pgadmin.utils.route import BaseTestGenerator
+
+TEMPLATES = os.path.join(os.path.dirname(__file__), '..', 'templates')
+MACROS = os.path.join(
+    os.path.dirname(__file__), '..', '..', '..', '..', 'templates'
+)
+
+
+class SequenceNodesSQLTestCase(BaseTestGenerator):
+    """
+    Test the sequences created as part of an IDENTITY column are hidden by
+    the query of the nodes (i.e. before paging).
+    """
+    scenarios = [
+        ('Identity sequences are hidden, when the paging is requested',
+         dict(
+             kwargs=dict(
+                 scid=2200, show_system_objects=False,
+                 paging={'limit': 50, 'after': None, 'prefix': None,
+                         'count': False}
+             ),
+             hidden=True
+         )),
+        ('Identity sequences are hidden, when the nodes are counted',
+         dict(
+             kwargs=dict(
+                 scid=2200, show_system_objects=False,
+                 paging={'limit': 50, 'after': None, 'prefix': None,
+                         'count': True}
+             ),
+             hidden=True
+         )),
+        ('Identity sequences are shown with the system objects',
+         dict(
+             kwargs=dict(scid=2200, show_system_objects=True, paging=None),
+             hidden=False
+         )),
+        ('Identity sequence is found by its id',
+         dict(
+             kwargs=dict(seid=16384, show_system_objects=False, paging=None),
+             hidden=False
+         )),
+    ]
+
+    def runTest(self):
+        env = Environment(loader=FileSystemLoader([TEMPLATES, MACROS]))
+        env.filters['qtLiteral'] = lambda value: "'{0}'".format(value)
+
+        SQL = env.get_template(
+            'sequences/sql/default/nodes.sql'
+        ).render(**self.kwargs)
+
+        self.assertEqual("dep.deptype = 'i'" in SQL, self.hidden)
@@ -16,12 +16,19 @@ import pgadmin.browser.server_groups.servers.databases as database
 from flask import render_template, request, jsonify, url_for
 from flask_babelex import gettext
 from pgadmin.browser.server_groups.servers.databases.schemas.utils \
-    import SchemaChildModule, DataTypeReader, VacuumSettings
+    import SchemaChildModule, DataTypeReader, VacuumSettings, \
+    CatalogPrefetch
+from pgadmin.browser.paging import fetch_nodes
 from pgadmin.browser.server_groups.servers.utils import parse_priv_to_db
 from pgadmin.utils.ajax import make_json_response, internal_server_error, \
     make_response as ajax_response, gone
 from .utils import BaseTableView
 from pgadmin.utils.preferences import Preferences
+from pgadmin.utils import IS_PY2
+
+# If we are in Python3
+if not IS_PY2:
+    unicode = str
 
 
 class TableModule(SchemaChildModule):
@@ -175,6 +182,10 @@ class TableView(BaseTableView, DataTypeReader, VacuumSettings):
       - This function will generate sql to show it in sql pane for the
         selected Table node.
 
+    * bulk_sql(gid, sid, did, scid, oids):
+      - This function will generate sql of the given Table nodes, fetching
+        their catalogs in bulk.
+
     * dependency(gid, sid, did, scid, tid):
       - This function will generate dependency list show it in dependency
         pane for the selected Table node.
@@ -251,7 +262,10 @@ class TableView(BaseTableView, DataTypeReader, VacuumSettings):
         'nodes': [{'get': 'node'}, {'get': 'nodes'}],
         'sql': [{'get': 'sql'}],
         'msql': [{'get': 'msql'}, {'get': 'msql'}],
-        'stats': [{'get': 'statistics'}, {'get': 'statistics'}],
+        'stats': [
+            {'get': 'statistics', 'delete': 'cancel_statistics'},
+            {'get': 'statistics'}
+        ],
         'dependency': [{'get': 'dependencies'}],
         'dependent': [{'get': 'dependents'}],
         'get_oftype': [{'get': 'get_oftype'}, {'get': 'get_oftype'}],
@@ -387,18 +401,18 @@ class TableView(BaseTableView, DataTypeReader, VacuumSettings):
             scid: Schema ID
 
         Returns:
-            JSON of available table nodes
+            JSON of available table nodes (and, the total number of the
+            tables, and the cursor of the next page, when paged)
         """
         res = []
-        SQL = render_template(
-            "/".join([self.table_template_path, 'nodes.sql']),
+        status, rows, page = fetch_nodes(
+            self.conn, "/".join([self.table_template_path, 'nodes.sql']),
             scid=scid
         )
-        status, rset = self.conn.execute_2darray(SQL)
         if not status:
-            return internal_server_error(errormsg=rset)
+            return internal_server_error(errormsg=rows)
 
-        for row in rset['rows']:
+        for row in rows:
             icon = self.get_icon_css_class(row)
 
             res.append(
@@ -415,6 +429,7 @@ class TableView(BaseTableView, DataTypeReader, VacuumSettings):
 
         return make_json_response(
             data=res,
+            result=page,
             status=200
         )
 
@@ -1377,6 +1392,46 @@ class TableView(BaseTableView, DataTypeReader, VacuumSettings):
         return BaseTableView.get_reverse_engineered_sql(
             self, did, scid, tid, main_sql, data)
 
+    @BaseTableView.check_precondition
+    def bulk_sql(self, gid, sid, did, scid, oids):
+        """
+        This function will creates reverse engineered sql for the given
+        tables of the schema, fetching their catalogs in bulk.
+
+         Args:
+           gid: Server Group ID
+           sid: Server ID
+           did: Database ID
+           scid: Schema ID
+           oids: List of the table IDs
+
+        Returns:
+            Dictionary of the table ID => SQL, None when the server does not
+            support the bulk fetching, or the error response
+        """
+        if not CatalogPrefetch.is_supported(self.manager):
+            return None
+
+        prefetch, error = BaseTableView.bulk_fetch(self, did, scid, oids)
+        if error is not None:
+            return error
+
+        result = dict()
+        for tid in oids:
+            res = prefetch.rows('properties', tid)
+            if len(res['rows']) == 0:
+                continue
+
+            SQL = BaseTableView._get_reverse_engineered_sql(
+                self, did, scid, tid, [], dict(res['rows'][0]), prefetch
+            )
+            if not isinstance(SQL, (str, unicode)):
+                return SQL
+
+            result[tid] = SQL
+
+        return result
+
     @BaseTableView.check_precondition
     def select_sql(self, gid, sid, did, scid, tid):
         """
@@ -1568,7 +1623,21 @@ class TableView(BaseTableView, DataTypeReader, VacuumSettings):
         otherwise it will return statistics for all the tables in that
         schema.
         """
-        return BaseTableView.get_table_statistics(self, scid, tid)
+        return BaseTableView.get_table_statistics(self, did, scid, tid)
+
+    @BaseTableView.check_precondition
+    def cancel_statistics(self, gid, sid, did, scid, tid):
+        """
+        Cancel the computation of the extended statistics of the table.
+
+        Args:
+            gid: Server Group Id
+            sid: Server Id
+            did: Database Id
+            scid: Schema Id
+            tid: Table Id
+        """
+        return BaseTableView.cancel_table_extended_statistics(self, did, tid)
 
     @BaseTableView.check_precondition
     def count_rows(self, gid, sid, did, scid, tid):
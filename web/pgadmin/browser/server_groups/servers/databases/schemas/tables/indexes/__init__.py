@@ -83,6 +83,10 @@ class IndexesModule(CollectionNodeModule):
             if 'vid' not in kwargs:
                 return True
 
+            # Indexes are supported only on the materialized views
+            if 'relkind' in kwargs:
+                return kwargs['relkind'] == 'm'
+
             template_path = 'indexes/sql/#{0}#'.format(manager.version)
             SQL = render_template(
                 "/".join([template_path, 'backend_support.sql']),
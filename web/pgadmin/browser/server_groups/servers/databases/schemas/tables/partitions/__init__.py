@@ -24,11 +24,16 @@ from pgadmin.browser.collection import CollectionNodeModule
 from pgadmin.utils.ajax import make_json_response, precondition_required
 from config import PG_DEFAULT_DRIVER
 from pgadmin.browser.utils import PGChildModule
+from pgadmin.browser.paging import fetch_nodes
 
 
 def backend_supported(module, manager, **kwargs):
     if 'tid' in kwargs and CollectionNodeModule.BackendSupported(
             module, manager, **kwargs):
+        # The kind of the table has already been fetched by the parent node.
+        if 'relkind' in kwargs and manager.server_type != 'gpdb':
+            return kwargs['relkind'] == 'p'
+
         conn = manager.connection(did=kwargs['did'])
 
         template_path = 'partitions/sql/{0}/#{0}#{1}#'.format(
@@ -291,15 +296,18 @@ class PartitionsView(BaseTableView, DataTypeReader, VacuumSettings):
             ptid: Partition Table ID
 
         Returns:
-            JSON of available table nodes
-        """
-        SQL = render_template(
-            "/".join([self.partition_template_path, 'nodes.sql']),
+            JSON of available table nodes (and, the total number of the
+            partitions, and the cursor of the next page, when paged)
+        """
+        # The partitions of Greenplum are not paged, as they are not
+        # ordered by their oids.
+        status, rows, page = fetch_nodes(
+            self.conn, "/".join([self.partition_template_path, 'nodes.sql']),
+            paged=ptid is None and self.manager.server_type != 'gpdb',
             scid=scid, tid=tid
         )
-        status, rset = self.conn.execute_2darray(SQL)
         if not status:
-            return internal_server_error(errormsg=rset)
+            return internal_server_error(errormsg=rows)
 
         def browser_node(row):
             return self.blueprint.generate_browser_node(
@@ -316,21 +324,22 @@ class PartitionsView(BaseTableView, DataTypeReader, VacuumSettings):
             )
 
         if ptid is not None:
-            if len(rset['rows']) == 0:
+            if len(rows) == 0:
                 return gone(gettext(
                     "The specified partitioned table could not be found."
                 ))
 
             return make_json_response(
-                data=browser_node(rset['rows'][0]), status=200
+                data=browser_node(rows[0]), status=200
             )
 
         res = []
-        for row in rset['rows']:
+        for row in rows:
             res.append(browser_node(row))
 
         return make_json_response(
             data=res,
+            result=page,
             status=200
         )
 
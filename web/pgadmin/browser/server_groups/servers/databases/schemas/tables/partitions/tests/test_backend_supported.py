@@ -72,6 +72,23 @@ class TestBackendSupport(BaseTestGenerator):
                  'partitions/sql/gpdb/#gpdb#5#/backend_support.sql', tid=123
              )
          )),
+        ('when kind of the table is already known, '
+         'should return whether it is partitioned and no query should be '
+         'done',
+         dict(
+             manager=dict(
+                 server_type="pg",
+                 version="10"
+             ),
+             input_arguments=dict(did=432, tid=123, relkind='p'),
+
+             collection_node_active=True,
+             connection_execution_return_value=[],
+
+             expected_return_value=True,
+             expect_error_response=False,
+             expected_number_calls_on_render_template=0
+         )),
         ('when error happens while querying the database, '
          'should return an internal server error',
          dict(
@@ -59,6 +59,10 @@ class RuleModule(CollectionNodeModule):
             if 'vid' not in kwargs:
                 return True
 
+            # Rules are not supported on the materialized views
+            if 'relkind' in kwargs:
+                return kwargs['relkind'] != 'm'
+
             self.template_path = 'rules/sql'
             SQL = render_template("/".join(
                 [self.template_path, 'backend_support.sql']
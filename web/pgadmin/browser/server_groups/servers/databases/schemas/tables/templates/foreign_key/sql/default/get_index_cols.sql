@@ -0,0 +1,9 @@
+{### Columns of the given indexes (see get_constraints.sql) ###}
+SELECT i.indexrelid AS oid,
+    pg_get_indexdef(i.indexrelid, i.n, true) AS column
+FROM (
+    SELECT indexrelid, generate_series(1, indnatts) AS n
+    FROM pg_index
+    WHERE indexrelid IN ({{ cids|join(', ') }})
+) i
+ORDER BY i.indexrelid, i.n
@@ -0,0 +1,13 @@
+{### Local and referenced columns of all the foreign keys of the table ###}
+SELECT ct.oid,
+    a1.attname as conattname,
+    a2.attname as confattname
+FROM (
+    SELECT oid, conrelid, confrelid, conkey, confkey,
+        generate_subscripts(conkey, 1) AS n
+    FROM pg_constraint
+    WHERE contype='f' AND conrelid = {{tid}}::oid
+) ct
+JOIN pg_attribute a1 ON (a1.attrelid = ct.conrelid AND a1.attnum = ct.conkey[ct.n])
+JOIN pg_attribute a2 ON (a2.attrelid = ct.confrelid AND a2.attnum = ct.confkey[ct.n])
+ORDER BY ct.oid, ct.n
@@ -0,0 +1,9 @@
+{### Key columns of all the index constraints of the table ###}
+SELECT i.indexrelid AS oid,
+    pg_get_indexdef(i.indexrelid, i.n, true) AS column
+FROM (
+    SELECT indexrelid, generate_series(1, indnkeyatts) AS n
+    FROM pg_index
+    WHERE indrelid = {{tid}}::oid
+) i
+ORDER BY i.indexrelid, i.n
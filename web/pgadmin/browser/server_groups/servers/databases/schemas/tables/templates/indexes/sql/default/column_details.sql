@@ -20,7 +20,7 @@ FROM (
           unnest(ARRAY(SELECT generate_series(1, i.indnatts) AS n)) AS attnum
       FROM
           pg_index i
-      WHERE i.indexrelid = {{idx}}::OID
+      WHERE {% if idx %}i.indexrelid = {{idx}}::OID{% else %}i.indrelid = {{tid}}::OID{% endif %}
 ) i
     LEFT JOIN pg_opclass o ON (o.oid = i.indclass[i.attnum - 1])
     LEFT OUTER JOIN pg_constraint c ON (c.conindid = i.indexrelid)
@@ -28,4 +28,4 @@ FROM (
     LEFT JOIN pg_attribute a ON (a.attrelid = i.indexrelid AND a.attnum = i.attnum)
     LEFT OUTER JOIN pg_collation coll ON a.attcollation=coll.oid
     LEFT OUTER JOIN pg_namespace nspc ON coll.collnamespace=nspc.oid
-ORDER BY i.attnum;
+ORDER BY i.indexrelid, i.attnum;
@@ -18,8 +18,8 @@ FROM (
           unnest(ARRAY(SELECT generate_series(1, i.indnatts) AS n)) AS attnum
       FROM
           pg_index i
-      WHERE i.indexrelid = {{idx}}::OID
+      WHERE {% if idx %}i.indexrelid = {{idx}}::OID{% else %}i.indrelid = {{tid}}::OID{% endif %}
 ) i
     LEFT JOIN pg_opclass o ON (o.oid = i.indclass[i.attnum - 1])
     LEFT JOIN pg_attribute a ON (a.attrelid = i.indexrelid AND a.attnum = i.attnum)
-ORDER BY i.attnum;
+ORDER BY i.indexrelid, i.attnum;
@@ -1,3 +1,4 @@
+{% import 'macros/paging.macros' as PAGING %}
 SELECT rel.oid, rel.relname AS name,
     (SELECT count(*) FROM pg_trigger WHERE tgrelid=rel.oid AND tgisinternal = FALSE) AS triggercount,
     (SELECT count(*) FROM pg_trigger WHERE tgrelid=rel.oid AND tgisinternal = FALSE AND tgenabled = 'O') AS has_enable_triggers,
@@ -12,4 +13,5 @@ FROM
     LEFT JOIN pg_namespace nsp ON rel.relnamespace = nsp.oid
     WHERE rel.relispartition
     {% if ptid %} AND rel.oid = {{ ptid }}::OID {% endif %}
-    ORDER BY rel.relname;
+    {{ PAGING.FILTER('rel.relname', 'rel.oid', paging) }}
+    {{ PAGING.ORDER('rel.relname', 'rel.oid', paging) }};
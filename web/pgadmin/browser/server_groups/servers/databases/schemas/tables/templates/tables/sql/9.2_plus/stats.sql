@@ -33,22 +33,8 @@ SELECT
     COALESCE((SELECT SUM(pg_relation_size(indexrelid))
                                 FROM pg_index WHERE indrelid=stat.relid)::int8, 0)
         AS {{ conn|qtIdent(_('Indexes size')) }}
-{% if is_pgstattuple %}
-{#== EXTENDED STATS ==#}
-    ,tuple_count AS {{ conn|qtIdent(_('Tuple count')) }},
-    tuple_len AS {{ conn|qtIdent(_('Tuple length')) }},
-    tuple_percent AS {{ conn|qtIdent(_('Tuple percent')) }},
-    dead_tuple_count AS {{ conn|qtIdent(_('Dead tuple count')) }},
-    dead_tuple_len AS {{ conn|qtIdent(_('Dead tuple length')) }},
-    dead_tuple_percent AS {{ conn|qtIdent(_('Dead tuple percent')) }},
-    free_space AS {{ conn|qtIdent(_('Free space')) }},
-    free_percent AS {{ conn|qtIdent(_('Free percent')) }}
-FROM
-    pgstattuple('{{schema_name}}.{{table_name}}'), pg_stat_all_tables stat
-{% else %}
 FROM
     pg_stat_all_tables stat
-{% endif %}
 JOIN
     pg_statio_all_tables statio ON stat.relid = statio.relid
 JOIN
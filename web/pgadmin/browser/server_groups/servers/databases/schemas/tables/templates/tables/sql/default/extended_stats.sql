@@ -0,0 +1,12 @@
+{#== EXTENDED STATS (pgstattuple scans the whole table) ==#}
+SELECT
+    tuple_count AS {{ conn|qtIdent(_('Tuple count')) }},
+    tuple_len AS {{ conn|qtIdent(_('Tuple length')) }},
+    tuple_percent AS {{ conn|qtIdent(_('Tuple percent')) }},
+    dead_tuple_count AS {{ conn|qtIdent(_('Dead tuple count')) }},
+    dead_tuple_len AS {{ conn|qtIdent(_('Dead tuple length')) }},
+    dead_tuple_percent AS {{ conn|qtIdent(_('Dead tuple percent')) }},
+    free_space AS {{ conn|qtIdent(_('Free space')) }},
+    free_percent AS {{ conn|qtIdent(_('Free percent')) }}
+FROM
+    pgstattuple({{ tid }}::oid)
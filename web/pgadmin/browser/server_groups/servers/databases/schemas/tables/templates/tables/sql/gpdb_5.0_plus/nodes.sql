@@ -1,3 +1,4 @@
+{% import 'macros/paging.macros' as PAGING %}
 SELECT rel.oid, rel.relname AS name,
     (SELECT count(*) FROM pg_trigger WHERE tgrelid=rel.oid) AS triggercount,
     (SELECT count(*) FROM pg_trigger WHERE tgrelid=rel.oid AND tgenabled = 'O') AS has_enable_triggers,
@@ -11,4 +12,5 @@ FROM pg_class rel
     {% if tid %}
       AND rel.oid = {{tid}}::OID
     {% endif %}
-    ORDER BY rel.relname;
+    {{ PAGING.FILTER('rel.relname', 'rel.oid', paging) }}
+    {{ PAGING.ORDER('rel.relname', 'rel.oid', paging) }};
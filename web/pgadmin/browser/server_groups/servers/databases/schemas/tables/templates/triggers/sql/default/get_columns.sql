@@ -1,4 +1,4 @@
-SELECT att.attname as name
+SELECT att.attnum, att.attname as name
 FROM pg_attribute att
     WHERE att.attrelid = {{tid}}::oid
     AND att.attnum IN ({{ clist }})
@@ -0,0 +1,63 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+import sys
+from pgadmin.browser.server_groups.servers.databases.schemas.tables import \
+    BaseTableView
+from pgadmin.utils.route import BaseTestGenerator
+
+if sys.version_info < (3, 3):
+    from mock import patch, MagicMock
+else:
+    from unittest.mock import patch, MagicMock
+
+
+class TestBackendSupportKeywords(BaseTestGenerator):
+    """
+    The kind of the table is fetched for the child modules only, when they
+    can use it.
+    """
+    scenarios = [
+        ('When tid is not present in arguments',
+         dict(server_type='pg', version=110000, kwargs=dict(did=1),
+              expected_fetch=False)),
+        ('When the server is older than PostgreSQL 10',
+         dict(server_type='pg', version=90600, kwargs=dict(did=1, tid=2),
+              expected_fetch=False)),
+        ('When the server is Greenplum',
+         dict(server_type='gpdb', version=90400, kwargs=dict(did=1, tid=2),
+              expected_fetch=False)),
+        ('When the server is PostgreSQL 10',
+         dict(server_type='pg', version=100000, kwargs=dict(did=1, tid=2),
+              expected_fetch=True)),
+        ('When the server is EDB Advanced Server 11',
+         dict(server_type='ppas', version=110000, kwargs=dict(did=1, tid=2),
+              expected_fetch=True)),
+    ]
+
+    @patch('pgadmin.browser.server_groups.servers.databases.schemas.tables'
+           '.utils.relation_backend_support_keywords')
+    def runTest(self, relkind_mock):
+        relkind_mock.side_effect = \
+            lambda conn, rid, keywords: dict(keywords, relkind='p')
+        manager = MagicMock(server_type=self.server_type,
+                            version=self.version)
+        conn = MagicMock()
+
+        keywords = BaseTableView.backend_support_keywords(
+            MagicMock(), manager, conn, **self.kwargs
+        )
+
+        self.assertEqual(relkind_mock.called, self.expected_fetch)
+        if self.expected_fetch:
+            relkind_mock.assert_called_with(
+                conn, self.kwargs['tid'], self.kwargs
+            )
+            self.assertEqual(keywords, dict(self.kwargs, relkind='p'))
+        else:
+            self.assertEqual(keywords, self.kwargs)
@@ -0,0 +1,204 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import sys
+
+from pgadmin.browser.server_groups.servers.databases.schemas.tables import \
+    TableView
+from pgadmin.utils.route import BaseTestGenerator
+
+if sys.version_info < (3, 3):
+    from mock import patch, MagicMock
+else:
+    from unittest.mock import patch, MagicMock
+
+TABLE_UTILS = 'pgadmin.browser.server_groups.servers.databases.schemas.' \
+              'tables.utils.'
+SCHEMA_UTILS = 'pgadmin.browser.server_groups.servers.databases.schemas.' \
+               'utils.'
+
+# Number of the child objects (of each type) of a table
+CHILDREN = 2
+
+
+def fake_rows(sql, base):
+    """
+    Returns the rows for the (fake) sql, which is the path of the template,
+    of the object with the given id (base of the ids of its child objects).
+    """
+    if sql.startswith('tables/') and sql.endswith('/properties.sql'):
+        return [{'oid': base, 'name': 'tab{0}'.format(base),
+                 'schema': 'public', 'typoid': None,
+                 'coll_inherits': ['public.parent']}]
+    if sql.endswith('/get_inherits.sql'):
+        return [{'oid': 99, 'inherits': 'public.parent'}]
+    if sql.endswith('/get_columns_for_table.sql'):
+        return [{'name': 'col1', 'inheritedfrom': 'public.parent'}]
+    if sql.startswith('columns/') and sql.endswith('/properties.sql'):
+        return [{'name': 'col{0}'.format(attnum), 'attnum': attnum,
+                 'atttypid': 23, 'typnspname': 'pg_catalog',
+                 'typname': 'integer', 'isdup': False, 'attndims': 0,
+                 'atttypmod': -1, 'cltype': 'integer'}
+                for attnum in range(1, CHILDREN + 1)]
+
+    rows = []
+    for oid in range(base * 100 + 1, base * 100 + CHILDREN + 1):
+        if sql.startswith('indexes/') and sql.endswith('/properties.sql'):
+            rows.append({'oid': oid, 'name': 'idx{0}'.format(oid)})
+        elif sql.endswith('/column_details.sql'):
+            rows.append({'indexrelid': oid, 'attdef': 'col',
+                         'collnspname': '', 'opcname': None,
+                         'options': ['ASC', 'NULLS LAST']})
+        elif sql.endswith('/include_details.sql'):
+            rows.append({'indexrelid': oid, 'colname': 'col'})
+        elif sql.startswith('triggers/') and \
+                sql.endswith('/properties.sql'):
+            rows.append({'oid': oid, 'name': 'trig{0}'.format(oid),
+                         'tgfoid': 7, 'lanname': 'plpgsql',
+                         'custom_tgargs': [], 'tgattr': '1',
+                         'is_enable_trigger': True})
+        elif sql.endswith('/get_triggerfunctions.sql'):
+            rows.append({'oid': 7, 'tfunctions': 'public.func'})
+        elif sql.endswith('/get_columns.sql'):
+            rows.append({'attnum': 1, 'name': 'col1'})
+        elif sql.startswith('rules/'):
+            rows.append({'oid': oid, 'name': 'rule{0}'.format(oid)})
+        elif sql.startswith('index_constraint/') and \
+                sql.endswith('/properties.sql'):
+            rows.append({'oid': oid, 'name': 'con{0}'.format(oid)})
+        elif sql.startswith('index_constraint/'):
+            rows.append({'oid': oid, 'column': '"col"', 'colname': 'col'})
+        elif sql.startswith('foreign_key/') and \
+                sql.endswith('/properties.sql'):
+            rows.append({'oid': oid, 'confrelid': 10, 'refnsp': 'public',
+                         'reftab': 'ref'})
+        elif sql.endswith('/get_table_constraint_cols.sql'):
+            rows.append({'oid': oid, 'conattname': 'col',
+                         'confattname': 'col'})
+        elif sql.endswith('/get_constraints.sql'):
+            rows.append({'oid': oid, 'idxname': 'con{0}'.format(oid)})
+        elif sql.endswith('/get_index_cols.sql'):
+            rows.append({'oid': oid, 'column': 'col'})
+        elif sql.startswith('exclusion_constraint/') and \
+                sql.endswith('/properties.sql'):
+            rows.append({'oid': oid, 'col_count': 1})
+        elif sql.endswith('/get_constraint_cols.sql'):
+            rows.append({'options': 0, 'coldef': 'col', 'opcname': None,
+                         'oprname': '=', 'datatype': 'integer'})
+    return rows
+
+
+def fake_result(sql):
+    """
+    Returns the result of the (fake) sql, i.e. the path of the template of
+    the query of an object, or the rendered prefetch/sql/*.sql template.
+    """
+    rows = []
+    if isinstance(sql, dict) and sql['path'] == 'prefetch/sql/lateral.sql':
+        for key in sql['keys']:
+            for row in fake_rows(sql['query'], key[0]):
+                for param, value in zip(sql['params'], key):
+                    row['prefetch_{0}'.format(param)] = value
+                rows.append(row)
+    elif isinstance(sql, dict):
+        for key, query in sql['queries']:
+            for row in fake_rows(query, key):
+                row['prefetch_key'] = key
+                rows.append(row)
+    else:
+        rows = fake_rows(sql, 0)
+    return True, {'rows': rows}
+
+
+class BulkSQLRoundTripsTestCase(BaseTestGenerator):
+    """
+    Test the number of the queries to generate the reverse engineered sql
+    of the tables of a schema (with the catalogs fetched in bulk) does not
+    grow with the number of the tables.
+    """
+    scenarios = [
+        ('Round trips for the tables on PostgreSQL 10',
+         dict(
+             version=100000,
+             expected_round_trips=22
+         )),
+        ('Round trips for the tables (with INCLUDE columns) on '
+         'PostgreSQL 11',
+         dict(
+             version=110000,
+             expected_round_trips=25
+         )),
+    ]
+
+    @patch(SCHEMA_UTILS + 'render_template')
+    @patch(TABLE_UTILS + 'parse_priv_to_db')
+    @patch(TABLE_UTILS + 'parse_rule_definition')
+    @patch(TABLE_UTILS + 'trigger_definition')
+    @patch(TABLE_UTILS + 'render_template')
+    def runTest(self, render_template_mock, trigger_definition_mock,
+                parse_rule_definition_mock, parse_priv_to_db_mock,
+                schema_render_template_mock):
+        render_template_mock.side_effect = lambda path, **kwargs: path
+        schema_render_template_mock.side_effect = \
+            lambda path, **kwargs: dict(kwargs, path=path) \
+            if path.startswith('prefetch/') else path
+        trigger_definition_mock.side_effect = lambda data: data
+        parse_rule_definition_mock.side_effect = lambda res: res['rows'][0]
+
+        for count in (1, 30):
+            subject = self._get_subject()
+            conn = subject.conn
+            tids = list(range(1, count + 1))
+
+            prefetch, error = subject.bulk_fetch(1, 2, tids)
+            self.assertIsNone(error)
+
+            for tid in tids:
+                main_sql = []
+                sql = subject._get_reverse_engineered_sql(
+                    1, 2, tid, main_sql,
+                    dict(prefetch.rows('properties', tid)['rows'][0]),
+                    prefetch
+                )
+                self.assertEqual(sql, '\n'.join(main_sql).strip('\n'))
+                # Table (header, and create), indexes, triggers, and rules
+                self.assertEqual(len(main_sql), 2 + CHILDREN * 3)
+
+            self.assertEqual(
+                conn.execute_dict.call_count +
+                conn.execute_2darray.call_count +
+                conn.execute_scalar.call_count,
+                self.expected_round_trips
+            )
+
+    def _get_subject(self):
+        subject = TableView(cmd='sql')
+        subject.conn = MagicMock()
+        subject.conn.execute_dict.side_effect = \
+            subject.conn.execute_2darray.side_effect = fake_result
+        subject.manager = MagicMock(version=self.version)
+        subject.datlastsysoid = 0
+        subject.blueprint = MagicMock(show_system_objects=False)
+        subject.table_template_path = 'tables/sql/#10#'
+        subject.partition_template_path = 'partitions/sql/pg/#10#'
+        subject.column_template_path = 'columns/sql/#10#'
+        subject.check_constraint_template_path = 'check_constraint/sql/#10#'
+        subject.exclusion_constraint_template_path = \
+            'exclusion_constraint/sql/#10#'
+        subject.index_constraint_template_path = 'index_constraint/sql/#10#'
+        subject.foreign_key_template_path = 'foreign_key/sql/#10#'
+        subject.index_template_path = 'indexes/sql/#10#'
+        subject.trigger_template_path = 'triggers/sql/#10#'
+        subject.rules_template_path = 'rules/sql'
+        subject.acl = ['a', 'r', 'w', 'd', 'D', 'x', 't']
+        subject.column_acl = ['a', 'r', 'w', 'x']
+        subject.qtIdent = MagicMock(return_value='public.tab')
+        subject.parse_vacuum_data = \
+            lambda conn, result, type, prefetch=None: []
+        return subject
@@ -0,0 +1,72 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import sys
+
+from pgadmin.browser.server_groups.servers.databases.schemas.tables import \
+    BaseTableView
+from pgadmin.utils.route import BaseTestGenerator
+from .test_reverse_engineered_sql_round_trips import TABLE_UTILS, fake_result
+
+if sys.version_info < (3, 3):
+    from mock import patch, MagicMock
+else:
+    from unittest.mock import patch, MagicMock
+
+
+class ConstraintsRoundTripsTestCase(BaseTestGenerator):
+    """
+    Test the number of the queries to fetch the index constraints, and the
+    foreign keys of a table does not grow with the number of constraints.
+    """
+    scenarios = [
+        ('Round trips for the constraints on PostgreSQL 10',
+         dict(
+             version=100000,
+             expected_round_trips=7
+         )),
+        ('Round trips for the constraints (with INCLUDE columns) on '
+         'PostgreSQL 11',
+         dict(
+             version=110000,
+             expected_round_trips=8
+         )),
+    ]
+
+    @patch(TABLE_UTILS + 'render_template')
+    def runTest(self, render_template_mock):
+        render_template_mock.side_effect = lambda path, **kwargs: path
+
+        for count in (1, 40):
+            subject = BaseTableView(cmd='sql')
+            subject.conn = MagicMock()
+            subject.conn.execute_dict.side_effect = \
+                subject.conn.execute_2darray.side_effect = \
+                lambda sql: fake_result(sql, count)
+            subject.manager = MagicMock(version=self.version)
+            subject.index_constraint_template_path = \
+                'index_constraint/sql/#10#'
+            subject.foreign_key_template_path = 'foreign_key/sql/#10#'
+
+            data = subject._index_constraints_formatter(1, 3, dict())
+            data = subject._foreign_key_formatter(3, data)
+
+            self.assertEqual(
+                subject.conn.execute_dict.call_count +
+                subject.conn.execute_2darray.call_count,
+                self.expected_round_trips
+            )
+            self.assertEqual(len(data['primary_key']), count)
+            self.assertEqual(len(data['foreign_key']), count)
+            self.assertEqual(
+                data['foreign_key'][0]['columns'][0]['local_column'], 'col'
+            )
+            self.assertEqual(
+                data['foreign_key'][0]['coveringindex'], 'con1'
+            )
@@ -0,0 +1,136 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import sys
+
+from pgadmin.browser.server_groups.servers.databases.schemas.tables import \
+    BaseTableView
+from pgadmin.utils.route import BaseTestGenerator
+
+if sys.version_info < (3, 3):
+    from mock import patch, MagicMock
+else:
+    from unittest.mock import patch, MagicMock
+
+TABLE_UTILS = 'pgadmin.browser.server_groups.servers.databases.schemas.' \
+              'tables.utils.'
+
+
+def fake_result(sql, count):
+    """
+    Returns the rows for the (fake) sql, which is the path of the template,
+    for a table with 'count' indexes, triggers, rules, and constraints.
+    """
+    rows = []
+    for oid in range(1, count + 1):
+        if sql.startswith('indexes/') and sql.endswith('/properties.sql'):
+            rows.append({'oid': oid, 'name': 'idx{0}'.format(oid)})
+        elif sql.endswith('/column_details.sql'):
+            rows.append({'indexrelid': oid, 'attdef': 'col',
+                         'collnspname': '', 'opcname': None,
+                         'options': ['ASC', 'NULLS LAST']})
+        elif sql.endswith('/include_details.sql'):
+            rows.append({'indexrelid': oid, 'colname': 'col'})
+        elif sql.startswith('triggers/') and \
+                sql.endswith('/properties.sql'):
+            rows.append({'oid': oid, 'name': 'trig{0}'.format(oid),
+                         'tgfoid': 100 + oid, 'lanname': 'plpgsql',
+                         'custom_tgargs': [], 'tgattr': str(oid),
+                         'is_enable_trigger': True})
+        elif sql.endswith('/get_triggerfunctions.sql'):
+            rows.append({'oid': 100 + oid, 'tfunctions': 'public.func'})
+        elif sql.endswith('/get_columns.sql'):
+            rows.append({'attnum': oid, 'name': 'col{0}'.format(oid)})
+        elif sql.startswith('rules/'):
+            rows.append({'oid': oid, 'name': 'rule{0}'.format(oid)})
+        elif sql.startswith('index_constraint/') and \
+                sql.endswith('/properties.sql'):
+            rows.append({'oid': oid, 'name': 'con{0}'.format(oid),
+                         'col_count': 1})
+        elif sql.startswith('index_constraint/'):
+            rows.append({'oid': oid, 'column': '"col"', 'colname': 'col'})
+        elif sql.startswith('foreign_key/') and \
+                sql.endswith('/properties.sql'):
+            rows.append({'oid': oid, 'confrelid': 10, 'refnsp': 'public',
+                         'reftab': 'ref'})
+        elif sql.endswith('/get_table_constraint_cols.sql'):
+            rows.append({'oid': oid, 'conattname': 'col',
+                         'confattname': 'col'})
+        elif sql.endswith('/get_constraints.sql'):
+            rows.append({'oid': oid, 'idxname': 'con{0}'.format(oid),
+                         'col_count': 1})
+        elif sql.endswith('/get_index_cols.sql'):
+            rows.append({'oid': oid, 'column': 'col'})
+    return True, {'rows': rows}
+
+
+class ReverseEngineeredSQLRoundTripsTestCase(BaseTestGenerator):
+    """
+    Test the number of the queries to generate the reverse engineered sql
+    of a table does not grow with the number of its child objects.
+    """
+    scenarios = [
+        ('Round trips for indexes, triggers, and rules on PostgreSQL 10',
+         dict(
+             version=100000,
+             expected_round_trips=6
+         )),
+        ('Round trips for indexes (with INCLUDE columns), triggers, and '
+         'rules on PostgreSQL 11',
+         dict(
+             version=110000,
+             expected_round_trips=7
+         )),
+    ]
+
+    @patch(TABLE_UTILS + 'ajax_response')
+    @patch(TABLE_UTILS + 'parse_rule_definition')
+    @patch(TABLE_UTILS + 'trigger_definition')
+    @patch(TABLE_UTILS + 'render_template')
+    def runTest(self, render_template_mock, trigger_definition_mock,
+                parse_rule_definition_mock, ajax_response_mock):
+        render_template_mock.side_effect = lambda path, **kwargs: path
+        trigger_definition_mock.side_effect = lambda data: data
+        parse_rule_definition_mock.side_effect = lambda res: res['rows'][0]
+
+        for count in (1, 40):
+            subject = self._get_subject(count)
+            conn = subject.conn
+
+            main_sql = []
+            subject.get_reverse_engineered_sql(
+                did=1, scid=2, tid=3, main_sql=main_sql,
+                data={'schema': 'public', 'name': 'tab'}
+            )
+
+            self.assertEqual(
+                conn.execute_dict.call_count +
+                conn.execute_2darray.call_count,
+                self.expected_round_trips
+            )
+            # Table (header, and create), indexes, triggers, and rules
+            self.assertEqual(len(main_sql), 2 + count * 3)
+
+    def _get_subject(self, count):
+        subject = BaseTableView(cmd='sql')
+        subject.conn = MagicMock()
+        subject.conn.execute_dict.side_effect = \
+            subject.conn.execute_2darray.side_effect = \
+            lambda sql: fake_result(sql, count)
+        subject.manager = MagicMock(version=self.version)
+        subject.datlastsysoid = 0
+        subject.blueprint = MagicMock(show_system_objects=False)
+        subject.table_template_path = 'tables/sql/#10#'
+        subject.index_template_path = 'indexes/sql/#10#'
+        subject.trigger_template_path = 'triggers/sql/#10#'
+        subject.rules_template_path = 'rules/sql'
+        subject.qtIdent = MagicMock(return_value='public.tab')
+        subject._formatter = \
+            lambda did, scid, tid, data, prefetch=None: data
+        return subject
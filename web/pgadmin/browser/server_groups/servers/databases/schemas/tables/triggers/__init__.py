@@ -78,6 +78,10 @@ class TriggerModule(CollectionNodeModule):
             if 'vid' not in kwargs:
                 return True
 
+            # Triggers are not supported on the materialized views
+            if 'relkind' in kwargs:
+                return kwargs['relkind'] != 'm'
+
             template_path = 'triggers/sql/#{0}#'.format(manager.version)
             SQL = render_template("/".join(
                 [template_path, 'backend_support.sql']), vid=kwargs['vid']
@@ -18,17 +18,26 @@ from flask_babelex import gettext
 from pgadmin.browser.server_groups.servers.databases.schemas\
     .tables.base_partition_table import BasePartitionTable
 from pgadmin.utils.ajax import make_json_response, internal_server_error, \
-    make_response as ajax_response
+    make_response as ajax_response, gone
 from pgadmin.browser.server_groups.servers.databases.schemas.utils \
-    import DataTypeReader, trigger_definition, parse_rule_definition
+    import DataTypeReader, trigger_definition, parse_rule_definition, \
+    relation_backend_support_keywords, CatalogPrefetch
+from pgadmin.browser.server_groups.servers.databases.extensions.utils \
+    import is_extension_installed
 from pgadmin.browser.server_groups.servers.utils import parse_priv_from_db, \
     parse_priv_to_db
 from pgadmin.browser.utils import PGChildNodeView
 from pgadmin.utils import IS_PY2
+from pgadmin.utils.background_query import BackgroundQuery, start_query, \
+    get_query, cancel_query
 from pgadmin.utils.compile_template_name import compile_template_path
 from pgadmin.utils.driver import get_driver
 from config import PG_DEFAULT_DRIVER
 
+# If we are in Python3
+if not IS_PY2:
+    unicode = str
+
 
 class BaseTableView(PGChildNodeView, BasePartitionTable):
     """
@@ -41,15 +50,15 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
         database connection before running view, it will also attaches
         manager,conn & template_path properties to self
 
-    * _formatter(data, tid)
+    * _formatter(did, scid, tid, data, prefetch=None)
       - It will return formatted output of query result
         as per client model format
 
-    * _columns_formatter(tid, data):
+    * _columns_formatter(tid, data, prefetch=None):
       - It will return formatted output of query result
         as per client model format for column node
 
-    * _index_constraints_formatter(self, did, tid, data):
+    * _index_constraints_formatter(self, did, tid, data, prefetch=None):
       - It will return formatted output of query result
         as per client model format for index constraint node
 
@@ -66,14 +75,26 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
       - This function get the dependencies and return ajax response
         for the table node.
 
-    * get_table_statistics(self, tid):
+    * get_table_statistics(self, did, scid, tid):
       - Returns the statistics for a particular table if tid is specified,
         otherwise it will return statistics for all the tables in that
         schema.
+
+    * get_table_extended_statistics(self, did, tid):
+      - Returns the extended statistics of the table computed in the
+        background.
+
+    * cancel_table_extended_statistics(self, did, tid):
+      - Cancel the computation of the extended statistics of the table.
+
     * get_reverse_engineered_sql(self, did, scid, tid, main_sql, data):
       - This function will creates reverse engineered sql for
         the table object.
 
+    * bulk_fetch(self, did, scid, tids):
+      - This function will fetch the catalogs of the given tables in bulk
+        for their reverse engineered sql.
+
     * reset_statistics(self, scid, tid):
       - This function will reset statistics of table.
 
@@ -155,6 +176,24 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
 
         return wrap
 
+    def backend_support_keywords(self, manager, conn, **kwargs):
+        """
+        Fetch the kind of the table once for all the child modules (i.e.
+        partitions, indexes), which depend on it.
+
+        Only the partitioned tables (PostgreSQL 10 and later) are told apart
+        by the kind of the table, hence - it is not fetched for the other
+        servers.
+        """
+        keywords = kwargs.copy()
+        if 'tid' not in kwargs or manager.server_type == 'gpdb' or \
+                manager.version < 100000:
+            return keywords
+
+        return relation_backend_support_keywords(
+            conn, kwargs['tid'], keywords
+        )
+
     def get_trigger_function_schema(self, data):
         """
         This function will return trigger function with schema name
@@ -197,16 +236,25 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
         formatted_args = ["'{0}'".format(arg) for arg in args]
         return ', '.join(formatted_args)
 
-    def _columns_formatter(self, tid, data):
+    def _columns_formatter(self, tid, data, prefetch=None):
         """
         Args:
             tid: Table OID
             data: dict of query result
+            prefetch: CatalogPrefetch with the catalogs of the table (if
+                      fetched in bulk)
 
         Returns:
             It will return formatted output of query result
             as per client model format for column node
         """
+        # The types, which a column can be altered to, are needed only in
+        # the edit mode, hence - they are not fetched, when the catalogs of
+        # the tables are fetched in bulk for their reverse engineered sql.
+        edit_types = prefetch is None
+        if prefetch is None:
+            prefetch = CatalogPrefetch(self.conn)
+
         for column in data['columns']:
 
             # We need to format variables according to client js collection
@@ -235,7 +283,9 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
                     [self.column_template_path, 'acl.sql']),
                     tid=tid, clid=column['attnum']
                 )
-                status, acl = self.conn.execute_dict(SQL)
+                status, acl = prefetch.execute_dict(
+                    'column_acl', (tid, column['attnum']), SQL
+                )
 
                 if not status:
                     return internal_server_error(errormsg=acl)
@@ -281,24 +331,27 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
                         column['attlen'] = matchObj.group(1)
                         column['attprecision'] = None
 
-                SQL = render_template("/".join([self.column_template_path,
-                                                'is_referenced.sql']),
-                                      tid=tid, clid=column['attnum'])
-
-                status, is_reference = self.conn.execute_scalar(SQL)
-
                 edit_types_list = list()
                 # We will need present type in edit mode
                 edit_types_list.append(column['cltype'])
 
-                if int(is_reference) == 0:
-                    SQL = render_template("/".join([self.column_template_path,
-                                                    'edit_mode_types.sql']),
-                                          type_id=type_id)
-                    status, rset = self.conn.execute_2darray(SQL)
+                if edit_types:
+                    SQL = render_template(
+                        "/".join([self.column_template_path,
+                                  'is_referenced.sql']),
+                        tid=tid, clid=column['attnum'])
+
+                    status, is_reference = self.conn.execute_scalar(SQL)
+
+                    if int(is_reference) == 0:
+                        SQL = render_template(
+                            "/".join([self.column_template_path,
+                                      'edit_mode_types.sql']),
+                            type_id=type_id)
+                        status, rset = self.conn.execute_2darray(SQL)
 
-                    for row in rset['rows']:
-                        edit_types_list.append(row['typname'])
+                        for row in rset['rows']:
+                            edit_types_list.append(row['typname'])
 
                 column['edit_types'] = edit_types_list
                 column['cltype'] = DataTypeReader.parse_type_name(
@@ -320,22 +373,53 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
 
         return data
 
-    def _index_constraints_formatter(self, did, tid, data):
+    def _index_constraints_formatter(self, did, tid, data, prefetch=None):
         """
         Args:
             tid: Table OID
             data: dict of query result
+            prefetch: CatalogPrefetch with the catalogs of the table (if
+                      fetched in bulk)
 
         Returns:
             It will return formatted output of query result
             as per client model format for index constraint node
         """
+        if prefetch is None:
+            prefetch = CatalogPrefetch(self.conn)
 
         # We will fetch all the index constraints for the table
         index_constraints = {
             'p': 'primary_key', 'u': 'unique_constraint'
         }
 
+        # Fetch the columns (and INCLUDE columns) of all the index
+        # constraints of the table at once, rather than per constraint
+        columns = self._get_table_constraint_columns(
+            self.index_constraint_template_path, tid, prefetch,
+            'index_constraint_columns'
+        )
+        if not isinstance(columns, dict):
+            return columns
+
+        include = None
+        # INCLUDE clause in index is supported from PG-11+
+        if self.manager.version >= 110000:
+            sql = render_template(
+                "/".join([self.index_constraint_template_path,
+                          'get_constraint_include.sql']),
+                tid=tid)
+            status, res = prefetch.execute_dict(
+                'index_constraint_include', tid, sql
+            )
+
+            if not status:
+                return internal_server_error(errormsg=res)
+
+            include = dict()
+            for row in res['rows']:
+                include.setdefault(row['oid'], []).append(row['colname'])
+
         for ctype in index_constraints.keys():
             data[index_constraints[ctype]] = []
 
@@ -347,85 +431,104 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
                 tid=tid,
                 constraint_type=ctype
             )
-            status, res = self.conn.execute_dict(sql)
+            status, res = prefetch.execute_dict(
+                'index_constraints_{0}'.format(ctype), tid, sql
+            )
 
             if not status:
                 return internal_server_error(errormsg=res)
 
             for row in res['rows']:
                 result = row
-                sql = render_template(
-                    "/".join([self.index_constraint_template_path,
-                              'get_constraint_cols.sql']),
-                    cid=row['oid'],
-                    colcnt=row['col_count'])
-                status, res = self.conn.execute_dict(sql)
+                result['columns'] = [
+                    {"column": r['column'].strip('"')}
+                    for r in columns.get(row['oid'], [])
+                ]
 
-                if not status:
-                    return internal_server_error(errormsg=res)
+                if include is not None:
+                    result['include'] = include.get(row['oid'], [])
 
-                columns = []
-                for r in res['rows']:
-                    columns.append({"column": r['column'].strip('"')})
+                # If not exists then create list and/or append into
+                # existing list [ Adding into main data dict]
+                data.setdefault(index_constraints[ctype], []).append(result)
 
-                result['columns'] = columns
+        return data
 
-                # INCLUDE clause in index is supported from PG-11+
-                if self.manager.version >= 110000:
-                    sql = render_template(
-                        "/".join([self.index_constraint_template_path,
-                                  'get_constraint_include.sql']),
-                        cid=row['oid'])
-                    status, res = self.conn.execute_dict(sql)
+    def _get_table_constraint_columns(self, template_path, tid,
+                                      prefetch=None, name=None):
+        """
+        Args:
+            template_path: Template path of the constraint node
+            tid: Table OID
+            prefetch: CatalogPrefetch with the catalogs of the table (if
+                      fetched in bulk)
+            name: Name of the prefetched rows of the columns
 
-                    if not status:
-                        return internal_server_error(errormsg=res)
+        Returns:
+            It will return the columns of all the constraints of the table
+            (using get_table_constraint_cols.sql) grouped by the constraint
+            oid, or an error response
+        """
+        if prefetch is None:
+            prefetch = CatalogPrefetch(self.conn)
 
-                    result['include'] = [col['colname'] for col in res['rows']]
+        sql = render_template(
+            "/".join([template_path, 'get_table_constraint_cols.sql']),
+            tid=tid
+        )
+        status, res = prefetch.execute_dict(name, tid, sql)
 
-                # If not exists then create list and/or append into
-                # existing list [ Adding into main data dict]
-                data.setdefault(index_constraints[ctype], []).append(result)
+        if not status:
+            return internal_server_error(errormsg=res)
 
-        return data
+        columns = dict()
+        for row in res['rows']:
+            columns.setdefault(row['oid'], []).append(row)
 
-    def _foreign_key_formatter(self, tid, data):
+        return columns
+
+    def _foreign_key_formatter(self, tid, data, prefetch=None):
         """
         Args:
             tid: Table OID
             data: dict of query result
+            prefetch: CatalogPrefetch with the catalogs of the table (if
+                      fetched in bulk)
 
         Returns:
             It will return formatted output of query result
             as per client model format for foreign key constraint node
         """
+        if prefetch is None:
+            prefetch = CatalogPrefetch(self.conn)
 
         # We will fetch all the index constraints for the table
         sql = render_template("/".join([self.foreign_key_template_path,
                                         'properties.sql']),
                               tid=tid)
 
-        status, result = self.conn.execute_dict(sql)
+        status, result = prefetch.execute_dict('foreign_keys', tid, sql)
 
         if not status:
             return internal_server_error(errormsg=result)
 
-        for fk in result['rows']:
+        if len(result['rows']) == 0:
+            return data
 
-            sql = render_template("/".join([self.foreign_key_template_path,
-                                            'get_constraint_cols.sql']),
-                                  tid=tid,
-                                  keys=zip(fk['confkey'], fk['conkey']),
-                                  confrelid=fk['confrelid'])
-
-            status, res = self.conn.execute_dict(sql)
+        fk_columns = self._get_table_constraint_columns(
+            self.foreign_key_template_path, tid, prefetch,
+            'foreign_key_columns'
+        )
+        if not isinstance(fk_columns, dict):
+            return fk_columns
 
-            if not status:
-                return internal_server_error(errormsg=res)
+        # Indexes of the table, which can cover the foreign keys
+        index_columns = self.get_index_columns(tid, prefetch)
 
+        for fk in result['rows']:
             columns = []
             cols = []
-            for row in res['rows']:
+            for row in fk_columns.get(fk['oid'], []):
                 columns.append({"local_column": row['conattname'],
                                 "references": fk['confrelid'],
                                 "referenced": row['confattname']})
@@ -433,18 +536,12 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
 
             fk['columns'] = columns
 
-            SQL = render_template("/".join([self.foreign_key_template_path,
-                                            'get_parent.sql']),
-                                  tid=fk['columns'][0]['references'])
-
-            status, rset = self.conn.execute_2darray(SQL)
-            if not status:
-                return internal_server_error(errormsg=rset)
-
-            fk['remote_schema'] = rset['rows'][0]['schema']
-            fk['remote_table'] = rset['rows'][0]['table']
+            fk['remote_schema'] = fk['refnsp']
+            fk['remote_table'] = fk['reftab']
 
-            coveringindex = self.search_coveringindex(tid, cols)
+            coveringindex = self.search_coveringindex(
+                tid, cols, index_columns
+            )
 
             fk['coveringindex'] = coveringindex
             if coveringindex:
@@ -459,23 +556,27 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
 
         return data
 
-    def _check_constraint_formatter(self, tid, data):
+    def _check_constraint_formatter(self, tid, data, prefetch=None):
         """
         Args:
             tid: Table OID
             data: dict of query result
+            prefetch: CatalogPrefetch with the catalogs of the table (if
+                      fetched in bulk)
 
         Returns:
             It will return formatted output of query result
             as per client model format for check constraint node
         """
+        if prefetch is None:
+            prefetch = CatalogPrefetch(self.conn)
 
         # We will fetch all the index constraints for the table
         SQL = render_template("/".join([self.check_constraint_template_path,
                                         'properties.sql']),
                               tid=tid)
 
-        status, res = self.conn.execute_dict(SQL)
+        status, res = prefetch.execute_dict('check_constraints', tid, SQL)
 
         if not status:
             return internal_server_error(errormsg=res)
@@ -486,16 +587,20 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
 
         return data
 
-    def _exclusion_constraint_formatter(self, did, tid, data):
+    def _exclusion_constraint_formatter(self, did, tid, data, prefetch=None):
         """
         Args:
             tid: Table OID
             data: dict of query result
+            prefetch: CatalogPrefetch with the catalogs of the table (if
+                      fetched in bulk)
 
         Returns:
             It will return formatted output of query result
             as per client model format for exclusion constraint node
         """
+        if prefetch is None:
+            prefetch = CatalogPrefetch(self.conn)
 
         # We will fetch all the index constraints for the table
         sql = render_template(
@@ -505,7 +610,9 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
             did=did, tid=tid
         )
 
-        status, result = self.conn.execute_dict(sql)
+        status, result = prefetch.execute_dict(
+            'exclusion_constraints', tid, sql
+        )
 
         if not status:
             return internal_server_error(errormsg=result)
@@ -518,7 +625,10 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
                 cid=ex['oid'],
                 colcnt=ex['col_count'])
 
-            status, res = self.conn.execute_dict(sql)
+            status, res = prefetch.execute_dict(
+                'exclusion_constraint_columns', (ex['oid'], ex['col_count']),
+                sql
+            )
 
             if not status:
                 return internal_server_error(errormsg=res)
@@ -548,7 +658,9 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
                     "/".join([self.exclusion_constraint_template_path,
                               'get_constraint_include.sql']),
                     cid=ex['oid'])
-                status, res = self.conn.execute_dict(sql)
+                status, res = prefetch.execute_dict(
+                    'exclusion_constraint_include', ex['oid'], sql
+                )
 
                 if not status:
                     return internal_server_error(errormsg=res)
@@ -561,17 +673,25 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
 
         return data
 
-    def _formatter(self, did, scid, tid, data):
+    def _formatter(self, did, scid, tid, data, prefetch=None):
         """
         Args:
             data: dict of query result
             scid: schema oid
             tid: table oid
+            prefetch: CatalogPrefetch with the catalogs of the table (if
+                      fetched in bulk)
 
         Returns:
             It will return formatted output of query result
             as per client model format
         """
+        # The catalogs of the table have been fetched in bulk (i.e. for the
+        # reverse engineered sql of many tables)
+        bulk = prefetch is not None
+        if prefetch is None:
+            prefetch = CatalogPrefetch(self.conn)
+
         # Need to format security labels according to client js collection
         if 'seclabels' in data and data['seclabels'] is not None:
             seclabels = []
@@ -584,7 +704,7 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
         # We need to parse & convert ACL coming from database to json format
         SQL = render_template("/".join([self.table_template_path, 'acl.sql']),
                               tid=tid, scid=scid)
-        status, acl = self.conn.execute_dict(SQL)
+        status, acl = prefetch.execute_dict('acl', tid, SQL)
         if not status:
             return internal_server_error(errormsg=acl)
 
@@ -598,8 +718,10 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
                 data[row['deftype']] = [priv]
 
         # We will add Auto vacuum defaults with out result for grid
-        data['vacuum_table'] = self.parse_vacuum_data(self.conn, data, 'table')
-        data['vacuum_toast'] = self.parse_vacuum_data(self.conn, data, 'toast')
+        data['vacuum_table'] = self.parse_vacuum_data(
+            self.conn, data, 'table', prefetch)
+        data['vacuum_toast'] = self.parse_vacuum_data(
+            self.conn, data, 'toast', prefetch)
 
         # Fetch columns for the table logic
         #
@@ -617,7 +739,9 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
                                             'get_columns_for_table.sql']),
                                   tid=data['typoid'])
 
-            status, res = self.conn.execute_dict(SQL)
+            status, res = prefetch.execute_dict(
+                'columns_for_table', data['typoid'], SQL
+            )
             if not status:
                 return internal_server_error(errormsg=res)
             other_columns = res['rows']
@@ -631,7 +755,7 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
                                   show_system_objects=False,
                                   scid=scid
                                   )
-            status, rset = self.conn.execute_2darray(SQL)
+            status, rset = prefetch.execute_dict('inherits', None, SQL)
             if not status:
                 return internal_server_error(errormsg=rset)
 
@@ -643,7 +767,9 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
                          'get_columns_for_table.sql']),
                         tid=row['oid']
                     )
-                    status, res = self.conn.execute_dict(SQL)
+                    status, res = prefetch.execute_dict(
+                        'columns_for_table', row['oid'], SQL
+                    )
                     if not status:
                         return internal_server_error(errormsg=res)
                     other_columns.extend(res['rows'][:])
@@ -658,7 +784,7 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
                               show_sys_objects=False
                               )
 
-        status, res = self.conn.execute_dict(SQL)
+        status, res = prefetch.execute_dict('columns', tid, SQL)
         if not status:
             return internal_server_error(errormsg=res)
         all_columns = res['rows']
@@ -673,13 +799,15 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
         data['columns'] = all_columns
 
         if 'columns' in data and len(data['columns']) > 0:
-            data = self._columns_formatter(tid, data)
+            data = self._columns_formatter(
+                tid, data, prefetch if bulk else None
+            )
 
         # Here we will add constraint in our output
-        data = self._index_constraints_formatter(did, tid, data)
-        data = self._foreign_key_formatter(tid, data)
-        data = self._check_constraint_formatter(tid, data)
-        data = self._exclusion_constraint_formatter(did, tid, data)
+        data = self._index_constraints_formatter(did, tid, data, prefetch)
+        data = self._foreign_key_formatter(tid, data, prefetch)
+        data = self._check_constraint_formatter(tid, data, prefetch)
+        data = self._exclusion_constraint_formatter(did, tid, data, prefetch)
 
         return data
 
@@ -763,30 +891,34 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
             status=200
         )
 
-    def get_table_statistics(self, scid, tid):
+    def get_table_statistics(self, did, scid, tid):
         """
         Statistics
 
         Args:
+            did: Database Id
             scid: Schema Id
             tid: Table Id
 
         Returns the statistics for a particular table if tid is specified,
         otherwise it will return statistics for all the tables in that
         schema.
-        """
 
-        # Fetch schema name
-        status, schema_name = self.conn.execute_scalar(
-            render_template(
-                "/".join([self.table_template_path, 'get_schema.sql']),
-                conn=self.conn, scid=scid
+        The extended statistics of a table (using pgstattuple, which scans
+        the whole table) are computed in the background, and are returned
+        separately, when asked for using the 'extended' argument.
+        """
+        if tid is None:
+            # Fetch schema name
+            status, schema_name = self.conn.execute_scalar(
+                render_template(
+                    "/".join([self.table_template_path, 'get_schema.sql']),
+                    conn=self.conn, scid=scid
+                )
             )
-        )
-        if not status:
-            return internal_server_error(errormsg=schema_name)
+            if not status:
+                return internal_server_error(errormsg=schema_name)
 
-        if tid is None:
             status, res = self.conn.execute_dict(
                 render_template(
                     "/".join([self.table_template_path,
@@ -794,37 +926,37 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
                     schema_name=schema_name
                 )
             )
+        elif request.args.get('extended', None):
+            return self.get_table_extended_statistics(did, tid)
         else:
             # For Individual table stats
-
-            # Check if pgstattuple extension is already created?
-            # if created then only add extended stats
-            status, is_pgstattuple = self.conn.execute_scalar("""
-            SELECT (count(extname) > 0) AS is_pgstattuple
-            FROM pg_extension
-            WHERE extname='pgstattuple'
-            """)
-            if not status:
-                return internal_server_error(errormsg=is_pgstattuple)
-
-            # Fetch Table name
-            status, table_name = self.conn.execute_scalar(
+            status, res = self.conn.execute_dict(
                 render_template(
-                    "/".join([self.table_template_path, 'get_table.sql']),
-                    conn=self.conn, scid=scid, tid=tid
+                    "/".join([self.table_template_path, 'stats.sql']),
+                    conn=self.conn, tid=tid
                 )
             )
             if not status:
-                return internal_server_error(errormsg=table_name)
+                return internal_server_error(errormsg=res)
 
-            status, res = self.conn.execute_dict(
-                render_template(
-                    "/".join([self.table_template_path, 'stats.sql']),
-                    conn=self.conn, schema_name=schema_name,
-                    table_name=table_name,
-                    is_pgstattuple=is_pgstattuple, tid=tid
-                )
+            # Check if pgstattuple extension is already created?
+            # if created then compute the extended stats in the background
+            status, is_pgstattuple = is_extension_installed(
+                self.conn, self.manager.sid, did, 'pgstattuple'
             )
+            if not status:
+                return internal_server_error(errormsg=is_pgstattuple)
+
+            if is_pgstattuple:
+                start_query(
+                    (self.manager.sid, did, 'table_extended_stats', tid),
+                    self.manager, did, render_template(
+                        "/".join([self.table_template_path,
+                                  'extended_stats.sql']),
+                        conn=self.conn, tid=tid
+                    )
+                )
+                res['extended'] = True
 
         if not status:
             return internal_server_error(errormsg=res)
@@ -834,7 +966,55 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
             status=200
         )
 
-    def get_reverse_engineered_sql(self, did, scid, tid, main_sql, data):
+    def get_table_extended_statistics(self, did, tid):
+        """
+        Returns the extended statistics of the table computed in the
+        background (status 202, if they are not available yet).
+
+        Args:
+            did: Database Id
+            tid: Table Id
+        """
+        query = get_query((self.manager.sid, did, 'table_extended_stats', tid))
+
+        if query is None or query.status == BackgroundQuery.CANCELLED:
+            return gone(
+                gettext("The extended statistics are not being computed.")
+            )
+
+        if query.status == BackgroundQuery.RUNNING:
+            return make_json_response(
+                info=gettext("Computing the extended statistics..."),
+                status=202
+            )
+
+        if query.status == BackgroundQuery.FAILED:
+            return internal_server_error(errormsg=query.error)
+
+        return make_json_response(
+            data=query.result,
+            status=200
+        )
+
+    def cancel_table_extended_statistics(self, did, tid):
+        """
+        Cancel the computation of the extended statistics of the table.
+
+        Args:
+            did: Database Id
+            tid: Table Id
+        """
+        cancelled = cancel_query(
+            (self.manager.sid, did, 'table_extended_stats', tid)
+        )
+
+        return make_json_response(
+            data={'cancelled': cancelled},
+            status=200
+        )
+
+    def get_reverse_engineered_sql(self, did, scid, tid, main_sql, data,
+                                   prefetch=None):
         """
         This function will creates reverse engineered sql for
         the table object
@@ -845,7 +1025,227 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
            tid: Table ID
            main_sql: List contains all the reversed engineered sql
            data: Table's Data
+           prefetch: CatalogPrefetch with the catalogs of the table (if
+                     fetched in bulk)
+        """
+        sql = self._get_reverse_engineered_sql(
+            did, scid, tid, main_sql, data, prefetch
+        )
+        # Most probably this is due to error
+        if not isinstance(sql, (str, unicode)):
+            return sql
+
+        return ajax_response(response=sql)
+
+    def bulk_fetch(self, did, scid, tids):
         """
+        This function will fetch the catalogs of the given tables in bulk,
+        i.e. the same queries, which are run for the reverse engineered sql
+        of a table, are run once for all the tables.
+
+         Args:
+           did: Database ID
+           scid: Schema ID
+           tids: Table IDs
+
+        Returns:
+            Tuple of the CatalogPrefetch, and the error response (if any)
+        """
+        prefetch = CatalogPrefetch(self.conn)
+
+        def fetch(*fetches):
+            for name, template, param, keys, kwargs in fetches:
+                error = prefetch.fetch(name, template, param, keys, **kwargs)
+                if error is not None:
+                    return error
+            return None
+
+        def rows(name, keys):
+            for key in keys:
+                for row in prefetch.rows(name, key)['rows']:
+                    yield key, row
+
+        error = fetch(
+            ('properties',
+             "/".join([self.table_template_path, 'properties.sql']), 'tid',
+             tids, {'did': did, 'scid': scid,
+                    'datlastsysoid': self.datlastsysoid}),
+            ('acl', "/".join([self.table_template_path, 'acl.sql']), 'tid',
+             tids, {'scid': scid}),
+            ('columns', "/".join([self.column_template_path,
+                                  'properties.sql']), 'tid',
+             tids, {'show_sys_objects': False}),
+            ('index_constraints_p', "/".join(
+                [self.index_constraint_template_path, 'properties.sql']),
+             'tid', tids, {'did': did, 'constraint_type': 'p'}),
+            ('index_constraints_u', "/".join(
+                [self.index_constraint_template_path, 'properties.sql']),
+             'tid', tids, {'did': did, 'constraint_type': 'u'}),
+            ('index_constraint_columns', "/".join(
+                [self.index_constraint_template_path,
+                 'get_table_constraint_cols.sql']), 'tid', tids, {}),
+            ('foreign_keys', "/".join([self.foreign_key_template_path,
+                                       'properties.sql']), 'tid', tids, {}),
+            ('foreign_key_columns', "/".join(
+                [self.foreign_key_template_path,
+                 'get_table_constraint_cols.sql']), 'tid', tids, {}),
+            ('check_constraints', "/".join(
+                [self.check_constraint_template_path, 'properties.sql']),
+             'tid', tids, {}),
+            ('exclusion_constraints', "/".join(
+                [self.exclusion_constraint_template_path, 'properties.sql']),
+             'tid', tids, {'did': did}),
+            ('indexes', "/".join([self.index_template_path,
+                                  'properties.sql']), 'tid',
+             tids, {'did': did, 'datlastsysoid': self.datlastsysoid}),
+            ('index_columns', "/".join([self.index_template_path,
+                                        'column_details.sql']), 'tid',
+             tids, {}),
+            ('triggers', "/".join([self.trigger_template_path,
+                                   'properties.sql']), 'tid',
+             tids, {'datlastsysoid': self.datlastsysoid}),
+            ('rules', "/".join([self.rules_template_path, 'properties.sql']),
+             'tid', tids, {})
+        )
+        if error is not None:
+            return prefetch, error
+
+        # INCLUDE clause in index is supported from PG-11+
+        if self.manager.version >= 110000:
+            error = fetch(
+                ('index_constraint_include', "/".join(
+                    [self.index_constraint_template_path,
+                     'get_constraint_include.sql']), 'tid', tids, {}),
+                ('index_include', "/".join([self.index_template_path,
+                                            'include_details.sql']), 'tid',
+                 tids, {})
+            )
+            if error is not None:
+                return prefetch, error
+
+        # The catalogs, which depend on the rows fetched above
+        tables = [row for tid, row in rows('properties', tids)]
+
+        typoids = set(row['typoid'] for row in tables if row['typoid'])
+        if any(
+            not row['typoid'] and row['coll_inherits'] for row in tables
+        ):
+            # All the tables, which can be inherited
+            status, res = prefetch.execute_dict(
+                'inherits', None, render_template(
+                    "/".join([self.table_template_path, 'get_inherits.sql']),
+                    show_system_objects=False, scid=scid
+                )
+            )
+            if not status:
+                return prefetch, internal_server_error(errormsg=res)
+
+            inherits = set()
+            for row in tables:
+                if not row['typoid'] and row['coll_inherits']:
+                    inherits.update(row['coll_inherits'])
+            typoids.update(
+                row['oid'] for row in res['rows']
+                if row['inherits'] in inherits
+            )
+
+        exclusion_constraints = [
+            row for tid, row in rows('exclusion_constraints', tids)
+        ]
+        triggers = list(rows('triggers', tids))
+
+        fetches = [
+            ('covering_indexes', "/".join([self.foreign_key_template_path,
+                                           'get_constraints.sql']), 'tid',
+             [tid for tid, row in rows('foreign_keys', tids)], {}),
+            ('partitions', "/".join([self.partition_template_path,
+                                     'nodes.sql']), 'tid', [
+                tid for tid, row in rows('properties', tids)
+                if 'is_partitioned' in row and row['is_partitioned']
+            ], {'scid': scid}),
+            ('columns_for_table', "/".join(
+                [self.table_template_path, 'get_columns_for_table.sql']),
+             'tid', typoids, {}),
+            ('column_acl', "/".join([self.column_template_path, 'acl.sql']),
+             ('tid', 'clid'), [
+                 (tid, row['attnum']) for tid, row in rows('columns', tids)
+                 if row['attnum'] is not None and row['attnum'] > 0
+             ], {}),
+            ('exclusion_constraint_columns', "/".join(
+                [self.exclusion_constraint_template_path,
+                 'get_constraint_cols.sql']), ('cid', 'colcnt'), [
+                (row['oid'], row['col_count'])
+                for row in exclusion_constraints
+            ], {})
+        ]
+        if self.manager.version >= 110000:
+            fetches.append(
+                ('exclusion_constraint_include', "/".join(
+                    [self.exclusion_constraint_template_path,
+                     'get_constraint_include.sql']), 'cid',
+                 [row['oid'] for row in exclusion_constraints], {})
+            )
+        error = fetch(*fetches)
+        if error is not None:
+            return prefetch, error
+
+        # The queries, which take the list of the trigger functions, the
+        # columns of the triggers, and the indexes of the table (rather than
+        # the table id)
+        trigger_functions = dict()
+        trigger_columns = dict()
+        for tid, row in triggers:
+            if row['lanname'] != 'edbspl':
+                trigger_functions.setdefault(tid, set()).add(row['tgfoid'])
+            if len(row['tgattr']) >= 1:
+                trigger_columns.setdefault(tid, set()).update(
+                    row['tgattr'].split(' ')
+                )
+
+        for name, queries in [
+            ('trigger_functions', dict(
+                (tid, render_template(
+                    "/".join([self.trigger_template_path,
+                              'get_triggerfunctions.sql']),
+                    tgfoids=sorted(tgfoids),
+                    show_system_objects=self.blueprint.show_system_objects
+                )) for tid, tgfoids in trigger_functions.items()
+            )),
+            ('trigger_columns', dict(
+                (tid, render_template(
+                    "/".join([self.trigger_template_path, 'get_columns.sql']),
+                    tid=tid, clist=', '.join(sorted(attnums))
+                )) for tid, attnums in trigger_columns.items()
+            )),
+            ('covering_index_columns', dict(
+                (tid, render_template(
+                    "/".join([self.foreign_key_template_path,
+                              'get_index_cols.sql']),
+                    cids=[row['oid'] for row in constraints['rows']]
+                )) for tid, constraints in (
+                    (tid, prefetch.rows('covering_indexes', tid))
+                    for tid in tids
+                ) if constraints is not None and len(constraints['rows']) > 0
+            ))
+        ]:
+            error = prefetch.fetch_union(name, queries)
+            if error is not None:
+                return prefetch, error
+
+        return prefetch, None
+
+    def _get_reverse_engineered_sql(self, did, scid, tid, main_sql, data,
+                                    prefetch=None):
+        """
+        This function will creates reverse engineered sql for the table
+        object, and returns it (or, the error response).
+        """
+        if prefetch is None:
+            bulk = False
+            prefetch = CatalogPrefetch(self.conn)
+        else:
+            bulk = True
+
         """
         #####################################
         # 1) Reverse engineered sql for TABLE
@@ -857,7 +1257,9 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
         table = data['name']
         is_partitioned = 'is_partitioned' in data and data['is_partitioned']
 
-        data = self._formatter(did, scid, tid, data)
+        data = self._formatter(
+            did, scid, tid, data, prefetch if bulk else None
+        )
 
         # Now we have all lis of columns which we need
         # to include in our create definition, Let's format them
@@ -911,40 +1313,57 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
         """
 
         SQL = render_template("/".join([self.index_template_path,
-                                        'nodes.sql']), tid=tid)
-        status, rset = self.conn.execute_2darray(SQL)
+                                        'properties.sql']),
+                              did=did, tid=tid,
+                              datlastsysoid=self.datlastsysoid)
+        status, indexes = prefetch.execute_dict('indexes', tid, SQL)
         if not status:
-            return internal_server_error(errormsg=rset)
-
-        for row in rset['rows']:
+            return internal_server_error(errormsg=indexes)
 
+        # We also need to fetch columns of the indexes, fetch them for all
+        # the indexes of the table at once
+        index_columns = dict()
+        index_include = dict()
+        if len(indexes['rows']) > 0:
             SQL = render_template("/".join([self.index_template_path,
-                                            'properties.sql']),
-                                  did=did, tid=tid, idx=row['oid'],
-                                  datlastsysoid=self.datlastsysoid)
-
-            status, res = self.conn.execute_dict(SQL)
+                                            'column_details.sql']),
+                                  tid=tid)
+            status, rset = prefetch.execute_dict('index_columns', tid, SQL)
             if not status:
-                return internal_server_error(errormsg=res)
+                return internal_server_error(errormsg=rset)
 
-            data = dict(res['rows'][0])
+            for col_row in rset['rows']:
+                index_columns.setdefault(
+                    col_row['indexrelid'], []
+                ).append(col_row)
+
+            if self.manager.version >= 110000:
+                SQL = render_template(
+                    "/".join([self.index_template_path,
+                              'include_details.sql']),
+                    tid=tid)
+                status, res = prefetch.execute_dict('index_include', tid, SQL)
+
+                if not status:
+                    return internal_server_error(errormsg=res)
+
+                for col in res['rows']:
+                    index_include.setdefault(
+                        col['indexrelid'], []
+                    ).append(col['colname'])
+
+        for row in indexes['rows']:
+            data = dict(row)
             # Adding parent into data dict, will be using it while creating sql
             data['schema'] = schema
             data['table'] = table
-            # We also need to fecth columns of index
-            SQL = render_template("/".join([self.index_template_path,
-                                            'column_details.sql']),
-                                  idx=row['oid'])
-            status, rset = self.conn.execute_2darray(SQL)
-            if not status:
-                return internal_server_error(errormsg=rset)
 
             # 'attdef' comes with quotes from query so we need to strip them
             # 'options' we need true/false to render switch
             # ASC(false)/DESC(true)
             columns = []
             cols = []
-            for col_row in rset['rows']:
+            for col_row in index_columns.get(row['oid'], []):
                 # We need all data as collection for ColumnsModel
                 # Only for displaying SQL, we can omit strip on colname
                 cols_data = {
@@ -973,16 +1392,7 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
             data['cols'] = ', '.join(cols)
 
             if self.manager.version >= 110000:
-                SQL = render_template(
-                    "/".join([self.index_template_path,
-                              'include_details.sql']),
-                    idx=row['oid'])
-                status, res = self.conn.execute_dict(SQL)
-
-                if not status:
-                    return internal_server_error(errormsg=res)
-
-                data['include'] = [col['colname'] for col in res['rows']]
+                data['include'] = index_include.get(row['oid'], [])
 
             sql_header = u"\n-- Index: {0}\n\n-- ".format(data['name'])
 
@@ -1008,31 +1418,68 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
         ########################################
         """
         SQL = render_template("/".join([self.trigger_template_path,
-                                        'nodes.sql']), tid=tid)
-        status, rset = self.conn.execute_2darray(SQL)
+                                        'properties.sql']),
+                              tid=tid, datlastsysoid=self.datlastsysoid)
+        status, triggers = prefetch.execute_dict('triggers', tid, SQL)
         if not status:
-            return internal_server_error(errormsg=rset)
+            return internal_server_error(errormsg=triggers)
+
+        # Fetch the trigger functions (with schema name), and the columns
+        # used by all the triggers of the table at once
+        trigger_functions = dict()
+        tgfoids = set(
+            row['tgfoid'] for row in triggers['rows']
+            if row['lanname'] != 'edbspl'
+        )
+        if len(tgfoids) > 0:
+            SQL = render_template(
+                "/".join(
+                    [self.trigger_template_path, 'get_triggerfunctions.sql']
+                ),
+                tgfoids=sorted(tgfoids),
+                show_system_objects=self.blueprint.show_system_objects
+            )
+            status, result = prefetch.execute_dict(
+                'trigger_functions', tid, SQL
+            )
+            if not status:
+                return internal_server_error(errormsg=result)
 
-        for row in rset['rows']:
-            trigger_sql = ''
+            for func in result['rows']:
+                trigger_functions[func['oid']] = func['tfunctions']
 
+        trigger_columns = dict()
+        attnums = set()
+        for row in triggers['rows']:
+            if len(row['tgattr']) >= 1:
+                attnums.update(row['tgattr'].split(' '))
+        if len(attnums) > 0:
             SQL = render_template("/".join([self.trigger_template_path,
-                                            'properties.sql']),
-                                  tid=tid, trid=row['oid'],
-                                  datlastsysoid=self.datlastsysoid)
+                                            'get_columns.sql']),
+                                  tid=tid, clist=', '.join(sorted(attnums)))
 
-            status, res = self.conn.execute_dict(SQL)
+            status, rset = prefetch.execute_dict('trigger_columns', tid, SQL)
             if not status:
-                return internal_server_error(errormsg=res)
+                return internal_server_error(errormsg=rset)
 
-            if len(res['rows']) == 0:
-                continue
-            data = dict(res['rows'][0])
+            for col_row in rset['rows']:
+                trigger_columns[str(col_row['attnum'])] = col_row['name']
+
+        for row in triggers['rows']:
+            trigger_sql = ''
+
+            data = dict(row)
             # Adding parent into data dict, will be using it while creating sql
             data['schema'] = schema
             data['table'] = table
 
-            data = self.get_trigger_function_schema(data)
+            # If language is 'edbspl' then trigger function should be
+            # 'Inline EDB-SPL' else we will use the trigger function
+            # with schema name.
+            if data['lanname'] == 'edbspl':
+                data['tfunction'] = 'Inline EDB-SPL'
+            elif data['tgfoid'] in trigger_functions:
+                data['tfunction'] = trigger_functions[data['tgfoid']]
 
             if len(data['custom_tgargs']) > 1:
                 # We know that trigger has more than 1 argument, let's
@@ -1040,22 +1487,12 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
                 data['tgargs'] = self._format_args(data['custom_tgargs'])
 
             if len(data['tgattr']) >= 1:
-                columns = ', '.join(data['tgattr'].split(' '))
-
-                SQL = render_template("/".join([self.trigger_template_path,
-                                                'get_columns.sql']),
-                                      tid=tid, clist=columns)
-
-                status, rset = self.conn.execute_2darray(SQL)
-                if not status:
-                    return internal_server_error(errormsg=rset)
                 # 'tgattr' contains list of columns from table used in trigger
-                columns = []
-
-                for col_row in rset['rows']:
-                    columns.append(col_row['name'])
-
-                data['columns'] = columns
+                data['columns'] = [
+                    trigger_columns[attnum]
+                    for attnum in sorted(data['tgattr'].split(' '), key=int)
+                    if attnum in trigger_columns
+                ]
 
             data = trigger_definition(data)
 
@@ -1093,21 +1530,13 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
         SQL = render_template("/".join(
             [self.rules_template_path, 'properties.sql']), tid=tid)
 
-        status, rset = self.conn.execute_2darray(SQL)
+        status, rset = prefetch.execute_dict('rules', tid, SQL)
         if not status:
             return internal_server_error(errormsg=rset)
 
         for row in rset['rows']:
             rules_sql = '\n'
-            SQL = render_template("/".join(
-                [self.rules_template_path, 'properties.sql']
-            ), rid=row['oid'], datlastsysoid=self.datlastsysoid)
-
-            status, res = self.conn.execute_dict(SQL)
-            if not status:
-                return internal_server_error(errormsg=res)
-
-            res_data = parse_rule_definition(res)
+            res_data = parse_rule_definition({'rows': [row]})
             rules_sql += render_template("/".join(
                 [self.rules_template_path, 'create.sql']),
                 data=res_data, display_comments=True)
@@ -1125,7 +1554,7 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
             SQL = render_template("/".join([self.partition_template_path,
                                             'nodes.sql']),
                                   scid=scid, tid=tid)
-            status, rset = self.conn.execute_2darray(SQL)
+            status, rset = prefetch.execute_dict('partitions', tid, SQL)
             if not status:
                 return internal_server_error(errormsg=rset)
 
@@ -1155,7 +1584,7 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
 
         sql = '\n'.join(main_sql)
 
-        return ajax_response(response=sql.strip('\n'))
+        return sql.strip('\n')
 
     def reset_statistics(self, scid, tid):
         """
@@ -2440,43 +2869,72 @@ class BaseTableView(PGChildNodeView, BasePartitionTable):
             data['attprecision'] = str(data['attprecision'])
         return data
 
-    def search_coveringindex(self, tid, cols):
+    def get_index_columns(self, tid, prefetch=None):
         """
 
         Args:
           tid: Table id
-          cols: column list
+          prefetch: CatalogPrefetch with the catalogs of the table (if
+                    fetched in bulk)
 
         Returns:
+          List of the name, and the set of the columns of the indexes of
+          the table, which can cover a foreign key
 
         """
+        if prefetch is None:
+            prefetch = CatalogPrefetch(self.conn)
 
-        cols = set(cols)
         SQL = render_template("/".join([self.foreign_key_template_path,
                                         'get_constraints.sql']),
                               tid=tid)
-        status, constraints = self.conn.execute_dict(SQL)
+        status, constraints = prefetch.execute_dict(
+            'covering_indexes', tid, SQL
+        )
 
         if not status:
             raise Exception(constraints)
 
-        for costrnt in constraints['rows']:
+        if len(constraints['rows']) == 0:
+            return []
 
-            sql = render_template(
-                "/".join([self.foreign_key_template_path, 'get_cols.sql']),
-                cid=costrnt['oid'],
-                colcnt=costrnt['col_count'])
-            status, rest = self.conn.execute_dict(sql)
+        SQL = render_template(
+            "/".join([self.foreign_key_template_path, 'get_index_cols.sql']),
+            cids=[costrnt['oid'] for costrnt in constraints['rows']])
+        status, rest = prefetch.execute_dict(
+            'covering_index_columns', tid, SQL
+        )
 
-            if not status:
-                return internal_server_error(errormsg=rest)
+        if not status:
+            raise Exception(rest)
+
+        indexcols = dict()
+        for r in rest['rows']:
+            indexcols.setdefault(r['oid'], set()).add(r['column'].strip('"'))
+
+        return [(costrnt['idxname'], indexcols.get(costrnt['oid'], set()))
+                for costrnt in constraints['rows']]
 
-            indexcols = set()
-            for r in rest['rows']:
-                indexcols.add(r['column'].strip('"'))
+    def search_coveringindex(self, tid, cols, index_columns=None):
+        """
+
+        Args:
+          tid: Table id
+          cols: column list
+          index_columns: indexes of the table (see get_index_columns), if
+                         already fetched
+
+        Returns:
+
+        """
+
+        cols = set(cols)
+        if index_columns is None:
+            index_columns = self.get_index_columns(tid)
 
+        for idxname, indexcols in index_columns:
             if len(cols - indexcols) == len(indexcols - cols) == 0:
-                return costrnt["idxname"]
+                return idxname
 
         return None
 
@@ -0,0 +1,17 @@
+{#=============Fetch the rows of a query for many objects at once========#}
+{#
+ # The query fetches the rows of one object, which is identified by the
+ # columns of the 'prefetch' relation (i.e. prefetch.tid) in place of the
+ # literal values.
+ #}
+SELECT
+    {% for param in params %}prefetch.{{ param }} AS prefetch_{{ param }},
+    {% endfor %}q.*
+FROM (VALUES
+    {% for key in keys %}({% for value in key %}{{ value }}::bigint{% if not loop.last %}, {% endif %}{% endfor %}){% if not loop.last %},
+    {% endif %}{% endfor %}
+
+) AS prefetch({{ params|join(', ') }})
+CROSS JOIN LATERAL (
+{{ query }}
+) q
@@ -0,0 +1,9 @@
+{#=============Fetch the rows of the queries of many objects at once========#}
+{% for key, query in queries %}
+{% if not loop.first %}
+UNION ALL
+{% endif %}
+SELECT {{ key }}::bigint AS prefetch_key, q.* FROM (
+{{ query }}
+) q
+{% endfor %}
@@ -0,0 +1,9 @@
+{#=============Fetch the kind of the relation========#}
+{% if rid %}
+SELECT
+    c.relkind
+FROM
+    pg_class c
+WHERE
+    c.oid = {{ rid }}::oid
+{% endif %}
@@ -0,0 +1,115 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import sys
+
+from pgadmin.browser.server_groups.servers.databases.schemas.utils import \
+    CatalogPrefetch
+from pgadmin.utils.route import BaseTestGenerator
+
+if sys.version_info < (3, 3):
+    from mock import patch, MagicMock
+else:
+    from unittest.mock import patch, MagicMock
+
+SCHEMA_UTILS = 'pgadmin.browser.server_groups.servers.databases.schemas.' \
+               'utils.'
+
+
+class CatalogPrefetchTestCase(BaseTestGenerator):
+    """Test fetching the rows of the queries of many objects at once"""
+    scenarios = [
+        ('Rows are fetched for all the objects in one query',
+         dict(
+             param='tid',
+             keys=[3, 1, 2, 1],
+             rows=[
+                 {'prefetch_tid': 1, 'name': 'a'},
+                 {'prefetch_tid': 3, 'name': 'b'},
+                 {'prefetch_tid': 3, 'name': 'c'}
+             ],
+             expected_keys=[(1, ), (2, ), (3, )],
+             expected_rows={1: ['a'], 2: [], 3: ['b', 'c']}
+         )),
+        ('Rows are fetched for the objects identified by many parameters',
+         dict(
+             param=('tid', 'trid'),
+             keys=[(1, 10), (1, 11)],
+             rows=[
+                 {'prefetch_tid': 1, 'prefetch_trid': 11, 'name': 'a'}
+             ],
+             expected_keys=[(1, 10), (1, 11)],
+             expected_rows={(1, 10): [], (1, 11): ['a']}
+         )),
+        ('Rows are not fetched without the objects',
+         dict(
+             param='tid',
+             keys=[],
+             rows=[],
+             expected_keys=None,
+             expected_rows={}
+         )),
+    ]
+
+    @patch(SCHEMA_UTILS + 'render_template')
+    def runTest(self, render_template_mock):
+        render_template_mock.side_effect = \
+            lambda path, **kwargs: dict(kwargs, path=path) \
+            if path.startswith('prefetch/') else 'object query;'
+        conn = MagicMock()
+        conn.execute_dict.return_value = (True, {'rows': self.rows})
+
+        prefetch = CatalogPrefetch(conn)
+        self.assertIsNone(prefetch.fetch(
+            'rows', 'object.sql', self.param, self.keys, did=5
+        ))
+
+        if self.expected_keys is None:
+            conn.execute_dict.assert_not_called()
+        else:
+            conn.execute_dict.assert_called_once()
+            sql = conn.execute_dict.call_args[0][0]
+            self.assertEqual(sql['path'], 'prefetch/sql/lateral.sql')
+            self.assertEqual(sql['keys'], self.expected_keys)
+
+            # The template of one object is rendered with the columns of
+            # the prefetched relation in place of its identifiers
+            params = self.param if isinstance(self.param, tuple) \
+                else (self.param, )
+            self.assertEqual(sql['params'], params)
+            self.assertEqual(sql['query'], 'object query')
+            query = render_template_mock.call_args_list[0]
+            self.assertEqual(query[0], ('object.sql', ))
+            self.assertEqual(query[1]['did'], 5)
+            for param in params:
+                self.assertEqual(
+                    query[1][param], 'prefetch.{0}'.format(param)
+                )
+
+        # The prefetched rows are returned without running the query
+        conn.execute_dict.reset_mock()
+        for key, names in self.expected_rows.items():
+            status, res = prefetch.execute_dict('rows', key, 'object sql')
+            self.assertTrue(status)
+            self.assertEqual([row['name'] for row in res['rows']], names)
+        conn.execute_dict.assert_not_called()
+
+        # The query of an object, which was not prefetched, is run
+        conn.execute_dict.return_value = (True, {'rows': [{'name': 'd'}]})
+        status, res = prefetch.execute_dict('rows', 100, 'object sql')
+        self.assertEqual(res['rows'], [{'name': 'd'}])
+        conn.execute_dict.assert_called_once_with('object sql')
+
+        # The rows common for all the objects are fetched only once
+        for idx in range(3):
+            status, res = prefetch.execute_dict(
+                'defaults', None, 'defaults sql'
+            )
+            self.assertEqual(res['rows'], [{'name': 'd'}])
+        self.assertEqual(conn.execute_dict.call_count, 2)
@@ -444,6 +444,33 @@ def parse_rule_definition(res):
     return res_data
 
 
+def relation_backend_support_keywords(conn, rid, keywords):
+    """
+    This function will fetch the kind of the relation (i.e. table,
+    partitioned table, view, materialized view), and add it as 'relkind' in
+    the given keywords, which will be passed to the BackendSupported(...)
+    method of the child modules of the relation.
+
+    The child modules will check their support using their own queries, when
+    the 'relkind' could not be fetched.
+
+    Args:
+        conn: Connection object
+        rid: Relation ID
+        keywords: Keywords to be passed to the child modules
+
+    Returns:
+        Keywords dictionary
+    """
+    SQL = render_template("relation/sql/relkind.sql", rid=rid)
+    status, relkind = conn.execute_scalar(SQL)
+
+    if status and relkind is not None:
+        keywords['relkind'] = relkind
+
+    return keywords
+
+
 class VacuumSettings:
     """
     VacuumSettings Class.
@@ -459,7 +486,7 @@ class VacuumSettings:
     * get_vacuum_toast_settings(conn):
       - Returns vacuum toast defaults settings.
 
-    * parse_vacuum_data(conn, result, type):
+    * parse_vacuum_data(conn, result, type, prefetch=None):
       - Returns result of an associated array
         of fields name, label, value and column_type.
         It adds name, label, column_type properties of table/toast
@@ -468,6 +495,7 @@ class VacuumSettings:
         * conn - It is db connection object
         * result - Resultset of vacuum data
         * type - table/toast vacuum type
+        * prefetch - CatalogPrefetch shared by many tables (if any)
 
     """
 
@@ -540,7 +568,7 @@ class VacuumSettings:
 
         return res
 
-    def parse_vacuum_data(self, conn, result, type):
+    def parse_vacuum_data(self, conn, result, type, prefetch=None):
         """
         This function returns result of an associated array
         of fields name, label, value and column_type.
@@ -550,6 +578,8 @@ class VacuumSettings:
         * conn - It is db connection object
         * result - Resultset of vacuum data
         * type - table/toast vacuum type
+        * prefetch - CatalogPrefetch shared by many tables (if any), so that
+          the defaults are fetched only once
         """
 
         # returns an array of name & label values
@@ -562,11 +592,19 @@ class VacuumSettings:
             vacuum_fields[type].keys()) + "'"
         SQL = render_template('vacuum_settings/sql/vacuum_defaults.sql',
                               columns=vacuum_fields_keys)
-        status, res = conn.execute_dict(SQL)
+
+        if prefetch is None:
+            prefetch = CatalogPrefetch(conn)
+        status, res = prefetch.execute_dict(
+            'vacuum_{0}'.format(type), None, SQL
+        )
 
         if not status:
             return internal_server_error(errormsg=res)
 
+        # The rows are updated for the given table
+        res = {'rows': [dict(row) for row in res['rows']]}
+
         if type is 'table':
             for row in res['rows']:
                 row_name = row['name']
@@ -596,3 +634,158 @@ class VacuumSettings:
                     row['value'] = row['setting'] = value
 
         return res['rows']
+
+
+class CatalogPrefetch:
+    """
+    CatalogPrefetch Class.
+
+    This class fetches the rows of the queries of many objects at once, i.e.
+    while generating the reverse engineered SQL of all the objects of a type
+    in a schema, so that the number of the queries does not grow with the
+    number of the objects.
+
+    The existing template of the query of one object is rendered once with
+    the columns of the 'prefetch' relation in place of the identifiers of the
+    object, and joined laterally with the identifiers of all the objects
+    (which requires PostgreSQL 9.3, or later).
+
+    Methods:
+    -------
+    * is_supported(manager):
+      - Returns True, if the server supports the lateral joins.
+
+    * fetch(name, template, param, keys, **kwargs):
+      - Fetches the rows of the template for all the keys in one query.
+
+    * fetch_union(name, queries):
+      - Fetches the rows of the given queries (by key) in one query.
+
+    * rows(name, key):
+      - Returns the prefetched rows of the key.
+
+    * execute_dict(name, key, query):
+      - Returns the prefetched rows of the key, or executes the query of the
+        object, when they were not prefetched.
+        The rows of the key None are common for all the objects (i.e. the
+        server settings), and are fetched only once.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self._rows = dict()
+
+    @staticmethod
+    def is_supported(manager):
+        return manager.server_type != 'gpdb' and manager.version >= 90300
+
+    def fetch(self, name, template, param, keys, **kwargs):
+        """
+        Fetch the rows of the template for all the given keys in one query.
+
+        Args:
+            name: Name of the rows (to get them using rows(...))
+            template: Path of the template of the query of one object
+            param: Name of the parameter of the template, which identifies
+                   the object (or, tuple of the names)
+            keys: Values of the parameter of the objects (or, tuples of the
+                  values)
+            **kwargs: Other parameters of the template
+
+        Returns:
+            None on success, otherwise the error response
+        """
+        params = param if isinstance(param, tuple) else (param, )
+        keys = sorted(set(keys))
+        self._rows[name] = dict((key, []) for key in keys)
+
+        if len(keys) == 0:
+            return None
+
+        for p in params:
+            kwargs[p] = 'prefetch.{0}'.format(p)
+
+        SQL = render_template(
+            'prefetch/sql/lateral.sql',
+            params=params,
+            keys=[
+                tuple(int(v) for v in (
+                    key if isinstance(key, tuple) else (key, )
+                )) for key in keys
+            ],
+            query=render_template(template, **kwargs).strip().rstrip(';')
+        )
+        status, res = self.conn.execute_dict(SQL)
+        if not status:
+            return internal_server_error(errormsg=res)
+
+        for row in res['rows']:
+            key = tuple(row.pop('prefetch_{0}'.format(p)) for p in params)
+            self._rows[name].setdefault(
+                key if isinstance(param, tuple) else key[0], []
+            ).append(row)
+
+        return None
+
+    def fetch_union(self, name, queries):
+        """
+        Fetch the rows of the given queries in one query, i.e. when the
+        query of an object can not be parameterized by its identifier.
+
+        Args:
+            name: Name of the rows (to get them using rows(...))
+            queries: Dictionary of the key (integer) => query of the object
+
+        Returns:
+            None on success, otherwise the error response
+        """
+        self._rows[name] = dict((key, []) for key in queries)
+
+        if len(queries) == 0:
+            return None
+
+        SQL = render_template(
+            'prefetch/sql/union.sql',
+            queries=[
+                (int(key), queries[key].strip().rstrip(';'))
+                for key in sorted(queries)
+            ]
+        )
+        status, res = self.conn.execute_dict(SQL)
+        if not status:
+            return internal_server_error(errormsg=res)
+
+        for row in res['rows']:
+            self._rows[name].setdefault(
+                row.pop('prefetch_key'), []
+            ).append(row)
+
+        return None
+
+    def rows(self, name, key):
+        """
+        Returns the prefetched rows of the key (as the result of the query,
+        i.e. {'rows': [...]}), or None if the rows were not prefetched.
+        """
+        if name not in self._rows or key not in self._rows[name]:
+            return None
+
+        return {'rows': self._rows[name][key]}
+
+    def execute_dict(self, name, key, query):
+        """
+        Returns the prefetched rows of the key (as conn.execute_dict(...)
+        does), or executes the given query of the object, when the rows were
+        not prefetched (i.e. while generating the SQL of a single object).
+        """
+        res = self.rows(name, key)
+        if res is not None:
+            return True, res
+
+        status, res = self.conn.execute_dict(query)
+
+        # The rows common for all the objects are fetched only once
+        if status and key is None:
+            self._rows.setdefault(name, dict())[key] = res['rows']
+
+        return status, res
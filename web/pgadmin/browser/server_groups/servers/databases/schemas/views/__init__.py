@@ -18,13 +18,19 @@ from flask_babelex import gettext
 import pgadmin.browser.server_groups.servers.databases as databases
 from config import PG_DEFAULT_DRIVER
 from pgadmin.browser.server_groups.servers.databases.schemas.utils import \
-    SchemaChildModule, parse_rule_definition, VacuumSettings
+    SchemaChildModule, parse_rule_definition, VacuumSettings, \
+    relation_backend_support_keywords, CatalogPrefetch
 from pgadmin.browser.server_groups.servers.utils import parse_priv_from_db, \
     parse_priv_to_db
 from pgadmin.browser.utils import PGChildNodeView
 from pgadmin.utils.ajax import make_json_response, internal_server_error, \
     make_response as ajax_response, gone
 from pgadmin.utils.driver import get_driver
+from pgadmin.utils import IS_PY2
+
+# If we are in Python3
+if not IS_PY2:
+    unicode = str
 
 """
     This module is responsible for generating two nodes
@@ -237,6 +243,10 @@ class ViewNode(PGChildNodeView, VacuumSettings):
       - This function will generate sql to show it in sql pane for the view
         node.
 
+    * bulk_sql(gid, sid, did, scid, oids):
+      - This function will generate sql of the given view nodes, fetching
+        their catalogs in bulk.
+
     * select_sql(gid, sid, did, scid, vid):
       - Returns select sql for Object
 
@@ -323,6 +333,20 @@ class ViewNode(PGChildNodeView, VacuumSettings):
         """
         return '#gpdb#{0}#'.format(ver)
 
+    def backend_support_keywords(self, manager, conn, **kwargs):
+        """
+        Fetch the kind of the view once for all the child modules (i.e.
+        indexes, triggers, rules), which are shown either under the views,
+        or under the materialized views.
+        """
+        keywords = kwargs.copy()
+        if 'vid' not in kwargs:
+            return keywords
+
+        return relation_backend_support_keywords(
+            conn, kwargs['vid'], keywords
+        )
+
     @check_precondition
     def list(self, gid, sid, did, scid):
         """
@@ -759,23 +783,27 @@ class ViewNode(PGChildNodeView, VacuumSettings):
 
         return SQL, data['name'] if 'name' in data else old_data['name']
 
-    def get_index_column_details(self, idx, data):
+    def get_index_column_details(self, idx, data, prefetch=None):
         """
         This functional will fetch list of column details for index
 
         Args:
             idx: Index OID
             data: Properties data
+            prefetch: CatalogPrefetch with the columns of the index (if
+                      fetched in bulk)
 
         Returns:
             Updated properties data with column details
         """
+        if prefetch is None:
+            prefetch = CatalogPrefetch(self.conn)
 
         self.index_temp_path = 'indexes'
         SQL = render_template("/".join([self.index_temp_path,
                                         'sql/#{0}#/column_details.sql'.format(
                                             self.manager.version)]), idx=idx)
-        status, rset = self.conn.execute_2darray(SQL)
+        status, rset = prefetch.execute_dict('index_columns', idx, SQL)
         if not status:
             return internal_server_error(errormsg=rset)
 
@@ -840,19 +868,21 @@ class ViewNode(PGChildNodeView, VacuumSettings):
 
         return columns
 
-    def get_rule_sql(self, vid):
+    def get_rule_sql(self, vid, prefetch=None):
         """
         Get all non system rules of view node,
         generate their sql and render
         into sql tab
         """
+        if prefetch is None:
+            prefetch = CatalogPrefetch(self.conn)
 
         self.rule_temp_path = 'rules'
         SQL_data = ''
         SQL = render_template("/".join(
             [self.rule_temp_path, 'sql/properties.sql']), tid=vid)
 
-        status, data = self.conn.execute_dict(SQL)
+        status, data = prefetch.execute_dict('rules', vid, SQL)
         if not status:
             return internal_server_error(errormsg=data)
 
@@ -865,7 +895,7 @@ class ViewNode(PGChildNodeView, VacuumSettings):
                     [self.rule_temp_path, 'sql/properties.sql']),
                     rid=rule['oid']
                 )
-                status, res = self.conn.execute_dict(SQL)
+                status, res = prefetch.execute_dict('rule', rule['oid'], SQL)
                 res = parse_rule_definition(res)
                 SQL = render_template("/".join(
                     [self.rule_temp_path, 'sql/create.sql']),
@@ -874,7 +904,7 @@ class ViewNode(PGChildNodeView, VacuumSettings):
                 SQL_data += SQL
         return SQL_data
 
-    def get_trigger_sql(self, vid):
+    def get_trigger_sql(self, vid, prefetch=None):
         """
         Get all trigger nodes associated with view node,
         generate their sql and render
@@ -886,6 +916,9 @@ class ViewNode(PGChildNodeView, VacuumSettings):
         from pgadmin.browser.server_groups.servers.databases.schemas.utils \
             import trigger_definition
 
+        if prefetch is None:
+            prefetch = CatalogPrefetch(self.conn)
+
         # Define template path
         self.trigger_temp_path = 'triggers'
 
@@ -895,7 +928,7 @@ class ViewNode(PGChildNodeView, VacuumSettings):
              'sql/#{0}#/properties.sql'.format(self.manager.version)]),
             tid=vid)
 
-        status, data = self.conn.execute_dict(SQL)
+        status, data = prefetch.execute_dict('triggers', vid, SQL)
         if not status:
             return internal_server_error(errormsg=data)
 
@@ -907,7 +940,9 @@ class ViewNode(PGChildNodeView, VacuumSettings):
                 trid=trigger['oid']
             )
 
-            status, res = self.conn.execute_dict(SQL)
+            status, res = prefetch.execute_dict(
+                'trigger', (vid, trigger['oid']), SQL
+            )
 
             res_rows = dict(res['rows'][0])
             if res_rows['tgnargs'] > 1:
@@ -937,7 +972,9 @@ class ViewNode(PGChildNodeView, VacuumSettings):
                 tgfoid=res_rows['tgfoid'],
                 show_system_objects=self.blueprint.show_system_objects)
 
-            status, result = self.conn.execute_dict(SQL)
+            status, result = prefetch.execute_dict(
+                'trigger_function', res_rows['tgfoid'], SQL
+            )
             if not status:
                 return internal_server_error(errormsg=result)
 
@@ -963,12 +1000,14 @@ class ViewNode(PGChildNodeView, VacuumSettings):
 
         return SQL_data
 
-    def get_index_sql(self, did, vid):
+    def get_index_sql(self, did, vid, prefetch=None):
         """
         Get all index associated with view node,
         generate their sql and render
         into sql tab
         """
+        if prefetch is None:
+            prefetch = CatalogPrefetch(self.conn)
 
         self.index_temp_path = 'indexes'
         SQL_data = ''
@@ -977,7 +1016,7 @@ class ViewNode(PGChildNodeView, VacuumSettings):
              'sql/#{0}#/properties.sql'.format(self.manager.version)]),
             did=did,
             tid=vid)
-        status, data = self.conn.execute_dict(SQL)
+        status, data = prefetch.execute_dict('indexes', vid, SQL)
         if not status:
             return internal_server_error(errormsg=data)
 
@@ -990,7 +1029,9 @@ class ViewNode(PGChildNodeView, VacuumSettings):
                 did=did,
                 tid=vid
             )
-            status, res = self.conn.execute_dict(SQL)
+            status, res = prefetch.execute_dict(
+                'index', (vid, index['oid']), SQL
+            )
 
             data = dict(res['rows'][0])
             # Adding parent into data dict, will be using it while creating sql
@@ -998,7 +1039,7 @@ class ViewNode(PGChildNodeView, VacuumSettings):
             data['table'] = data['tabname']
 
             # Add column details for current index
-            data = self.get_index_column_details(index['oid'], data)
+            data = self.get_index_column_details(index['oid'], data, prefetch)
 
             SQL = render_template("/".join(
                 [self.index_temp_path,
@@ -1013,6 +1054,97 @@ class ViewNode(PGChildNodeView, VacuumSettings):
         """
         This function will generate sql to render into the sql panel
         """
+        SQL = self._get_reverse_engineered_sql(did, vid)
+        # Most probably this is due to error
+        if not isinstance(SQL, (str, unicode)):
+            return SQL
+
+        return ajax_response(response=SQL)
+
+    @check_precondition
+    def bulk_sql(self, gid, sid, did, scid, oids):
+        """
+        This function will generate the sql of the given views of the
+        schema, fetching their catalogs (including the rules, triggers and
+        indexes of the views) in bulk.
+
+        Returns:
+            Dictionary of the view id => sql, None when the server does not
+            support the bulk fetching, or the error response
+        """
+        if not CatalogPrefetch.is_supported(self.manager):
+            return None
+
+        prefetch = CatalogPrefetch(self.conn)
+        trigger_path = 'triggers/sql/#{0}#'.format(self.manager.version)
+        index_path = 'indexes/sql/#{0}#'.format(self.manager.version)
+
+        for name, template, param, kwargs in [
+            ('properties', self.template_path + '/sql/properties.sql', 'vid',
+             {'did': did, 'datlastsysoid': self.datlastsysoid}),
+            ('acl', self.template_path + '/sql/acl.sql', 'vid', {}),
+            ('rules', 'rules/sql/properties.sql', 'tid', {}),
+            ('triggers', trigger_path + '/properties.sql', 'tid', {}),
+            ('indexes', index_path + '/properties.sql', 'tid', {'did': did})
+        ]:
+            error = prefetch.fetch(name, template, param, oids, **kwargs)
+            if error is not None:
+                return error
+
+        # Fetch the rules, triggers and indexes of all the views
+        rules = []
+        triggers = []
+        indexes = []
+        for vid in oids:
+            rules.extend(
+                row['oid'] for row in prefetch.rows('rules', vid)['rows']
+                if row['name'] != '_RETURN'
+            )
+            triggers.extend(
+                (vid, row['oid'], row['tgfoid'])
+                for row in prefetch.rows('triggers', vid)['rows']
+            )
+            indexes.extend(
+                (vid, row['oid'])
+                for row in prefetch.rows('indexes', vid)['rows']
+            )
+
+        for name, template, param, keys, kwargs in [
+            ('rule', 'rules/sql/properties.sql', 'rid', rules, {}),
+            ('trigger', trigger_path + '/properties.sql', ('tid', 'trid'),
+             [(vid, trid) for vid, trid, tgfoid in triggers], {}),
+            ('trigger_function', trigger_path + '/get_triggerfunctions.sql',
+             'tgfoid', [tgfoid for vid, trid, tgfoid in triggers],
+             {'show_system_objects': self.blueprint.show_system_objects}),
+            ('index', index_path + '/properties.sql', ('tid', 'idx'),
+             indexes, {'did': did}),
+            ('index_columns', index_path + '/column_details.sql', 'idx',
+             [idx for vid, idx in indexes], {})
+        ]:
+            error = prefetch.fetch(name, template, param, keys, **kwargs)
+            if error is not None:
+                return error
+
+        result = dict()
+        for vid in oids:
+            if len(prefetch.rows('properties', vid)['rows']) == 0:
+                continue
+
+            SQL = self._get_reverse_engineered_sql(did, vid, prefetch)
+            if not isinstance(SQL, (str, unicode)):
+                return SQL
+
+            result[vid] = SQL
+
+        return result
+
+    def _get_reverse_engineered_sql(self, did, vid, prefetch=None):
+        """
+        This function will generate the sql of the view (including its
+        rules, triggers and indexes), or returns the error response.
+        """
+        if prefetch is None:
+            prefetch = CatalogPrefetch(self.conn)
 
         SQL_data = ''
         SQL = render_template("/".join(
@@ -1021,7 +1153,7 @@ class ViewNode(PGChildNodeView, VacuumSettings):
             datlastsysoid=self.datlastsysoid
         )
 
-        status, res = self.conn.execute_dict(SQL)
+        status, res = prefetch.execute_dict('properties', vid, SQL)
         if not status:
             return internal_server_error(errormsg=res)
         if len(res['rows']) == 0:
@@ -1040,7 +1172,7 @@ class ViewNode(PGChildNodeView, VacuumSettings):
         # Fetch all privileges for view
         SQL = render_template("/".join(
             [self.template_path, 'sql/acl.sql']), vid=vid)
-        status, dataclres = self.conn.execute_dict(SQL)
+        status, dataclres = prefetch.execute_dict('acl', vid, SQL)
         if not status:
             return internal_server_error(errormsg=res)
 
@@ -1078,11 +1210,11 @@ class ViewNode(PGChildNodeView, VacuumSettings):
             [self.template_path, 'sql/grant.sql']), data=result)
 
         SQL_data += SQL
-        SQL_data += self.get_rule_sql(vid)
-        SQL_data += self.get_trigger_sql(vid)
-        SQL_data += self.get_index_sql(did, vid)
+        SQL_data += self.get_rule_sql(vid, prefetch)
+        SQL_data += self.get_trigger_sql(vid, prefetch)
+        SQL_data += self.get_index_sql(did, vid, prefetch)
 
-        return ajax_response(response=SQL_data)
+        return SQL_data
 
     @check_precondition
     def get_tblspc(self, gid, sid, did, scid):
@@ -1548,11 +1680,14 @@ class MViewNode(ViewNode, VacuumSettings):
                     [self.template_path, 'sql/grant.sql']), data=data)
         return SQL, data['name'] if 'name' in data else old_data['name']
 
-    @check_precondition
-    def sql(self, gid, sid, did, scid, vid):
+    def _get_reverse_engineered_sql(self, did, vid, prefetch=None):
         """
-        This function will generate sql to render into the sql panel
+        This function will generate the sql of the materialized view
+        (including its rules, triggers and indexes), or returns the error
+        response.
         """
+        if prefetch is None:
+            prefetch = CatalogPrefetch(self.conn)
 
         SQL_data = ''
         SQL = render_template("/".join(
@@ -1562,7 +1697,7 @@ class MViewNode(ViewNode, VacuumSettings):
             datlastsysoid=self.datlastsysoid
         )
 
-        status, res = self.conn.execute_dict(SQL)
+        status, res = prefetch.execute_dict('properties', vid, SQL)
         if not status:
             return internal_server_error(errormsg=res)
         if len(res['rows']) == 0:
@@ -1578,9 +1713,9 @@ class MViewNode(ViewNode, VacuumSettings):
         # merging formated result with main result again
         result.update(frmtd_reslt)
         result['vacuum_table'] = self.parse_vacuum_data(
-            self.conn, result, 'table')
+            self.conn, result, 'table', prefetch)
         result['vacuum_toast'] = self.parse_vacuum_data(
-            self.conn, result, 'toast')
+            self.conn, result, 'toast', prefetch)
 
         # merge vacuum lists into one
         vacuum_table = [item for item in result['vacuum_table']
@@ -1619,7 +1754,7 @@ class MViewNode(ViewNode, VacuumSettings):
         # Fetch all privileges for view
         SQL = render_template("/".join(
             [self.template_path, 'sql/acl.sql']), vid=vid)
-        status, dataclres = self.conn.execute_dict(SQL)
+        status, dataclres = prefetch.execute_dict('acl', vid, SQL)
         if not status:
             return internal_server_error(errormsg=res)
 
@@ -1657,11 +1792,11 @@ class MViewNode(ViewNode, VacuumSettings):
             [self.template_path, 'sql/grant.sql']), data=result)
 
         SQL_data += SQL
-        SQL_data += self.get_rule_sql(vid)
-        SQL_data += self.get_trigger_sql(vid)
-        SQL_data += self.get_index_sql(did, vid)
+        SQL_data += self.get_rule_sql(vid, prefetch)
+        SQL_data += self.get_trigger_sql(vid, prefetch)
+        SQL_data += self.get_index_sql(did, vid, prefetch)
         SQL_data = SQL_data.strip('\n')
-        return ajax_response(response=SQL_data)
+        return SQL_data
 
     @check_precondition
     def get_table_vacuum(self, gid, sid, did, scid):
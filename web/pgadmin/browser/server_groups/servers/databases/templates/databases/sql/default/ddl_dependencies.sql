@@ -0,0 +1,43 @@
+{###
+Dependencies among the given objects, i.e. (objid depends on refobjid) for
+the normal dependencies, and (objid is a member of the extension refobjid)
+for the extension members.
+
+The dependencies recorded for the sub-objects (i.e. rewrite rules, column
+defaults, constraints, triggers, and indexes) are attributed to the objects
+owning them, and the dependencies on the row/array types to the relations
+and the element types respectively.
+###}
+SELECT DISTINCT dep.objid, dep.refobjid, dep.deptype
+FROM (
+    SELECT
+        CASE dep.classid
+            WHEN 'pg_rewrite'::regclass THEN rw.ev_class
+            WHEN 'pg_attrdef'::regclass THEN ad.adrelid
+            WHEN 'pg_constraint'::regclass THEN
+                COALESCE(NULLIF(con.conrelid, 0::oid), con.contypid)
+            WHEN 'pg_trigger'::regclass THEN tg.tgrelid
+            WHEN 'pg_class'::regclass THEN
+                COALESCE(ind.indrelid, CASE WHEN cls.relkind = 'c' THEN cls.reltype END, dep.objid)
+            ELSE dep.objid
+        END AS objid,
+        CASE dep.refclassid
+            WHEN 'pg_type'::regclass THEN
+                COALESCE(NULLIF(typ.typrelid, 0::oid), elem.oid, dep.refobjid)
+            ELSE dep.refobjid
+        END AS refobjid,
+        dep.deptype
+    FROM pg_depend dep
+    LEFT JOIN pg_rewrite rw ON (dep.classid = 'pg_rewrite'::regclass AND rw.oid = dep.objid)
+    LEFT JOIN pg_attrdef ad ON (dep.classid = 'pg_attrdef'::regclass AND ad.oid = dep.objid)
+    LEFT JOIN pg_constraint con ON (dep.classid = 'pg_constraint'::regclass AND con.oid = dep.objid)
+    LEFT JOIN pg_trigger tg ON (dep.classid = 'pg_trigger'::regclass AND tg.oid = dep.objid)
+    LEFT JOIN pg_index ind ON (dep.classid = 'pg_class'::regclass AND ind.indexrelid = dep.objid)
+    LEFT JOIN pg_class cls ON (dep.classid = 'pg_class'::regclass AND cls.oid = dep.objid)
+    LEFT JOIN pg_type typ ON (dep.refclassid = 'pg_type'::regclass AND typ.oid = dep.refobjid)
+    LEFT JOIN pg_type elem ON (elem.typarray = typ.oid)
+    WHERE dep.deptype IN ('n', 'e')
+) dep
+WHERE dep.objid IN ({{ oids|join(', ') }})
+    AND (dep.deptype = 'e' OR dep.refobjid IN ({{ oids|join(', ') }}))
+    AND dep.objid != dep.refobjid
@@ -0,0 +1,71 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import random
+import sys
+import time
+
+from flask import Flask
+
+from pgadmin.browser.server_groups.servers.databases import ddl
+from pgadmin.utils.route import BaseTestGenerator
+
+if sys.version_info < (3, 3):
+    from mock import patch, MagicMock
+else:
+    from unittest.mock import patch, MagicMock
+
+
+class ExtractDDLTestCase(BaseTestGenerator):
+    """Test the parallel extraction of the DDL of the objects"""
+    scenarios = [
+        ('DDL is extracted in the order of the objects over the separate '
+         'connections',
+         dict(
+             workers=4,
+             connected=True,
+             expected_connections=4
+         )),
+        ('DDL is extracted using the default connection, when the separate '
+         'connections can not be made',
+         dict(
+             workers=4,
+             connected=False,
+             expected_connections=0
+         )),
+    ]
+
+    @patch('pgadmin.browser.server_groups.servers.databases.ddl.'
+           'get_object_sql')
+    def runTest(self, get_object_sql_mock):
+        def get_object_sql(obj):
+            time.sleep(random.random() / 100)
+            return obj['key']
+
+        get_object_sql_mock.side_effect = get_object_sql
+
+        manager = MagicMock()
+        manager.connection.return_value.connect.return_value = \
+            (self.connected, 'error')
+        objects = [{'key': idx} for idx in range(50)]
+
+        app = Flask(__name__)
+        with app.test_request_context():
+            result = list(ddl.extract_ddl(
+                manager, 1, objects, self.workers
+            ))
+
+        self.assertEqual(result, list(range(50)))
+        self.assertEqual(
+            manager.pin_connection.call_count, self.expected_connections
+        )
+        # All the separate connections are released
+        self.assertEqual(
+            manager.release.call_count, max(self.expected_connections, 1)
+        )
@@ -0,0 +1,102 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import sys
+
+from flask import Flask
+
+from pgadmin.browser.server_groups.servers.databases import ddl
+from pgadmin.utils.route import BaseTestGenerator
+
+if sys.version_info < (3, 3):
+    from mock import patch, MagicMock
+else:
+    from unittest.mock import patch, MagicMock
+
+
+class ExtractDDLInBulkTestCase(BaseTestGenerator):
+    """
+    Test the DDL of the objects of a type is extracted using the catalogs
+    fetched in bulk
+    """
+    scenarios = [
+        ('DDL of the objects is generated in bulk',
+         dict(
+             bulk_sql=lambda oids: dict(
+                 (oid, 'bulk {0}'.format(oid)) for oid in oids
+             ),
+             expected_fallback=[]
+         )),
+        ('DDL of the objects, which could not be generated in bulk, is '
+         'generated by their sql view',
+         dict(
+             bulk_sql=lambda oids: dict(
+                 (oid, 'bulk {0}'.format(oid)) for oid in oids
+                 if oid % 2 == 0
+             ),
+             expected_fallback=[1, 3, 5, 101]
+         )),
+        ('DDL of the objects is generated by their sql view, when the '
+         'server does not support the bulk fetching',
+         dict(
+             bulk_sql=lambda oids: None,
+             expected_fallback=[1, 2, 3, 4, 5, 100, 101]
+         )),
+    ]
+
+    @patch('pgadmin.browser.server_groups.servers.databases.ddl.'
+           'get_object_sql')
+    def runTest(self, get_object_sql_mock):
+        get_object_sql_mock.side_effect = \
+            lambda obj: 'sql {0}\n'.format(obj['id'])
+
+        tables = MagicMock(ids=[{'id': 'tid', 'type': 'int'}])
+        tables.return_value.bulk_sql.side_effect = \
+            lambda oids, **kwargs: self.bulk_sql(oids)
+        casts = MagicMock(spec=[])
+
+        def obj(view, oid, **ids):
+            ids['did'] = 1
+            ids[view is tables and 'tid' or 'cid'] = oid
+            return {'id': oid, 'view': view, 'ids': ids}
+
+        objects = [
+            obj(tables, 1, scid=2), obj(casts, 10), obj(tables, 2, scid=2),
+            obj(tables, 100, scid=3), obj(tables, 3, scid=2),
+            obj(tables, 101, scid=3), obj(tables, 4, scid=2),
+            obj(tables, 5, scid=2)
+        ]
+
+        with patch.object(ddl, 'BULK_FETCH_SIZE', 4):
+            tasks = ddl.get_tasks(objects)
+
+            manager = MagicMock()
+            manager.connection.return_value.connect.return_value = \
+                (False, 'error')
+            with Flask(__name__).test_request_context():
+                result = list(ddl.extract_ddl(manager, 1, objects, 4))
+
+        # The objects of a type are grouped by their parent (in batches)
+        self.assertEqual(
+            [[o['id'] for idx, o in task] for task in tasks],
+            [[1, 2, 3, 4], [10], [100, 101], [5]]
+        )
+        self.assertEqual(
+            [call[1] for call in tables.return_value.bulk_sql.call_args_list],
+            [{'oids': [1, 2, 3, 4], 'did': 1, 'scid': 2},
+             {'oids': [100, 101], 'did': 1, 'scid': 3}]
+        )
+
+        # The DDL is returned in the order of the objects
+        self.assertEqual(result, [
+            'sql {0}\n'.format(o['id'])
+            if o['id'] in self.expected_fallback + [5, 10]
+            else 'bulk {0}\n'.format(o['id'])
+            for o in objects
+        ])
@@ -0,0 +1,51 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.browser.server_groups.servers.databases import ddl
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class DependencyOrderTestCase(BaseTestGenerator):
+    """Test the sorting of the objects in the dependency order"""
+    scenarios = [
+        ('Objects without dependencies keep their order',
+         dict(
+             objects=['a', 'b', 'c'],
+             dependencies={},
+             expected=['a', 'b', 'c']
+         )),
+        ('Objects come after the objects they depend on',
+         dict(
+             objects=['view', 'table', 'func', 'seq'],
+             dependencies={
+                 'view': set(['table', 'func']),
+                 'table': set(['seq'])
+             },
+             expected=['func', 'seq', 'table', 'view']
+         )),
+        ('Dependencies on the unknown objects are ignored',
+         dict(
+             objects=['a', 'b'],
+             dependencies={'a': set(['b', 'x'])},
+             expected=['b', 'a']
+         )),
+        ('Cyclic dependencies are broken using the given order',
+         dict(
+             objects=['a', 'b', 'c'],
+             dependencies={'a': set(['b']), 'b': set(['a'])},
+             expected=['c', 'a', 'b']
+         )),
+    ]
+
+    def runTest(self):
+        objects = [{'key': key} for key in self.objects]
+
+        result = ddl.dependency_order(objects, self.dependencies)
+
+        self.assertEqual([obj['key'] for obj in result], self.expected)
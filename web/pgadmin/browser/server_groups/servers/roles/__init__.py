@@ -7,11 +7,14 @@
 #
 ##########################################################################
 import re
+import time
 from functools import wraps
+from threading import Lock, Thread
 
 import pgadmin.browser.server_groups as sg
 import simplejson as json
-from flask import render_template, request, jsonify, current_app
+from flask import render_template, request, jsonify, current_app, \
+    copy_current_request_context
 from flask_babelex import gettext as _
 import dateutil.parser as dateutil_parser
 from pgadmin.browser.collection import CollectionNodeModule
@@ -21,6 +24,7 @@ from pgadmin.utils.ajax import make_json_response, \
     internal_server_error, forbidden, success_return, gone
 from pgadmin.utils.driver import get_driver
 
+import config
 from config import PG_DEFAULT_DRIVER
 
 
@@ -85,6 +89,205 @@ class RoleModule(CollectionNodeModule):
 
 blueprint = RoleModule(__name__)
 
+# Dependents of the roles found in a database
+# (server id, database name, role id) => (time, dependents)
+DEPENDENTS_CACHE = dict()
+DEPENDENTS_LOCK = Lock()
+
+# Dictionary for the object types
+DEPENDENT_TYPES = {
+    # None specified special handling for this type
+    'r': 'table',
+    'i': None,
+    'S': 'sequence',
+    'v': 'view',
+    'x': 'external_table',
+    'p': 'function',
+    'n': 'schema',
+    'y': 'type',
+    'd': 'domain',
+    'T': 'trigger_function',
+    'C': 'conversion',
+    'o': None
+}
+
+
+def database_dependents(manager, db_row, rid, sql_path):
+    """
+    Returns the dependents of the role in the given database.
+
+    Args:
+        manager: Server connection manager
+        db_row: Row of the database (datname, datlastsysoid)
+        rid: Role ID
+        sql_path: Path of the templates
+
+    Returns:
+        List of the dependents
+    """
+    # Get the connection from the manager for the specified database.
+    # Check the connect status and if it is not connected then create
+    # a new connection to run the query and fetch the dependents.
+    temp_conn = manager.connection(db_row['datname'])
+    is_connected = temp_conn.connected()
+
+    try:
+        if not is_connected:
+            status, msg = temp_conn.connect()
+            if not status:
+                raise Exception(msg)
+
+        query = render_template(
+            "/".join([sql_path, 'dependents.sql']),
+            fetch_dependents=True, rid=rid,
+            lastsysoid=db_row['datlastsysoid']
+        )
+
+        status, result = temp_conn.execute_dict(query)
+        if not status:
+            raise Exception(result)
+    finally:
+        # Release only those connections which we have created above.
+        if not is_connected:
+            manager.release(db_row['datname'])
+
+    dependents = list()
+
+    for row in result['rows']:
+        rel_name = row['nspname']
+        if rel_name is not None:
+            rel_name += '.'
+
+        if rel_name is None:
+            rel_name = row['relname']
+        else:
+            rel_name += row['relname']
+
+        type_name = ''
+        type_str = row['relkind']
+        # Fetch the type name from the dictionary
+        # if type is not present in the types dictionary then
+        # we will continue and not going to add it.
+        if type_str[0] in DEPENDENT_TYPES:
+
+            # if type is present in the types dictionary, but it's
+            # value is None then it requires special handling.
+            if DEPENDENT_TYPES[type_str[0]] is None:
+                if type_str[0] == 'i':
+                    type_name = 'index'
+                    rel_name = row['indname'] + ' ON ' + rel_name
+                elif type_str[0] == 'o':
+                    type_name = 'operator'
+                    rel_name = row['relname']
+            else:
+                type_name = DEPENDENT_TYPES[type_str[0]]
+        else:
+            continue
+
+        dependents.append(
+            {
+                'type': type_name,
+                'name': rel_name,
+                'field': db_row['datname']
+            }
+        )
+
+    return dependents
+
+
+def databases_dependents(manager, rid, databases, sql_path):
+    """
+    Returns the dependents of the role in the given databases as a
+    dictionary (database name => list of the dependents).
+
+    The databases are searched in parallel (using at most
+    ROLE_DEPENDENTS_WORKERS connections at a time), and the dependents found
+    in a database are cached for ROLE_DEPENDENTS_CACHE_TTL seconds. We wait
+    at most for ROLE_DEPENDENTS_TIMEOUT seconds, and the databases, which
+    could not be searched (within that time), are reported as such in their
+    list of the dependents.
+
+    Args:
+        manager: Server connection manager
+        rid: Role ID
+        databases: Rows of the databases (datname, datlastsysoid)
+        sql_path: Path of the templates
+    """
+    now = time.time()
+    results = dict()
+    pending = []
+
+    with DEPENDENTS_LOCK:
+        for db_row in databases:
+            cached = DEPENDENTS_CACHE.get(
+                (manager.sid, db_row['datname'], rid)
+            )
+            if cached is not None and \
+                    now - cached[0] < config.ROLE_DEPENDENTS_CACHE_TTL:
+                results[db_row['datname']] = cached[1]
+            else:
+                pending.append(db_row)
+
+    if not pending:
+        return results
+
+    deadline = now + config.ROLE_DEPENDENTS_TIMEOUT
+    errors = dict()
+    lock = Lock()
+    pending.reverse()
+
+    def fetch():
+        while True:
+            with lock:
+                if not pending or time.time() >= deadline:
+                    return
+                db_row = pending.pop()
+
+            try:
+                dependents = database_dependents(
+                    manager, db_row, rid, sql_path
+                )
+            except Exception as e:
+                current_app.logger.exception(e)
+                with lock:
+                    errors[db_row['datname']] = str(e)
+                continue
+
+            with DEPENDENTS_LOCK:
+                DEPENDENTS_CACHE[(manager.sid, db_row['datname'], rid)] = \
+                    (time.time(), dependents)
+            with lock:
+                results[db_row['datname']] = dependents
+
+    threads = []
+    for idx in range(
+        min(max(1, config.ROLE_DEPENDENTS_WORKERS), len(pending))
+    ):
+        # Each thread requires its own copy of the request context.
+        t = Thread(target=copy_current_request_context(fetch))
+        t.daemon = True
+        t.start()
+        threads.append(t)
+
+    for t in threads:
+        t.join(max(0, deadline - time.time()))
+
+    with lock:
+        for db_row in databases:
+            datname = db_row['datname']
+            if datname in results:
+                continue
+
+            results[datname] = [{
+                'type': 'database',
+                'name': _(
+                    "Could not fetch the dependents: {0}"
+                ).format(errors.get(datname, _("Timed out."))),
+                'field': datname
+            }]
+
+        return dict(results)
+
 
 class RoleView(PGChildNodeView):
     node_type = 'role'
@@ -934,34 +1137,25 @@ rolmembership:{
         Returns: Dictionary of dependents for the selected node.
         """
 
-        # Dictionary for the object types
-        types = {
-            # None specified special handling for this type
-            'r': 'table',
-            'i': None,
-            'S': 'sequence',
-            'v': 'view',
-            'x': 'external_table',
-            'p': 'function',
-            'n': 'schema',
-            'y': 'type',
-            'd': 'domain',
-            'T': 'trigger_function',
-            'C': 'conversion',
-            'o': None
-        }
-
         query = render_template("/".join([self.sql_path, 'dependents.sql']),
                                 fetch_database=True, rid=rid)
         status, db_result = self.conn.execute_dict(query)
         if not status:
             current_app.logger.error(db_result)
 
-        dependents = list()
-
         # Get the server manager
         manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(sid)
 
+        # Search the databases, which allow connections, in parallel
+        results = databases_dependents(
+            manager, rid, [
+                db_row for db_row in db_result['rows']
+                if db_row['datallowconn']
+            ], self.sql_path
+        )
+
+        dependents = list()
+
         for db_row in db_result['rows']:
             oid = db_row['datdba']
             if db_row['type'] == 'd':
@@ -982,76 +1176,7 @@ rolmembership:{
                     }
                 )
 
-            # If connection to the database is not allowed then continue
-            # with the next database
-            if not db_row['datallowconn']:
-                continue
-
-            # Get the connection from the manager for the specified database.
-            # Check the connect status and if it is not connected then create
-            # a new connection to run the query and fetch the dependents.
-            is_connected = True
-            try:
-                temp_conn = manager.connection(db_row['datname'])
-                is_connected = temp_conn.connected()
-                if not is_connected:
-                    temp_conn.connect()
-            except Exception as e:
-                current_app.logger.exception(e)
-
-            if temp_conn.connected():
-                query = render_template(
-                    "/".join([self.sql_path, 'dependents.sql']),
-                    fetch_dependents=True, rid=rid,
-                    lastsysoid=db_row['datlastsysoid']
-                )
-
-                status, result = temp_conn.execute_dict(query)
-                if not status:
-                    current_app.logger.error(result)
-
-                for row in result['rows']:
-                    rel_name = row['nspname']
-                    if rel_name is not None:
-                        rel_name += '.'
-
-                    if rel_name is None:
-                        rel_name = row['relname']
-                    else:
-                        rel_name += row['relname']
-
-                    type_name = ''
-                    type_str = row['relkind']
-                    # Fetch the type name from the dictionary
-                    # if type is not present in the types dictionary then
-                    # we will continue and not going to add it.
-                    if type_str[0] in types:
-
-                        # if type is present in the types dictionary, but it's
-                        # value is None then it requires special handling.
-                        if types[type_str[0]] is None:
-                            if type_str[0] == 'i':
-                                type_name = 'index'
-                                rel_name = row['indname'] + ' ON ' + rel_name
-                            elif type_str[0] == 'o':
-                                type_name = 'operator'
-                                rel_name = row['relname']
-                        else:
-                            type_name = types[type_str[0]]
-                    else:
-                        continue
-
-                    dependents.append(
-                        {
-                            'type': type_name,
-                            'name': rel_name,
-                            'field': db_row['datname']
-                        }
-                    )
-
-                # Release only those connections which we have created above.
-                if not is_connected:
-                    manager.release(db_row['datname'])
+            dependents.extend(results.get(db_row['datname'], []))
 
         return dependents
 
@@ -0,0 +1,115 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import sys
+import threading
+import time
+
+from flask import Flask
+
+import config
+from pgadmin.browser.server_groups.servers import roles
+from pgadmin.utils.route import BaseTestGenerator
+
+if sys.version_info < (3, 3):
+    from mock import patch, MagicMock
+else:
+    from unittest.mock import patch, MagicMock
+
+
+class RoleDependentsInDatabasesTestCase(BaseTestGenerator):
+    """Test the parallel search of the dependents of a role in databases"""
+    scenarios = [
+        ('Databases are searched in parallel',
+         dict(
+             databases=['db{0}'.format(idx) for idx in range(8)],
+             failing=[],
+             slow=[],
+             cached=[],
+             expected_errors=[],
+             expected_searched=8
+         )),
+        ('Unreachable databases are reported with the others',
+         dict(
+             databases=['db1', 'db2', 'db3'],
+             failing=['db2'],
+             slow=[],
+             cached=[],
+             expected_errors=['db2'],
+             expected_searched=3
+         )),
+        ('Databases not searched within the timeout are reported',
+         dict(
+             databases=['db1', 'db2'],
+             failing=[],
+             slow=['db2'],
+             cached=[],
+             expected_errors=['db2'],
+             expected_searched=2
+         )),
+        ('Cached dependents are not searched again',
+         dict(
+             databases=['db1', 'db2'],
+             failing=[],
+             slow=[],
+             cached=['db1'],
+             expected_errors=[],
+             expected_searched=1
+         )),
+    ]
+
+    @patch.object(config, 'ROLE_DEPENDENTS_TIMEOUT', 1)
+    @patch.object(config, 'ROLE_DEPENDENTS_WORKERS', 4)
+    @patch('pgadmin.browser.server_groups.servers.roles.database_dependents')
+    def runTest(self, database_dependents_mock):
+        searched = []
+        threads = set()
+
+        def database_dependents(manager, db_row, rid, sql_path):
+            searched.append(db_row['datname'])
+            threads.add(threading.current_thread().ident)
+            if db_row['datname'] in self.failing:
+                raise Exception('could not connect')
+            time.sleep(2 if db_row['datname'] in self.slow else 0.05)
+            return [{'type': 'table', 'name': 'public.t',
+                     'field': db_row['datname']}]
+
+        database_dependents_mock.side_effect = database_dependents
+
+        manager = MagicMock(sid=1)
+        roles.DEPENDENTS_CACHE.clear()
+        for datname in self.cached:
+            roles.DEPENDENTS_CACHE[(1, datname, 10)] = (time.time(), [
+                {'type': 'table', 'name': 'public.t', 'field': datname}
+            ])
+
+        app = Flask(__name__)
+        with app.test_request_context():
+            start = time.time()
+            results = roles.databases_dependents(
+                manager, 10, [
+                    {'datname': datname, 'datlastsysoid': 0}
+                    for datname in self.databases
+                ], 'roles/sql/#10#'
+            )
+            elapsed = time.time() - start
+
+        self.assertEqual(sorted(results), sorted(self.databases))
+        self.assertEqual(len(searched), self.expected_searched)
+        self.assertLess(elapsed, 1.5)
+        if self.expected_searched > 1:
+            self.assertGreater(len(threads), 1)
+
+        for datname in self.databases:
+            if datname in self.expected_errors:
+                self.assertEqual(results[datname][0]['type'], 'database')
+                self.assertNotIn((1, datname, 10), roles.DEPENDENTS_CACHE)
+            else:
+                self.assertEqual(results[datname][0]['type'], 'table')
+                self.assertIn((1, datname, 10), roles.DEPENDENTS_CACHE)
@@ -0,0 +1,9 @@
+{### Type, and identity of the given objects, i.e. (classid, objid, objsubid) ###}
+SELECT obj.classid, obj.objid, obj.objsubid, ident.type, ident.identity
+FROM (VALUES
+{% for obj in objects %}
+    ({{ obj[0] }}::oid, {{ obj[1] }}::oid, {{ obj[2] }}){% if not loop.last %},{% endif %}
+
+{% endfor %}
+) obj(classid, objid, objsubid),
+LATERAL pg_identify_object(obj.classid, obj.objid, obj.objsubid) ident
@@ -0,0 +1,31 @@
+{###
+Rows of pg_depend (or, of pg_shdepend for the current database, if 'shared'
+is specified) added by the transactions after 'xid' (all the rows, if not
+specified), along with the total number of the rows, and the maximum
+transaction id of the rows in the catalog.
+
+The total number, and the maximum transaction id are returned even if no rows
+were added (with NULLs in the other columns), and are found within the same
+snapshot.
+###}
+WITH dep AS (
+{% if shared %}
+    SELECT classid, objid, objsubid, refclassid, refobjid,
+        0 AS refobjsubid, 's' || deptype AS deptype, xmin::text::bigint AS xid
+    FROM pg_shdepend
+    WHERE deptype != 'p' AND dbid IN (
+        0, (SELECT oid FROM pg_database WHERE datname = current_database())
+    )
+{% else %}
+    SELECT classid, objid, objsubid, refclassid, refobjid, refobjsubid,
+        deptype::text AS deptype, xmin::text::bigint AS xid
+    FROM pg_depend
+    WHERE deptype != 'p'
+{% endif %}
+)
+SELECT total.count AS total, total.xid AS max_xid,
+    dep.classid, dep.objid, dep.objsubid, dep.refclassid, dep.refobjid,
+    dep.refobjsubid, dep.deptype
+FROM (SELECT count(*) AS count, COALESCE(max(xid), 0) AS xid FROM dep) total
+LEFT JOIN dep ON {% if xid %}dep.xid > {{ xid }}{% else %}true{% endif %}
+
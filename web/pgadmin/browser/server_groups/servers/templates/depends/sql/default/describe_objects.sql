@@ -0,0 +1,9 @@
+{### Description of the given objects, i.e. (classid, objid, objsubid) ###}
+SELECT obj.classid, obj.objid, obj.objsubid,
+    NULL::text AS type, pg_describe_object(obj.classid, obj.objid, obj.objsubid) AS identity
+FROM (VALUES
+{% for obj in objects %}
+    ({{ obj[0] }}::oid, {{ obj[1] }}::oid, {{ obj[2] }}){% if not loop.last %},{% endif %}
+
+{% endfor %}
+) obj(classid, objid, objsubid)
@@ -0,0 +1,104 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import sys
+import time
+
+from flask import Flask
+
+from pgadmin.browser.server_groups import servers
+from pgadmin.utils.route import BaseTestGenerator
+
+if sys.version_info < (3, 3):
+    from mock import patch, Mock
+else:
+    from unittest.mock import patch, Mock
+
+
+class RecoveryStatesTestCase(BaseTestGenerator):
+    """Test the parallel, cached check of the recovery state of servers"""
+    scenarios = [
+        ('Servers without the cached state are checked',
+         dict(
+             cached={},
+             check_delay=0,
+             expected={1: (False, False), 2: (False, False)},
+             expected_checks=[1, 2]
+         )),
+        ('Fresh cached state is returned without checking',
+         dict(
+             cached={1: (True, False, 0)},
+             check_delay=0,
+             expected={1: (True, False), 2: (False, False)},
+             expected_checks=[2]
+         )),
+        ('Stale cached state is returned without waiting for the check',
+         dict(
+             cached={1: (True, True, -60)},
+             check_delay=0.5,
+             expected={1: (True, True)},
+             expected_checks=[1]
+         )),
+        ('Unknown state is returned, when the check exceeds the timeout',
+         dict(
+             cached={},
+             check_delay=1,
+             expected={1: (None, None)},
+             expected_checks=[1]
+         )),
+    ]
+
+    def setUp(self):
+        servers.RECOVERY_STATE_CACHE.clear()
+        servers.RECOVERY_STATE_CHECKS.clear()
+        now = time.time()
+        for sid, state in self.cached.items():
+            servers.RECOVERY_STATE_CACHE[sid] = \
+                (state[0], state[1], now + state[2])
+
+    def tearDown(self):
+        servers.RECOVERY_STATE_CACHE.clear()
+        servers.RECOVERY_STATE_CHECKS.clear()
+
+    @patch('pgadmin.browser.server_groups.servers.config')
+    @patch('pgadmin.browser.server_groups.servers.recovery_state')
+    def runTest(self, recovery_state_mock, config_mock):
+        config_mock.SERVER_STATUS_CACHE_TTL = 10
+        config_mock.SERVER_STATUS_CHECK_WORKERS = 4
+        config_mock.SERVER_STATUS_CHECK_TIMEOUT = 0.2
+
+        checked = []
+
+        def check(conn, version):
+            time.sleep(self.check_delay)
+            checked.append(conn.manager.sid)
+            servers.RECOVERY_STATE_CACHE[conn.manager.sid] = \
+                (False, False, time.time())
+            return False, False
+
+        recovery_state_mock.side_effect = check
+
+        managers = []
+        for sid in self.expected:
+            manager = Mock(sid=sid, version=100000)
+            manager.connection.return_value = Mock(manager=manager)
+            managers.append(manager)
+
+        app = Flask(__name__)
+        with app.test_request_context():
+            states = servers.recovery_states(managers)
+
+        self.assertEqual(states, self.expected)
+
+        # Wait for the checks running in the background
+        deadline = time.time() + 5
+        while servers.RECOVERY_STATE_CHECKS and time.time() < deadline:
+            time.sleep(0.05)
+
+        self.assertEqual(sorted(checked), self.expected_checks)
@@ -0,0 +1,27 @@
+{#=============Version of the catalogs of the database========#}
+{#
+    The numbers of the inserted, updated, and deleted rows of the catalogs
+    are kept by the statistics (without scanning the catalogs), and they only
+    grow until the statistics are reset.
+
+    When the statistics are not collected (track_counts = off), the number
+    of the rows, and the maximum xmin of the catalogs are used instead.
+#}
+SELECT CASE WHEN pg_catalog.current_setting('track_counts')::boolean THEN (
+    SELECT COALESCE(pg_catalog.pg_stat_get_db_stat_reset_time(d.oid)::text, '') || ',' ||
+        pg_catalog.string_agg(
+            pg_catalog.pg_stat_get_tuples_inserted(c.oid) || ':' ||
+            pg_catalog.pg_stat_get_tuples_updated(c.oid) || ':' ||
+            pg_catalog.pg_stat_get_tuples_deleted(c.oid), ',' ORDER BY c.oid
+        )
+    FROM pg_catalog.pg_class c, pg_catalog.pg_database d
+    WHERE c.oid IN ({% for catalog in catalogs %}'pg_catalog.{{ catalog }}'::regclass{% if not loop.last %}, {% endif %}{% endfor %})
+        AND d.datname = pg_catalog.current_database()
+    GROUP BY d.oid
+) ELSE (
+    SELECT
+{% for catalog in catalogs %}
+        (SELECT count(*) || ':' || COALESCE(max(xmin::text::bigint), 0) FROM pg_catalog.{{ catalog }}){% if not loop.last %} || ',' ||{% endif %}
+
+{% endfor %}
+) END AS version
@@ -0,0 +1,78 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from flask import Response
+
+from pgadmin.browser.catalog_cache import CatalogCache
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class CatalogCacheTestCase(BaseTestGenerator):
+    """Test the caching of the responses in the catalog cache"""
+    scenarios = [
+        ('Cached response is returned for the same catalog version',
+         dict(
+             responses=[((1, 2, 'a'), 'v1', b'{"a": 1}')],
+             lookup=((1, 2, 'a'), 'v1'),
+             invalidate=None,
+             expected=b'{"a": 1}',
+             expected_entries=1
+         )),
+        ('Cached response is not returned for a different catalog version',
+         dict(
+             responses=[((1, 2, 'a'), 'v1', b'{"a": 1}')],
+             lookup=((1, 2, 'a'), 'v2'),
+             invalidate=None,
+             expected=None,
+             expected_entries=1
+         )),
+        ('Least recently used response is evicted, when the size exceeds',
+         dict(
+             responses=[((1, 2, 'a'), 'v1', b'a' * 6),
+                        ((1, 2, 'b'), 'v1', b'b' * 6)],
+             lookup=((1, 2, 'a'), 'v1'),
+             invalidate=None,
+             expected=None,
+             expected_entries=1
+         )),
+        ('Cached responses of the server are removed on invalidation',
+         dict(
+             responses=[((1, 2, 'a'), 'v1', b'a'),
+                        ((3, 2, 'a'), 'v1', b'a')],
+             lookup=((1, 2, 'a'), 'v1'),
+             invalidate=1,
+             expected=None,
+             expected_entries=1
+         )),
+    ]
+
+    def runTest(self):
+        cache = CatalogCache(max_size=10, probe_interval=60)
+
+        for key, version, body in self.responses:
+            cache.set(key, version, Response(
+                body, status=200, mimetype='application/json'
+            ))
+
+        if self.invalidate is not None:
+            cache.invalidate(self.invalidate)
+
+        response = cache.get(*self.lookup)
+        stats = cache.stats()
+
+        if self.expected is None:
+            self.assertIsNone(response)
+            self.assertEqual(stats['misses'], 1)
+        else:
+            self.assertEqual(response.get_data(), self.expected)
+            self.assertEqual(response.mimetype, 'application/json')
+            self.assertEqual(stats['hit_rate'], 1)
+
+        self.assertEqual(stats['entries'], self.expected_entries)
+        self.assertTrue(stats['size'] <= 10)
@@ -0,0 +1,58 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import sys
+
+from pgadmin.browser.catalog_cache import CatalogCache
+from pgadmin.utils.route import BaseTestGenerator
+
+if sys.version_info < (3, 3):
+    from mock import patch, Mock
+else:
+    from unittest.mock import patch, Mock
+
+
+class CatalogVersionTestCase(BaseTestGenerator):
+    """Test the probe of the catalog version in the catalog cache"""
+    scenarios = [
+        ('Catalog version is probed once within the probe interval',
+         dict(
+             probe_interval=60,
+             invalidate=False,
+             expected_probes=1
+         )),
+        ('Catalog version is probed again after invalidation',
+         dict(
+             probe_interval=60,
+             invalidate=True,
+             expected_probes=2
+         )),
+        ('Catalog version is probed every time without the probe interval',
+         dict(
+             probe_interval=0,
+             invalidate=False,
+             expected_probes=2
+         )),
+    ]
+
+    @patch('pgadmin.browser.catalog_cache.render_template')
+    def runTest(self, render_template_mock):
+        render_template_mock.return_value = 'SELECT 1'
+        cache = CatalogCache(max_size=10, probe_interval=self.probe_interval)
+        conn = Mock()
+        conn.execute_scalar.return_value = (True, '10:20')
+
+        self.assertEqual(cache.catalog_version(1, 2, conn), '10:20')
+        if self.invalidate:
+            cache.invalidate(1, 2)
+        self.assertEqual(cache.catalog_version(1, 2, conn), '10:20')
+
+        self.assertEqual(
+            conn.execute_scalar.call_count, self.expected_probes
+        )
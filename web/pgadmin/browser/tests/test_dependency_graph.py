@@ -0,0 +1,118 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.browser.dependency_graph import DependencyGraph
+from pgadmin.utils.route import BaseTestGenerator
+
+PG_CLASS = 1259
+PG_PROC = 1255
+PG_REWRITE = 2618
+PG_TRIGGER = 2620
+
+
+def dep(node, ref, deptype='n'):
+    return {
+        'classid': node[0], 'objid': node[1], 'objsubid': node[2],
+        'refclassid': ref[0], 'refobjid': ref[1], 'refobjsubid': ref[2],
+        'deptype': deptype
+    }
+
+
+TABLE = (PG_CLASS, 10, 0)
+TRIGGER = (PG_TRIGGER, 11, 0)
+TRIGGER_FUNC = (PG_PROC, 12, 0)
+VIEW = (PG_CLASS, 20, 0)
+VIEW_RULE = (PG_REWRITE, 21, 0)
+OTHER_VIEW = (PG_CLASS, 30, 0)
+OTHER_VIEW_RULE = (PG_REWRITE, 31, 0)
+FUNC_A = (PG_PROC, 40, 0)
+FUNC_B = (PG_PROC, 41, 0)
+
+ROWS = [
+    # Trigger (with its function) on the table
+    dep(TRIGGER, TABLE, 'a'),
+    dep(TRIGGER, TRIGGER_FUNC),
+    # View on a column of the table, and a view on that view
+    dep(VIEW_RULE, VIEW, 'i'),
+    dep(VIEW_RULE, (PG_CLASS, 10, 2)),
+    dep(OTHER_VIEW_RULE, OTHER_VIEW, 'i'),
+    dep(OTHER_VIEW_RULE, VIEW),
+    # Functions depending on each other
+    dep(FUNC_A, FUNC_B),
+    dep(FUNC_B, FUNC_A),
+]
+
+
+class DependencyGraphWalkTestCase(BaseTestGenerator):
+    """Test the transitive dependencies, and dependents in the graph"""
+    scenarios = [
+        ('Direct dependents of a table include the owners of the rules',
+         dict(
+             nodes=[TABLE],
+             dependents=True,
+             depth=1,
+             expected=[
+                 (VIEW_RULE, 'n', 1), (VIEW, 'n', 1), (TRIGGER, 'a', 1)
+             ]
+         )),
+        ('Transitive dependents of a table',
+         dict(
+             nodes=[TABLE],
+             dependents=True,
+             depth=None,
+             expected=[
+                 (VIEW_RULE, 'n', 1), (VIEW, 'n', 1), (TRIGGER, 'a', 1),
+                 (OTHER_VIEW_RULE, 'n', 2), (OTHER_VIEW, 'n', 2)
+             ]
+         )),
+        ('Dependencies of a table include the dependencies of its parts',
+         dict(
+             nodes=[TABLE],
+             dependents=False,
+             depth=None,
+             expected=[(TRIGGER_FUNC, 'n', 1)]
+         )),
+        ('Transitive dependencies of a view are limited by the depth',
+         dict(
+             nodes=[OTHER_VIEW],
+             dependents=False,
+             depth=1,
+             expected=[(VIEW, 'n', 1)]
+         )),
+        ('Transitive dependencies of a view include the table of the '
+         'column it depends on',
+         dict(
+             nodes=[OTHER_VIEW],
+             dependents=False,
+             depth=None,
+             expected=[
+                 (VIEW, 'n', 1), ((PG_CLASS, 10, 2), 'n', 2),
+                 (TABLE, 'n', 2), (TRIGGER_FUNC, 'n', 3)
+             ]
+         )),
+        ('Cyclic dependencies are visited once',
+         dict(
+             nodes=[FUNC_A],
+             dependents=False,
+             depth=None,
+             expected=[(FUNC_B, 'n', 1)]
+         )),
+    ]
+
+    def runTest(self):
+        graph = DependencyGraph()
+        for row in ROWS:
+            graph.add(row)
+
+        if self.dependents:
+            result = graph.dependents(self.nodes, self.depth)
+        else:
+            result = graph.dependencies(self.nodes, self.depth)
+
+        self.assertEqual(result, self.expected)
@@ -0,0 +1,49 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.browser.dependency_graph import DependencyGraph, \
+    NODE_TYPE_CATALOGS
+from pgadmin.utils.route import BaseTestGenerator
+from .test_dependency_graph import dep, PG_CLASS, PG_PROC, PG_TRIGGER
+
+# A table, and a function having the same OID
+TABLE = (PG_CLASS, 10, 0)
+FUNC = (PG_PROC, 10, 0)
+TRIGGER = (PG_TRIGGER, 11, 0)
+
+
+class DependencyGraphNodesTestCase(BaseTestGenerator):
+    """Test finding the nodes of an object in the dependency graph"""
+    scenarios = [
+        ('Nodes of the table are found by the catalog of the table',
+         dict(
+             node_type='table',
+             expected=set([TABLE])
+         )),
+        ('Nodes of the function are found by the catalog of the function',
+         dict(
+             node_type='function',
+             expected=set([FUNC])
+         )),
+        ('Nodes of all the catalogs are found, when the catalog is not known',
+         dict(
+             node_type='catalog_object',
+             expected=set([TABLE, FUNC])
+         )),
+    ]
+
+    def runTest(self):
+        graph = DependencyGraph()
+        graph.add(dep(TRIGGER, TABLE, 'a'))
+        graph.add(dep(TRIGGER, FUNC))
+
+        self.assertEqual(
+            graph.nodes(10, NODE_TYPE_CATALOGS.get(self.node_type)),
+            self.expected
+        )
@@ -0,0 +1,82 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import sys
+
+from pgadmin.browser.dependency_graph import DependencyGraph
+from pgadmin.utils.route import BaseTestGenerator
+from .test_dependency_graph import dep, ROWS, TABLE, VIEW, OTHER_VIEW_RULE, \
+    TRIGGER_FUNC
+
+if sys.version_info < (3, 3):
+    from mock import patch, MagicMock
+else:
+    from unittest.mock import patch, MagicMock
+
+
+def scan_result(rows, total, max_xid):
+    """Returns the result of the dependency_graph.sql"""
+    if len(rows) == 0:
+        rows = [dict((key, None) for key in dep(TABLE, TABLE))]
+    return True, {'rows': [
+        dict(row, total=total, max_xid=max_xid) for row in rows
+    ]}
+
+
+class DependencyGraphRefreshTestCase(BaseTestGenerator):
+    """Test the incremental refresh of the dependency graph"""
+    scenarios = [
+        ('Rows added after the previous scan are merged',
+         dict(
+             refresh=[
+                 scan_result([dep(OTHER_VIEW_RULE, VIEW)], 3, 110),
+                 scan_result([], 0, 0)
+             ],
+             expected_round_trips=4
+         )),
+        ('Graph is rebuilt, when the rows have been removed',
+         dict(
+             refresh=[
+                 scan_result([dep(OTHER_VIEW_RULE, VIEW)], 2, 110),
+                 scan_result(ROWS[:2] + [dep(OTHER_VIEW_RULE, VIEW)],
+                             3, 110),
+                 scan_result([], 0, 0)
+             ],
+             expected_round_trips=5
+         )),
+    ]
+
+    @patch('pgadmin.browser.dependency_graph.render_template')
+    def runTest(self, render_template_mock):
+        render_template_mock.side_effect = \
+            lambda path, **kwargs: kwargs.get('xid')
+
+        conn = MagicMock()
+        conn.execute_dict.side_effect = [
+            scan_result(ROWS[:2], 2, 100),
+            scan_result([], 0, 0)
+        ] + self.refresh
+
+        graph = DependencyGraph()
+        for _ in range(2):
+            self.assertEqual(graph.refresh(conn, 'depends/sql/#10#', 60),
+                             (True, None))
+
+        # Only the rows added after the first scan were fetched at first
+        self.assertEqual(conn.execute_dict.call_args_list[2][0][0], 100)
+        self.assertEqual(
+            conn.execute_dict.call_count, self.expected_round_trips
+        )
+        self.assertEqual(graph.versions[False], (3, 110))
+        self.assertEqual(
+            graph.dependents([VIEW], None), [(OTHER_VIEW_RULE, 'n', 1)]
+        )
+        self.assertEqual(
+            graph.dependencies([TABLE], None), [(TRIGGER_FUNC, 'n', 1)]
+        )
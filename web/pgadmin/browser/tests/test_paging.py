@@ -0,0 +1,113 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import sys
+
+from flask import Flask
+
+from pgadmin.browser import paging
+from pgadmin.utils.route import BaseTestGenerator
+
+if sys.version_info < (3, 3):
+    from mock import patch, MagicMock
+else:
+    from unittest.mock import patch, MagicMock
+
+ROWS = [
+    {'oid': 10, 'name': 'a_table'},
+    {'oid': 11, 'name': 'b_table'},
+    {'oid': 12, 'name': 'c_table'}
+]
+
+
+class FetchNodesTestCase(BaseTestGenerator):
+    """Test the paging of the nodes in a collection"""
+    scenarios = [
+        ('All the nodes are returned, when the paging is not requested',
+         dict(
+             query_string='',
+             rows=ROWS,
+             expected_paging=None,
+             expected_rows=ROWS,
+             expected_page=None
+         )),
+        ('First page returns the cursor of the next page',
+         dict(
+             query_string='limit=2&prefix=a_%25',
+             rows=ROWS,
+             expected_paging={
+                 'limit': 2, 'after': None, 'prefix': 'a\\_\\%%',
+                 'count': False
+             },
+             expected_rows=ROWS[:2],
+             expected_page={
+                 'total': 5, 'next': paging.encode_cursor('b_table', 11)
+             }
+         )),
+        ('Last page does not return the cursor',
+         dict(
+             query_string='limit=2&after={0}'.format(
+                 paging.encode_cursor('b_table', 11)
+             ),
+             rows=ROWS[2:],
+             expected_paging={
+                 'limit': 2, 'after': ['b_table', 11], 'prefix': None,
+                 'count': False
+             },
+             expected_rows=ROWS[2:],
+             expected_page={'total': 5, 'next': None}
+         )),
+        ('Invalid cursor is reported',
+         dict(
+             query_string='limit=2&after=invalid',
+             rows=ROWS,
+             expected_paging=None,
+             expected_rows=None,
+             expected_page=None
+         )),
+    ]
+
+    @patch('pgadmin.browser.paging.render_template')
+    def runTest(self, render_template_mock):
+        render_template_mock.side_effect = \
+            lambda template, **kwargs: 'SELECT 1;'
+
+        conn = MagicMock()
+        conn.execute_2darray.return_value = (True, {'rows': self.rows})
+        conn.execute_scalar.return_value = (True, '5')
+
+        app = Flask(__name__)
+        with app.test_request_context('/?' + self.query_string):
+            status, rows, page = paging.fetch_nodes(
+                conn, 'tables/sql/#10#/nodes.sql', scid=2200
+            )
+
+        if self.expected_rows is None:
+            self.assertFalse(status)
+            self.assertEqual(conn.execute_2darray.call_count, 0)
+            return
+
+        self.assertTrue(status)
+        self.assertEqual(rows, self.expected_rows)
+        self.assertEqual(page, self.expected_page)
+
+        kwargs = render_template_mock.call_args_list[0][1]
+        if kwargs['paging'] is not None:
+            kwargs['paging']['after'] = kwargs['paging']['after'] and \
+                list(kwargs['paging']['after'])
+        self.assertEqual(kwargs['paging'], self.expected_paging)
+        self.assertEqual(kwargs['scid'], 2200)
+
+        if self.expected_page is not None:
+            # The total is counted without the cursor, and the limit
+            self.assertTrue(render_template_mock.call_args_list[1][1][
+                'paging']['count'])
+            conn.execute_scalar.assert_called_once_with(
+                'SELECT count(*) FROM (SELECT 1) nodes'
+            )
@@ -0,0 +1,59 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import os
+
+from jinja2 import Environment, FileSystemLoader
+
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class PagingMacrosTestCase(BaseTestGenerator):
+    """Test the paging macros used by the templates of the nodes"""
+    scenarios = [
+        ('Nodes are ordered by their names, when not paged',
+         dict(
+             paging=None,
+             expected='ORDER BY rel.relname'
+         )),
+        ('Nodes are filtered, and limited, when paged',
+         dict(
+             paging={
+                 'limit': 50, 'after': ('b_table', 11), 'prefix': 'b%',
+                 'count': False
+             },
+             expected="AND rel.relname LIKE 'b%' "
+                      "AND (rel.relname, rel.oid) > ('b_table'::name, "
+                      "11::oid) "
+                      "ORDER BY rel.relname, rel.oid LIMIT 51"
+         )),
+        ('Nodes are only filtered by the prefix, when counted',
+         dict(
+             paging={
+                 'limit': 50, 'after': ('b_table', 11), 'prefix': 'b%',
+                 'count': True
+             },
+             expected="AND rel.relname LIKE 'b%'"
+         )),
+    ]
+
+    def runTest(self):
+        env = Environment(loader=FileSystemLoader(os.path.join(
+            os.path.dirname(__file__), '..', 'server_groups', 'servers',
+            'templates'
+        )))
+        env.filters['qtLiteral'] = lambda value: "'{0}'".format(value)
+
+        SQL = env.from_string(
+            "{% import 'macros/paging.macros' as PAGING %}"
+            "{{ PAGING.FILTER('rel.relname', 'rel.oid', paging) }} "
+            "{{ PAGING.ORDER('rel.relname', 'rel.oid', paging) }}"
+        ).render(paging=self.paging)
+
+        self.assertEqual(' '.join(SQL.split()), self.expected)
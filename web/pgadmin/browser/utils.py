@@ -15,8 +15,13 @@ import flask
 from flask import render_template, current_app
 from flask.views import View, MethodViewType, with_metaclass
 from flask_babelex import gettext
+from flask_login import current_user
 
+import config
 from config import PG_DEFAULT_DRIVER
+from pgadmin.browser.catalog_cache import catalog_cache
+from pgadmin.browser.dependency_graph import dependency_graph_cache, \
+    describe_objects, requested_depth, DEPENDENCY_TYPES, NODE_TYPE_CATALOGS
 from pgadmin.utils.ajax import make_json_response, precondition_required
 from pgadmin.utils.exception import ConnectionLost, SSHTunnelConnectionLost,\
     CryptKeyMissing
@@ -306,6 +311,70 @@ class NodeView(with_metaclass(MethodViewType, View)):
 
 
 class PGChildNodeView(NodeView):
+    def dispatch_request(self, *args, **kwargs):
+        """
+        Serve the nodes, properties, and reverse engineered SQL of the
+        database objects from the catalog cache (when enabled), and remove
+        the cached responses of the server, when anything is modified.
+        """
+        if not config.CATALOG_CACHE_ENABLED or 'sid' not in kwargs:
+            return super(PGChildNodeView, self).dispatch_request(
+                *args, **kwargs
+            )
+
+        sid = kwargs['sid']
+        did = kwargs.get('did', None)
+
+        if flask.request.method not in ('GET', 'HEAD'):
+            try:
+                return super(PGChildNodeView, self).dispatch_request(
+                    *args, **kwargs
+                )
+            finally:
+                catalog_cache.invalidate(sid)
+
+        has_args, has_id = self.check_args(**kwargs)
+
+        # The database nodes are not cached, as they contain the connection
+        # status.
+        if did is None or self.node_type == 'database' or not (
+            self.cmd in ('nodes', 'sql') or (self.cmd == 'obj' and has_id)
+        ):
+            return super(PGChildNodeView, self).dispatch_request(
+                *args, **kwargs
+            )
+
+        version = None
+        try:
+            from pgadmin.utils.driver import get_driver
+            manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(sid)
+            conn = manager.connection(did=did)
+            if conn.connected():
+                version = catalog_cache.catalog_version(sid, did, conn)
+        except Exception as e:
+            current_app.logger.exception(e)
+
+        if version is None:
+            return super(PGChildNodeView, self).dispatch_request(
+                *args, **kwargs
+            )
+
+        key = (
+            sid, did, current_user.id, self.node_type, self.cmd, has_id,
+            tuple(sorted(kwargs.items())), flask.request.query_string,
+            getattr(self.blueprint, 'show_system_objects', None)
+        )
+
+        response = catalog_cache.get(key, version)
+        if response is None:
+            response = super(PGChildNodeView, self).dispatch_request(
+                *args, **kwargs
+            )
+            if isinstance(response, flask.Response):
+                catalog_cache.set(key, version, response)
+
+        return response
+
     def children(self, **kwargs):
         """Build a list of treeview nodes from the child nodes."""
 
@@ -342,12 +411,18 @@ class PGChildNodeView(NodeView):
                 )
             )
 
+        backend_support_keywords = self.backend_support_keywords(
+            manager, conn, **kwargs
+        )
+
         nodes = []
         for module in self.blueprint.submodules:
             if isinstance(module, PGChildModule):
                 if (
                     manager is not None and
-                    module.BackendSupported(manager, **kwargs)
+                    module.BackendSupported(
+                        manager, **backend_support_keywords
+                    )
                 ):
                     nodes.extend(module.get_nodes(**kwargs))
             else:
@@ -360,6 +435,27 @@ class PGChildNodeView(NodeView):
             )
         )
 
+    def backend_support_keywords(self, manager, conn, **kwargs):
+        """
+        Returns the keywords to be passed to the BackendSupported(...) method
+        of the child modules, while listing the children of this node.
+
+        Some of the child modules need to know about the parent object (i.e.
+        whether it is a materialized view, or a partitioned table) to decide
+        whether they should be shown. Instead of running a query from each
+        of those modules, the node can fetch that information once here, and
+        pass it along with the keywords.
+
+        Args:
+            manager: Server connection manager
+            conn: Connection object
+            **kwargs: Identifiers of the node
+
+        Returns:
+            Dictionary of the keywords
+        """
+        return kwargs.copy()
+
     def get_dependencies(self, conn, object_id, where=None,
                          show_system_objects=None):
         """
@@ -376,6 +472,15 @@ class PGChildNodeView(NodeView):
         # Set the sql_path
         sql_path = 'depends/sql/#{0}#'.format(conn.manager.version)
 
+        # Transitive dependencies requested using the 'depth' argument
+        depth = requested_depth()
+        if depth is not None and where is None:
+            dependencies = self.__fetch_transitive_dependency(
+                conn, sql_path, object_id, depth, False, show_system_objects
+            )
+            if dependencies is not None:
+                return dependencies
+
         if where is None:
             where_clause = "WHERE dep.objid={0}::oid".format(object_id)
         else:
@@ -430,6 +535,15 @@ class PGChildNodeView(NodeView):
         # Set the sql_path
         sql_path = 'depends/sql/#{0}#'.format(conn.manager.version)
 
+        # Transitive dependents requested using the 'depth' argument
+        depth = requested_depth()
+        if depth is not None and where is None:
+            dependents = self.__fetch_transitive_dependency(
+                conn, sql_path, object_id, depth, True
+            )
+            if dependents is not None:
+                return dependents
+
         if where is None:
             where_clause = "WHERE dep.refobjid={0}::oid".format(object_id)
         else:
@@ -442,6 +556,61 @@ class PGChildNodeView(NodeView):
 
         return dependents
 
+    def __fetch_transitive_dependency(self, conn, sql_path, object_id,
+                                      depth, dependents,
+                                      show_system_objects=None):
+        """
+        This function is used to fetch the transitive dependencies (or,
+        dependents) of the selected node using the dependency graph of the
+        database.
+
+        Args:
+            conn: Connection object
+            sql_path: Path of the templates
+            object_id: Object Id of the selected node.
+            depth: Maximum depth (0 for unlimited)
+            dependents: Fetch the dependents (instead of the dependencies)
+
+        Returns: List of dependencies/dependents (with their depth) for the
+                 selected node, or None if the graph could not be fetched.
+        """
+        status, result = dependency_graph_cache.walk(
+            conn.manager.sid, conn.db, conn, sql_path, object_id, depth,
+            dependents, NODE_TYPE_CATALOGS.get(self.node_type)
+        )
+        if not status:
+            current_app.logger.error(result)
+            return None
+
+        status, objects = describe_objects(
+            conn, sql_path, set(node for node, _, _ in result)
+        )
+        if not status:
+            current_app.logger.error(objects)
+            return None
+
+        if show_system_objects is None:
+            show_system_objects = self.blueprint.show_system_objects
+
+        dependency = list()
+        for node, dep_str, level in result:
+            if node not in objects or (
+                    dep_str == 'i' and not show_system_objects):
+                continue
+
+            type_name, ref_name = objects[node]
+            dependency.append(
+                {
+                    'type': type_name,
+                    'name': ref_name,
+                    'field': DEPENDENCY_TYPES.get(dep_str, ''),
+                    'icon': None,
+                    'depth': level
+                }
+            )
+
+        return dependency
+
     def __fetch_dependency(self, conn, query, show_system_objects=None):
         """
         This function is used to fetch the dependency for the selected node.
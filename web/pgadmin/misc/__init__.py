@@ -10,9 +10,11 @@
 """A blueprint module providing utility functions for the application."""
 
 import pgadmin.utils.driver as driver
-from flask import url_for, render_template, Response, request
+from flask import url_for, render_template, Response, request, abort
 from flask_babelex import gettext
-from pgadmin.utils import PgAdminModule
+from flask_security import roles_required
+from pgadmin.utils import PgAdminModule, profiler
+from pgadmin.utils.ajax import make_json_response
 from pgadmin.utils.csrf import pgCSRFProtect
 from pgadmin.utils.preferences import Preferences
 from pgadmin.utils.session import cleanup_session_files
@@ -140,3 +142,16 @@ def shutdown():
         return 'SHUTDOWN'
     else:
         return ''
+
+
+##########################################################################
+# The measurements of the requests aggregated per endpoint
+##########################################################################
+@blueprint.route("/profiling", methods=['GET'], endpoint='profiling')
+@roles_required('Administrator')
+def profiling():
+    """Returns the measurements of the requests (if enabled)."""
+    if not config.PROFILING_ENABLED:
+        abort(404)
+
+    return make_json_response(data=profiler.get_stats())
@@ -54,6 +54,10 @@ blueprint = BGProcessModule(
     MODULE_NAME, __name__, url_prefix='/misc/bgprocess'
 )
 
+# The processes queued by the previous run of the application will never be
+# started.
+blueprint.before_app_first_request(BatchProcess.fail_queued_processes)
+
 
 @blueprint.route('/', methods=['GET'], endpoint='list')
 @login_required
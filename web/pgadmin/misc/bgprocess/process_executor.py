@@ -283,6 +283,12 @@ def execute():
     """
     command = sys.argv[1:]
     args = dict()
+
+    # Run the python script (i.e. orchestrating the multiple utilities) using
+    # the same interpreter as the process executor.
+    if command and command[0].endswith('.py'):
+        command.insert(0, sys.executable)
+
     _log('Initialize the process execution: {0}'.format(command))
 
     # Create seprate thread for stdout and stderr
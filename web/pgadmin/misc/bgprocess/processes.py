@@ -13,12 +13,15 @@ Introduce a function to run the process executor in detached mode.
 """
 import csv
 import os
+import shutil
 import sys
+import time
 import psutil
 from abc import ABCMeta, abstractproperty, abstractmethod
-from datetime import datetime
+from datetime import datetime, timedelta
 from pickle import dumps, loads
 from subprocess import Popen
+from threading import Lock, Thread
 
 from pgadmin.utils import IS_PY2, u, file_quote, fs_encoding, \
     get_complete_file_path
@@ -31,6 +34,7 @@ from flask_security import current_user
 
 import config
 from pgadmin.model import Process, db
+from .scheduler import BatchProcessScheduler
 if IS_PY2:
     from StringIO import StringIO
 else:
@@ -40,6 +44,7 @@ PROCESS_NOT_STARTED = 0
 PROCESS_STARTED = 1
 PROCESS_FINISHED = 2
 PROCESS_TERMINATED = 3
+PROCESS_QUEUED = 4
 
 
 def get_current_time(format='%Y-%m-%d %H:%M:%S.%f %z'):
@@ -51,6 +56,97 @@ def get_current_time(format='%Y-%m-%d %H:%M:%S.%f %z'):
     ).strftime(format)
 
 
+class ProcessInfoCache(object):
+    """
+    In-memory (per application process) cache of the background process
+    information, used by BatchProcess.list().
+
+    The description, command and arguments of a process never change after
+    its creation, hence - the unpickled description, and the details built
+    from them are kept for the lifetime of the process entry. Once a process
+    has finished, its complete list entry is kept too, as nothing but the
+    acknowledgement (which removes the entry) can change it.
+
+    For the running processes, we remember the modification time and size of
+    the 'status' file, so that it is parsed again only when the process
+    executor has updated it.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        # (user_id, pid) => (desc, type_desc, details)
+        self._details = dict()
+        # (user_id, pid) => list entry of the finished process
+        self._finished = dict()
+        # pid => (mtime, size) of the status file
+        self._status = dict()
+
+    def get_details(self, user_id, pid):
+        with self._lock:
+            return self._details.get((user_id, pid), None)
+
+    def set_details(self, user_id, pid, details):
+        with self._lock:
+            self._details[(user_id, pid)] = details
+
+    def get_finished(self, user_id, pid):
+        with self._lock:
+            return self._finished.get((user_id, pid), None)
+
+    def set_finished(self, user_id, pid, entry):
+        with self._lock:
+            self._finished[(user_id, pid)] = entry
+            self._status.pop(pid, None)
+
+    def status_changed(self, pid, stat):
+        """
+        Returns True, if the status file has been modified since the last
+        time we have seen it.
+        """
+        with self._lock:
+            key = (stat.st_mtime, stat.st_size)
+            if self._status.get(pid, None) == key:
+                return False
+            self._status[pid] = key
+            return True
+
+    def invalidate(self, pid, user_id=None):
+        with self._lock:
+            self._status.pop(pid, None)
+            for cache in (self._details, self._finished):
+                for key in list(cache):
+                    if key[1] == pid and (
+                        user_id is None or key[0] == user_id
+                    ):
+                        del cache[key]
+
+    def retain(self, user_id, pids):
+        """
+        Remove the cached entries of the given user, which are not in the
+        given list of process ids (i.e. removed from the configuration
+        database by another application process).
+        """
+        with self._lock:
+            for cache in (self._details, self._finished):
+                for key in list(cache):
+                    if key[0] == user_id and key[1] not in pids:
+                        self._status.pop(key[1], None)
+                        del cache[key]
+
+
+process_info_cache = ProcessInfoCache()
+
+# Limits the number of the background processes running concurrently.
+scheduler = BatchProcessScheduler(
+    max_jobs=config.BG_PROCESS_MAX_JOBS,
+    max_jobs_per_server=config.BG_PROCESS_MAX_JOBS_PER_SERVER
+)
+
+# Last time, we have checked for the background processes to be pruned.
+LAST_CHECK_PRUNE_PROCESSES = None
+PRUNE_PROCESSES_LOCK = Lock()
+
+
 class IProcessDesc(object):
     __metaclass__ = ABCMeta
 
@@ -68,7 +164,7 @@ class BatchProcess(object):
 
         self.id = self.desc = self.cmd = self.args = self.log_dir = \
             self.stdout = self.stderr = self.stime = self.etime = \
-            self.ecode = None
+            self.ecode = self.server_id = self.user_id = self.cb = None
         self.env = dict()
 
         if 'id' in kwargs:
@@ -98,6 +194,8 @@ class BatchProcess(object):
 
         # ID
         self.id = _id
+        # User ID
+        self.user_id = p.user_id
         # Description
         self.desc = tmp_desc
         # Status Acknowledged time
@@ -155,6 +253,8 @@ class BatchProcess(object):
 
         # ID
         self.id = ctime
+        # User ID
+        self.user_id = current_user.id
         # Description
         self.desc = _desc
         # Status Acknowledged time
@@ -216,7 +316,62 @@ class BatchProcess(object):
         db.session.add(j)
         db.session.commit()
 
-    def start(self, cb=None):
+    def start(self, cb=None, priority=0):
+        """
+        Start the process, or put it in the queue, if the configured number
+        of the background processes are already running.
+
+        Args:
+            cb: Callback to update the environment variables of the process
+            priority: Processes with the higher priority will be started
+                      first from the queue.
+        """
+        if self.stime is not None:
+            if self.etime is None:
+                raise Exception(_('The process has already been started.'))
+            raise Exception(
+                _('The process has already finished and cannot be restarted.')
+            )
+
+        self.cb = cb
+        scheduler.submit(current_app._get_current_object(), self, priority)
+
+    def on_queued(self):
+        """
+        Mark the process as queued.
+
+        It is called by the scheduler before the process is put in the queue,
+        hence - the process can not be started (and marked as started) by the
+        watcher thread before it is marked as queued.
+        """
+        current_app.logger.info(
+            u"Queued the process: %s", self.id
+        )
+        p = Process.query.filter_by(
+            pid=self.id, user_id=self.user_id
+        ).first()
+        p.process_state = PROCESS_QUEUED
+        p.queue_time = get_current_time()
+        db.session.commit()
+        self.process_state = PROCESS_QUEUED
+
+    def launch(self):
+        """
+        Run the process executor for this process.
+
+        Returns:
+            The Popen object of the process executor, or None if the process
+            has been stopped while it was in the queue.
+        """
+        # The queued process may have been stopped from another application
+        # process (i.e. web worker), which could not remove it from the queue.
+        p = Process.query.filter_by(
+            pid=self.id, user_id=self.user_id
+        ).first()
+        if p is None or p.end_time is not None:
+            return None
+
+        cb = self.cb
 
         def which(program, paths):
             def is_exe(fpath):
@@ -249,13 +404,6 @@ class BatchProcess(object):
                 temp_env[key] = value
             return temp_env
 
-        if self.stime is not None:
-            if self.etime is None:
-                raise Exception(_('The process has already been started.'))
-            raise Exception(
-                _('The process has already finished and cannot be restarted.')
-            )
-
         executor = file_quote(os.path.join(
             os.path.dirname(u(__file__)), u'process_executor.py'
         ))
@@ -396,22 +544,56 @@ class BatchProcess(object):
             # There is no way to find out the error message from this process
             # as standard output, and standard error were redirected to
             # devnull.
-            p = Process.query.filter_by(
-                pid=self.id, user_id=current_user.id
+            j = Process.query.filter_by(
+                pid=self.id, user_id=self.user_id
             ).first()
-            p.start_time = p.end_time = get_current_time()
-            if not p.exit_code:
-                p.exit_code = self.ecode
-            p.process_state = PROCESS_FINISHED
+            j.start_time = j.end_time = get_current_time()
+            if not j.exit_code:
+                j.exit_code = self.ecode
+            j.process_state = PROCESS_FINISHED
             db.session.commit()
         else:
             # Update the process state to "Started"
-            p = Process.query.filter_by(
-                pid=self.id, user_id=current_user.id
+            j = Process.query.filter_by(
+                pid=self.id, user_id=self.user_id
             ).first()
-            p.process_state = PROCESS_STARTED
+            j.process_state = PROCESS_STARTED
+            db.session.commit()
+
+        return p
+
+    def is_running(self):
+        """
+        Check if the process is still running.
+
+        The process executor detaches the utility, and exits immediately,
+        hence - the Popen object returned by launch() can not be used for it.
+        The process is running until its end time is set, or the process
+        (executor, or utility), whose pid is found in the status file, is
+        gone.
+        """
+        p = Process.query.filter_by(
+            pid=self.id, user_id=self.user_id
+        ).first()
+
+        if p is None:
+            return False
+
+        status, updated = BatchProcess.update_process_info(p)
+        if updated:
             db.session.commit()
 
+        if p.end_time is not None or \
+                p.process_state == PROCESS_TERMINATED:
+            return False
+
+        # The status file has not been written yet, the process executor is
+        # still starting.
+        if p.utility_pid is None:
+            return True
+
+        return psutil.pid_exists(p.utility_pid)
+
     def status(self, out=0, err=0):
         import re
 
@@ -468,6 +650,7 @@ class BatchProcess(object):
         ).first()
 
         execution_time = None
+        queue_wait = None
 
         if j is not None:
             status, updated = BatchProcess.update_process_info(j)
@@ -476,6 +659,8 @@ class BatchProcess(object):
             self.stime = j.start_time
             self.etime = j.end_time
             self.ecode = j.exit_code
+            self.process_state = j.process_state
+            queue_wait = BatchProcess.queue_wait(j)
 
             if self.stime is not None:
                 stime = parser.parse(self.stime)
@@ -498,6 +683,7 @@ class BatchProcess(object):
                 'start_time': self.stime,
                 'exit_code': self.ecode,
                 'execution_time': execution_time,
+                'queue_wait': queue_wait,
                 'process_state': self.process_state
             }
 
@@ -515,6 +701,7 @@ class BatchProcess(object):
             'start_time': self.stime,
             'exit_code': self.ecode,
             'execution_time': execution_time,
+            'queue_wait': queue_wait,
             'process_state': self.process_state
         }
 
@@ -522,9 +709,16 @@ class BatchProcess(object):
     def update_process_info(p):
         if p.start_time is None or p.end_time is None:
             status = os.path.join(p.logdir, 'status')
-            if not os.path.isfile(status):
+            try:
+                stat = os.stat(status)
+            except OSError:
                 return False, False
 
+            # Nothing has been changed by the process executor since we have
+            # read the status last time.
+            if not process_info_cache.status_changed(p.pid, stat):
+                return True, False
+
             with open(status, 'r') as fp:
                 import json
                 try:
@@ -550,6 +744,9 @@ class BatchProcess(object):
                     return True, True
 
                 except ValueError as e:
+                    # Read it again next time, the process executor might
+                    # be in the middle of writing it.
+                    process_info_cache.invalidate(p.pid)
                     current_app.logger.warning(
                         _("Status for the background process '{0}' could "
                           "not be loaded.").format(p.pid)
@@ -558,58 +755,89 @@ class BatchProcess(object):
                     return False, False
         return True, False
 
+    @staticmethod
+    def _get_process_details(p):
+        """
+        Unpickle the description of the process, and generate the details
+        from its command and arguments.
+        """
+        desc = ""
+        try:
+            desc = loads(p.desc.encode('latin-1')) if \
+                IS_PY2 and hasattr(p.desc, 'encode') else loads(p.desc)
+        except UnicodeDecodeError:
+            desc = loads(p.desc.encode('utf-8')) if \
+                IS_PY2 and hasattr(p.desc, 'encode') else loads(p.desc)
+        except Exception:
+            desc = loads(p.desc.encode('utf-8', 'ignore')) if \
+                IS_PY2 and hasattr(p.desc, 'encode') else loads(p.desc)
+
+        details = desc
+        type_desc = ''
+
+        if isinstance(desc, IProcessDesc):
+            args = []
+            args_csv = StringIO(
+                p.arguments.encode('utf-8')
+                if hasattr(p.arguments, 'decode') else p.arguments
+            )
+            args_reader = csv.reader(args_csv, delimiter=str(','))
+            for arg in args_reader:
+                args = args + arg
+            details = desc.details(p.command, args)
+            type_desc = desc.type_desc
+            desc = desc.message
+
+        return desc, type_desc, details
+
     @staticmethod
     def list():
-        processes = Process.query.filter_by(user_id=current_user.id)
+        user_id = current_user.id
+        processes = Process.query.filter_by(user_id=user_id)
         changed = False
 
         res = []
+        pids = set()
         for p in processes:
-            status, updated = BatchProcess.update_process_info(p)
-            if not status:
+            pids.add(p.pid)
+
+            # The finished process information can not be changed anymore.
+            entry = process_info_cache.get_finished(user_id, p.pid)
+            if entry is not None:
+                res.append(dict(entry))
                 continue
 
-            if not changed:
-                changed = updated
+            queued = p.process_state == PROCESS_QUEUED
+
+            # Queued process does not have the status file yet.
+            if not queued:
+                status, updated = BatchProcess.update_process_info(p)
+                if not status:
+                    continue
+
+                if not changed:
+                    changed = updated
 
-            if p.start_time is None or (
+            if (p.start_time is None and not queued) or (
                 p.acknowledge is not None and p.end_time is None
             ):
                 continue
 
-            execution_time = None
+            stime = execution_time = None
 
-            stime = parser.parse(p.start_time)
-            etime = parser.parse(p.end_time or get_current_time())
+            if p.start_time is not None:
+                stime = parser.parse(p.start_time)
+                etime = parser.parse(p.end_time or get_current_time())
 
-            execution_time = BatchProcess.total_seconds(etime - stime)
-            desc = ""
-            try:
-                desc = loads(p.desc.encode('latin-1')) if \
-                    IS_PY2 and hasattr(p.desc, 'encode') else loads(p.desc)
-            except UnicodeDecodeError:
-                desc = loads(p.desc.encode('utf-8')) if \
-                    IS_PY2 and hasattr(p.desc, 'encode') else loads(p.desc)
-            except Exception:
-                desc = loads(p.desc.encode('utf-8', 'ignore')) if \
-                    IS_PY2 and hasattr(p.desc, 'encode') else loads(p.desc)
-
-            details = desc
-
-            if isinstance(desc, IProcessDesc):
-                args = []
-                args_csv = StringIO(
-                    p.arguments.encode('utf-8')
-                    if hasattr(p.arguments, 'decode') else p.arguments
-                )
-                args_reader = csv.reader(args_csv, delimiter=str(','))
-                for arg in args_reader:
-                    args = args + arg
-                details = desc.details(p.command, args)
-                type_desc = desc.type_desc
-                desc = desc.message
-
-            res.append({
+                execution_time = BatchProcess.total_seconds(etime - stime)
+
+            details = process_info_cache.get_details(user_id, p.pid)
+            if details is None:
+                details = BatchProcess._get_process_details(p)
+                process_info_cache.set_details(user_id, p.pid, details)
+            desc, type_desc, details = details
+
+            entry = {
                 'id': p.pid,
                 'desc': desc,
                 'type_desc': type_desc,
@@ -619,18 +847,146 @@ class BatchProcess(object):
                 'exit_code': p.exit_code,
                 'acknowledge': p.acknowledge,
                 'execution_time': execution_time,
+                'queue_wait': BatchProcess.queue_wait(p),
                 'process_state': p.process_state
-            })
+            }
+
+            if p.end_time is not None:
+                process_info_cache.set_finished(user_id, p.pid, entry)
+                entry = dict(entry)
+
+            res.append(entry)
 
         if changed:
             db.session.commit()
 
+        process_info_cache.retain(user_id, pids)
+        BatchProcess.prune_processes()
+
         return res
 
+    @staticmethod
+    def prune_processes():
+        """
+        Remove the information, and the log files of the finished processes
+        older than the configured retention period in the background.
+
+        It will check for such processes at most once in the configured prune
+        interval.
+        """
+        if not getattr(config, 'BG_PROCESS_RETENTION_DAYS', 0):
+            return
+
+        global LAST_CHECK_PRUNE_PROCESSES
+        with PRUNE_PROCESSES_LOCK:
+            now = datetime.now()
+            if LAST_CHECK_PRUNE_PROCESSES is not None and \
+                    now < LAST_CHECK_PRUNE_PROCESSES + timedelta(
+                        hours=config.BG_PROCESS_PRUNE_INTERVAL):
+                return
+            LAST_CHECK_PRUNE_PROCESSES = now
+
+        app = current_app._get_current_object()
+
+        def _prune():
+            with app.app_context():
+                try:
+                    BatchProcess._prune_processes(
+                        config.BG_PROCESS_RETENTION_DAYS
+                    )
+                except Exception as e:
+                    app.logger.warning(
+                        _("Failed to remove the old background processes.")
+                    )
+                    app.logger.exception(e)
+
+        t = Thread(target=_prune)
+        t.daemon = True
+        t.start()
+
+    @staticmethod
+    def _prune_processes(retention_days):
+        """
+        Remove the finished processes (of all the users), which were
+        completed before the given number of days, along with their log
+        directories, and the log directories not referred by any process.
+        """
+        expiry = datetime.utcnow().replace(tzinfo=pytz.utc) - \
+            timedelta(days=retention_days)
+        logdirs = set()
+        removed = 0
+
+        for p in Process.query.all():
+            if p.end_time is not None and parser.parse(p.end_time) < expiry:
+                process_info_cache.invalidate(p.pid, p.user_id)
+                if p.logdir:
+                    shutil.rmtree(p.logdir, True)
+                db.session.delete(p)
+                removed += 1
+            elif p.logdir:
+                logdirs.add(os.path.realpath(p.logdir))
+
+        if removed:
+            db.session.commit()
+
+        # Remove the orphan log directories (i.e. the process entries have
+        # already been removed by other means).
+        root = os.path.join(config.SESSION_DB_PATH, 'process_logs')
+        if not os.path.isdir(root):
+            return removed
+
+        expiry_ts = time.time() - \
+            timedelta(days=retention_days).total_seconds()
+        for name in os.listdir(root):
+            logdir = os.path.join(root, name)
+            if os.path.realpath(logdir) in logdirs or \
+                    not os.path.isdir(logdir):
+                continue
+            try:
+                if os.stat(logdir).st_mtime < expiry_ts:
+                    shutil.rmtree(logdir, True)
+            except OSError:
+                pass
+
+        return removed
+
     @staticmethod
     def total_seconds(dt):
         return round(dt.total_seconds(), 2)
 
+    @staticmethod
+    def queue_wait(p):
+        """
+        Returns the time (in seconds) the process has been waiting in the
+        queue, or None if it was never queued.
+        """
+        if getattr(p, 'queue_time', None) is None:
+            return None
+
+        qtime = parser.parse(p.queue_time)
+        stime = parser.parse(p.start_time or get_current_time())
+
+        return BatchProcess.total_seconds(stime - qtime)
+
+    @staticmethod
+    def fail_queued_processes():
+        """
+        Mark the processes left in the queue by the previous run of the
+        application as failed, as they will never be started (the queue is
+        kept in the memory).
+        """
+        processes = Process.query.filter_by(process_state=PROCESS_QUEUED)
+
+        for p in processes:
+            current_app.logger.warning(
+                u"The queued process '%s' was not started.", p.pid
+            )
+            p.start_time = p.end_time = get_current_time()
+            p.exit_code = -1
+            p.process_state = PROCESS_FINISHED
+
+        db.session.commit()
+
     @staticmethod
     def acknowledge(_pid):
         """
@@ -652,7 +1008,7 @@ class BatchProcess(object):
         if p.end_time is not None:
             logdir = p.logdir
             db.session.delete(p)
-            import shutil
+            process_info_cache.invalidate(_pid, current_user.id)
             shutil.rmtree(logdir, True)
         else:
             p.acknowledge = get_current_time()
@@ -662,6 +1018,9 @@ class BatchProcess(object):
     def set_env_variables(self, server, **kwargs):
         """Set environment variables"""
         if server:
+            # Used by the scheduler to apply the per server limit
+            self.server_id = server.id
+
             # Set SSL related ENV variables
             if server.sslcert and server.sslkey and server.sslrootcert:
                 # SSL environment variables
@@ -692,6 +1051,26 @@ class BatchProcess(object):
                 _("Could not find a process with the specified ID.")
             )
 
+        # Process has not been started yet, remove it from the queue.
+        # It may not be found in the queue of this application process (i.e.
+        # it was queued by another web worker), which will not start it, once
+        # it is marked as terminated.
+        if p.process_state == PROCESS_QUEUED:
+            scheduler.cancel(str(p.pid))
+            p.start_time = p.end_time = get_current_time()
+            p.exit_code = -1
+            p.process_state = PROCESS_TERMINATED
+            db.session.commit()
+            return
+
+        # The process executor has not updated the status yet.
+        if p.utility_pid is None:
+            current_app.logger.warning(
+                _("Unable to kill the background process '{0}', it has not "
+                  "been started yet.").format(p.pid)
+            )
+            return
+
         try:
             process = psutil.Process(p.utility_pid)
             process.terminate()
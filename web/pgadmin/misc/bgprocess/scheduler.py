@@ -0,0 +1,230 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL License
+#
+##########################################################################
+
+"""
+Scheduler to limit the number of the background processes (backup, restore,
+maintenance, import/export, etc.) running concurrently.
+
+The jobs, which can not be started immediately because of the global, or the
+per server limit are kept in a priority queue (FIFO for the jobs with same
+priority), and started by a watcher thread as soon as one of the running jobs
+has finished.
+
+NOTE: The scheduler keeps its state in memory, hence - the limits are applied
+      per application process.
+"""
+
+import heapq
+import itertools
+import time
+from threading import Lock, Thread
+
+
+class BatchProcessScheduler(object):
+    """
+    class BatchProcessScheduler(object)
+
+    A job submitted to the scheduler must have the following attributes, and
+    methods:
+    * id        - Unique identifier of the job
+    * server_id - Identifier of the server, on which the job operates (can be
+                  None)
+    * launch()  - Start the job, and return the handle (i.e. Popen object) of
+                  the started process (or None, if it could not be started).
+    * is_running()
+                - Returns True, while the started job is running. The handle
+                  returned by launch() is not used for it, as the started
+                  process may detach the actual job (i.e. the process
+                  executor), and exit immediately.
+
+    Both the methods are called within the application context of the
+    application, which submitted the job.
+
+    The job may also have the method on_queued(), which is called before the
+    job is put in the queue. It is called while holding the lock of the
+    scheduler, hence - the watcher thread can not start the job, before it
+    returns.
+    """
+
+    # Interval (in seconds) to check for the finished processes.
+    POLL_INTERVAL = 1
+
+    def __init__(self, max_jobs=0, max_jobs_per_server=0):
+        self.max_jobs = max_jobs
+        self.max_jobs_per_server = max_jobs_per_server
+
+        self._lock = Lock()
+        # Heap of (-priority, sequence, app, job)
+        self._queue = []
+        self._queued = dict()
+        # job id => (server id, app, job), the job is None while launching
+        self._running = dict()
+        self._seq = itertools.count()
+        self._watcher = None
+
+    def _can_run(self, server_id):
+        if self.max_jobs and len(self._running) >= self.max_jobs:
+            return False
+
+        if self.max_jobs_per_server and server_id is not None:
+            count = sum(
+                1 for sid, _, _ in self._running.values() if sid == server_id
+            )
+            if count >= self.max_jobs_per_server:
+                return False
+
+        return True
+
+    def submit(self, app, job, priority=0):
+        """
+        Start the job immediately, if the limits allow it, otherwise put it in
+        the queue.
+
+        Returns:
+            True if the job has been queued, False if started.
+        """
+        with self._lock:
+            self._reap()
+            queued = len(self._queue) > 0 or not self._can_run(job.server_id)
+
+            if queued:
+                on_queued = getattr(job, 'on_queued', None)
+                if on_queued is not None:
+                    on_queued()
+
+                heapq.heappush(
+                    self._queue, (-priority, next(self._seq), app, job)
+                )
+                self._queued[job.id] = job
+                self._start_watcher()
+                return True
+
+            # Reserve the slot, before releasing the lock.
+            self._running[job.id] = (job.server_id, app, None)
+
+        self._launch(app, job)
+        return False
+
+    def cancel(self, job_id):
+        """
+        Remove the job from the queue.
+
+        Returns:
+            True if the job was found in the queue, otherwise False.
+        """
+        with self._lock:
+            if job_id not in self._queued:
+                return False
+
+            del self._queued[job_id]
+            self._queue = [
+                item for item in self._queue if item[3].id != job_id
+            ]
+            heapq.heapify(self._queue)
+
+            return True
+
+    def is_queued(self, job_id):
+        with self._lock:
+            return job_id in self._queued
+
+    def queue_position(self, job_id):
+        """
+        Returns the position (starting with 1) of the job in the queue, or
+        None if it is not queued.
+        """
+        with self._lock:
+            for pos, item in enumerate(sorted(self._queue), 1):
+                if item[3].id == job_id:
+                    return pos
+        return None
+
+    def _launch(self, app, job):
+        handle = None
+        try:
+            if app is not None:
+                with app.app_context():
+                    handle = job.launch()
+            else:
+                handle = job.launch()
+        finally:
+            with self._lock:
+                if handle is None:
+                    self._running.pop(job.id, None)
+                else:
+                    self._running[job.id] = (job.server_id, app, job)
+                if self._queue:
+                    self._start_watcher()
+
+    @staticmethod
+    def _is_running(app, job):
+        try:
+            if app is not None:
+                with app.app_context():
+                    return job.is_running()
+            return job.is_running()
+        except Exception as e:
+            # Do not let a job, whose status can not be found out, hold its
+            # slot forever.
+            if app is not None:
+                app.logger.exception(e)
+            return False
+
+    def _reap(self):
+        """Remove the finished jobs from the running list"""
+        for job_id, (server_id, app, job) in list(self._running.items()):
+            if job is not None and not self._is_running(app, job):
+                del self._running[job_id]
+
+    def _next_job(self):
+        """
+        Find the job with the highest priority, which can be started now.
+
+        The jobs blocked by the per server limit do not block the jobs of the
+        other servers.
+        """
+        if self.max_jobs and len(self._running) >= self.max_jobs:
+            return None
+
+        for item in sorted(self._queue):
+            if self._can_run(item[3].server_id):
+                self._queue.remove(item)
+                heapq.heapify(self._queue)
+                del self._queued[item[3].id]
+                self._running[item[3].id] = (item[3].server_id, item[2], None)
+                return item
+        return None
+
+    def _start_watcher(self):
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+
+        self._watcher = Thread(target=self._watch)
+        self._watcher.daemon = True
+        self._watcher.start()
+
+    def _watch(self):
+        while True:
+            with self._lock:
+                self._reap()
+                if not self._queue:
+                    self._watcher = None
+                    return
+                item = self._next_job()
+
+            if item is None:
+                time.sleep(self.POLL_INTERVAL)
+                continue
+
+            _, _, app, job = item
+            try:
+                self._launch(app, job)
+            except Exception as e:
+                if app is not None:
+                    app.logger.exception(e)
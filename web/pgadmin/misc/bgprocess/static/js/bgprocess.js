@@ -59,7 +59,7 @@ define('misc.bgprocess', [
           details: false,
           notify: (_.isUndefined(notify) || notify),
           curr_status: null,
-          state: 0, // 0: NOT Started, 1: Started, 2: Finished, 3: Terminated
+          state: 0, // 0: NOT Started, 1: Started, 2: Finished, 3: Terminated, 4: Queued
           completed: false,
 
           id: info['id'],
@@ -70,6 +70,7 @@ define('misc.bgprocess', [
           exit_code: null,
           acknowledge: info['acknowledge'],
           execution_time: null,
+          queue_wait: null,
           out: -1,
           err: -1,
           lot_more: false,
@@ -140,11 +141,14 @@ define('misc.bgprocess', [
           out = [],
           err = [];
 
-        if ('stime' in data)
+        if ('stime' in data && !_.isNull(data.stime))
           self.stime = new Date(data.stime);
 
         if ('execution_time' in data)
-          self.execution_time = parseFloat(data.execution_time);
+          self.execution_time = parseFloat(data.execution_time) || 0;
+
+        if ('queue_wait' in data)
+          self.queue_wait = data.queue_wait;
 
         if ('type_desc' in data)
           self.type_desc = data.type_desc;
@@ -245,6 +249,16 @@ define('misc.bgprocess', [
             );
           }
 
+          setTimeout(function() {
+            self.show.apply(self);
+          }, 10);
+        } else if (self.state == 4) {
+          self.curr_status = self.other_status_tpl({
+            status_text: S(
+              gettext('Queued (waiting for %s seconds)...')
+            ).sprintf(String(self.queue_wait)).value(),
+          });
+
           setTimeout(function() {
             self.show.apply(self);
           }, 10);
@@ -299,7 +313,7 @@ define('misc.bgprocess', [
               </div>
               <div class="card-body px-2">
                 <div class="py-1">${self.desc}</div>
-                <div class="py-1">${self.stime.toString()}</div>
+                <div class="py-1 pg-bg-stime"></div>
                 <div class="d-flex py-1">
                   <div class="my-auto mr-2">
                     <span class="fa fa-clock-o fa-2x"></span>
@@ -356,6 +370,10 @@ define('misc.bgprocess', [
             content.find('.bg-process-stop').off('click').on('click', self.stop_process.bind(this));
           }
 
+          self.container.find('.pg-bg-stime').text(
+            self.stime ? self.stime.toString() : gettext('Queued')
+          );
+
           // TODO:: Formatted execution time
           self.container.find('.pg-bg-etime').empty().append(
             $('<span></span>').text(
@@ -0,0 +1,80 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import sys
+from pickle import dumps
+
+from pgadmin.misc.bgprocess.processes import BatchProcess, \
+    process_info_cache
+from pgadmin.utils.route import BaseTestGenerator
+
+if sys.version_info < (3, 3):
+    from mock import patch
+else:
+    from unittest.mock import patch
+
+
+class TestMockProcess():
+    def __init__(self, pid, end_time):
+        self.pid = pid
+        self.exit_code = 0 if end_time else None
+        self.start_time = '2018-04-17 06:18:56.315445 +0000'
+        self.end_time = end_time
+        self.desc = dumps('Test process')
+        self.arguments = ''
+        self.command = 'test'
+        self.acknowledge = None
+        self.process_state = 2 if end_time else 1
+
+
+class ProcessInfoCacheTest(BaseTestGenerator):
+    """Test the caching of the process information in BatchProcess.list"""
+    scenarios = [
+        ('When the process has finished',
+         dict(
+             pid='test_cache_finished',
+             end_time='2018-04-17 06:19:56.315445 +0000',
+             expected_calls=1
+         )),
+        ('When the process is still running',
+         dict(
+             pid='test_cache_running',
+             end_time=None,
+             expected_calls=2
+         ))
+    ]
+
+    @patch('pgadmin.misc.bgprocess.processes.Process')
+    @patch('pgadmin.misc.bgprocess.processes.BatchProcess.'
+           'update_process_info')
+    @patch('pgadmin.misc.bgprocess.processes.db')
+    @patch('pgadmin.misc.bgprocess.processes.current_user')
+    def runTest(self, current_user_mock, db_mock, update_process_info_mock,
+                process_mock):
+        current_user_mock.id = 1
+        update_process_info_mock.return_value = [True, False]
+        process_mock.query.filter_by.return_value = [
+            TestMockProcess(self.pid, self.end_time)
+        ]
+
+        first = BatchProcess.list()
+        second = BatchProcess.list()
+
+        self.assertEqual(1, len(second))
+        self.assertEqual(first[0]['desc'], second[0]['desc'])
+        self.assertEqual(first[0]['etime'], second[0]['etime'])
+        self.assertEqual(
+            self.expected_calls, update_process_info_mock.call_count
+        )
+
+        # Removed by another application process
+        process_mock.query.filter_by.return_value = []
+        self.assertEqual(0, len(BatchProcess.list()))
+        self.assertIsNone(process_info_cache.get_details(1, self.pid))
+        self.assertIsNone(process_info_cache.get_finished(1, self.pid))
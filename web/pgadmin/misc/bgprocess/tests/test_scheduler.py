@@ -0,0 +1,131 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import time
+
+from pgadmin.misc.bgprocess.scheduler import BatchProcessScheduler
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class TestMockHandle():
+    def __init__(self, exit_code):
+        self.exit_code = exit_code
+
+    def poll(self):
+        return self.exit_code
+
+
+class TestMockJob():
+    def __init__(self, id, server_id, launched, launcher_exit_code=None):
+        self.id = id
+        self.server_id = server_id
+        self.launched = launched
+        # The launcher (i.e. process executor) may exit, while the job is
+        # still running.
+        self.handle = TestMockHandle(launcher_exit_code)
+        self.running = True
+        self.queued = False
+        self.queued_at_launch = None
+
+    def on_queued(self):
+        self.queued = True
+
+    def launch(self):
+        self.queued_at_launch = self.queued
+        self.launched.append(self.id)
+        return self.handle
+
+    def is_running(self):
+        return self.running
+
+
+class BatchProcessSchedulerTest(BaseTestGenerator):
+    """Test the concurrency limits of the BatchProcessScheduler"""
+    scenarios = [
+        ('When the global limit is reached',
+         dict(
+             max_jobs=1,
+             max_jobs_per_server=0,
+             jobs=[('j1', 1, 0), ('j2', 2, 0), ('j3', 2, 1)],
+             started=['j1'],
+             # Higher priority job is started first
+             after_finish=['j1', 'j3'],
+             launcher_exit_code=None
+         )),
+        ('When the launcher exits immediately, while the job is running',
+         dict(
+             max_jobs=1,
+             max_jobs_per_server=1,
+             jobs=[('j1', 1, 0), ('j2', 1, 0), ('j3', 2, 0)],
+             started=['j1'],
+             after_finish=['j1', 'j2'],
+             launcher_exit_code=0
+         )),
+        ('When the per server limit is reached',
+         dict(
+             max_jobs=0,
+             max_jobs_per_server=1,
+             jobs=[('j1', 1, 0), ('j2', 1, 0), ('j3', 2, 0)],
+             started=['j1', 'j3'],
+             after_finish=['j1', 'j3', 'j2'],
+             launcher_exit_code=None
+         )),
+        ('When there is no limit',
+         dict(
+             max_jobs=0,
+             max_jobs_per_server=0,
+             jobs=[('j1', 1, 0), ('j2', 1, 0), ('j3', 2, 0)],
+             started=['j1', 'j2', 'j3'],
+             after_finish=['j1', 'j2', 'j3'],
+             launcher_exit_code=0
+         ))
+    ]
+
+    def runTest(self):
+        BatchProcessScheduler.POLL_INTERVAL = 0.01
+        launched = []
+        scheduler = BatchProcessScheduler(
+            max_jobs=self.max_jobs,
+            max_jobs_per_server=self.max_jobs_per_server
+        )
+        jobs = dict()
+        queued = dict()
+
+        for id, server_id, priority in self.jobs:
+            jobs[id] = TestMockJob(
+                id, server_id, launched, self.launcher_exit_code
+            )
+            queued[id] = scheduler.submit(None, jobs[id], priority)
+
+        # The watcher thread may start the job from the queue, which was
+        # queued behind another job.
+        time.sleep(0.1)
+        self.assertEqual(self.started, launched)
+
+        jobs['j1'].running = False
+
+        for _ in range(100):
+            if len(launched) == len(self.after_finish):
+                break
+            time.sleep(0.01)
+
+        self.assertEqual(self.after_finish, launched)
+
+        # The queued jobs are marked as queued, before they are started.
+        for id in self.after_finish:
+            self.assertEqual(jobs[id].queued_at_launch, queued[id])
+
+        # Cancel the job from the queue
+        scheduler.max_jobs = 1
+        scheduler.submit(None, TestMockJob('j4', 3, launched))
+        self.assertTrue(scheduler.is_queued('j4'))
+        self.assertIsNotNone(scheduler.queue_position('j4'))
+        self.assertTrue(scheduler.cancel('j4'))
+        self.assertFalse(scheduler.is_queued('j4'))
+        self.assertFalse(scheduler.cancel('j4'))
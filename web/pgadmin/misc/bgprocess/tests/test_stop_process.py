@@ -0,0 +1,73 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import sys
+
+from flask import Flask
+
+from pgadmin.misc.bgprocess.processes import BatchProcess, \
+    PROCESS_QUEUED, PROCESS_STARTED, PROCESS_TERMINATED
+from pgadmin.utils.route import BaseTestGenerator
+
+if sys.version_info < (3, 3):
+    from mock import patch, MagicMock
+else:
+    from unittest.mock import patch, MagicMock
+
+
+class BatchProcessStopTest(BaseTestGenerator):
+    """Test stopping the background process"""
+    scenarios = [
+        ('When the queued process is not in the queue of this process',
+         dict(
+             process_state=PROCESS_QUEUED,
+             utility_pid=None,
+             expected_state=PROCESS_TERMINATED,
+             terminated=False
+         )),
+        ('When the process executor has not updated the utility pid',
+         dict(
+             process_state=PROCESS_STARTED,
+             utility_pid=None,
+             expected_state=PROCESS_STARTED,
+             terminated=False
+         )),
+        ('When the utility is running',
+         dict(
+             process_state=PROCESS_STARTED,
+             utility_pid=1234,
+             expected_state=PROCESS_TERMINATED,
+             terminated=True
+         )),
+    ]
+
+    @patch('pgadmin.misc.bgprocess.processes.psutil.Process')
+    @patch('pgadmin.misc.bgprocess.processes.db')
+    @patch('pgadmin.misc.bgprocess.processes.current_user')
+    @patch('pgadmin.misc.bgprocess.processes.Process')
+    def runTest(self, process_mock, current_user_mock, db_mock,
+                psutil_process_mock):
+        p = MagicMock(
+            pid='123', process_state=self.process_state,
+            utility_pid=self.utility_pid, end_time=None
+        )
+        process_mock.query.filter_by.return_value.first.return_value = p
+
+        with Flask(__name__).app_context():
+            BatchProcess.stop_process('123')
+
+        self.assertEqual(p.process_state, self.expected_state)
+        if self.terminated:
+            psutil_process_mock.assert_called_once_with(self.utility_pid)
+            psutil_process_mock.return_value.terminate.assert_called_once()
+        else:
+            psutil_process_mock.assert_not_called()
+
+        if self.process_state == PROCESS_QUEUED:
+            self.assertIsNotNone(p.end_time)
@@ -12,10 +12,13 @@
 import os
 import os.path
 import random
+import stat
 import string
 import sys
 import time
+from collections import OrderedDict
 from sys import platform as _platform
+from threading import Lock
 import config
 import codecs
 
@@ -26,7 +29,7 @@ from flask_babelex import gettext
 from flask_security import login_required
 from pgadmin.utils import PgAdminModule
 from pgadmin.utils import get_storage_directory
-from pgadmin.utils.ajax import make_json_response
+from pgadmin.utils.ajax import make_json_response, bad_request
 from pgadmin.utils.preferences import Preferences
 
 # Checks if platform is Windows
@@ -51,6 +54,16 @@ try:
 except Exception as e:
     from urllib.parse import unquote
 
+# os.scandir is available in python 3.5+, use the 'scandir' package (if
+# installed) for the older versions.
+try:
+    from os import scandir
+except ImportError:
+    try:
+        from scandir import scandir
+    except ImportError:
+        scandir = None
+
 MODULE_NAME = 'file_manager'
 global transid
 
@@ -94,6 +107,18 @@ def splitext(path):
     return ext[1:]
 
 
+# check if the offset/limit of the listing is a non-negative integer
+def is_valid_paging_value(value):
+    if value is None:
+        return True
+    if isinstance(value, bool):
+        return False
+    try:
+        return int(value) >= 0
+    except (TypeError, ValueError):
+        return False
+
+
 # check if file is hidden in windows platform
 def is_folder_hidden(filepath):
     if _platform == "win32":
@@ -109,6 +134,121 @@ def is_folder_hidden(filepath):
     return False
 
 
+def is_protected(st, user=None):
+    """
+    Returns True if the current user does not have read or write permission
+    on the file with the given stat result, without making another system
+    call (i.e. os.access).
+
+    The user can be given as a tuple of effective user id, and the list of
+    group ids (to avoid fetching them for each file).
+    """
+    if _platform == "win32":
+        return not (st.st_mode & stat.S_IWRITE)
+
+    euid, groups = user or (os.geteuid(), [os.getegid()] + os.getgroups())
+    if euid == 0:
+        return False
+
+    if st.st_uid == euid:
+        mask = stat.S_IRUSR | stat.S_IWUSR
+    elif st.st_gid in groups:
+        mask = stat.S_IRGRP | stat.S_IWGRP
+    else:
+        mask = stat.S_IROTH | stat.S_IWOTH
+
+    return (st.st_mode & mask) != mask
+
+
+def scan_directory(path):
+    """
+    Returns the sorted list of the entries (as tuples of name, is_dir,
+    hidden, protected, size, created and modified time) of the given
+    directory, using a single stat call per entry.
+    """
+    entries = []
+    user = None
+    if _platform != "win32":
+        user = (os.geteuid(), set([os.getegid()] + os.getgroups()))
+
+    def add_entry(name, st):
+        hidden = name.startswith('.')
+        if not hidden and _platform == "win32":
+            attrs = getattr(st, 'st_file_attributes', None)
+            hidden = bool(attrs & 2) if attrs is not None else \
+                is_folder_hidden(os.path.join(path, name))
+
+        entries.append((
+            name, stat.S_ISDIR(st.st_mode), hidden, is_protected(st, user),
+            st.st_size, st.st_ctime, st.st_mtime
+        ))
+
+    if scandir is not None:
+        for entry in scandir(path):
+            try:
+                st = entry.stat()
+            except OSError:
+                # Broken symbolic link
+                st = entry.stat(follow_symlinks=False)
+            add_entry(entry.name, st)
+    else:
+        for name in os.listdir(path):
+            system_path = os.path.join(path, name)
+            try:
+                st = os.stat(system_path)
+            except OSError:
+                st = os.lstat(system_path)
+            add_entry(name, st)
+
+    entries.sort(key=lambda e: e[0])
+    return entries
+
+
+class DirectoryListingCache(object):
+    """
+    Caches the listing of the recently visited directories, until the
+    modification time of the directory changes (i.e. entries are added,
+    removed, or renamed).
+
+    NOTE: Changes in the size/modification time of the existing files in the
+          directory do not change the modification time of the directory,
+          and they will not be reflected until it is modified, or the
+          listing has been removed from the cache.
+    """
+
+    def __init__(self, size=8):
+        self.size = size
+        self._lock = Lock()
+        self._listings = OrderedDict()
+
+    def get(self, path):
+        key = os.path.realpath(path)
+        st = os.stat(path)
+        version = (st.st_mtime, st.st_size, st.st_nlink)
+
+        with self._lock:
+            item = self._listings.pop(key, None)
+            if item is not None and item[0] == version:
+                self._listings[key] = item
+                return item[1]
+
+        entries = scan_directory(path)
+
+        with self._lock:
+            self._listings[key] = (version, entries)
+            while len(self._listings) > self.size:
+                self._listings.popitem(last=False)
+
+        return entries
+
+    def clear(self):
+        with self._lock:
+            self._listings.clear()
+
+
+listing_cache = DirectoryListingCache()
+
+
 class FileManagerModule(PgAdminModule):
     """
     FileManager lists files and folders and does
@@ -548,10 +688,15 @@ class Filemanager(object):
             kernel32.SetThreadErrorMode(oldmode, ctypes.byref(oldmode))
 
     @staticmethod
-    def list_filesystem(dir, path, trans_data, file_type, show_hidden):
+    def list_filesystem(dir, path, trans_data, file_type, show_hidden,
+                        offset=0, limit=None, name_filter=None):
         """
         It lists all file and folders within the given
         directory.
+
+        The listing can be filtered by the name (case insensitive substring
+        match), and paged using the offset and limit (in the order of the
+        names).
         """
         Filemanager.suspend_windows_warning()
         is_show_hidden_files = show_hidden
@@ -618,53 +763,73 @@ class Filemanager(object):
             if 'supported_types' in trans_data else []
 
         orig_path = unquote(orig_path)
+        if name_filter:
+            name_filter = name_filter.lower()
+
         try:
-            mylist = [x for x in sorted(os.listdir(orig_path))]
-            for f in mylist:
-                protected = 0
-                system_path = os.path.join(os.path.join(orig_path, f))
+            entries = []
+            for entry in listing_cache.get(orig_path):
+                f, is_dir, hidden, protected, size, ctime, mtime = entry
 
                 # continue if file/folder is hidden (based on user preference)
-                if not is_show_hidden_files and \
-                        (is_folder_hidden(system_path) or f.startswith('.')):
+                if not is_show_hidden_files and hidden:
                     continue
 
-                user_path = os.path.join(os.path.join(user_dir, f))
-                created = time.ctime(os.path.getctime(system_path))
-                modified = time.ctime(os.path.getmtime(system_path))
-                file_extension = str(splitext(system_path))
-
-                # set protected to 1 if no write or read permission
-                if (not os.access(system_path, os.R_OK) or
-                        not os.access(system_path, os.W_OK)):
-                    protected = 1
+                if name_filter and name_filter not in f.lower():
+                    continue
 
                 # list files only or folders only
-                if os.path.isdir(system_path):
+                if is_dir:
                     if files_only == 'true':
                         continue
-                    file_extension = u"dir"
-                    user_path = u"{0}/".format(user_path)
                 else:
                     # filter files based on file_type
                     if file_type is not None and file_type != "*":
+                        file_extension = str(splitext(f))
                         if folders_only or len(supported_types) > 0 and \
                                 file_extension not in supported_types or \
                                 file_type != file_extension:
                             continue
 
+                entries.append(entry)
+
+            total = len(entries)
+            if limit is not None:
+                entries = entries[offset:offset + limit]
+            elif offset:
+                entries = entries[offset:]
+
+            for f, is_dir, hidden, protected, size, ctime, mtime in entries:
+                user_path = os.path.join(os.path.join(user_dir, f))
+
+                if is_dir:
+                    file_extension = u"dir"
+                    user_path = u"{0}/".format(user_path)
+                else:
+                    file_extension = str(splitext(f))
+
                 # create a list of files and folders
                 files[f] = {
                     "Filename": f,
                     "Path": user_path,
                     "file_type": file_extension,
-                    "Protected": protected,
+                    "Protected": 1 if protected else 0,
                     "Properties": {
-                        "Date Created": created,
-                        "Date Modified": modified,
-                        "Size": sizeof_fmt(getSize(system_path))
+                        "Date Created": time.ctime(ctime),
+                        "Date Modified": time.ctime(mtime),
+                        "Size": sizeof_fmt(size)
                     }
                 }
+
+            # Return the page along with the total number of the matching
+            # entries, only if the page has been requested.
+            if limit is not None or offset:
+                files = {
+                    'Files': files,
+                    'Total': total,
+                    'Offset': offset,
+                    'Limit': limit
+                }
         except Exception as e:
             Filemanager.resume_windows_warning()
             if (hasattr(e, 'strerror') and
@@ -816,7 +981,8 @@ class Filemanager(object):
         return thefile
 
     def getfolder(self, path=None, file_type="", name=None, req=None,
-                  show_hidden=False):
+                  show_hidden=False, offset=0, limit=None,
+                  name_filter=None):
         """
         Returns files and folders in give path
         """
@@ -828,7 +994,11 @@ class Filemanager(object):
                 dir += u'/'
 
         filelist = self.list_filesystem(
-            dir, path, trans_data, file_type, show_hidden)
+            dir, path, trans_data, file_type, show_hidden,
+            offset=int(offset or 0),
+            limit=int(limit) if limit is not None else None,
+            name_filter=name_filter
+        )
         return filelist
 
     def rename(self, old=None, new=None, req=None):
@@ -1249,9 +1419,21 @@ def file_manager(trans_id):
         }
         mode = req.args['mode']
 
+    if mode == 'getfolder':
+        for key in ('offset', 'limit'):
+            if not is_valid_paging_value(kwargs.get(key)):
+                return bad_request(gettext(
+                    u"'{0}' must be a non-negative integer.".format(key)
+                ))
+
     try:
         func = getattr(myFilemanager, mode)
         res = func(**kwargs)
+        # The modification time of the directory may not change (within its
+        # resolution) for the quick successive modifications, hence - do not
+        # rely on it for the changes made through the file manager itself.
+        if mode in ('rename', 'delete', 'add', 'addfolder'):
+            listing_cache.clear()
         return make_json_response(data={'result': res, 'status': True})
     except Exception:
         return getattr(myFilemanager, mode)(**kwargs)
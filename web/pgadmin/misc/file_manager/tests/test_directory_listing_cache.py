@@ -0,0 +1,57 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import os
+import shutil
+import sys
+import tempfile
+
+from pgadmin.misc.file_manager import listing_cache
+from pgadmin.utils.route import BaseTestGenerator
+
+if sys.version_info < (3, 3):
+    from mock import patch
+else:
+    from unittest.mock import patch
+
+
+class DirectoryListingCacheTest(BaseTestGenerator):
+    """Test the caching of the directory listing in the file manager"""
+    scenarios = [
+        ('Listing is refreshed after the directory is modified',
+         dict()),
+    ]
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        with open(os.path.join(self.dir, 'a.sql'), 'w') as f:
+            f.write('a')
+
+    def tearDown(self):
+        listing_cache.clear()
+        shutil.rmtree(self.dir)
+
+    def runTest(self):
+        listing = listing_cache.get(self.dir)
+        self.assertEqual([e[0] for e in listing], ['a.sql'])
+
+        # Cached listing is returned without scanning the directory again
+        with patch('pgadmin.misc.file_manager.scan_directory') as scan_mock:
+            self.assertIs(listing_cache.get(self.dir), listing)
+            self.assertFalse(scan_mock.called)
+
+        with open(os.path.join(self.dir, 'b.sql'), 'w') as f:
+            f.write('b')
+        # Make sure the modification time changes on the file systems with
+        # coarse time resolution.
+        st = os.stat(self.dir)
+        os.utime(self.dir, (st.st_atime, st.st_mtime + 2))
+
+        listing = listing_cache.get(self.dir)
+        self.assertEqual([e[0] for e in listing], ['a.sql', 'b.sql'])
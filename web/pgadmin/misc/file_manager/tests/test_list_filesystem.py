@@ -0,0 +1,89 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import os
+import shutil
+import sys
+import tempfile
+
+from pgadmin.misc.file_manager import Filemanager, listing_cache
+from pgadmin.utils.route import BaseTestGenerator
+
+if sys.version_info < (3, 3):
+    from mock import patch
+else:
+    from unittest.mock import patch
+
+
+class ListFilesystemTest(BaseTestGenerator):
+    """Test the listing of the directory in the file manager"""
+    scenarios = [
+        ('List all the files and folders',
+         dict(
+             kwargs=dict(),
+             show_hidden=False,
+             expected=['a.sql', 'b.sql', 'c.txt', 'd_dir'],
+             expected_total=None
+         )),
+        ('List including the hidden files',
+         dict(
+             kwargs=dict(),
+             show_hidden=True,
+             expected=['.hidden', 'a.sql', 'b.sql', 'c.txt', 'd_dir'],
+             expected_total=None
+         )),
+        ('List a page of the files and folders',
+         dict(
+             kwargs=dict(offset=1, limit=2),
+             show_hidden=False,
+             expected=['b.sql', 'c.txt'],
+             expected_total=4
+         )),
+        ('List the files and folders matching the filter',
+         dict(
+             kwargs=dict(name_filter='SQL', limit=1),
+             show_hidden=False,
+             expected=['a.sql'],
+             expected_total=2
+         )),
+    ]
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        for name in ('a.sql', 'b.sql', 'c.txt', '.hidden'):
+            with open(os.path.join(self.dir, name), 'w') as f:
+                f.write(name)
+        os.mkdir(os.path.join(self.dir, 'd_dir'))
+
+    def tearDown(self):
+        listing_cache.clear()
+        shutil.rmtree(self.dir)
+
+    @patch('pgadmin.misc.file_manager.config')
+    def runTest(self, config_mock):
+        config_mock.SERVER_MODE = False
+
+        res = Filemanager.list_filesystem(
+            None, self.dir, {}, '*', self.show_hidden, **self.kwargs
+        )
+
+        if self.expected_total is not None:
+            self.assertEqual(res['Total'], self.expected_total)
+            res = res['Files']
+
+        self.assertEqual(sorted(res.keys()), self.expected)
+        for name, entry in res.items():
+            if name == 'd_dir':
+                self.assertEqual(entry['file_type'], 'dir')
+                self.assertEqual(entry['Path'], self.dir + '/d_dir/')
+            else:
+                # Each file contains its own name
+                self.assertEqual(
+                    entry['Properties']['Size'], '%.1f B' % len(name)
+                )
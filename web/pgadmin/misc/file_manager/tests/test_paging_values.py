@@ -0,0 +1,28 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.misc.file_manager import is_valid_paging_value
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class PagingValuesTest(BaseTestGenerator):
+    """Test the validation of the offset/limit of the directory listing"""
+    scenarios = [
+        ('When the value is not given', dict(value=None, expected=True)),
+        ('When the value is an integer', dict(value=10, expected=True)),
+        ('When the value is a numeric string',
+         dict(value='10', expected=True)),
+        ('When the value is negative', dict(value='-1', expected=False)),
+        ('When the value is not numeric', dict(value='ten', expected=False)),
+        ('When the value is a boolean', dict(value=True, expected=False)),
+        ('When the value is a list', dict(value=[1], expected=False)),
+    ]
+
+    def runTest(self):
+        self.assertEqual(is_valid_paging_value(self.value), self.expected)
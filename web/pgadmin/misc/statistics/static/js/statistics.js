@@ -228,6 +228,9 @@ define('misc.statistics', [
         // Cache the current IDs for next time
         $(panel[0]).data('node-prop', cache_flag);
 
+        // Stop computing the extended statistics of the previous node
+        self.__cancelExtendedStatistics();
+
         if (statisticsHelper.nodeHasStatistics(node, item)) {
           msg = '';
           var timer;
@@ -296,6 +299,12 @@ define('misc.statistics', [
                   }
                   $gridContainer.removeClass('d-none');
 
+                  // The extended statistics are being computed in the
+                  // background, fetch them when ready.
+                  if (data['extended']) {
+                    self.__fetchExtendedStatistics(url, node.statsPrettifyFields);
+                  }
+
                 } else if (res.info) {
                   if (!$gridContainer.hasClass('d-none')) {
                     $gridContainer.addClass('d-none');
@@ -424,12 +433,16 @@ define('misc.statistics', [
     },
 
     __createSingleLineStatistics: function(data, prettifyFields) {
+      this.columns = this.statistic_columns;
+      this.collection.reset(this.__singleLineRows(data, prettifyFields));
+    },
+
+    __singleLineRows: function(data, prettifyFields) {
       var row = data['rows'][0],
         columns = data['columns'],
         res = [],
         name;
 
-      this.columns = this.statistic_columns;
       for (var idx in columns) {
         name = (columns[idx])['name'];
         res.push({
@@ -441,7 +454,76 @@ define('misc.statistics', [
         });
       }
 
-      this.collection.reset(res);
+      return res;
+    },
+
+    // Poll for the extended statistics, and add them to the statistics shown
+    // once they are computed.
+    __fetchExtendedStatistics: function(url, prettifyFields) {
+      var self = this;
+
+      self.extendedUrl = url;
+
+      var poll = function() {
+        $.ajax({
+          url: url + '?extended=1',
+          type: 'GET',
+          beforeSend: function(xhr) {
+            xhr.setRequestHeader(
+              pgAdmin.csrf_token_header, pgAdmin.csrf_token
+            );
+          },
+        })
+          .done(function(res, textStatus, xhr) {
+            // The selection has been changed in the meantime
+            if (self.extendedUrl !== url) {
+              return;
+            }
+
+            if (xhr.status == 202) {
+              self.extendedTimer = setTimeout(poll, 1000);
+              return;
+            }
+
+            self.extendedUrl = null;
+            if (res.data) {
+              self.collection.add(
+                self.__singleLineRows(res.data, prettifyFields)
+              );
+            }
+          })
+          .fail(function(xhr, error, message) {
+            if (self.extendedUrl === url) {
+              self.extendedUrl = null;
+              console.warn(error, message);
+            }
+          });
+      };
+
+      self.extendedTimer = setTimeout(poll, 500);
+    },
+
+    // Cancel the computation of the extended statistics (if any)
+    __cancelExtendedStatistics: function() {
+      var url = this.extendedUrl;
+
+      if (this.extendedTimer) {
+        clearTimeout(this.extendedTimer);
+        this.extendedTimer = null;
+      }
+
+      if (url) {
+        this.extendedUrl = null;
+        $.ajax({
+          url: url,
+          type: 'DELETE',
+          beforeSend: function(xhr) {
+            xhr.setRequestHeader(
+              pgAdmin.csrf_token_header, pgAdmin.csrf_token
+            );
+          },
+        });
+      }
     },
 
     panelVisibilityChanged: function(panel) {
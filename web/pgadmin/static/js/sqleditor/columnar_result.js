@@ -0,0 +1,76 @@
+/////////////////////////////////////////////////////////////
+//
+// pgAdmin 4 - PostgreSQL Tools
+//
+// Copyright (C) 2013 - 2019, The pgAdmin Development Team
+// This software is released under the PostgreSQL Licence
+//
+//////////////////////////////////////////////////////////////
+
+/* The request header, and its value asking the server to send the rows of
+ * the query results column by column (see
+ * pgadmin/tools/sqleditor/utils/columnar_result.py).
+ */
+export const RESULT_FORMAT_HEADER = 'X-pgA-Result-Format';
+export const COLUMNAR_RESULT_FORMAT = 'columnar';
+
+export function columnarResultHeaders() {
+  return {[RESULT_FORMAT_HEADER]: COLUMNAR_RESULT_FORMAT};
+}
+
+function decodeValues(column) {
+  switch (column.type) {
+  case 'null':
+    return [];
+  case 'bool':
+    return column.values.split('').map((value) => value === '1');
+  case 'joined':
+    return column.values.split(',');
+  case 'dict':
+    return column.values.map((idx) => column.dictionary[idx]);
+  default:
+    return column.values;
+  }
+}
+
+function decodeColumn(column, rowCount) {
+  let values = decodeValues(column);
+
+  if (!column.nulls) {
+    return values;
+  }
+
+  let bitmap = atob(column.nulls),
+    res = new Array(rowCount),
+    valueIdx = 0;
+
+  for (let idx = 0; idx < rowCount; idx++) {
+    if (bitmap.charCodeAt(idx >> 3) & (1 << (idx & 7))) {
+      res[idx] = null;
+    } else {
+      res[idx] = values[valueIdx++];
+    }
+  }
+  return res;
+}
+
+/* Returns the rows (the array of the arrays of the values) of the columnar
+ * result. Any other result is returned as it is.
+ */
+export function decodeResult(result) {
+  if (!result || result.format !== COLUMNAR_RESULT_FORMAT) {
+    return result;
+  }
+
+  let columns = result.columns.map((column) => decodeColumn(column, result.rows)),
+    rows = new Array(result.rows);
+
+  for (let rowIdx = 0; rowIdx < result.rows; rowIdx++) {
+    let row = new Array(columns.length);
+    for (let colIdx = 0; colIdx < columns.length; colIdx++) {
+      row[colIdx] = columns[colIdx][rowIdx];
+    }
+    rows[rowIdx] = row;
+  }
+  return rows;
+}
@@ -12,6 +12,7 @@ import $ from 'jquery';
 import url_for from '../url_for';
 import axios from 'axios';
 import * as httpErrorHandler from './query_tool_http_error_handler';
+import {columnarResultHeaders, decodeResult} from './columnar_result';
 
 class LoadingScreen {
   constructor(sqlEditor) {
@@ -115,9 +116,15 @@ class ExecuteQuery {
     axios.get(
       url_for('sqleditor.poll', {
         'trans_id': self.sqlServerObject.transId,
-      })
+      }), {
+        headers: columnarResultHeaders(),
+      }
     ).then(
       (httpMessage) => {
+        if (httpMessage.data.data) {
+          httpMessage.data.data.result = decodeResult(httpMessage.data.data.result);
+        }
+
         // Enable/Disable commit and rollback button.
         if (httpMessage.data.data.transaction_status == 2 || httpMessage.data.data.transaction_status == 3) {
           self.enableTransactionButtons();
@@ -19,9 +19,10 @@ from flask_babelex import gettext as _
 from flask_security import login_required, current_user
 from pgadmin.misc.bgprocess.processes import BatchProcess, IProcessDesc
 from pgadmin.utils import PgAdminModule, get_storage_directory, html, \
-    fs_short_path, document_dir, is_utility_exists
+    fs_short_path, document_dir, is_utility_exists, IS_PY2
 from pgadmin.utils.ajax import make_json_response, bad_request
 
+import config
 from config import PG_DEFAULT_DRIVER
 from pgadmin.model import Server
 
@@ -64,7 +65,7 @@ class BackupModule(PgAdminModule):
             list: URL endpoints for backup module
         """
         return ['backup.create_server_job', 'backup.create_object_job',
-                'backup.utility_exists']
+                'backup.create_databases_job', 'backup.utility_exists']
 
 
 # Create blueprint for BackupModule class
@@ -80,6 +81,7 @@ class BACKUP(object):
     GLOBALS = 1
     SERVER = 2
     OBJECT = 3
+    DATABASES = 4
 
 
 class BackupMessage(IProcessDesc):
@@ -94,6 +96,8 @@ class BackupMessage(IProcessDesc):
         self.sid = _sid
         self.bfile = _bfile
         self.database = _kwargs['database'] if 'database' in _kwargs else None
+        self.databases = _kwargs['databases'] \
+            if 'databases' in _kwargs else None
         self.cmd = ''
 
         def cmdArg(x):
@@ -133,6 +137,8 @@ class BackupMessage(IProcessDesc):
             return _("Backing up the global objects")
         elif self.backup_type == BACKUP.SERVER:
             return _("Backing up the server")
+        elif self.backup_type == BACKUP.DATABASES:
+            return _("Backing up the databases")
         else:
             # It should never reach here.
             return _("Unknown Backup")
@@ -167,6 +173,13 @@ class BackupMessage(IProcessDesc):
                     name, host, port
                 )
             )
+        elif self.backup_type == BACKUP.DATABASES:
+            return _("Backing up {0} database(s) on the server '{1}'").format(
+                len(self.databases or []),
+                "{0} ({1}:{2})".format(
+                    name, host, port
+                )
+            )
         else:
             # It should never reach here.
             return "Unknown Backup"
@@ -202,6 +215,18 @@ class BackupMessage(IProcessDesc):
                 )
             )
             res += html.safe_str(msg)
+        elif self.backup_type == BACKUP.DATABASES:
+            msg = _(
+                "Backing up {0} database(s) on the server '{1}' in the "
+                "directory '{2}'..."
+            ).format(
+                len(self.databases or []),
+                "{0} ({1}:{2})".format(
+                    name, host, port
+                ),
+                self.bfile
+            )
+            res += html.safe_str(msg)
         else:
             # It should never reach here.
             res += "Backup"
@@ -481,6 +506,176 @@ def create_backup_objects_job(sid):
     )
 
 
+@blueprint.route(
+    '/job/<int:sid>/databases', methods=['POST'],
+    endpoint='create_databases_job'
+)
+@login_required
+def create_backup_databases_job(sid):
+    """
+    Args:
+        sid: Server ID
+
+        Creates a new job for backing up all (or the given) databases of the
+        server in parallel, using the directory format of pg_dump.
+
+        It runs as a single background process, which reports the progress
+        of all the databases, and writes the manifest of the outputs and
+        timings in the given directory.
+
+    Returns:
+        None
+    """
+    if request.form:
+        data = json.loads(request.form['data'], encoding='utf-8')
+    else:
+        data = json.loads(request.data, encoding='utf-8')
+
+    try:
+        backup_dir = filename_with_file_manager_path(data['file'], False)
+    except Exception as e:
+        return bad_request(errormsg=str(e))
+
+    # Fetch the server details like hostname, port, roles etc
+    server = Server.query.filter_by(
+        id=sid, user_id=current_user.id
+    ).first()
+
+    if server is None:
+        return make_json_response(
+            success=0,
+            errormsg=_("Could not find the specified server.")
+        )
+
+    # To fetch MetaData for the server
+    from pgadmin.utils.driver import get_driver
+    driver = get_driver(PG_DEFAULT_DRIVER)
+    manager = driver.connection_manager(server.id)
+    conn = manager.connection()
+    connected = conn.connected()
+
+    if not connected:
+        return make_json_response(
+            success=0,
+            errormsg=_("Please connect to the server first.")
+        )
+
+    utility = manager.utility('backup')
+    ret_val = is_utility_exists(utility)
+    if ret_val:
+        return make_json_response(
+            success=0,
+            errormsg=ret_val
+        )
+
+    databases = data.get('databases', None)
+    if not databases:
+        status, res = conn.execute_dict(
+            render_template('backup/sql/databases.sql')
+        )
+        if not status:
+            return make_json_response(
+                success=0,
+                errormsg=res
+            )
+        databases = [row['name'] for row in res['rows']]
+
+    if not databases:
+        return make_json_response(
+            success=0,
+            errormsg=_("Could not find any database to back up.")
+        )
+
+    parallel = data.get('parallel', None) or \
+        config.BACKUP_DATABASES_PARALLELISM
+    jobs = data.get('no_of_jobs', None) or 1
+
+    args = [
+        '--pg-dump', utility,
+        '--directory', backup_dir,
+        '--jobs', str(jobs),
+        '--parallel', str(parallel),
+        '--host',
+        manager.local_bind_host if manager.use_ssh_tunnel else server.host,
+        '--port',
+        str(manager.local_bind_port) if manager.use_ssh_tunnel
+        else str(server.port),
+        '--username',
+        server.username,
+        '--no-password'
+    ]
+
+    def set_param(key, param):
+        if key in data and data[key]:
+            args.append(param)
+
+    def set_value(key, param):
+        if key in data and data[key] is not None and data[key] != '':
+            args.append(param)
+            args.append(str(data[key]))
+
+    set_param('verbose', '--verbose')
+    set_param('dqoute', '--quote-all-identifiers')
+    set_value('role', '--role')
+    set_value('encoding', '--encoding')
+    set_value('ratio', '--compress')
+
+    if 'only_data' in data and data['only_data']:
+        set_param('only_data', '--data-only')
+    elif 'only_schema' in data and data['only_schema']:
+        set_param('only_schema', '--schema-only')
+
+    set_param('dns_owner', '--no-owner')
+    set_param('dns_privilege', '--no-privileges')
+    set_param('dns_tablespace', '--no-tablespaces')
+    set_param('dns_unlogged_tbl_data', '--no-unlogged-table-data')
+
+    args.append('--')
+    args.extend(databases)
+
+    try:
+        p = BatchProcess(
+            desc=BackupMessage(
+                BACKUP.DATABASES, sid,
+                backup_dir.encode('utf-8') if hasattr(
+                    backup_dir, 'encode'
+                ) and IS_PY2 else backup_dir,
+                *args,
+                databases=databases
+            ),
+            cmd=os.path.join(
+                os.path.dirname(os.path.realpath(__file__)),
+                'backup_databases.py'
+            ),
+            args=args
+        )
+
+        manager.export_password_env(p.id)
+        # Check for connection timeout and if it is greater than 0 then
+        # set the environment variable PGCONNECT_TIMEOUT.
+        if manager.connect_timeout > 0:
+            env = dict()
+            env['PGCONNECT_TIMEOUT'] = str(manager.connect_timeout)
+            p.set_env_variables(server, env=env)
+        else:
+            p.set_env_variables(server)
+
+        p.start()
+        jid = p.id
+    except Exception as e:
+        current_app.logger.exception(e)
+        return make_json_response(
+            status=410,
+            success=0,
+            errormsg=str(e)
+        )
+
+    # Return response
+    return make_json_response(
+        data={'job_id': jid, 'Success': 1}
+    )
+
+
 @blueprint.route(
     '/utility_exists/<int:sid>/<backup_obj_type>', endpoint='utility_exists'
 )
@@ -509,7 +704,8 @@ def check_utility_exists(sid, backup_obj_type):
     driver = get_driver(PG_DEFAULT_DRIVER)
     manager = driver.connection_manager(server.id)
 
-    utility = manager.utility('backup') if backup_obj_type == 'objects' \
+    utility = manager.utility('backup') \
+        if backup_obj_type in ('objects', 'databases') \
         else manager.utility('backup_server')
 
     ret_val = is_utility_exists(utility)
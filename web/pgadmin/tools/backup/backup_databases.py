@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL License
+#
+##########################################################################
+
+"""
+This python script is responsible for backing up multiple databases of a
+server in parallel using the directory format of pg_dump.
+
+It is run by the process executor (as a single background process), and it
+will:
+* Run 'pg_dump --format=d --jobs=<N>' for each database, writing it in a
+  separate sub-directory of the given directory, while keeping the total
+  number of the pg_dump worker connections within the given parallelism
+  budget.
+* Write the output of each pg_dump in a separate log file.
+* Report the progress of the whole backup on the standard output.
+* Write the manifest (manifest.json) with the outputs, exit codes, and
+  timings of all the databases in the given directory.
+
+It must not depend on any external library, as it is run outside of the
+application.
+
+Usage:
+  backup_databases.py --pg-dump <path> --directory <path>
+      [--jobs <N>] [--parallel <budget>] [pg_dump options] -- <databases>
+
+The connection related environment variables (i.e. PGPASSWORD, PGSSLMODE)
+are passed as it is to the pg_dump.
+"""
+from __future__ import print_function
+
+import json
+import os
+import re
+import sys
+import time
+from datetime import datetime
+from subprocess import Popen, STDOUT
+from threading import Lock, Thread
+
+MANIFEST_FILE = 'manifest.json'
+
+
+def get_current_time(format='%Y-%m-%d %H:%M:%S.%f'):
+    """
+    Generate the current time string in the given format.
+    """
+    return datetime.utcnow().strftime(format)
+
+
+def output_name(database, used):
+    """
+    Generate a file system friendly (and unique) name for the backup of the
+    given database.
+    """
+    name = re.sub(
+        r'[^\w.-]', '_', database, flags=re.UNICODE
+    ).lstrip('.') or '_'
+    candidate = name
+    idx = 1
+    while candidate.lower() in used:
+        candidate = '{0}_{1}'.format(name, idx)
+        idx += 1
+    used.add(candidate.lower())
+    return candidate
+
+
+def parse_arguments(argv):
+    """
+    Parse the arguments, and separate them in the options for this script,
+    the options to be passed to pg_dump, and the list of databases.
+    """
+    opts = {
+        'pg_dump': None,
+        'directory': None,
+        'jobs': 1,
+        'parallel': 1
+    }
+    pg_dump_args = []
+    databases = []
+
+    idx = 0
+    while idx < len(argv):
+        arg = argv[idx]
+        if arg == '--':
+            databases = argv[idx + 1:]
+            break
+
+        key = arg[2:].replace('-', '_') if arg.startswith('--') else None
+        if key in opts:
+            if idx + 1 >= len(argv):
+                raise ValueError('Missing value for the option: ' + arg)
+            opts[key] = argv[idx + 1]
+            idx += 2
+            continue
+
+        pg_dump_args.append(arg)
+        idx += 1
+
+    if opts['pg_dump'] is None or opts['directory'] is None:
+        raise ValueError('--pg-dump, and --directory options are required.')
+
+    opts['jobs'] = max(1, int(opts['jobs']))
+    opts['parallel'] = max(1, int(opts['parallel']))
+
+    return opts, pg_dump_args, databases
+
+
+class DatabaseBackup(object):
+    """Backup of a single database"""
+
+    def __init__(self, database, output, log):
+        self.database = database
+        self.output = output
+        self.log = log
+        self.exit_code = None
+        self.start_time = None
+        self.end_time = None
+        self.duration = None
+
+    def run(self, pg_dump, args, jobs):
+        cmd = [pg_dump, '--format=d', '--jobs={0}'.format(jobs),
+               '--file', self.output]
+        cmd.extend(args)
+        cmd.append(self.database)
+
+        self.start_time = get_current_time()
+        started = time.time()
+
+        with open(self.log, 'wb') as log:
+            try:
+                p = Popen(
+                    cmd, stdout=log, stderr=STDOUT, stdin=None,
+                    close_fds=False, shell=(os.name == 'nt')
+                )
+                self.exit_code = p.wait()
+            except OSError as e:
+                log.write(str(e).encode('utf-8'))
+                self.exit_code = e.errno or -1
+
+        self.duration = round(time.time() - started, 2)
+        self.end_time = get_current_time()
+
+    def to_dict(self):
+        return {
+            'database': self.database,
+            'output': self.output,
+            'log': self.log,
+            'exit_code': self.exit_code,
+            'start_time': self.start_time,
+            'end_time': self.end_time,
+            'duration': self.duration
+        }
+
+
+def run_backups(opts, pg_dump_args, databases, out=sys.stdout):
+    """
+    Backup the given databases using at most 'parallel' pg_dump worker
+    connections at a time.
+
+    Returns:
+        The manifest as a dictionary.
+    """
+    directory = opts['directory']
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+    # Do not run more pg_dump jobs (per database) than the budget
+    jobs = min(opts['jobs'], opts['parallel'])
+    concurrency = max(1, opts['parallel'] // jobs)
+
+    used = set()
+    pending = []
+    for database in databases:
+        name = output_name(database, used)
+        pending.append(DatabaseBackup(
+            database,
+            os.path.join(directory, name),
+            os.path.join(directory, name + '.log')
+        ))
+    backups = list(pending)
+    pending.reverse()
+
+    lock = Lock()
+    progress = {'done': 0, 'failed': 0}
+    total = len(backups)
+
+    def report(msg):
+        with lock:
+            print(msg, file=out)
+            out.flush()
+
+    def worker():
+        while True:
+            with lock:
+                if not pending:
+                    return
+                backup = pending.pop()
+
+            report('Backing up the database "{0}"...'.format(backup.database))
+            backup.run(opts['pg_dump'], pg_dump_args, jobs)
+
+            with lock:
+                progress['done'] += 1
+                if backup.exit_code != 0:
+                    progress['failed'] += 1
+                done = progress['done']
+
+            if backup.exit_code == 0:
+                report(
+                    '[{0}/{1}] Backed up the database "{2}" in {3} '
+                    'seconds.'.format(
+                        done, total, backup.database, backup.duration
+                    )
+                )
+            else:
+                report(
+                    '[{0}/{1}] Failed to back up the database "{2}" (exit '
+                    'code: {3}), see "{4}" for details.'.format(
+                        done, total, backup.database, backup.exit_code,
+                        backup.log
+                    )
+                )
+
+    start_time = get_current_time()
+    started = time.time()
+
+    report(
+        'Backing up {0} database(s) using {1} parallel pg_dump run(s) with '
+        '{2} job(s) each...'.format(total, concurrency, jobs)
+    )
+
+    threads = [
+        Thread(target=worker) for _ in range(min(concurrency, total))
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    manifest = {
+        'start_time': start_time,
+        'end_time': get_current_time(),
+        'duration': round(time.time() - started, 2),
+        'jobs': jobs,
+        'parallel': opts['parallel'],
+        'total': total,
+        'failed': progress['failed'],
+        'databases': [b.to_dict() for b in backups]
+    }
+
+    with open(os.path.join(directory, MANIFEST_FILE), 'w') as fp:
+        json.dump(manifest, fp, indent=2)
+
+    report(
+        'Completed in {0} seconds, {1} of {2} database(s) failed.'.format(
+            manifest['duration'], progress['failed'], total
+        )
+    )
+
+    return manifest
+
+
+if __name__ == '__main__':
+    try:
+        opts, pg_dump_args, databases = parse_arguments(sys.argv[1:])
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        sys.exit(2)
+
+    manifest = run_backups(opts, pg_dump_args, databases)
+    sys.exit(1 if manifest['failed'] else 0)
@@ -0,0 +1,8 @@
+SELECT
+    db.datname as name
+FROM
+    pg_database db
+WHERE
+    db.datallowconn AND NOT db.datistemplate AND
+    has_database_privilege(db.oid, 'CONNECT')
+ORDER BY pg_database_size(db.oid) DESC, db.datname;
@@ -0,0 +1,109 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+from pgadmin.tools.backup.backup_databases import parse_arguments, \
+    run_backups, MANIFEST_FILE
+from pgadmin.utils.route import BaseTestGenerator
+
+if sys.version_info[0] >= 3:
+    from io import StringIO
+else:
+    from StringIO import StringIO
+
+
+class BackupDatabasesTest(BaseTestGenerator):
+    """Test the parallel backup of the multiple databases"""
+    scenarios = [
+        ('When all the databases are backed up',
+         dict(
+             databases=['postgres', 'db/1', 'DB/1'],
+             failing=[],
+             jobs='2',
+             parallel='4'
+         )),
+        ('When backup of a database fails',
+         dict(
+             databases=['postgres', 'test_fail', 'test_db'],
+             failing=['test_fail'],
+             jobs='4',
+             parallel='2'
+         ))
+    ]
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        # Fake pg_dump, which creates the output directory, and fails for
+        # the database names starting with 'test_fail'.
+        self.pg_dump = os.path.join(self.directory, 'pg_dump')
+        with open(self.pg_dump, 'w') as fp:
+            fp.write(
+                '#!/bin/sh\n'
+                'for arg; do\n'
+                '  [ "$prev" = "--file" ] && mkdir -p "$arg"\n'
+                '  prev="$arg"\n'
+                'done\n'
+                'case "$prev" in test_fail*) exit 1;; esac\n'
+            )
+        os.chmod(self.pg_dump, 0o700)
+
+    def runTest(self):
+        if os.name == 'nt':
+            self.skipTest('Fake pg_dump is not executable on Windows')
+
+        output = os.path.join(self.directory, 'backup')
+        argv = [
+            '--pg-dump', self.pg_dump,
+            '--directory', output,
+            '--jobs', self.jobs,
+            '--parallel', self.parallel,
+            '--no-password', '--'
+        ] + self.databases
+
+        opts, pg_dump_args, databases = parse_arguments(argv)
+        self.assertEqual(self.databases, databases)
+        self.assertEqual(['--no-password'], pg_dump_args)
+
+        out = StringIO()
+        manifest = run_backups(opts, pg_dump_args, databases, out)
+
+        self.assertEqual(len(self.databases), manifest['total'])
+        self.assertEqual(len(self.failing), manifest['failed'])
+        self.assertTrue(
+            manifest['jobs'] * (
+                manifest['parallel'] // manifest['jobs']
+            ) <= int(self.parallel)
+        )
+
+        with open(os.path.join(output, MANIFEST_FILE)) as fp:
+            self.assertEqual(manifest, json.load(fp))
+
+        outputs = set()
+        for entry in manifest['databases']:
+            self.assertEqual(
+                entry['database'] in self.failing, entry['exit_code'] != 0
+            )
+            self.assertTrue(os.path.isfile(entry['log']))
+            if entry['exit_code'] == 0:
+                self.assertTrue(os.path.isdir(entry['output']))
+            outputs.add(entry['output'])
+
+        # Each database must have its own output directory
+        self.assertEqual(len(self.databases), len(outputs))
+        self.assertTrue(
+            '[{0}/{0}]'.format(len(self.databases)) in out.getvalue()
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, True)
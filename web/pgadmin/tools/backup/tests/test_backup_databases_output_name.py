@@ -0,0 +1,31 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.tools.backup.backup_databases import output_name
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class BackupDatabasesOutputNameTest(BaseTestGenerator):
+    """Test the output names of the databases"""
+    scenarios = [
+        ('When the names are unique', dict(
+            databases=['postgres', 'test'],
+            expected=['postgres', 'test']
+        )),
+        ('When the names contain special characters', dict(
+            databases=['test db', 'test/db', '..'],
+            expected=['test_db', 'test_db_1', '_']
+        )),
+    ]
+
+    def runTest(self):
+        used = set()
+        self.assertEqual(
+            self.expected, [output_name(db, used) for db in self.databases]
+        )
@@ -15,7 +15,7 @@ import pickle
 import random
 
 from threading import Lock
-from flask import Response, url_for, session, request, make_response
+from flask import Response, url_for, session, request
 from werkzeug.useragents import UserAgent
 from flask import current_app as app
 from flask_security import login_required
@@ -29,6 +29,7 @@ from pgadmin.model import Server
 from pgadmin.utils.driver import get_driver
 from pgadmin.utils.exception import ConnectionLost, SSHTunnelConnectionLost
 from pgadmin.utils.preferences import Preferences
+from pgadmin.utils.rendered_cache import render_cached
 from pgadmin.settings import get_setting
 
 query_tool_close_session_lock = Lock()
@@ -99,9 +100,9 @@ def index():
 
 @blueprint.route("/css/datagrid.css")
 def datagrid_css():
-    return make_response(
-        render_template('datagrid/css/datagrid.css'),
-        200, {'Content-Type': 'text/css'}
+    return render_cached(
+        'datagrid/css/datagrid.css', 'text/css',
+        lambda: render_template('datagrid/css/datagrid.css')
     )
 
 
@@ -9,6 +9,7 @@
 
 """A blueprint module implementing the maintenance tool for vacuum"""
 
+import os
 import simplejson as json
 
 from flask import url_for, Response, render_template, request, current_app
@@ -68,7 +69,8 @@ class MaintenanceModule(PgAdminModule):
         Returns:
             list: URL endpoints for backup module
         """
-        return ['maintenance.create_job', 'maintenance.utility_exists']
+        return ['maintenance.create_job', 'maintenance.create_bulk_job',
+                'maintenance.utility_exists']
 
 
 blueprint = MaintenanceModule(MODULE_NAME, __name__)
@@ -143,6 +145,58 @@ class Message(IProcessDesc):
         return res
 
 
+class BulkMessage(IProcessDesc):
+    def __init__(self, _sid, _data, _tables):
+        self.sid = _sid
+        self.data = _data
+        self.tables = _tables
+
+    @property
+    def message(self):
+        res = _("Maintenance ({0}) on {1} table(s)")
+
+        if self.data['op'] == "VACUUM":
+            return res.format(_('Vacuum'), len(self.tables))
+        if self.data['op'] == "ANALYZE":
+            return res.format(_('Analyze'), len(self.tables))
+
+    @property
+    def type_desc(self):
+        return _("Maintenance")
+
+    def details(self, cmd, args):
+        if self.data['op'] == "VACUUM":
+            res = _('VACUUM ({0})')
+
+            opts = []
+            if self.data.get('vacuum_full', False):
+                opts.append(_('FULL'))
+            if self.data.get('vacuum_freeze', False):
+                opts.append(_('FREEZE'))
+            if self.data.get('verbose', False):
+                opts.append(_('VERBOSE'))
+            if self.data.get('vacuum_analyze', False):
+                opts.append(_('ANALYZE'))
+
+            res = res.format(', '.join(str(x) for x in opts))
+        else:
+            res = _('ANALYZE')
+            if self.data.get('verbose', False):
+                res += '(' + _('VERBOSE') + ')'
+
+        res = '<div>' + html.safe_str(res)
+
+        res += '</div><div class="py-1">'
+        res += _("Tables ({0}):").format(len(self.tables))
+        res += '<div class="pg-bg-cmd enable-selection p-1">'
+        res += html.safe_str(
+            ', '.join('{0}.{1}'.format(s, t) for s, t in self.tables)
+        )
+        res += '</div></div>'
+
+        return res
+
+
 @blueprint.route("/")
 @login_required
 def index():
@@ -270,6 +324,145 @@ def create_maintenance_job(sid, did):
     )
 
 
+@blueprint.route(
+    '/job/<int:sid>/<int:did>/bulk', methods=['POST'],
+    endpoint='create_bulk_job'
+)
+@login_required
+def create_bulk_maintenance_job(sid, did):
+    """
+    Args:
+        sid: Server ID
+        did: Database ID
+
+        Creates a new job for running VACUUM/ANALYZE on multiple tables over
+        the parallel connections.
+
+        The tables are either given as a list of [schema, table] pairs, or
+        selected from pg_stat_user_tables by the ratio of the dead tuples
+        ('dead_tuple_ratio'), optionally within a schema.
+
+    Returns:
+        None
+    """
+    if request.form:
+        data = json.loads(request.form['data'], encoding='utf-8')
+    else:
+        data = json.loads(request.data, encoding='utf-8')
+
+    if data.get('op', None) not in ('VACUUM', 'ANALYZE'):
+        return bad_request(
+            errormsg=_("Only VACUUM and ANALYZE can be run on multiple "
+                       "tables.")
+        )
+
+    # Fetch the server details like hostname, port, roles etc
+    server = Server.query.filter_by(
+        id=sid, user_id=current_user.id
+    ).first()
+
+    if server is None:
+        return make_json_response(
+            success=0,
+            errormsg=_("Could not find the given server")
+        )
+
+    # To fetch MetaData for the server
+    driver = get_driver(PG_DEFAULT_DRIVER)
+    manager = driver.connection_manager(server.id)
+    conn = manager.connection(did=did)
+    connected = conn.connected()
+
+    if not connected:
+        return make_json_response(
+            success=0,
+            errormsg=_("Please connect to the server first.")
+        )
+
+    tables = data.get('tables', None)
+    if not tables:
+        try:
+            threshold = float(data.get('dead_tuple_ratio', 0.2))
+        except (TypeError, ValueError):
+            return bad_request(
+                errormsg=_("Invalid ratio of the dead tuples.")
+            )
+
+        status, res = conn.execute_dict(render_template(
+            'maintenance/sql/bulk_tables.sql', conn=conn,
+            threshold=threshold, schema=data.get('schema', None)
+        ))
+        if not status:
+            return make_json_response(
+                success=0,
+                errormsg=res
+            )
+        tables = [[row['schema'], row['name']] for row in res['rows']]
+
+    if not tables:
+        return make_json_response(
+            success=0,
+            errormsg=_("Could not find any table to run the maintenance on.")
+        )
+
+    args = [
+        '--op', data['op'],
+        '--parallel', str(data.get('parallel', None) or 1)
+    ]
+
+    for key, param in [
+        ('vacuum_full', '--full'), ('vacuum_freeze', '--freeze'),
+        ('vacuum_analyze', '--analyze'), ('verbose', '--verbose')
+    ]:
+        if data.get(key, False):
+            args.append(param)
+
+    args.append('--')
+    for schema, table in tables:
+        args.extend([schema, table])
+
+    try:
+        p = BatchProcess(
+            desc=BulkMessage(sid, data, tables),
+            cmd=os.path.join(
+                os.path.dirname(os.path.realpath(__file__)),
+                'bulk_maintenance.py'
+            ),
+            args=args
+        )
+        manager.export_password_env(p.id)
+
+        env = dict()
+        env['PGHOST'] = \
+            manager.local_bind_host if manager.use_ssh_tunnel else server.host
+        env['PGPORT'] = \
+            str(manager.local_bind_port) if manager.use_ssh_tunnel \
+            else str(server.port)
+        env['PGUSER'] = server.username
+        env['PGDATABASE'] = conn.db
+        # Check for connection timeout and if it is greater than 0 then
+        # set the environment variable PGCONNECT_TIMEOUT.
+        if manager.connect_timeout > 0:
+            env['PGCONNECT_TIMEOUT'] = str(manager.connect_timeout)
+        p.set_env_variables(server, env=env)
+
+        p.start()
+        jid = p.id
+    except Exception as e:
+        current_app.logger.exception(e)
+        return make_json_response(
+            status=410,
+            success=0,
+            errormsg=str(e)
+        )
+
+    # Return response
+    return make_json_response(
+        data={'job_id': jid, 'status': True,
+              'info': 'Maintenance job created.'}
+    )
+
+
 @blueprint.route(
     '/utility_exists/<int:sid>', endpoint='utility_exists'
 )
@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL License
+#
+##########################################################################
+
+"""
+This python script is responsible for running VACUUM/ANALYZE on multiple
+tables over a number of parallel connections.
+
+It is run by the process executor (as a single background process), and it
+will:
+* Run the maintenance command for each of the given tables, using at most
+  the given number of parallel connections.
+* Report the progress of the running VACUUM commands from the
+  pg_stat_progress_vacuum view (PostgreSQL 9.6+) periodically.
+* Report the time taken by each table, and in total at the end.
+
+It uses the libpq environment variables (i.e. PGHOST, PGPORT, PGUSER,
+PGDATABASE, PGPASSWORD) to connect to the database.
+
+Usage:
+  bulk_maintenance.py --op <VACUUM|ANALYZE> [--parallel <N>]
+      [--interval <seconds>] [--full] [--freeze] [--analyze] [--verbose]
+      -- <schema> <table> [<schema> <table>...]
+"""
+from __future__ import print_function
+
+import sys
+import time
+from threading import Event, Lock, Thread
+
+import psycopg2
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+
+PROGRESS_QUERY = """SELECT
+    pid, phase, heap_blks_total, heap_blks_scanned, heap_blks_vacuumed,
+    index_vacuum_count
+FROM pg_stat_progress_vacuum
+WHERE pid = ANY(%s)"""
+
+
+def parse_arguments(argv):
+    """
+    Parse the arguments, and return the options and the list of (schema,
+    table) pairs.
+    """
+    opts = {
+        'op': None,
+        'parallel': 1,
+        'interval': 2,
+        'full': False,
+        'freeze': False,
+        'analyze': False,
+        'verbose': False
+    }
+    tables = []
+
+    idx = 0
+    while idx < len(argv):
+        arg = argv[idx]
+        if arg == '--':
+            names = argv[idx + 1:]
+            if len(names) % 2:
+                raise ValueError('Schema and table names must be in pairs.')
+            tables = list(zip(names[0::2], names[1::2]))
+            break
+
+        key = arg[2:] if arg.startswith('--') else None
+        if key not in opts:
+            raise ValueError('Invalid option: ' + arg)
+
+        if isinstance(opts[key], bool):
+            opts[key] = True
+            idx += 1
+            continue
+
+        if idx + 1 >= len(argv):
+            raise ValueError('Missing value for the option: ' + arg)
+        opts[key] = argv[idx + 1]
+        idx += 2
+
+    if opts['op'] not in ('VACUUM', 'ANALYZE'):
+        raise ValueError('--op must be either VACUUM or ANALYZE.')
+
+    opts['parallel'] = max(1, int(opts['parallel']))
+    opts['interval'] = max(0.1, float(opts['interval']))
+
+    return opts, tables
+
+
+def qtIdent(value):
+    return '"' + value.replace('"', '""') + '"'
+
+
+def build_command(opts, schema, table):
+    """Generate the maintenance command for the given table"""
+    cmd = opts['op']
+
+    if opts['op'] == 'VACUUM':
+        if opts['full']:
+            cmd += ' FULL'
+        if opts['freeze']:
+            cmd += ' FREEZE'
+        if opts['verbose']:
+            cmd += ' VERBOSE'
+        if opts['analyze']:
+            cmd += ' ANALYZE'
+    elif opts['verbose']:
+        cmd += ' VERBOSE'
+
+    return '{0} {1}.{2};'.format(cmd, qtIdent(schema), qtIdent(table))
+
+
+def format_progress(table, row):
+    """
+    Generate the progress message from the row of pg_stat_progress_vacuum.
+    """
+    _, phase, total, scanned, vacuumed, index_vacuum_count = row
+    msg = '{0}: {1}'.format(table, phase)
+
+    if total:
+        msg += ', {0}% scanned, {1}% vacuumed'.format(
+            round(100.0 * (scanned or 0) / total, 1),
+            round(100.0 * (vacuumed or 0) / total, 1)
+        )
+    if index_vacuum_count:
+        msg += ', {0} index vacuum cycle(s)'.format(index_vacuum_count)
+
+    return msg
+
+
+def run_maintenance(opts, tables, connect=psycopg2.connect, out=sys.stdout):
+    """
+    Run the maintenance command for the given tables over 'parallel'
+    connections.
+
+    Returns:
+        List of (table, duration, error) for each of the tables.
+    """
+    lock = Lock()
+    done = Event()
+    pending = list(reversed(tables))
+    results = []
+    # backend pid => table name being processed
+    running = dict()
+    total = len(tables)
+
+    def report(msg):
+        with lock:
+            print(msg, file=out)
+            out.flush()
+
+    def worker():
+        conn = None
+        try:
+            conn = connect('')
+            conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+            pid = conn.get_backend_pid()
+        except psycopg2.Error as e:
+            report('Could not connect to the database: {0}'.format(e))
+            return
+
+        try:
+            while True:
+                with lock:
+                    if not pending:
+                        return
+                    schema, table = pending.pop()
+
+                name = '{0}.{1}'.format(schema, table)
+                with lock:
+                    running[pid] = name
+
+                error = None
+                started = time.time()
+                try:
+                    cur = conn.cursor()
+                    cur.execute(build_command(opts, schema, table))
+                    cur.close()
+                except psycopg2.Error as e:
+                    error = str(e).strip()
+
+                duration = round(time.time() - started, 2)
+
+                for notice in conn.notices:
+                    report(notice.strip())
+                del conn.notices[:]
+
+                with lock:
+                    running.pop(pid, None)
+                    results.append((name, duration, error))
+                    count = len(results)
+
+                if error is None:
+                    report('[{0}/{1}] {2} completed in {3} seconds.'.format(
+                        count, total, name, duration
+                    ))
+                else:
+                    report('[{0}/{1}] {2} failed: {3}'.format(
+                        count, total, name, error
+                    ))
+        finally:
+            conn.close()
+
+    def monitor():
+        try:
+            conn = connect('')
+            conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        except psycopg2.Error:
+            return
+
+        try:
+            if conn.server_version < 90600:
+                return
+
+            while not done.wait(opts['interval']):
+                with lock:
+                    pids = list(running.keys())
+                    names = dict(running)
+                if not pids:
+                    continue
+
+                cur = conn.cursor()
+                cur.execute(PROGRESS_QUERY, (pids,))
+                for row in cur.fetchall():
+                    if row[0] in names:
+                        report(format_progress(names[row[0]], row))
+                cur.close()
+        except psycopg2.Error as e:
+            report('Could not fetch the progress: {0}'.format(e))
+        finally:
+            conn.close()
+
+    started = time.time()
+    report('Running {0} on {1} table(s) using {2} connection(s)...'.format(
+        opts['op'], total, min(opts['parallel'], total)
+    ))
+
+    progress = None
+    # VACUUM FULL is not reported in pg_stat_progress_vacuum.
+    if opts['op'] == 'VACUUM' and not opts['full']:
+        progress = Thread(target=monitor)
+        progress.daemon = True
+        progress.start()
+
+    threads = [
+        Thread(target=worker) for _ in range(min(opts['parallel'], total))
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    done.set()
+    if progress is not None:
+        progress.join()
+
+    # Timing report (slowest first)
+    report('')
+    report('Timings:')
+    for name, duration, error in sorted(
+        results, key=lambda r: r[1], reverse=True
+    ):
+        report('  {0}: {1} seconds{2}'.format(
+            name, duration, '' if error is None else ' (failed)'
+        ))
+
+    failed = len([r for r in results if r[2] is not None])
+    report(
+        'Completed in {0} seconds, {1} of {2} table(s) failed.'.format(
+            round(time.time() - started, 2), failed + total - len(results),
+            total
+        )
+    )
+
+    return results
+
+
+if __name__ == '__main__':
+    try:
+        opts, tables = parse_arguments(sys.argv[1:])
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        sys.exit(2)
+
+    results = run_maintenance(opts, tables)
+    sys.exit(
+        0 if len(results) == len(tables) and
+        all(r[2] is None for r in results) else 1
+    )
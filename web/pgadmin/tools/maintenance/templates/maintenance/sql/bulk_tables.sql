@@ -0,0 +1,11 @@
+SELECT
+    st.schemaname AS schema, st.relname AS name,
+    st.n_live_tup, st.n_dead_tup
+FROM
+    pg_stat_user_tables st
+WHERE
+    st.n_dead_tup > 0 AND
+    st.n_dead_tup::float8 / GREATEST(st.n_live_tup + st.n_dead_tup, 1) >= {{ threshold }}{% if schema %}
+    AND st.schemaname = {{ schema|qtLiteral }}{% endif %}
+
+ORDER BY st.n_dead_tup DESC;
@@ -0,0 +1,106 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import sys
+
+import psycopg2
+
+from pgadmin.tools.maintenance.bulk_maintenance import parse_arguments, \
+    run_maintenance
+from pgadmin.utils.route import BaseTestGenerator
+
+if sys.version_info[0] >= 3:
+    from io import StringIO
+else:
+    from StringIO import StringIO
+
+
+class TestMockCursor():
+    def __init__(self, executed):
+        self.executed = executed
+
+    def execute(self, query, params=None):
+        if 'test_fail' in query:
+            raise psycopg2.ProgrammingError('test error')
+        self.executed.append(query)
+
+    def fetchall(self):
+        return []
+
+    def close(self):
+        pass
+
+
+class TestMockConnection():
+    pids = 0
+
+    def __init__(self, executed):
+        self.executed = executed
+        self.notices = []
+        self.server_version = 110000
+        TestMockConnection.pids += 1
+        self.pid = TestMockConnection.pids
+
+    def set_isolation_level(self, level):
+        pass
+
+    def get_backend_pid(self):
+        return self.pid
+
+    def cursor(self):
+        return TestMockCursor(self.executed)
+
+    def close(self):
+        pass
+
+
+class BulkMaintenanceTest(BaseTestGenerator):
+    """Test the bulk maintenance script"""
+    scenarios = [
+        ('When vacuum multiple tables',
+         dict(
+             argv=['--op', 'VACUUM', '--parallel', '2', '--analyze',
+                   '--interval', '0.1', '--',
+                   'public', 'tab1', 'public', 'tab"2', 'test', 'tab3'],
+             expected_commands=[
+                 'VACUUM ANALYZE "public"."tab1";',
+                 'VACUUM ANALYZE "public"."tab""2";',
+                 'VACUUM ANALYZE "test"."tab3";'
+             ],
+             failed=0
+         )),
+        ('When analyze fails for a table',
+         dict(
+             argv=['--op', 'ANALYZE', '--verbose', '--',
+                   'public', 'tab1', 'public', 'test_fail'],
+             expected_commands=[
+                 'ANALYZE VERBOSE "public"."tab1";'
+             ],
+             failed=1
+         ))
+    ]
+
+    def runTest(self):
+        opts, tables = parse_arguments(self.argv)
+        executed = []
+        out = StringIO()
+
+        results = run_maintenance(
+            opts, tables,
+            connect=lambda dsn: TestMockConnection(executed), out=out
+        )
+
+        self.assertEqual(len(tables), len(results))
+        self.assertEqual(
+            sorted(self.expected_commands), sorted(executed)
+        )
+        self.assertEqual(
+            self.failed, len([r for r in results if r[2] is not None])
+        )
+        self.assertTrue('Timings:' in out.getvalue())
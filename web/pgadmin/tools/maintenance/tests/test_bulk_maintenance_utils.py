@@ -0,0 +1,40 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.tools.maintenance.bulk_maintenance import parse_arguments, \
+    build_command, format_progress
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class BulkMaintenanceUtilsTest(BaseTestGenerator):
+    """Test the utility functions of the bulk maintenance script"""
+    scenarios = [
+        ('When vacuum full freeze', dict(
+            argv=['--op', 'VACUUM', '--full', '--freeze', '--',
+                  'public', 'tab1'],
+            expected='VACUUM FULL FREEZE "public"."tab1";'
+        )),
+    ]
+
+    def runTest(self):
+        opts, tables = parse_arguments(self.argv)
+        self.assertEqual(self.expected, build_command(opts, *tables[0]))
+
+        self.assertEqual(
+            'public.tab1: scanning heap, 50.0% scanned, 25.0% vacuumed',
+            format_progress(
+                'public.tab1', (1, 'scanning heap', 100, 50, 25, 0)
+            )
+        )
+
+        # Invalid arguments
+        self.assertRaises(ValueError, parse_arguments, ['--op', 'CLUSTER'])
+        self.assertRaises(
+            ValueError, parse_arguments, ['--op', 'VACUUM', '--', 'public']
+        )
@@ -14,7 +14,7 @@ import sys
 
 import simplejson as json
 from flask import Response, url_for, render_template, session, request, \
-    current_app
+    current_app, stream_with_context
 from flask_babelex import gettext
 from flask_security import login_required, current_user
 
@@ -42,6 +42,8 @@ from pgadmin.tools.sqleditor.utils.query_tool_fs_utils import \
     read_file_generator
 from pgadmin.tools.sqleditor.utils.filter_dialog import FilterDialog
 from pgadmin.tools.sqleditor.utils.query_history import QueryHistory
+from pgadmin.tools.sqleditor.utils.columnar_result import \
+    is_columnar_result_requested, encode_columnar_result
 
 MODULE_NAME = 'sqleditor'
 
@@ -103,6 +105,7 @@ class SqlEditorModule(PgAdminModule):
             'sqleditor.exclusive_filter',
             'sqleditor.remove_filter',
             'sqleditor.set_limit',
+            'sqleditor.set_keyset_page',
             'sqleditor.cancel_transaction',
             'sqleditor.get_object_name',
             'sqleditor.auto_commit',
@@ -257,6 +260,9 @@ def start_view_data(trans_id):
         # Fetch the limit for the SQL query
         limit = trans_obj.get_limit()
 
+        # Fetch the page of the keyset pagination
+        keyset_page = trans_obj.get_keyset_page()
+
         can_edit = trans_obj.can_edit()
         can_filter = trans_obj.can_filter()
 
@@ -280,6 +286,7 @@ def start_view_data(trans_id):
         can_edit = False
         can_filter = False
         sql = None
+        keyset_page = None
 
     return make_json_response(
         data={
@@ -287,6 +294,7 @@ def start_view_data(trans_id):
             'filter_applied': filter_applied,
             'limit': limit, 'can_edit': can_edit,
             'can_filter': can_filter, 'sql': sql,
+            'keyset_page': keyset_page,
             'info_notifier_timeout': blueprint.info_notifier_timeout.get()
         }
     )
@@ -539,6 +547,10 @@ def poll(trans_id):
            result is not None and additional_messages:
             result = additional_messages + result
 
+    if status == 'Success' and isinstance(result, list) and \
+            is_columnar_result_requested():
+        result = encode_columnar_result(result)
+
     transaction_status = conn.transaction_status()
     return make_json_response(
         data={
@@ -557,7 +569,8 @@ def poll(trans_id):
             'oids': oids,
             'transaction_status': transaction_status,
         },
-        encoding=conn.python_encoding
+        encoding=conn.python_encoding,
+        stream_rows='result'
     )
 
 
@@ -602,12 +615,30 @@ def fetch(trans_id, fetch_all=None):
                                   status=404)
 
     if status and conn is not None and session_obj is not None:
-        status, result = conn.async_fetchmany_2darray(fetch_row_cnt)
+        if fetch_all == 1:
+            # Stream all the remaining rows a batch at a time straight from
+            # the cursor, instead of fetching, and encoding all of them at
+            # once. The session is saved before the rows are streamed, hence
+            # the rows are counted (from the cursor) up front.
+            # The first batch is fetched before the response is started, so
+            # that an error is still reported with the 'Error' status.
+            res_len = conn.async_remaining_rows()
+            status, result = conn.async_fetchmany_2darray(
+                ON_DEMAND_RECORD_COUNT
+            )
+            if status:
+                result = stream_with_context(
+                    generate_remaining_rows(conn, result)
+                )
+        else:
+            status, result = conn.async_fetchmany_2darray(fetch_row_cnt)
+            if status:
+                res_len = len(result)
+
         if not status:
             status = 'Error'
         else:
             status = 'Success'
-            res_len = len(result)
             if fetch_row_cnt != -1 and res_len == ON_DEMAND_RECORD_COUNT:
                 has_more_rows = True
 
@@ -622,6 +653,10 @@ def fetch(trans_id, fetch_all=None):
         status = 'NotConnected'
         result = error_msg
 
+    if status == 'Success' and isinstance(result, list) and \
+            is_columnar_result_requested():
+        result = encode_columnar_result(result)
+
     return make_json_response(
         data={
             'status': status,
@@ -630,10 +665,41 @@ def fetch(trans_id, fetch_all=None):
             'rows_fetched_from': rows_fetched_from,
             'rows_fetched_to': rows_fetched_to
         },
-        encoding=conn.python_encoding
+        encoding=conn.python_encoding,
+        stream_rows='result'
     )
 
 
+def generate_remaining_rows(conn, first_rows):
+    """
+    Generate the remaining rows of the result of the async query,
+    ON_DEMAND_RECORD_COUNT rows at a time.
+
+    The response has already been started, when the rows are generated,
+    hence - an error is sent as the last row {'error': <message>}, which the
+    client looks for.
+
+    Args:
+        conn: connection object
+        first_rows: the rows already fetched
+    """
+    result = first_rows
+    while result:
+        yield result
+
+        try:
+            status, result = conn.async_fetchmany_2darray(
+                ON_DEMAND_RECORD_COUNT
+            )
+        except Exception as e:
+            current_app.logger.exception(e)
+            status, result = False, str(e)
+
+        if not status:
+            yield [{'error': result}]
+            break
+
+
 def fetch_pg_types(columns_info, trans_obj):
     """
     This method is used to fetch the pg types, which is required
@@ -923,6 +989,82 @@ def remove_filter(trans_id):
     return make_json_response(data={'status': status, 'result': res})
 
 
+@blueprint.route(
+    '/keyset/<int:trans_id>', methods=["PUT", "POST", "DELETE"],
+    endpoint='set_keyset_page'
+)
+@login_required
+def set_keyset_page(trans_id):
+    """
+    This method is used to set the page of the rows (ordered by the primary
+    keys) fetched by View Data, or to stop paging the rows (DELETE).
+    The rows of the page are fetched by executing the query again.
+
+    Args:
+        trans_id: unique transaction id
+    """
+    if request.data:
+        data = json.loads(request.data, encoding='utf-8')
+    else:
+        data = request.args or request.form
+
+    # Check the transaction and connection status
+    status, error_msg, conn, trans_obj, session_obj = \
+        check_transaction_status(trans_id)
+
+    if error_msg == gettext('Transaction ID not found in the session.'):
+        return make_json_response(success=0, errormsg=error_msg,
+                                  info='DATAGRID_TRANSACTION_REQUIRED',
+                                  status=404)
+
+    if status and conn is not None and \
+       trans_obj is not None and session_obj is not None:
+
+        # Only the rows of the tables (having the primary keys) are paged
+        if getattr(trans_obj, 'object_type', None) != 'table':
+            return bad_request(
+                errormsg=gettext('The rows of the object can not be paged.')
+            )
+
+        if request.method == 'DELETE':
+            status, res = trans_obj.set_keyset_page(None)
+        else:
+            status, res = trans_obj.set_keyset_page(
+                data.get('page'), data.get('key'), data.get('page_size')
+            )
+        if not status:
+            return bad_request(errormsg=res)
+
+        # The key is saved in the transaction, and used by every later run of
+        # the query, hence - check it has a value for each primary key.
+        keyset_page = trans_obj.get_keyset_page()
+        if keyset_page is not None and keyset_page['key'] is not None:
+            try:
+                pk_names, primary_keys = trans_obj.get_primary_keys()
+            except (ConnectionLost, SSHTunnelConnectionLost):
+                raise
+            except Exception as e:
+                current_app.logger.error(e)
+                return internal_server_error(errormsg=str(e))
+
+            if len(keyset_page['key']) != len(primary_keys):
+                return bad_request(
+                    errormsg=gettext(
+                        'The key must have a value for each primary key.'
+                    )
+                )
+
+        # As we changed the transaction object we need to
+        # restore it and update the session variable.
+        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
+        update_session_grid_transaction(trans_id, session_obj)
+    else:
+        status = False
+        res = error_msg
+
+    return make_json_response(data={'status': status, 'result': res})
+
+
 @blueprint.route(
     '/limit/<int:trans_id>', methods=["PUT", "POST"], endpoint='set_limit'
 )
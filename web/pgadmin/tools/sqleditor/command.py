@@ -20,13 +20,30 @@ from flask_babelex import gettext
 from pgadmin.utils.ajax import forbidden
 from pgadmin.utils.driver import get_driver
 
-from config import PG_DEFAULT_DRIVER
+from config import PG_DEFAULT_DRIVER, ON_DEMAND_RECORD_COUNT
 
 VIEW_FIRST_100_ROWS = 1
 VIEW_LAST_100_ROWS = 2
 VIEW_ALL_ROWS = 3
 VIEW_FILTERED_ROWS = 4
 
+# The pages of the keyset pagination (of the rows ordered by the primary keys)
+KEYSET_FIRST_PAGE = 'first'
+KEYSET_LAST_PAGE = 'last'
+KEYSET_NEXT_PAGE = 'next'
+KEYSET_PREVIOUS_PAGE = 'previous'
+KEYSET_JUMP_TO_KEY = 'jump'
+
+# The operator comparing the primary keys with the key, and whether the rows
+# are read backwards (from the key) for the pages
+KEYSET_PAGES = {
+    KEYSET_FIRST_PAGE: (None, False),
+    KEYSET_LAST_PAGE: (None, True),
+    KEYSET_NEXT_PAGE: ('>', False),
+    KEYSET_PREVIOUS_PAGE: ('<', True),
+    KEYSET_JUMP_TO_KEY: ('>=', False),
+}
+
 
 class ObjectRegistry(ABCMeta):
     """
@@ -339,7 +356,16 @@ class GridCommand(BaseCommand, SQLFilter, FetchedRowTracker):
 
     * get_limit()
       - This method returns the limit.
+
+    * set_keyset_page(page, key, page_size)
+      - This method sets the page of the rows ordered by the primary keys
+        (keyset pagination).
+
+    * get_keyset_page()
+      - This method returns the page of the keyset pagination.
     """
+    # The page of the keyset pagination (None, when the rows are not paged)
+    keyset_page = None
 
     def __init__(self, **kwargs):
         """
@@ -429,6 +455,53 @@ class GridCommand(BaseCommand, SQLFilter, FetchedRowTracker):
         """
         self.limit = limit
 
+    def get_keyset_page(self):
+        """
+        This function returns the page of the keyset pagination.
+        """
+        return self.keyset_page
+
+    def set_keyset_page(self, page, key=None, page_size=None):
+        """
+        This function sets the page of the rows ordered by the primary keys,
+        which is fetched using the index of the primary key (instead of
+        reading, and skipping all the rows before it).
+
+        Args:
+            page: first, last, next (the rows after the key), previous (the
+                  rows before the key), or jump (the rows from the key). None
+                  to stop paging the rows.
+            key: values of the primary keys (of the last row of the current
+                 page for next, the first row for previous)
+            page_size: number of the rows of a page
+        """
+        if page is None:
+            self.keyset_page = None
+            return True, None
+
+        if page not in KEYSET_PAGES:
+            return False, gettext('Invalid page: {0}').format(page)
+
+        operator, backward = KEYSET_PAGES[page]
+        if operator is not None and \
+                (not key or not isinstance(key, (list, tuple))):
+            return False, gettext('The key is required for the page.')
+
+        try:
+            page_size = int(page_size or ON_DEMAND_RECORD_COUNT)
+        except (TypeError, ValueError):
+            page_size = 0
+        if page_size <= 0:
+            return False, gettext('Invalid page size.')
+
+        self.keyset_page = {
+            'page': page,
+            'key': [six.text_type(value) for value in key]
+            if operator is not None else None,
+            'page_size': page_size
+        }
+        return True, None
+
     def get_pk_order(self):
         """
         This function gets the order required for primary keys
@@ -472,6 +545,13 @@ class TableCommand(GridCommand):
         has_oids = self.has_oids(default_conn)
 
         sql_filter = self.get_filter()
+
+        keyset_page = self.get_keyset_page()
+        if keyset_page is not None and primary_keys:
+            return self.get_keyset_sql(
+                keyset_page, primary_keys, has_oids, sql_filter
+            )
+
         data_sorting = self.get_data_sorting()
 
         # If data sorting is none and not reset from the filter dialog then
@@ -507,6 +587,31 @@ class TableCommand(GridCommand):
 
         return sql
 
+    def get_keyset_sql(self, keyset_page, primary_keys, has_oids,
+                       sql_filter=None):
+        """
+        This method is used to create the SQL query to fetch a page of the
+        rows ordered by the primary keys, i.e.
+            WHERE (pk1, pk2) > (key1, key2) ORDER BY pk1, pk2 LIMIT n
+        for the next page, which is read by an index scan of the primary key
+        irrespective of the size of the table.
+        """
+        operator, backward = KEYSET_PAGES[keyset_page['page']]
+        key = keyset_page['key']
+
+        if key is not None and len(key) != len(primary_keys):
+            raise Exception(
+                gettext('The key must have a value for each primary key.')
+            )
+
+        return render_template(
+            "/".join([self.sql_path, 'keyset_query.sql']),
+            object_name=self.object_name, nsp_name=self.nsp_name,
+            has_oids=has_oids, sql_filter=sql_filter,
+            primary_keys=primary_keys, key=key, operator=operator,
+            backward=backward, limit=keyset_page['page_size']
+        )
+
     def get_primary_keys(self, default_conn=None):
         """
         This function is used to fetch the primary key columns.
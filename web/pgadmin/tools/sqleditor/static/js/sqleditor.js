@@ -36,6 +36,7 @@ define('tools.querytool', [
   'sources/sqleditor/call_render_after_poll',
   'sources/sqleditor/query_tool_preferences',
   'sources/csrf',
+  'sources/sqleditor/columnar_result',
   'sources/../bundle/slickgrid',
   'pgadmin.file_manager',
   'backgrid.sizeable.columns',
@@ -50,7 +51,8 @@ define('tools.querytool', [
   XCellSelectionModel, setStagedRows, SqlEditorUtils, ExecuteQuery, httpErrorHandler, FilterHandler,
   GeometryViewer, historyColl, queryHist,
   keyboardShortcuts, queryToolActions, queryToolNotifications, Datagrid,
-  modifyAnimation, calculateQueryRunTime, callRenderAfterPoll, queryToolPref, csrfToken) {
+  modifyAnimation, calculateQueryRunTime, callRenderAfterPoll, queryToolPref, csrfToken,
+  columnarResult) {
   /* Return back, this has been called more than once */
   if (pgAdmin.SqlEditor)
     return pgAdmin.SqlEditor;
@@ -121,6 +123,12 @@ define('tools.querytool', [
       'click #btn-explain-buffers': 'on_explain_buffers',
       'click #btn-explain-timing': 'on_explain_timing',
       'change .limit': 'on_limit_change',
+      'click #btn-keyset-previous': 'on_keyset_previous',
+      'click #btn-keyset-next': 'on_keyset_next',
+      'click #btn-keyset-first': 'on_keyset_first',
+      'click #btn-keyset-last': 'on_keyset_last',
+      'click #btn-keyset-jump': 'on_keyset_jump',
+      'click #btn-keyset-stop': 'on_keyset_stop',
       'keydown': 'keyAction',
       // Comment options
       'click #btn-comment-code': 'on_toggle_comment_block_code',
@@ -1240,17 +1248,36 @@ define('tools.querytool', [
       $.ajax({
         url: url,
         method: 'GET',
+        headers: columnarResult.columnarResultHeaders(),
       })
         .done(function(res) {
-          self.handler.has_more_rows = res.data.has_more_rows;
+          var rows = [],
+            error_msg = null;
+
+          if (res.data.status == 'Success') {
+            rows = columnarResult.decodeResult(res.data.result);
+            // The streamed rows end with {'error': <message>}, when the rest
+            // of the rows could not be fetched.
+            if (rows.length && !_.isArray(rows[rows.length - 1])) {
+              error_msg = rows.pop().error;
+            }
+          } else {
+            error_msg = res.data.result;
+          }
+
+          self.handler.has_more_rows = !error_msg && res.data.has_more_rows;
           $('#btn-flash').prop('disabled', false);
           $('#btn-download').prop('disabled', false);
           self.handler.trigger('pgadmin-sqleditor:loading-icon:hide');
-          self.update_grid_data(res.data.result);
+          self.update_grid_data(rows);
           self.handler.fetching_rows = false;
           if (typeof cb == 'function') {
             cb();
           }
+
+          if (error_msg) {
+            self.handler.update_msg_history(false, error_msg, false);
+          }
         })
         .fail(function(e) {
           $('#btn-flash').prop('disabled', false);
@@ -1608,6 +1635,44 @@ define('tools.querytool', [
       );
     },
 
+    // Callback functions for the keyset paging buttons click.
+    on_keyset_previous: function() {
+      this._keyset_page('previous');
+    },
+
+    on_keyset_next: function() {
+      this._keyset_page('next');
+    },
+
+    on_keyset_first: function(ev) {
+      this._keyset_page('first', ev);
+    },
+
+    on_keyset_last: function(ev) {
+      this._keyset_page('last', ev);
+    },
+
+    on_keyset_jump: function(ev) {
+      this._keyset_page('jump', ev);
+    },
+
+    on_keyset_stop: function(ev) {
+      this._keyset_page(null, ev);
+    },
+
+    _keyset_page: function(page, ev) {
+      if (ev) {
+        this._stopEventPropogation(ev);
+        this._closeDropDown(ev);
+      }
+
+      // Trigger the keyset-page signal to the SqlEditorController class
+      this.handler.trigger(
+        'pgadmin-sqleditor:button:keyset-page',
+        page
+      );
+    },
+
     // Callback function for the flash button click.
     on_flash: function() {
       queryToolActions.executeQuery(this.handler);
@@ -2203,6 +2268,7 @@ define('tools.querytool', [
         self.on('pgadmin-sqleditor:button:copy_row', self._copy_row, self);
         self.on('pgadmin-sqleditor:button:paste_row', self._paste_row, self);
         self.on('pgadmin-sqleditor:button:limit', self._set_limit, self);
+        self.on('pgadmin-sqleditor:button:keyset-page', self._set_keyset_page, self);
         self.on('pgadmin-sqleditor:button:cancel-query', self._cancel_query, self);
         self.on('pgadmin-sqleditor:button:auto_rollback', self._auto_rollback, self);
         self.on('pgadmin-sqleditor:button:auto_commit', self._auto_commit, self);
@@ -2386,6 +2452,12 @@ define('tools.querytool', [
           $('#btn-filter-dropdown').prop('disabled', false);
         }
 
+        /* The rows are paged by the primary keys (keyset pagination), hence -
+         * enable the paging buttons only if the table has the primary keys.
+         */
+        self.can_keyset_page = self.can_filter && !_.isEmpty(data.primary_keys);
+        $('.keyset-page').prop('disabled', !self.can_keyset_page);
+
         // Initial settings for delete row, copy row and paste row buttons.
         $('#btn-delete-row').prop('disabled', true);
         // Do not disable save button in query tool
@@ -3548,6 +3620,93 @@ define('tools.querytool', [
           });
       },
 
+      /* This function is used to fetch a page of the rows ordered by the
+       * primary keys, i.e. the rows after the last row (next), or before the
+       * first row (previous) of the grid, or from the given key (jump).
+       * The page is null to stop paging the rows.
+       */
+      _set_keyset_page: function(page) {
+        var self = this,
+          pk_names = _.keys(self.primary_keys),
+          items = self.slickgrid ? self.slickgrid.getData().getItems() : [],
+          data = {'page': page};
+
+        if (!self.can_keyset_page)
+          return;
+
+        // The new rows (not saved yet) do not have the primary keys
+        items = _.filter(items, function(item) {
+          return _.every(pk_names, function(name) {
+            return !_.isUndefined(item[name]) && !_.isNull(item[name]);
+          });
+        });
+
+        var row_key = function(item) {
+          return _.map(pk_names, function(name) {
+            return item[name];
+          });
+        };
+
+        if (page == 'next' || page == 'previous') {
+          if (items.length == 0)
+            return;
+          data.key = row_key(page == 'next' ? _.last(items) : _.first(items));
+        } else if (page == 'jump') {
+          alertify.prompt(
+            gettext('Jump to key'),
+            pk_names.length > 1 ?
+              S(gettext('Enter the values of the primary keys (%s) separated by commas.')).sprintf(pk_names.join(', ')).value() :
+              S(gettext('Enter the value of the primary key (%s).')).sprintf(pk_names[0]).value(),
+            items.length > 0 ? row_key(_.first(items)).join(',') : '',
+            function(evt, value) {
+              data.key = pk_names.length > 1 ? value.split(',') : [value];
+              self._send_keyset_page(data);
+            },
+            function() {}
+          );
+          return;
+        }
+
+        self._send_keyset_page(data);
+      },
+
+      _send_keyset_page: function(data) {
+        var self = this;
+
+        self.trigger(
+          'pgadmin-sqleditor:loading-icon:show',
+          gettext('Setting the page of the rows...')
+        );
+        // Make ajax call to set the page (or to stop paging the rows)
+        $.ajax({
+          url: url_for('sqleditor.set_keyset_page', {
+            'trans_id': self.transId,
+          }),
+          method: data.page ? 'PUT' : 'DELETE',
+          contentType: 'application/json',
+          data: data.page ? JSON.stringify(data) : undefined,
+        })
+          .done(function(res) {
+            self.trigger('pgadmin-sqleditor:loading-icon:hide');
+            setTimeout(
+              function() {
+                if (res.data.status) {
+                // Refresh the sql grid
+                  queryToolActions.executeQuery(self);
+                } else
+                  alertify.alert(gettext('Page Error'), res.data.result);
+              }, 10
+            );
+          })
+          .fail(function(e) {
+            self.trigger('pgadmin-sqleditor:loading-icon:hide');
+            let msg = httpErrorHandler.handleQueryToolAjaxError(
+              pgAdmin, self, e, '_send_keyset_page', [data], true
+            );
+            alertify.alert(gettext('Page Error'), msg);
+          });
+      },
+
       // This function is used to enable/disable buttons
       disable_tool_buttons: function(disabled) {
         let mode_disabled = disabled;
@@ -0,0 +1,16 @@
+{# SQL query for a page of the rows of a table ordered by its primary keys #}
+{% set pk_list %}{% for pk in primary_keys %}{{ conn|qtIdent(pk) }}{% if not loop.last %}, {% endif %}{% endfor %}{% endset %}
+{% if backward %}
+SELECT * FROM (
+{% endif %}
+SELECT {% if has_oids %}oid, {% endif %}* FROM {{ conn|qtIdent(nsp_name, object_name) }}
+{% if sql_filter or key %}
+WHERE {% if sql_filter %}({{ sql_filter }}){% if key %} AND {% endif %}{% endif %}
+{% if key %}({{ pk_list }}) {{ operator }} ({% for value in key %}{{ value|qtLiteral }}{% if not loop.last %}, {% endif %}{% endfor %}){% endif %}
+{% endif %}
+ORDER BY {% for pk in primary_keys %}{{ conn|qtIdent(pk) }} {% if backward %}DESC{% else %}ASC{% endif %}{% if not loop.last %}, {% endif %}{% endfor %}
+LIMIT {{ limit }}
+{% if backward %}
+) page
+ORDER BY {{ pk_list }}
+{% endif %}
@@ -1,8 +1,13 @@
 {# ============= Fetch the primary keys for given object id ============= #}
+{# The columns are returned in the order of the primary key (conkey). #}
 {% if obj_id %}
 SELECT at.attname, ty.typname
-FROM pg_attribute at LEFT JOIN pg_type ty ON (ty.oid = at.atttypid)
-WHERE attrelid={{obj_id}}::oid AND attnum = ANY (
-    (SELECT con.conkey FROM pg_class rel LEFT OUTER JOIN pg_constraint con ON con.conrelid=rel.oid
-    AND con.contype='p' WHERE rel.relkind IN ('r','s','t') AND rel.oid = {{obj_id}}::oid)::oid[])
-{% endif %}
\ No newline at end of file
+FROM (
+    SELECT con.conkey, generate_subscripts(con.conkey, 1) AS pos
+    FROM pg_class rel JOIN pg_constraint con ON con.conrelid=rel.oid
+    AND con.contype='p' WHERE rel.relkind IN ('r','s','t') AND rel.oid = {{obj_id}}::oid
+) pk
+JOIN pg_attribute at ON (at.attrelid = {{obj_id}}::oid AND at.attnum = pk.conkey[pk.pos])
+LEFT JOIN pg_type ty ON (ty.oid = at.atttypid)
+ORDER BY pk.pos
+{% endif %}
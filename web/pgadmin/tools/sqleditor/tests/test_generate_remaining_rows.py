@@ -0,0 +1,70 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import sys
+
+from flask import Flask
+
+from pgadmin.tools.sqleditor import generate_remaining_rows
+from pgadmin.utils.route import BaseTestGenerator
+
+if sys.version_info < (3, 3):
+    from mock import MagicMock
+else:
+    from unittest.mock import MagicMock
+
+
+class TestGenerateRemainingRows(BaseTestGenerator):
+    """
+    The remaining rows are generated a batch at a time, and the error is
+    sent as the last row.
+    """
+    scenarios = [
+        (
+            'When all the rows are fetched',
+            dict(
+                first_rows=[[1], [2]],
+                fetched=[(True, [[3]]), (True, [])],
+                expected=[[[1], [2]], [[3]]]
+            )
+        ), (
+            'When there are no rows',
+            dict(
+                first_rows=None,
+                fetched=[],
+                expected=[]
+            )
+        ), (
+            'When fetching the rows fails',
+            dict(
+                first_rows=[[1]],
+                fetched=[(True, [[2]]), (False, 'ERROR: failed')],
+                expected=[[[1]], [[2]], [{'error': 'ERROR: failed'}]]
+            )
+        ), (
+            'When fetching the rows raises an exception',
+            dict(
+                first_rows=[[1]],
+                fetched=[Exception('connection lost')],
+                expected=[[[1]], [{'error': 'connection lost'}]]
+            )
+        ),
+    ]
+
+    def runTest(self):
+        conn = MagicMock()
+        conn.async_fetchmany_2darray.side_effect = self.fetched
+
+        with Flask(__name__).app_context():
+            result = list(generate_remaining_rows(conn, self.first_rows))
+
+        self.assertEqual(result, self.expected)
+        self.assertEqual(
+            conn.async_fetchmany_2darray.call_count, len(self.fetched)
+        )
@@ -0,0 +1,94 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import re
+
+from flask import render_template
+
+from pgadmin.utils.route import BaseTestGenerator
+from .test_view_data_templates import FakeApp
+try:
+    from collections import OrderedDict
+except ImportError:
+    from ordereddict import OrderedDict
+
+
+class TestKeysetQueryTemplate(BaseTestGenerator):
+    """
+    This class validates the template query for fetching a page of the rows
+    ordered by the primary keys.
+    """
+    scenarios = [
+        (
+            'When fetching the first page',
+            dict(
+                parameters=dict(
+                    primary_keys=OrderedDict([('id', 'int4')]),
+                    key=None, operator=None, backward=False, limit=100
+                ),
+                expected_return_value='SELECT * FROM '
+                                      'test_schema.test_table '
+                                      'ORDER BY id ASC LIMIT 100'
+            )
+        ), (
+            'When fetching the next page with multiple PK',
+            dict(
+                parameters=dict(
+                    primary_keys=OrderedDict([('id', 'int4'),
+                                              ('name', 'text')]),
+                    key=['10', "it's"], operator='>', backward=False,
+                    limit=100
+                ),
+                expected_return_value='SELECT * FROM '
+                                      'test_schema.test_table '
+                                      'WHERE (id, name) > '
+                                      '(\'10\', \'it\'\'s\') '
+                                      'ORDER BY id ASC, name ASC LIMIT 100'
+            )
+        ), (
+            'When fetching the previous page with a filter, and OID',
+            dict(
+                parameters=dict(
+                    primary_keys=OrderedDict([('id', 'int4')]),
+                    key=['10'], operator='<', backward=True, limit=50,
+                    has_oids=True, sql_filter='id > 5'
+                ),
+                expected_return_value='SELECT * FROM ( '
+                                      'SELECT oid, * FROM '
+                                      'test_schema.test_table '
+                                      'WHERE (id > 5) AND (id) < (\'10\') '
+                                      'ORDER BY id DESC LIMIT 50 '
+                                      ') page ORDER BY id'
+            )
+        ), (
+            'When fetching the last page',
+            dict(
+                parameters=dict(
+                    primary_keys=OrderedDict([('id', 'int4')]),
+                    key=None, operator=None, backward=True, limit=100
+                ),
+                expected_return_value='SELECT * FROM ( '
+                                      'SELECT * FROM test_schema.test_table '
+                                      'ORDER BY id DESC LIMIT 100 '
+                                      ') page ORDER BY id'
+            )
+        ),
+    ]
+
+    def runTest(self):
+        with FakeApp().app_context():
+            result = render_template(
+                'sqleditor/sql/default/keyset_query.sql',
+                object_name='test_table', nsp_name='test_schema',
+                **self.parameters
+            )
+            self.assertEqual(
+                re.sub(' +', ' ', str(result).replace("\n", " ")).strip(),
+                self.expected_return_value
+            )
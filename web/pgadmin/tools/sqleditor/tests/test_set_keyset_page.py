@@ -0,0 +1,63 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.tools.sqleditor.command import TableCommand
+from pgadmin.utils.route import BaseTestGenerator
+from .test_view_data_templates import FakeApp
+
+
+class TestSetKeysetPage(BaseTestGenerator):
+    """
+    This class validates the pages of the keyset pagination.
+    """
+    scenarios = [
+        (
+            'When setting the first page',
+            dict(page='first', key=None, page_size=100, status=True,
+                 keyset_page={'page': 'first', 'key': None,
+                              'page_size': 100})
+        ), (
+            'When setting the next page',
+            dict(page='next', key=[10, 'a'], page_size='50', status=True,
+                 keyset_page={'page': 'next', 'key': [u'10', u'a'],
+                              'page_size': 50})
+        ), (
+            'When setting the next page without the key',
+            dict(page='next', key=None, page_size=100, status=False,
+                 keyset_page=None)
+        ), (
+            'When setting an invalid page',
+            dict(page='middle', key=None, page_size=100, status=False,
+                 keyset_page=None)
+        ), (
+            'When setting an invalid page size',
+            dict(page='jump', key=['10'], page_size='-1', status=False,
+                 keyset_page=None)
+        ), (
+            'When setting a page size, which is not a number',
+            dict(page='first', key=None, page_size=[100], status=False,
+                 keyset_page=None)
+        ), (
+            'When stopping the pagination',
+            dict(page=None, key=None, page_size=None, status=True,
+                 keyset_page=None)
+        ),
+    ]
+
+    def runTest(self):
+        # The command is not initialized, as it needs the database server.
+        command = TableCommand.__new__(TableCommand)
+
+        with FakeApp().app_context():
+            status, msg = command.set_keyset_page(
+                self.page, self.key, self.page_size
+            )
+
+        self.assertEqual(status, self.status)
+        self.assertEqual(command.get_keyset_page(), self.keyset_page)
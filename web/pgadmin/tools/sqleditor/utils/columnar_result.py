@@ -0,0 +1,120 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Encode the rows of the query results column by column.
+
+The columnar result is sent in place of the array of the rows, when the
+client asks for it by the request header RESULT_FORMAT_HEADER:
+
+    {
+        'format': 'columnar',
+        'rows': <number of the rows>,
+        'columns': [{
+            'type': <type of the column>,
+            'values': <values of the column (except the nulls)>,
+            'nulls': <base64 encoded bitmap of the nulls (if any)>,
+            'dictionary': <distinct values of the column (type 'dict')>
+        }, ...]
+    }
+
+The types of the columns are:
+    null    - all the values are null (no values).
+    bool    - the values as a string of '0' and '1'.
+    int     - the array of the integers.
+    float   - the array of the numbers.
+    dict    - the text having a few distinct values; the values are the
+              indexes in the dictionary.
+    joined  - the text having no ',' (e.g. the numbers, which are returned
+              as the strings by the typecasters) joined by ',' in a string.
+    text    - the array of the strings.
+    json    - the array of any other values.
+"""
+
+import base64
+
+import six
+from flask import request
+
+RESULT_FORMAT_HEADER = 'X-pgA-Result-Format'
+COLUMNAR_RESULT_FORMAT = 'columnar'
+
+# The text column is encoded by a dictionary, when the values repeat at least
+# this many times (on average).
+DICTIONARY_RATIO = 2
+
+INTEGER_TYPES = set(six.integer_types)
+FLOAT_TYPES = INTEGER_TYPES | set([float])
+STRING_TYPES = set([six.text_type, str])
+
+
+def is_columnar_result_requested():
+    """Check if the client asked for the columnar result."""
+    return request.headers.get(RESULT_FORMAT_HEADER, '').lower() == \
+        COLUMNAR_RESULT_FORMAT
+
+
+def _null_bitmap(values):
+    bitmap = bytearray((len(values) + 7) // 8)
+    for idx, value in enumerate(values):
+        if value is None:
+            bitmap[idx >> 3] |= 1 << (idx & 7)
+    return base64.b64encode(bytes(bitmap)).decode('ascii')
+
+
+def _encode_text(values):
+    words = set(values)
+
+    if len(words) * DICTIONARY_RATIO <= len(values):
+        words = sorted(words)
+        dictionary = dict((word, idx) for idx, word in enumerate(words))
+        return {'type': 'dict',
+                'values': [dictionary[value] for value in values],
+                'dictionary': words}
+
+    joined = ','.join(values)
+    if joined.count(',') == len(values) - 1:
+        return {'type': 'joined', 'values': joined}
+
+    return {'type': 'text', 'values': values}
+
+
+def _encode_column(column):
+    values = [value for value in column if value is not None]
+    value_types = set(map(type, values))
+
+    if not values:
+        res = {'type': 'null'}
+    elif value_types == set([bool]):
+        res = {'type': 'bool',
+               'values': ''.join('1' if value else '0' for value in values)}
+    elif value_types <= INTEGER_TYPES:
+        res = {'type': 'int', 'values': values}
+    elif value_types <= FLOAT_TYPES:
+        res = {'type': 'float', 'values': values}
+    elif value_types <= STRING_TYPES:
+        res = _encode_text(values)
+    else:
+        res = {'type': 'json', 'values': values}
+
+    if len(values) != len(column):
+        res['nulls'] = _null_bitmap(column)
+
+    return res
+
+
+def encode_columnar_result(rows):
+    """
+    Encode the rows (the array of the arrays of the values) column by
+    column.
+    """
+    return {
+        'format': COLUMNAR_RESULT_FORMAT,
+        'rows': len(rows),
+        'columns': [_encode_column(column) for column in zip(*rows)]
+    }
@@ -0,0 +1,66 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.tools.sqleditor.utils.columnar_result import \
+    encode_columnar_result
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class TestColumnarResult(BaseTestGenerator):
+    """Ensures the rows are encoded column by column."""
+    scenarios = [
+        (
+            'When there are no rows',
+            dict(
+                rows=[],
+                expected_columns=[]
+            )
+        ), (
+            'When the columns have no nulls',
+            dict(
+                rows=[[1, True, 1.5, u'-12.50', u'a,b'],
+                      [2, False, 2, u'1e10', u'c']],
+                expected_columns=[
+                    {'type': 'int', 'values': [1, 2]},
+                    {'type': 'bool', 'values': '10'},
+                    {'type': 'float', 'values': [1.5, 2]},
+                    {'type': 'joined', 'values': '-12.50,1e10'},
+                    {'type': 'text', 'values': [u'a,b', u'c']},
+                ]
+            )
+        ), (
+            'When the columns have nulls',
+            dict(
+                rows=[[None, None, u'x']] + [[1, None, u'y']] * 8 +
+                     [[None, None, u'x']],
+                expected_columns=[
+                    {'type': 'int', 'values': [1] * 8, 'nulls': 'AQI='},
+                    {'type': 'null', 'nulls': '/wM='},
+                    {'type': 'dict', 'values': [0] + [1] * 8 + [0],
+                     'dictionary': [u'x', u'y']},
+                ]
+            )
+        ), (
+            'When the values are of the mixed types',
+            dict(
+                rows=[[u'1', {u'a': 1}], [2, [u'b']]],
+                expected_columns=[
+                    {'type': 'json', 'values': [u'1', 2]},
+                    {'type': 'json', 'values': [{u'a': 1}, [u'b']]},
+                ]
+            )
+        ),
+    ]
+
+    def runTest(self):
+        res = encode_columnar_result(self.rows)
+
+        self.assertEqual(res['format'], 'columnar')
+        self.assertEqual(res['rows'], len(self.rows))
+        self.assertEqual(res['columns'], self.expected_columns)
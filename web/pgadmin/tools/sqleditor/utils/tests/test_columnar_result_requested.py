@@ -0,0 +1,34 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from flask import Flask
+
+from pgadmin.tools.sqleditor.utils.columnar_result import \
+    is_columnar_result_requested, RESULT_FORMAT_HEADER
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class TestColumnarResultRequested(BaseTestGenerator):
+    """Ensures the columnar result is sent only when the client asks."""
+    scenarios = [
+        (
+            'When the client asks for the columnar result',
+            dict(headers={RESULT_FORMAT_HEADER: 'columnar'}, expected=True)
+        ), (
+            'When the client asks for an unknown format',
+            dict(headers={RESULT_FORMAT_HEADER: 'rows'}, expected=False)
+        ), (
+            'When the client does not ask',
+            dict(headers={}, expected=False)
+        ),
+    ]
+
+    def runTest(self):
+        with Flask(__name__).test_request_context(headers=self.headers):
+            self.assertEqual(is_columnar_result_requested(), self.expected)
@@ -23,6 +23,7 @@ from pgadmin.utils import PgAdminModule
 from pgadmin.utils.ajax import make_response as ajax_response, \
     make_json_response, bad_request, internal_server_error
 from pgadmin.utils.csrf import pgCSRFProtect
+from pgadmin.utils.preferences import invalidate_user_preferences
 
 from pgadmin.model import db, Role, User, UserPreference, Server, \
     ServerGroup, Process, Setting
@@ -291,6 +292,8 @@ def delete(uid):
 
         db.session.commit()
 
+        invalidate_user_preferences(uid)
+
         return make_json_response(
             success=1,
             info=_("User deleted."),
@@ -11,11 +11,23 @@
 
 import datetime
 import decimal
+import types
+import uuid
 
 import simplejson as json
 from flask import Response
 from flask_babelex import gettext as _
 
+# orjson (if installed) encodes the rows of the results much faster than
+# simplejson, which is used for everything else.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Number of the rows encoded at a time, when the rows are streamed
+ROWS_CHUNK_SIZE = 1000
+
 
 class DataTypeJSONEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -30,6 +42,64 @@ class DataTypeJSONEncoder(json.JSONEncoder):
         return json.JSONEncoder.default(self, obj)
 
 
+_data_type_encoder = DataTypeJSONEncoder()
+
+
+def encode_rows(rows, encoding='utf-8'):
+    """
+    Encode the rows as a JSON array, using orjson when available. The rows
+    orjson can not encode (e.g. having the time with a timezone, or an integer
+    out of the 64-bit range) are encoded by simplejson.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(rows, default=_data_type_encoder.default)
+        except TypeError:
+            pass
+
+    return json.dumps(rows, cls=DataTypeJSONEncoder, separators=(',', ':'),
+                      encoding=encoding)
+
+
+def iterencode_rows(doc, rows_key, encoding='utf-8'):
+    """
+    Generate the document as JSON in the chunks, encoding the rows of
+    doc['data'][rows_key] ROWS_CHUNK_SIZE at a time, instead of building one
+    huge string. The rows may also be a generator of the lists of the rows
+    (encoded a list at a time).
+    """
+    data = doc['data']
+    rows = data[rows_key]
+    batches = rows
+    if isinstance(rows, list):
+        batches = (
+            rows[idx:idx + ROWS_CHUNK_SIZE]
+            for idx in range(0, len(rows), ROWS_CHUNK_SIZE)
+        )
+
+    # The rows are encoded separately, and put in place of the marker.
+    marker = uuid.uuid4().hex
+    data = dict(data)
+    data[rows_key] = marker
+    head, tail = json.dumps(
+        dict(doc, data=data), cls=DataTypeJSONEncoder, separators=(',', ':'),
+        encoding=encoding
+    ).split('"{0}"'.format(marker), 1)
+
+    yield head + '['
+    first = True
+    for chunk in batches:
+        if not chunk:
+            continue
+        # Strip the brackets of the array of the chunk
+        chunk = encode_rows(chunk, encoding)[1:-1]
+        if not first:
+            chunk = (b',' if isinstance(chunk, bytes) else ',') + chunk
+        first = False
+        yield chunk
+    yield ']' + tail
+
+
 class ColParamsJSONDecoder(json.JSONDecoder):
     def decode(self, obj):
         retval = obj
@@ -59,10 +129,14 @@ def get_no_cache_header():
 
 def make_json_response(
         success=1, errormsg='', info='', result=None, data=None, status=200,
-        encoding='utf-8'
+        encoding='utf-8', stream_rows=None
 ):
     """Create a HTML response document describing the results of a request and
-    containing the data."""
+    containing the data.
+
+    If stream_rows is given, and data[stream_rows] is a list (of the rows), or
+    a generator (of the lists of the rows), the rows are encoded, and sent in
+    the chunks."""
     doc = dict()
     doc['success'] = success
     doc['errormsg'] = errormsg
@@ -70,9 +144,15 @@ def make_json_response(
     doc['result'] = result
     doc['data'] = data
 
+    if stream_rows is not None and isinstance(data, dict) and \
+            isinstance(data.get(stream_rows), (list, types.GeneratorType)):
+        response = iterencode_rows(doc, stream_rows, encoding)
+    else:
+        response = json.dumps(doc, cls=DataTypeJSONEncoder,
+                              separators=(',', ':'), encoding=encoding)
+
     return Response(
-        response=json.dumps(doc, cls=DataTypeJSONEncoder,
-                            separators=(',', ':'), encoding=encoding),
+        response=response,
         status=status,
         mimetype="application/json",
         headers=get_no_cache_header()
@@ -0,0 +1,181 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Run the expensive queries (i.e. the ones scanning a whole table) in the
+background over a dedicated connection, so that the request does not have to
+wait for them, and they can be cancelled.
+
+The queries are identified by a key chosen by the caller (which must start
+with the server id), and their results are kept for
+BACKGROUND_QUERY_RESULT_TTL seconds after they have finished.
+"""
+
+import random
+import time
+from threading import Lock, Thread
+
+from flask import current_app, copy_current_request_context
+
+import config
+
+# key => query
+QUERIES = dict()
+QUERIES_LOCK = Lock()
+
+
+class BackgroundQuery(object):
+    """
+    class BackgroundQuery(object)
+
+    A query running in a separate thread over its own connection to the
+    database.
+    """
+    RUNNING = 'running'
+    FINISHED = 'finished'
+    FAILED = 'failed'
+    CANCELLED = 'cancelled'
+
+    def __init__(self, manager, did, sql):
+        self.manager = manager
+        self.did = did
+        self.sql = sql
+        self.conn_id = 'bgquery-{0}'.format(random.randint(1, 9999999))
+
+        self.status = BackgroundQuery.RUNNING
+        self.result = None
+        self.error = None
+        self.finished = None
+
+        self._conn = None
+        self._lock = Lock()
+
+    def start(self):
+        # The thread requires its own copy of the request context.
+        t = Thread(target=copy_current_request_context(self._run))
+        t.daemon = True
+        t.start()
+
+    def _run(self):
+        status, res = False, None
+        try:
+            conn = self.manager.connection(
+                did=self.did, conn_id=self.conn_id, auto_reconnect=False,
+                async_=False
+            )
+            status, res = conn.connect()
+            if status:
+                with self._lock:
+                    self._conn = conn
+                    cancelled = self.status == BackgroundQuery.CANCELLED
+
+                if not cancelled:
+                    status, res = conn.execute_dict(self.sql)
+        except Exception as e:
+            current_app.logger.exception(e)
+            status, res = False, str(e)
+        finally:
+            with self._lock:
+                self._conn = None
+
+            self.manager.release(conn_id=self.conn_id)
+
+            with self._lock:
+                self.finished = time.time()
+                if self.status == BackgroundQuery.RUNNING:
+                    if status:
+                        self.status = BackgroundQuery.FINISHED
+                        self.result = res
+                    else:
+                        self.status = BackgroundQuery.FAILED
+                        self.error = res
+
+    def cancel(self):
+        """
+        Cancel the query, if it is still running.
+
+        Returns:
+            Whether the query was cancelled
+        """
+        with self._lock:
+            if self.status != BackgroundQuery.RUNNING:
+                return False
+
+            self.status = BackgroundQuery.CANCELLED
+            if self._conn is not None and self._conn.conn is not None:
+                try:
+                    self._conn.conn.cancel()
+                except Exception as e:
+                    current_app.logger.exception(e)
+
+        return True
+
+    def expired(self, now):
+        return self.finished is not None and \
+            now - self.finished >= config.BACKGROUND_QUERY_RESULT_TTL
+
+
+def start_query(key, manager, did, sql):
+    """
+    Start running the query in the background, unless the query of the same
+    key is already running (or, has its result available).
+
+    Args:
+        key: Key of the query (starting with the server id)
+        manager: Server connection manager
+        did: Database ID
+        sql: Query to be run
+
+    Returns:
+        The query
+    """
+    now = time.time()
+
+    with QUERIES_LOCK:
+        for k in [k for k, q in QUERIES.items() if q.expired(now)]:
+            del QUERIES[k]
+
+        query = QUERIES.get(key)
+        if query is not None and query.status in (
+                BackgroundQuery.RUNNING, BackgroundQuery.FINISHED
+        ):
+            return query
+
+        query = QUERIES[key] = BackgroundQuery(manager, did, sql)
+
+    query.start()
+    return query
+
+
+def get_query(key):
+    """Returns the query of the given key (if any)"""
+    with QUERIES_LOCK:
+        query = QUERIES.get(key)
+
+    if query is not None and query.expired(time.time()):
+        return None
+
+    return query
+
+
+def cancel_query(key):
+    """
+    Cancel the running query of the given key.
+
+    Returns:
+        Whether the query was cancelled
+    """
+    with QUERIES_LOCK:
+        query = QUERIES.get(key)
+        if query is None or not query.cancel():
+            return False
+
+        del QUERIES[key]
+
+    return True
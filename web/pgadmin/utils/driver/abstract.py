@@ -115,6 +115,10 @@ class BaseConnection(object):
         This returns the result as a 2 dimensional array.
         If records is -1 then fetchmany will behave as fetchall.
 
+    * async_remaining_rows()
+      - Implement this method to get the number of the rows of the result of
+        the asynchronous connection, which are not fetched yet.
+
     * connected()
       - Implement this method to get the status of the connection. It should
         return True for connected, otherwise False
@@ -206,6 +210,10 @@ class BaseConnection(object):
                                 formatted_exception_msg=False):
         pass
 
+    @abstractmethod
+    def async_remaining_rows(self):
+        pass
+
     @abstractmethod
     def connected(self):
         pass
@@ -18,6 +18,7 @@ import select
 import sys
 import six
 import datetime
+import time
 from collections import deque
 import simplejson as json
 import psycopg2
@@ -39,6 +40,7 @@ from .typecast import register_global_typecasters, \
 from .encoding import getEncoding, configureDriverEncodings
 from pgadmin.utils import csv
 from pgadmin.utils.master_password import get_crypt_key
+from pgadmin.utils.profiler import record_query
 
 if sys.version_info < (3,):
     from StringIO import StringIO
@@ -659,9 +661,11 @@ WHERE
         query = query.encode(self.python_encoding)
 
         params = self.escape_params_sqlascii(params)
+        start = time.time()
         cur.execute(query, params)
         if self.async_ == 1:
             self._wait(cur.connection)
+        record_query(start)
 
     def execute_on_server_as_csv(self,
                                  query, params=None,
@@ -980,8 +984,10 @@ WHERE
             self.__notices = []
             self.__notifies = []
             self.execution_aborted = False
+            start = time.time()
             cur.execute(query, params)
             res = self._wait_timeout(cur.connection)
+            record_query(start)
         except psycopg2.Error as pe:
             errmsg = self._formatted_exception_msg(pe, formatted_exception_msg)
             current_app.logger.error(
@@ -1269,6 +1275,17 @@ WHERE
 
         return True, result
 
+    def async_remaining_rows(self):
+        """
+        This function will return the number of the rows of the result of the
+        last async sql command, which are not fetched yet.
+        """
+        cur = self.__async_cursor
+        if not cur or cur.rowcount < 0 or cur.rownumber is None:
+            return 0
+
+        return cur.rowcount - cur.rownumber
+
     def connected(self):
         if self.conn:
             if not self.conn.closed:
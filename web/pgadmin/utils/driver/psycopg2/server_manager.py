@@ -12,6 +12,8 @@ Implementation of ServerManager
 """
 import os
 import datetime
+from contextlib import contextmanager
+
 import config
 from flask import current_app, session
 from flask_security import current_user
@@ -25,13 +27,16 @@ from pgadmin.model import Server, User
 from pgadmin.utils.exception import ConnectionLost, SSHTunnelConnectionLost,\
     CryptKeyMissing
 from pgadmin.utils.master_password import get_crypt_key
-from threading import Lock
+from threading import Lock, local
 
 if config.SUPPORT_SSH_TUNNEL:
     from sshtunnel import SSHTunnelForwarder, BaseSSHTunnelForwarderError
 
 connection_restore_lock = Lock()
 
+# Connections pinned to the current thread (see ServerManager.pin_connection)
+pinned_connections = local()
+
 
 class ServerManager(object):
     """
@@ -232,6 +237,13 @@ WHERE db.oid = {0}""".format(did))
         my_id = (u'CONN:{0}'.format(conn_id)) if conn_id is not None else \
             (u'DB:{0}'.format(database))
 
+        # Use the connection pinned to the current thread for the database
+        # (if any), when the connection id is not given.
+        if conn_id is None:
+            my_id = getattr(pinned_connections, 'ids', {}).get(
+                (self.sid, my_id), my_id
+            )
+
         self.pinged = datetime.datetime.now()
 
         if my_id in self.connections:
@@ -249,6 +261,37 @@ WHERE db.oid = {0}""".format(did))
 
             return self.connections[my_id]
 
+    @contextmanager
+    def pin_connection(self, conn_id, did):
+        """
+        Within this context, the connection to the given database without
+        any connection id (i.e. the one used by the browser nodes) is served
+        by the connection 'conn_id' in the current thread.
+
+        It allows to run the existing views of the nodes over the separate
+        connections in parallel. The connection 'conn_id' must have been
+        created before using this context.
+        """
+        if did in self.db_info:
+            database = self.db_info[did]['datname']
+        else:
+            database = self.db
+
+        key = (self.sid, u'DB:{0}'.format(database))
+        ids = getattr(pinned_connections, 'ids', None)
+        if ids is None:
+            ids = pinned_connections.ids = dict()
+
+        previous = ids.get(key, None)
+        ids[key] = u'CONN:{0}'.format(conn_id)
+        try:
+            yield
+        finally:
+            if previous is None:
+                ids.pop(key, None)
+            else:
+                ids[key] = previous
+
     def _restore(self, data):
         """
         Helps restoring to reconnect the auto-connect connections smoothly on
@@ -10,9 +10,18 @@
 """
 Utility classes to register, getter, setter functions for the preferences of a
 module within the system.
+
+The values of the preferences of a user are loaded from the configuration
+table in a single query, and are cached (after converting them to the proper
+types) for PREFERENCES_CACHE_TTL seconds in each process. They are removed
+from the cache, when any of them is changed.
 """
 
+import copy
 import decimal
+import time
+from threading import Lock
+
 import simplejson as json
 
 import dateutil.parser as dateutil_parser
@@ -25,6 +34,129 @@ from pgadmin.model import db, Preferences as PrefTable, \
     PreferenceCategory as PrefCategoryTbl
 
 
+class _UserValues(object):
+    """
+    Values of the preferences of a user stored in the configuration table,
+    along with their converted (typed) values.
+    """
+
+    def __init__(self, values):
+        self.loaded = time.time()
+        # pid => value stored in the configuration table
+        self.values = values
+        # pid => converted value
+        self.typed = dict()
+
+
+# uid => values of the preferences of the user
+_user_values = dict()
+_user_values_lock = Lock()
+# Incremented, whenever the cached values are removed, so that the values
+# loaded before that are not cached.
+_user_values_generation = 0
+
+
+def _get_user_values(uid):
+    """
+    Returns the values of the preferences of the given user (loading all of
+    them in one query, when not cached).
+    """
+    # The configuration is imported here, as it imports pgadmin.utils, which
+    # imports this module.
+    import config
+
+    with _user_values_lock:
+        res = _user_values.get(uid, None)
+        if res is not None and \
+                time.time() - res.loaded < config.PREFERENCES_CACHE_TTL:
+            return res
+        generation = _user_values_generation
+
+    res = _UserValues(dict(
+        (pref.pid, pref.value)
+        for pref in UserPrefTable.query.filter_by(uid=uid)
+    ))
+
+    with _user_values_lock:
+        if generation == _user_values_generation:
+            _user_values[uid] = res
+
+    return res
+
+
+def invalidate_user_preferences(uid=None):
+    """
+    Remove the cached values of the preferences of the given user (or, of all
+    the users).
+    """
+    global _user_values_generation
+
+    with _user_values_lock:
+        _user_values_generation += 1
+        if uid is None:
+            _user_values.clear()
+        else:
+            _user_values.pop(uid, None)
+
+
+class _Registration(object):
+    """
+    Ids of the modules, categories, and preferences in the configuration
+    tables, loaded at once for registering the preferences of all the
+    modules in a single transaction.
+    """
+
+    def __init__(self):
+        # name => id
+        self.modules = dict(
+            (row.name, row.id) for row in ModulePrefTable.query.all()
+        )
+        # (mid, name) => id
+        self.categories = dict(
+            ((row.mid, row.name), row.id)
+            for row in PrefCategoryTbl.query.all()
+        )
+        # (cid, name) => id
+        self.preferences = dict(
+            ((row.cid, row.name), row.id) for row in PrefTable.query.all()
+        )
+        self.added = False
+
+
+# Registration in progress (if any)
+_registration = None
+
+
+def _get_or_create(table, rows, key, **values):
+    """
+    Returns the id of the row of the given configuration table having the
+    given values, creating the row (if not found).
+
+    While registering the preferences in a batch, the row is looked up in the
+    given rows of the registration, and the new row is only flushed (and,
+    committed at the end of the registration).
+    """
+    if _registration is not None:
+        rows = getattr(_registration, rows)
+        if key not in rows:
+            res = table(**values)
+            db.session.add(res)
+            db.session.flush()
+            rows[key] = res.id
+            _registration.added = True
+
+        return rows[key]
+
+    res = table.query.filter_by(**values).first()
+
+    if res is None:
+        res = table(**values)
+        db.session.add(res)
+        db.session.commit()
+
+    return res.id
+
+
 class _Preference(object):
     """
     Internal class representing module, and categoy bound preference.
@@ -76,23 +208,11 @@ class _Preference(object):
         self.allow_blanks = allow_blanks
 
         # Look into the configuration table to find out the id of the specific
-        # preference.
-        res = PrefTable.query.filter_by(
-            name=name, cid=cid
-        ).first()
-
-        if res is None:
-            # Could not find in the configuration table, we will create new
-            # entry for it.
-            res = PrefTable(name=self.name, cid=cid)
-            db.session.add(res)
-            db.session.commit()
-            res = PrefTable.query.filter_by(
-                name=name
-            ).first()
-
-        # Save this id for letter use.
-        self.pid = res.id
+        # preference (create new entry for it, if not found), and save this
+        # id for letter use.
+        self.pid = _get_or_create(
+            PrefTable, 'preferences', (cid, name), name=name, cid=cid
+        )
 
     def get(self):
         """
@@ -103,56 +223,72 @@ class _Preference(object):
 
         :returns: value for this preference.
         """
-        res = UserPrefTable.query.filter_by(
-            pid=self.pid
-        ).filter_by(uid=current_user.id).first()
+        res = _get_user_values(current_user.id)
 
         # Could not find any preference for this user, return default value.
-        if res is None:
+        if self.pid not in res.values:
             return self.default
 
-        # The data stored in the configuration will be in string format, we
-        # need to convert them in proper format.
+        if self.pid not in res.typed:
+            res.typed[self.pid] = self._to_value(res.values[self.pid])
+
+        value = res.typed[self.pid]
+
+        # Do not let the caller modify the cached value
+        if isinstance(value, (dict, list)):
+            return copy.deepcopy(value)
+
+        return value
+
+    def _to_value(self, value):
+        """
+        _to_value
+        Convert the value stored in the configuration table (in string
+        format) to the proper format.
+
+        :param value: value stored in the configuration table
+        :returns: value for this preference.
+        """
         if self._type == 'boolean' or self._type == 'switch' or \
                 self._type == 'node':
-            return res.value == 'True'
+            return value == 'True'
         if self._type == 'integer':
             try:
-                return int(res.value)
+                return int(value)
             except Exception as e:
                 current_app.logger.exeception(e)
                 return self.default
         if self._type == 'numeric':
             try:
-                return decimal.Decimal(res.value)
+                return decimal.Decimal(value)
             except Exception as e:
                 current_app.logger.exeception(e)
                 return self.default
         if self._type == 'date' or self._type == 'datetime':
             try:
-                return dateutil_parser.parse(res.value)
+                return dateutil_parser.parse(value)
             except Exception as e:
                 current_app.logger.exeception(e)
                 return self.default
         if self._type == 'options':
             for opt in self.options:
-                if 'value' in opt and opt['value'] == res.value:
-                    return res.value
+                if 'value' in opt and opt['value'] == value:
+                    return value
             if self.select2 and self.select2['tags']:
-                return res.value
+                return value
             return self.default
         if self._type == 'text':
-            if res.value == '' and (self.allow_blanks is None or
-                                    not self.allow_blanks):
+            if value == '' and (self.allow_blanks is None or
+                                not self.allow_blanks):
                 return self.default
         if self._type == 'keyboardshortcut':
             try:
-                return json.loads(res.value)
+                return json.loads(value)
             except Exception as e:
                 current_app.logger.exeception(e)
                 return self.default
 
-        return res.value
+        return value
 
     def set(self, value):
         """
@@ -233,6 +369,8 @@ class _Preference(object):
             pref.value = value
         db.session.commit()
 
+        invalidate_user_preferences(current_user.id)
+
         return True, None
 
     def to_json(self):
@@ -302,18 +440,11 @@ class Preferences(object):
         self.label = label
         self.categories = dict()
 
-        # Find the entry for this module in the configuration database.
-        module = ModulePrefTable.query.filter_by(name=name).first()
-
-        # Can't find the reference for it in the configuration database,
-        # create on for it.
-        if module is None:
-            module = ModulePrefTable(name=name)
-            db.session.add(module)
-            db.session.commit()
-            module = ModulePrefTable.query.filter_by(name=name).first()
-
-        self.mid = module.id
+        # Find the entry for this module in the configuration database (create
+        # on for it, if not found).
+        self.mid = _get_or_create(
+            ModulePrefTable, 'modules', name, name=name
+        )
 
         if name in Preferences.modules:
             m = Preferences.modules[name]
@@ -370,20 +501,13 @@ class Preferences(object):
 
             return res
 
-        cat = PrefCategoryTbl.query.filter_by(
-            mid=self.mid
-        ).filter_by(name=name).first()
-
-        if cat is None:
-            cat = PrefCategoryTbl(name=name, mid=self.mid)
-            db.session.add(cat)
-            db.session.commit()
-            cat = PrefCategoryTbl.query.filter_by(
-                mid=self.mid
-            ).filter_by(name=name).first()
+        cid = _get_or_create(
+            PrefCategoryTbl, 'categories', (self.mid, name),
+            name=name, mid=self.mid
+        )
 
         self.categories[name] = res = {
-            'id': cat.id,
+            'id': cid,
             'name': name,
             'label': label,
             'preferences': dict()
@@ -544,6 +668,33 @@ class Preferences(object):
 
         return None
 
+    @classmethod
+    def begin_registration(cls):
+        """
+        begin_registration
+        Start registering the preferences in a batch, i.e. the existing
+        entries of the modules, categories, and preferences are loaded at
+        once, and the new entries are committed together by
+        end_registration.
+        """
+        global _registration
+
+        _registration = _Registration()
+
+    @classmethod
+    def end_registration(cls):
+        """
+        end_registration
+        Commit the entries created, while registering the preferences in a
+        batch.
+        """
+        global _registration
+
+        registration, _registration = _registration, None
+
+        if registration is not None and registration.added:
+            db.session.commit()
+
     @classmethod
     def module(cls, name, create=True):
         """
@@ -0,0 +1,249 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Profiling of the requests (enabled using PROFILING_ENABLED).
+
+For every request, the wall time, the CPU time of the thread handling it, the
+number, and the total time of the queries executed by the driver, and the
+time spent in rendering the templates are recorded, and aggregated per
+endpoint. The requests executing more than PROFILING_QUERIES_THRESHOLD
+queries (i.e. running one query per object, instead of one for all of them)
+are logged, and counted.
+
+A sample of the requests (PROFILING_SAMPLE_RATE) is profiled using cProfile,
+and the statistics are written to PROFILING_DIR, from where they can be
+loaded using pstats, or converted to the flame graphs.
+"""
+
+import cProfile
+import os
+import random
+import time
+from collections import defaultdict
+from threading import Lock
+
+from flask import g, request, has_request_context, before_render_template, \
+    template_rendered
+
+# The CPU time of the current thread (the process CPU time, when not
+# available)
+if hasattr(time, 'thread_time'):
+    cpu_time = time.thread_time
+elif hasattr(time, 'process_time'):
+    cpu_time = time.process_time
+else:
+    cpu_time = time.clock
+
+# Set, when the profiling is enabled, so that the driver does not look for
+# the profile of the request otherwise.
+_enabled = False
+
+
+class RequestProfile(object):
+    """
+    class RequestProfile(object)
+
+    The measurements of a request.
+    """
+
+    def __init__(self, profiler=None):
+        self.start = time.time()
+        self.cpu_start = cpu_time()
+        self.queries = 0
+        self.query_time = 0.0
+        self.templates = 0
+        self.template_time = 0.0
+        # Start time of the templates being rendered (templates may be
+        # rendered from within the other templates)
+        self.rendering = []
+        self.profiler = profiler
+
+
+class EndpointStats(object):
+    """
+    class EndpointStats(object)
+
+    The aggregated measurements of the requests of an endpoint.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.wall_time = 0.0
+        self.max_wall_time = 0.0
+        self.cpu_time = 0.0
+        self.queries = 0
+        self.max_queries = 0
+        self.query_time = 0.0
+        self.templates = 0
+        self.template_time = 0.0
+        self.n_plus_one = 0
+
+    def add(self, wall_time, cpu, profile, n_plus_one):
+        self.requests += 1
+        self.wall_time += wall_time
+        self.max_wall_time = max(self.max_wall_time, wall_time)
+        self.cpu_time += cpu
+        self.queries += profile.queries
+        self.max_queries = max(self.max_queries, profile.queries)
+        self.query_time += profile.query_time
+        self.templates += profile.templates
+        self.template_time += profile.template_time
+        if n_plus_one:
+            self.n_plus_one += 1
+
+    def as_dict(self):
+        return {
+            'requests': self.requests,
+            'wall_time': self.wall_time,
+            'max_wall_time': self.max_wall_time,
+            'avg_wall_time': self.wall_time / self.requests,
+            'cpu_time': self.cpu_time,
+            'avg_cpu_time': self.cpu_time / self.requests,
+            'queries': self.queries,
+            'max_queries': self.max_queries,
+            'avg_queries': float(self.queries) / self.requests,
+            'query_time': self.query_time,
+            'avg_query_time': self.query_time / self.requests,
+            'templates': self.templates,
+            'template_time': self.template_time,
+            'n_plus_one': self.n_plus_one
+        }
+
+
+# endpoint => aggregated measurements
+_stats = defaultdict(EndpointStats)
+_stats_lock = Lock()
+
+
+def _current_profile():
+    if not has_request_context():
+        return None
+    return g.get('_request_profile', None)
+
+
+def record_query(start):
+    """
+    Records a query executed by the driver (started at 'start') for the
+    current request.
+    """
+    if not _enabled:
+        return
+
+    profile = _current_profile()
+    if profile is not None:
+        profile.queries += 1
+        profile.query_time += time.time() - start
+
+
+def _before_render_template(sender, template, context, **extra):
+    profile = _current_profile()
+    if profile is not None:
+        profile.rendering.append(time.time())
+
+
+def _template_rendered(sender, template, context, **extra):
+    profile = _current_profile()
+    if profile is not None and profile.rendering:
+        profile.templates += 1
+        profile.template_time += time.time() - profile.rendering.pop()
+
+
+def get_stats():
+    """
+    Returns the aggregated measurements of all the endpoints.
+    """
+    with _stats_lock:
+        return dict(
+            (endpoint, stats.as_dict()) for endpoint, stats in _stats.items()
+        )
+
+
+def reset_stats():
+    with _stats_lock:
+        _stats.clear()
+
+
+def init_app(app):
+    """
+    Registers the request hooks recording the measurements of the requests
+    (when enabled in the configuration).
+    """
+    global _enabled
+
+    if not app.config.get('PROFILING_ENABLED', False):
+        return
+
+    _enabled = True
+
+    threshold = app.config.get('PROFILING_QUERIES_THRESHOLD', 20)
+    sample_rate = app.config.get('PROFILING_SAMPLE_RATE', 0)
+    profiles_dir = app.config.get('PROFILING_DIR', None)
+
+    if sample_rate and profiles_dir and not os.path.exists(profiles_dir):
+        os.makedirs(profiles_dir)
+
+    # The signals hold the weak references of the receivers by default, so
+    # they are connected with the strong references here.
+    before_render_template.connect(_before_render_template, app, weak=False)
+    template_rendered.connect(_template_rendered, app, weak=False)
+
+    @app.before_request
+    def start_request_profile():
+        profiler = None
+        if sample_rate and profiles_dir and random.random() < sample_rate:
+            profiler = cProfile.Profile()
+            profiler.enable()
+
+        g._request_profile = RequestProfile(profiler)
+
+    def finish_request_profile():
+        profile = g.pop('_request_profile', None)
+        if profile is None:
+            return
+
+        wall_time = time.time() - profile.start
+        cpu = cpu_time() - profile.cpu_start
+        endpoint = request.endpoint or request.path
+
+        if profile.profiler is not None:
+            profile.profiler.disable()
+            try:
+                profile.profiler.dump_stats(os.path.join(
+                    profiles_dir, '{0}-{1}-{2}.prof'.format(
+                        endpoint.replace('/', '_'),
+                        int(profile.start * 1000), os.getpid()
+                    )
+                ))
+            except (IOError, OSError) as e:
+                app.logger.warning(
+                    'Failed to write the profile of the request: %s', str(e)
+                )
+
+        n_plus_one = profile.queries > threshold
+        if n_plus_one:
+            app.logger.warning(
+                'The request %s %s (%s) executed %d queries in %.3f seconds.',
+                request.method, request.path, endpoint, profile.queries,
+                profile.query_time
+            )
+
+        with _stats_lock:
+            _stats[endpoint].add(wall_time, cpu, profile, n_plus_one)
+
+    @app.after_request
+    def after_request_profile(response):
+        finish_request_profile()
+        return response
+
+    # The request may fail without calling the 'after_request' hooks, but
+    # the profiler must be disabled anyway.
+    @app.teardown_request
+    def teardown_request_profile(exception=None):
+        finish_request_profile()
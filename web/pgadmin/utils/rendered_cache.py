@@ -0,0 +1,153 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Cache for the scripts, and stylesheets generated from the templates (i.e.
+utils.js, browser.css), which are requested on every page load, but change
+only with the preferences, and the language of the user.
+
+The content is rendered once for the same inputs (the key given by the
+caller along with the language, the application version, and the script
+root), and is served with a strong ETag, so that the browser receives it only
+when it has changed. The gzip compressed copy of the content is kept along
+with it, and is served to the browsers accepting it.
+"""
+
+import gzip
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from io import BytesIO
+from threading import Lock
+
+from flask import request, Response
+from flask_babelex import get_locale
+
+import config
+
+
+class RenderedContent(object):
+    """
+    class RenderedContent(object)
+
+    The rendered content along with its gzip compressed copy, and its ETag.
+    """
+
+    def __init__(self, content):
+        if not isinstance(content, bytes):
+            content = content.encode('utf-8')
+
+        self.content = content
+        self.etag = hashlib.sha1(content).hexdigest()
+        self.created = time.time()
+
+        buf = BytesIO()
+        # The modification time is not stored, so that the compressed copy
+        # is the same for the same content.
+        with gzip.GzipFile(fileobj=buf, mode='wb', mtime=0) as f:
+            f.write(content)
+        self.gzipped = buf.getvalue()
+
+
+class RenderedCache(object):
+    """
+    class RenderedCache(object)
+
+    A thread safe cache of at most 'max_items' rendered contents. The least
+    recently used content is evicted, when it exceeds the limit.
+    """
+
+    def __init__(self, max_items):
+        self.max_items = max_items
+
+        self._lock = Lock()
+        # key => rendered content
+        self._items = OrderedDict()
+
+    def get(self, key, render, max_age=None):
+        """
+        Returns the rendered content for the given key, rendering it (using
+        the given function), when it is not cached, or is older than
+        'max_age' seconds.
+        """
+        with self._lock:
+            item = self._items.pop(key, None)
+            if item is not None and (
+                max_age is None or time.time() - item.created < max_age
+            ):
+                self._items[key] = item
+                return item
+
+        item = RenderedContent(render())
+
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = item
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+        return item
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+rendered_cache = RenderedCache(config.RENDERED_CACHE_SIZE)
+
+
+def render_cached(name, mimetype, render, key=None, max_age=None):
+    """
+    Returns the response serving the content rendered using the given
+    function, rendering it only when it is not cached for the given key (and,
+    the language of the user, the application version, and the script root).
+    The response is 'Not Modified', when the browser has the same content.
+
+    Args:
+        name: Name of the content (i.e. 'browser/js/utils.js')
+        mimetype: Mime type of the content
+        render: Function rendering the content
+        key: Inputs (JSON serializable) the content depends on (other than
+             the language), i.e. the values of the preferences used
+        max_age: Maximum age (in seconds) of the cached content
+
+    Returns:
+        Response
+    """
+    digest = hashlib.sha1(json.dumps(
+        [str(get_locale()), config.APP_VERSION, request.script_root, key],
+        sort_keys=True, default=str
+    ).encode('utf-8')).hexdigest()
+
+    item = rendered_cache.get((name, digest), render, max_age)
+
+    gzipped = 'gzip' in request.accept_encodings
+    # Both the representations need their own strong ETags
+    etag = item.etag + ('-gzip' if gzipped else '')
+
+    headers = {
+        'Vary': 'Accept-Encoding',
+        # Validate the content with the server on every use
+        'Cache-Control': 'no-cache'
+    }
+
+    if request.if_none_match.contains(etag):
+        response = Response(status=304, headers=headers)
+    else:
+        response = Response(
+            item.gzipped if gzipped else item.content,
+            status=200, mimetype=mimetype, headers=headers
+        )
+        if gzipped:
+            response.headers['Content-Encoding'] = 'gzip'
+
+    response.set_etag(etag)
+
+    return response
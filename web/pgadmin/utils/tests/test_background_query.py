@@ -0,0 +1,95 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import sys
+import threading
+import time
+
+from flask import Flask
+
+from pgadmin.utils import background_query
+from pgadmin.utils.background_query import BackgroundQuery
+from pgadmin.utils.route import BaseTestGenerator
+
+if sys.version_info < (3, 3):
+    from mock import MagicMock
+else:
+    from unittest.mock import MagicMock
+
+
+class BackgroundQueryTestCase(BaseTestGenerator):
+    """Test the queries running in the background"""
+    scenarios = [
+        ('Result of the query is available, once it has finished',
+         dict(
+             result=(True, {'rows': [{'a': 1}]}),
+             cancel=False,
+             expected_status=BackgroundQuery.FINISHED
+         )),
+        ('Error of the failed query is available',
+         dict(
+             result=(False, 'relation does not exist'),
+             cancel=False,
+             expected_status=BackgroundQuery.FAILED
+         )),
+        ('Running query is cancelled',
+         dict(
+             result=(True, {'rows': [{'a': 1}]}),
+             cancel=True,
+             expected_status=BackgroundQuery.CANCELLED
+         )),
+    ]
+
+    def runTest(self):
+        started = threading.Event()
+        cancelled = threading.Event()
+
+        def execute_dict(sql):
+            started.set()
+            if self.cancel:
+                cancelled.wait(5)
+                return False, 'canceling statement due to user request'
+            return self.result
+
+        manager = MagicMock(sid=1)
+        conn = manager.connection.return_value
+        conn.connect.return_value = (True, None)
+        conn.execute_dict.side_effect = execute_dict
+        conn.conn.cancel.side_effect = lambda: cancelled.set()
+
+        key = (1, 2, 'test', 3)
+        background_query.QUERIES.clear()
+
+        app = Flask(__name__)
+        with app.test_request_context():
+            query = background_query.start_query(key, manager, 2, 'SQL')
+            started.wait(5)
+            if self.cancel:
+                self.assertTrue(background_query.cancel_query(key))
+                self.assertIsNone(background_query.get_query(key))
+
+            for _ in range(100):
+                if query.finished is not None:
+                    break
+                time.sleep(0.05)
+
+        self.assertEqual(query.status, self.expected_status)
+        self.assertEqual(manager.connection.call_count, 1)
+        manager.release.assert_called_once_with(conn_id=query.conn_id)
+
+        if self.expected_status == BackgroundQuery.FINISHED:
+            self.assertEqual(query.result, self.result[1])
+            self.assertIs(background_query.get_query(key), query)
+            # The finished query is not run again
+            with app.test_request_context():
+                self.assertIs(background_query.start_query(
+                    key, manager, 2, 'SQL'
+                ), query)
+        elif self.expected_status == BackgroundQuery.FAILED:
+            self.assertEqual(query.error, self.result[1])
@@ -0,0 +1,58 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import simplejson as json
+
+from pgadmin.utils.ajax import make_json_response
+from pgadmin.utils.route import BaseTestGenerator
+from .test_json_rows_streaming import ROWS
+
+
+class TestJSONRowBatchesStreaming(BaseTestGenerator):
+    """
+    The rows generated in the batches are streamed a batch at a time.
+    """
+    scenarios = [
+        (
+            'When there are many batches',
+            dict(batches=[ROWS, ROWS[:1], [], ROWS])
+        ), (
+            'When there is a single batch',
+            dict(batches=[ROWS])
+        ), (
+            'When there are no batches',
+            dict(batches=[])
+        ),
+    ]
+
+    def runTest(self):
+        generated = []
+
+        def generate_rows():
+            for batch in self.batches:
+                generated.append(batch)
+                yield batch
+
+        response = make_json_response(
+            data={'status': 'Success', 'result': generate_rows()},
+            stream_rows='result'
+        )
+        self.assertTrue(response.is_streamed)
+        # The rows are not generated until the response is sent.
+        self.assertEqual(generated, [])
+
+        rows = [row for batch in self.batches for row in batch]
+        expected = make_json_response(
+            data={'status': 'Success', 'result': rows}
+        )
+
+        self.assertEqual(
+            json.loads(response.get_data(as_text=True)),
+            json.loads(expected.get_data(as_text=True))
+        )
@@ -0,0 +1,70 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import datetime
+import decimal
+
+import simplejson as json
+
+from pgadmin.utils import ajax
+from pgadmin.utils.ajax import make_json_response
+from pgadmin.utils.route import BaseTestGenerator
+
+ROWS = [
+    [1, u'name é', None, True, [u'a', u'b']],
+    [2, datetime.datetime(2019, 1, 2, 3, 4, 5), decimal.Decimal('1.5'),
+     datetime.timedelta(hours=1, minutes=2), {u'key': u'value'}],
+    [3, datetime.date(2019, 1, 2), datetime.time(10, 20), u'"quoted"',
+     None],
+]
+
+
+class TestJSONRowsStreaming(BaseTestGenerator):
+    """
+    The rows of a response are streamed in the chunks, and the streamed
+    response is the same as the response encoded at once.
+    """
+    scenarios = [
+        (
+            'When the rows span multiple chunks',
+            dict(data={'status': 'Success', 'result': ROWS * 5},
+                 chunk_size=2, streamed=True)
+        ), (
+            'When the rows fit in a single chunk',
+            dict(data={'status': 'Success', 'result': ROWS},
+                 chunk_size=1000, streamed=True)
+        ), (
+            'When there are no rows',
+            dict(data={'status': 'Success', 'result': []},
+                 chunk_size=2, streamed=True)
+        ), (
+            'When the result is not the rows',
+            dict(data={'status': 'Error', 'result': u'ERROR: "failed"'},
+                 chunk_size=2, streamed=False)
+        ),
+    ]
+
+    def setUp(self):
+        self.old_chunk_size = ajax.ROWS_CHUNK_SIZE
+        ajax.ROWS_CHUNK_SIZE = self.chunk_size
+
+    def runTest(self):
+        response = make_json_response(data=self.data, stream_rows='result')
+        self.assertEqual(response.is_streamed, self.streamed)
+
+        expected = make_json_response(data=self.data)
+        self.assertFalse(expected.is_streamed)
+
+        self.assertEqual(
+            json.loads(response.get_data(as_text=True)),
+            json.loads(expected.get_data(as_text=True))
+        )
+
+    def tearDown(self):
+        ajax.ROWS_CHUNK_SIZE = self.old_chunk_size
@@ -0,0 +1,102 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import decimal
+import sys
+
+from pgadmin.utils import preferences
+from pgadmin.utils.preferences import _Preference
+from pgadmin.utils.route import BaseTestGenerator
+
+if sys.version_info < (3, 3):
+    from mock import patch, MagicMock
+else:
+    from unittest.mock import patch, MagicMock
+
+PREFERENCES = [
+    # pid, type, default, stored value, expected value
+    (1, 'boolean', False, 'True', True),
+    (2, 'integer', 4, '8', 8),
+    (3, 'numeric', 1, '2.5', decimal.Decimal('2.5')),
+    (4, 'keyboardshortcut', {}, '{"key_code": 65}', {'key_code': 65}),
+    (5, 'text', 'default', '', 'default'),
+    (6, 'integer', 10, None, 10),
+]
+
+
+class PreferencesCacheTestCase(BaseTestGenerator):
+    """Test the cache of the values of the preferences of the users"""
+    scenarios = [
+        ('Values of a user are loaded in one query',
+         dict(
+             users=[1],
+             change=False,
+             expected_queries=1
+         )),
+        ('Values are loaded for each user',
+         dict(
+             users=[1, 2],
+             change=False,
+             expected_queries=2
+         )),
+        ('Values are loaded again, when a preference is changed',
+         dict(
+             users=[1],
+             change=True,
+             expected_queries=2
+         )),
+    ]
+
+    @patch('pgadmin.utils.preferences.db')
+    @patch('pgadmin.utils.preferences.current_user')
+    @patch('pgadmin.utils.preferences.UserPrefTable')
+    @patch('pgadmin.utils.preferences.PrefTable')
+    def runTest(self, pref_table_mock, user_pref_table_mock,
+                current_user_mock, db_mock):
+        queries = []
+
+        def filter_by(uid=None, **kwargs):
+            queries.append(uid)
+            if kwargs:
+                return MagicMock()
+            return [
+                MagicMock(pid=pid, value=value)
+                for pid, _type, _, value, _ in PREFERENCES
+                if value is not None
+            ]
+
+        user_pref_table_mock.query.filter_by.side_effect = filter_by
+
+        prefs = []
+        for pid, _type, default, _, _ in PREFERENCES:
+            pref_table_mock.query.filter_by.return_value.first.return_value = \
+                MagicMock(id=pid)
+            prefs.append(_Preference(10, 'pref', 'Pref', _type, default))
+
+        preferences.invalidate_user_preferences()
+
+        for uid in self.users:
+            current_user_mock.id = uid
+            for idx in range(3):
+                for pref, expected in zip(
+                        prefs, [p[4] for p in PREFERENCES]
+                ):
+                    self.assertEqual(pref.get(), expected)
+
+                if self.change and idx == 0:
+                    self.assertEqual(prefs[1].set(16), (True, None))
+
+        # The cached value can not be modified by the caller
+        prefs[3].get()['key_code'] = 66
+        self.assertEqual(prefs[3].get(), {'key_code': 65})
+
+        self.assertEqual(
+            len([uid for uid in queries if uid is not None]),
+            self.expected_queries
+        )
@@ -0,0 +1,109 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from flask import Flask
+from sqlalchemy import event
+
+from pgadmin.model import db, Preferences as PrefTable, \
+    ModulePreference as ModulePrefTable, \
+    PreferenceCategory as PrefCategoryTbl
+from pgadmin.utils.preferences import Preferences
+from pgadmin.utils.route import BaseTestGenerator
+
+
+def register(modules):
+    """Register 10 preferences in 2 categories of each of the modules"""
+    for module in range(modules):
+        prefs = Preferences('test_module_{0}'.format(module))
+        for pref in range(10):
+            prefs.register(
+                'category_{0}'.format(pref % 2), 'pref_{0}'.format(pref),
+                'Preference', 'integer', pref
+            )
+
+
+class PreferencesRegistrationTestCase(BaseTestGenerator):
+    """Test the registration of the preferences in a batch"""
+    scenarios = [
+        ('Preferences are created in one transaction',
+         dict(
+             existing=False,
+             batch=True,
+             expected_commits=1,
+             expected_max_statements=3 + 5 * 13
+         )),
+        ('Existing preferences are loaded at once',
+         dict(
+             existing=True,
+             batch=True,
+             expected_commits=0,
+             expected_max_statements=3
+         )),
+        ('Preferences are looked up one by one, when not in a batch',
+         dict(
+             existing=True,
+             batch=False,
+             expected_commits=0,
+             expected_max_statements=5 * 13
+         )),
+    ]
+
+    def runTest(self):
+        app = Flask(__name__)
+        app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+        app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+        db.init_app(app)
+
+        saved_modules = Preferences.modules
+        Preferences.modules = dict()
+
+        try:
+            with app.app_context():
+                db.create_all()
+
+                if self.existing:
+                    register(5)
+                    Preferences.modules = dict()
+
+                statements = []
+                commits = []
+
+                event.listen(
+                    db.engine, 'before_cursor_execute',
+                    lambda *args: statements.append(args[2])
+                )
+                event.listen(
+                    db.engine, 'commit', lambda *args: commits.append(1)
+                )
+
+                if self.batch:
+                    Preferences.begin_registration()
+                register(5)
+                if self.batch:
+                    Preferences.end_registration()
+
+                self.assertEqual(len(commits), self.expected_commits)
+                self.assertLessEqual(
+                    len(statements), self.expected_max_statements
+                )
+
+                self.assertEqual(ModulePrefTable.query.count(), 5)
+                self.assertEqual(PrefCategoryTbl.query.count(), 10)
+                self.assertEqual(PrefTable.query.count(), 50)
+                self.assertEqual(len(set(
+                    pref.pid
+                    for cat in Preferences.modules['test_module_4'].
+                    categories.values()
+                    for pref in cat['preferences'].values()
+                )), 10)
+
+                db.session.remove()
+                db.drop_all()
+        finally:
+            Preferences.modules = saved_modules
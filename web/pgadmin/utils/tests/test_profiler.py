@@ -0,0 +1,98 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import os
+import pstats
+import shutil
+import tempfile
+import time
+
+from flask import Flask, render_template_string
+
+from pgadmin.utils import profiler
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class ProfilerTestCase(BaseTestGenerator):
+    """Test the profiling of the requests"""
+    scenarios = [
+        ('Queries, and templates of the requests are recorded',
+         dict(
+             queries=3,
+             sample_rate=0,
+             expected_n_plus_one=0,
+             expected_profiles=0
+         )),
+        ('Requests executing too many queries are flagged',
+         dict(
+             queries=8,
+             sample_rate=0,
+             expected_n_plus_one=2,
+             expected_profiles=0
+         )),
+        ('Sampled requests are profiled using cProfile',
+         dict(
+             queries=1,
+             sample_rate=1,
+             expected_n_plus_one=0,
+             expected_profiles=2
+         )),
+    ]
+
+    def setUp(self):
+        self.profiles_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        profiler._enabled = False
+        profiler.reset_stats()
+        shutil.rmtree(self.profiles_dir, ignore_errors=True)
+
+    def runTest(self):
+        app = Flask(__name__)
+        app.config.update(
+            PROFILING_ENABLED=True,
+            PROFILING_QUERIES_THRESHOLD=5,
+            PROFILING_SAMPLE_RATE=self.sample_rate,
+            PROFILING_DIR=self.profiles_dir
+        )
+
+        @app.route('/objects', endpoint='objects')
+        def objects():
+            for _ in range(self.queries):
+                profiler.record_query(time.time())
+            return render_template_string('{{ queries }}',
+                                          queries=self.queries)
+
+        profiler.reset_stats()
+        profiler.init_app(app)
+
+        client = app.test_client()
+        for _ in range(2):
+            response = client.get('/objects')
+            self.assertEqual(response.status_code, 200)
+
+        # Queries executed outside of a request are not recorded
+        profiler.record_query(time.time())
+
+        stats = profiler.get_stats()
+        self.assertEqual(list(stats.keys()), ['objects'])
+
+        stats = stats['objects']
+        self.assertEqual(stats['requests'], 2)
+        self.assertEqual(stats['queries'], 2 * self.queries)
+        self.assertEqual(stats['max_queries'], self.queries)
+        self.assertEqual(stats['templates'], 2)
+        self.assertEqual(stats['n_plus_one'], self.expected_n_plus_one)
+        self.assertGreaterEqual(stats['wall_time'], stats['query_time'])
+
+        profiles = os.listdir(self.profiles_dir)
+        self.assertEqual(len(profiles), self.expected_profiles)
+        for name in profiles:
+            self.assertTrue(name.startswith('objects-'))
+            pstats.Stats(os.path.join(self.profiles_dir, name))
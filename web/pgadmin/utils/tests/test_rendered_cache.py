@@ -0,0 +1,112 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import gzip
+from io import BytesIO
+
+from flask import Flask
+
+from pgadmin.utils.rendered_cache import rendered_cache, render_cached, \
+    RenderedContent
+from pgadmin.utils.route import BaseTestGenerator
+
+CONTENT = u'define([], function() { return "é"; });'
+
+
+class RenderedCacheTestCase(BaseTestGenerator):
+    """Test the caching of the generated scripts, and stylesheets"""
+    scenarios = [
+        ('Content is rendered, and served with the ETag',
+         dict(
+             headers={},
+             key=None,
+             expected_status=200,
+             expected_gzip=False,
+             expected_renders=1
+         )),
+        ('Content is compressed for the browsers accepting it',
+         dict(
+             headers={'Accept-Encoding': 'gzip, deflate'},
+             key=None,
+             expected_status=200,
+             expected_gzip=True,
+             expected_renders=1
+         )),
+        ('Unchanged content is not sent again',
+         dict(
+             headers={'If-None-Match': '"{0}"'.format(
+                 RenderedContent(CONTENT).etag
+             )},
+             key=None,
+             expected_status=304,
+             expected_gzip=False,
+             expected_renders=1
+         )),
+        ('Compressed copy has its own ETag',
+         dict(
+             headers={
+                 'Accept-Encoding': 'gzip',
+                 'If-None-Match': '"{0}"'.format(
+                     RenderedContent(CONTENT).etag
+                 )
+             },
+             key=None,
+             expected_status=200,
+             expected_gzip=True,
+             expected_renders=1
+         )),
+        ('Content is rendered again for the different key',
+         dict(
+             headers={},
+             key={'tab_size': 4},
+             expected_status=200,
+             expected_gzip=False,
+             expected_renders=2
+         )),
+    ]
+
+    def runTest(self):
+        renders = []
+
+        def render():
+            renders.append(1)
+            return CONTENT
+
+        rendered_cache.clear()
+        app = Flask(__name__)
+
+        with app.test_request_context('/'):
+            render_cached('test.js', 'application/javascript', render)
+
+        with app.test_request_context('/', headers=self.headers):
+            response = render_cached(
+                'test.js', 'application/javascript', render, key=self.key
+            )
+
+        self.assertEqual(response.status_code, self.expected_status)
+        self.assertEqual(len(renders), self.expected_renders)
+        self.assertEqual(response.headers['Vary'], 'Accept-Encoding')
+
+        etag, weak = response.get_etag()
+        self.assertFalse(weak)
+
+        if self.expected_status == 304:
+            self.assertEqual(response.get_data(), b'')
+            return
+
+        data = response.get_data()
+        if self.expected_gzip:
+            self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+            self.assertTrue(etag.endswith('-gzip'))
+            with gzip.GzipFile(fileobj=BytesIO(data)) as f:
+                data = f.read()
+        else:
+            self.assertNotIn('Content-Encoding', response.headers)
+
+        self.assertEqual(data.decode('utf-8'), CONTENT)
@@ -0,0 +1,88 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import os
+import shutil
+import sys
+import tempfile
+
+from flask import Flask
+from flask.templating import DispatchingJinjaLoader
+from jinja2 import FileSystemLoader
+from werkzeug.datastructures import ImmutableDict
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.versioned_template_loader import \
+    VersionedTemplateLoader, TemplateBytecodeCache, compile_templates
+
+if sys.version_info < (3, 3):
+    from mock import patch
+else:
+    from unittest.mock import patch
+
+
+class TemplatesApp(Flask):
+    def __init__(self, cache_dir):
+        self.jinja_options = ImmutableDict(
+            loader=VersionedTemplateLoader(self),
+            bytecode_cache=TemplateBytecodeCache(cache_dir)
+        )
+        super(TemplatesApp, self).__init__("")
+        self.jinja_loader = FileSystemLoader(
+            os.path.dirname(os.path.realpath(__file__)) + "/templates"
+        )
+
+
+class TemplateBytecodeCacheTestCase(BaseTestGenerator):
+    """Test the resolution, and the bytecode cache of the templates"""
+    scenarios = [
+        ('Versioned template is found without trying the directories',
+         dict(
+             template='some_feature/sql/#90300#/some_action.sql',
+             expected='some_feature/sql/9.2_plus/some_action.sql',
+             expected_content='Some 9.2 SQL'
+         )),
+        ('Default template is found without trying the directories',
+         dict(
+             template='some_feature/sql/#gpdb#80323#/'
+                      'some_action_with_default.sql',
+             expected='some_feature/sql/default/some_action_with_default.sql',
+             expected_content='Some default SQL'
+         )),
+    ]
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def runTest(self):
+        app = TemplatesApp(self.cache_dir)
+        self.assertEqual(compile_templates(app), 6)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 6)
+
+        # The templates are not compiled again by the other processes, and
+        # the template is compiled once for all the versions it serves.
+        app = TemplatesApp(self.cache_dir)
+        with patch.object(
+            DispatchingJinjaLoader, 'get_source',
+            side_effect=DispatchingJinjaLoader.get_source, autospec=True
+        ) as get_source_mock, patch.object(
+            app.jinja_env, 'compile'
+        ) as compile_mock:
+            template = app.jinja_env.get_template(self.template)
+
+            self.assertEqual(template.name, self.expected)
+            self.assertEqual(
+                template.render().replace('\r', '').strip(),
+                self.expected_content
+            )
+            self.assertEqual(get_source_mock.call_count, 1)
+            self.assertEqual(compile_mock.call_count, 0)
@@ -6,30 +6,55 @@
 # This software is released under the PostgreSQL Licence
 #
 ##########################################################################
+import os
+import tempfile
+
 from flask.templating import DispatchingJinjaLoader
-from jinja2 import TemplateNotFound
+from jinja2 import TemplateNotFound, FileSystemBytecodeCache
 
 
 class VersionedTemplateLoader(DispatchingJinjaLoader):
-    def get_source(self, environment, template):
+    def __init__(self, app):
+        super(VersionedTemplateLoader, self).__init__(app)
+        # Names of all the templates, so that the template in the versioned
+        # directory matching the version can be found without trying to load
+        # each of the directories.
+        self._templates = None
+
+    def template_index(self):
+        """Returns the names of all the templates (listed only once)"""
+        if self._templates is None:
+            self._templates = frozenset(self.list_templates())
+        return self._templates
+
+    def resolve(self, template):
+        """
+        Returns the name of the template in the versioned directory matching
+        the version specified in the given name of the template (or, the
+        name itself, when no version is specified).
+        """
         specified_version_number, exists = parse_version(template)
         if not exists:
-            return super(VersionedTemplateLoader, self).get_source(
-                environment, template
-            )
+            return template
 
-        template_dir, file_name = parse_template(template)
+        templates = self.template_index()
+        for template_path in get_versioned_paths(template):
+            if template_path in templates:
+                return template_path
 
-        for version_mapping in get_version_mapping(template):
-            if version_mapping['number'] > specified_version_number:
-                continue
+        return None
 
-            template_path = '/'.join([
-                template_dir,
-                version_mapping['name'],
-                file_name
-            ])
+    def get_source(self, environment, template):
+        template_path = self.resolve(template)
+        if template_path is not None:
+            return super(VersionedTemplateLoader, self).get_source(
+                environment, template_path
+            )
 
+        # The template may have been added after listing the templates
+        # (i.e. in the debug mode), hence - try to load it from each of the
+        # versioned directories.
+        for template_path in get_versioned_paths(template):
             try:
                 return super(VersionedTemplateLoader, self).get_source(
                     environment, template_path
@@ -38,6 +63,76 @@ class VersionedTemplateLoader(DispatchingJinjaLoader):
                 continue
         raise TemplateNotFound(template)
 
+    def load(self, environment, name, globals=None):
+        # Load the template of the versioned directory by its own name, so
+        # that it is compiled (and, its bytecode is cached) only once for all
+        # the versions it serves.
+        template_path = self.resolve(name)
+        return super(VersionedTemplateLoader, self).load(
+            environment, template_path or name, globals
+        )
+
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """
+    class TemplateBytecodeCache(FileSystemBytecodeCache)
+
+    Bytecode cache of the templates on the disk shared by the processes of
+    the application, which writes the compiled templates atomically, so that
+    the other processes never read them partially written.
+    """
+
+    def dump_bytecode(self, bucket):
+        filename = self._get_cache_filename(bucket)
+        fd, tmp_filename = tempfile.mkstemp(
+            dir=os.path.dirname(filename), suffix='.tmp'
+        )
+
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                bucket.write_bytecode(f)
+
+            if hasattr(os, 'replace'):
+                os.replace(tmp_filename, filename)
+            else:
+                if os.path.exists(filename):
+                    os.remove(filename)
+                os.rename(tmp_filename, filename)
+        except Exception:
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
+            raise
+
+
+def compile_templates(app, directory='sql'):
+    """
+    Compile the templates in the given directories (i.e. 'sql' for the
+    templates of the queries) of all the modules to the bytecode cache of the
+    application.
+
+    :param app: application
+    :param directory: name of the directories containing the templates
+    :return: number of the templates compiled
+    """
+    env = app.jinja_env
+    if env.bytecode_cache is None:
+        return 0
+
+    count = 0
+    for name in sorted(env.loader.list_templates()):
+        if directory not in name.split('/')[:-1]:
+            continue
+
+        try:
+            env.get_template(name)
+            count += 1
+        except Exception as e:
+            app.logger.warning(
+                u'Could not compile the template {0}: {1}'.format(name, e)
+            )
+
+    return count
+
 
 def parse_version(template):
     template_path_parts = template.split("#", 3)
@@ -61,6 +156,26 @@ def parse_template(template):
         template_path_parts[-1].strip('\\').strip('/')
 
 
+def get_versioned_paths(template):
+    """
+    Returns the paths of the template in the versioned directories, which
+    may serve the version specified in the name of the template (in the
+    order of preference).
+    """
+    specified_version_number, _ = parse_version(template)
+    template_dir, file_name = parse_template(template)
+
+    for version_mapping in get_version_mapping(template):
+        if version_mapping['number'] > specified_version_number:
+            continue
+
+        yield '/'.join([
+            template_dir,
+            version_mapping['name'],
+            file_name
+        ])
+
+
 def get_version_mapping(template):
     template_path_parts = template.split("#", 3)
 
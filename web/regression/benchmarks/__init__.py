@@ -0,0 +1,240 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Benchmarks of the hot paths of pgAdmin (the driver, and the query tool),
+and of its startup.
+
+Every benchmark is a subclass of BaseBenchmark, which is registered by its
+name in BenchmarkRegistry. A benchmark prepares its inputs in setUp() (and
+in prepare() before every iteration), and the time taken by run() is
+measured. The measurements are reported as JSON, which can be compared
+with the report of an earlier run.
+"""
+
+import gc
+import math
+import time
+from abc import ABCMeta, abstractmethod
+from importlib import import_module
+
+import six
+
+if hasattr(time, 'perf_counter'):
+    timer = time.perf_counter
+else:
+    timer = time.time
+
+BENCHMARK_MODULES = [
+    'regression.benchmarks.driver_benchmarks',
+    'regression.benchmarks.utils_benchmarks',
+    'regression.benchmarks.sqleditor_benchmarks',
+    'regression.benchmarks.startup_benchmarks',
+]
+
+
+class BenchmarkRegistry(ABCMeta):
+    """
+    class BenchmarkRegistry(ABCMeta)
+
+    Every benchmark will be registered automatically by its name, whenever a
+    class inheriting from BaseBenchmark (and having a name) is created.
+    """
+
+    registry = dict()
+
+    def __init__(cls, name, bases, d):
+        if d.get('name', None) is not None:
+            BenchmarkRegistry.registry[d['name']] = cls
+
+        ABCMeta.__init__(cls, name, bases, d)
+
+    @classmethod
+    def load_benchmarks(cls, names=None):
+        """
+        Loads the benchmark modules, and returns the benchmarks (all of them,
+        or only the ones with the given names) sorted by their names.
+        """
+        for module_name in BENCHMARK_MODULES:
+            import_module(module_name)
+
+        if names:
+            unknown = [n for n in names if n not in cls.registry]
+            if unknown:
+                raise ValueError(
+                    'Unknown benchmark(s): {0}'.format(', '.join(unknown))
+                )
+            return [cls.registry[n] for n in sorted(names)]
+
+        return [cls.registry[n] for n in sorted(cls.registry)]
+
+
+@six.add_metaclass(BenchmarkRegistry)
+class BaseBenchmark(object):
+    """
+    class BaseBenchmark(object)
+
+    Base class for the benchmarks.
+
+    Attributes:
+    * name
+      - Name of the benchmark in the report.
+    * description
+      - What is measured by the benchmark.
+    * unit
+      - Unit of the items processed by an iteration (used for the throughput)
+    """
+    name = None
+    description = None
+    unit = 'rows'
+
+    def __init__(self, context):
+        self.context = context
+
+    def setUp(self):
+        """Prepares the inputs of the benchmark (not measured)."""
+        pass
+
+    def prepare(self):
+        """Prepares the inputs of an iteration (not measured)."""
+        pass
+
+    @abstractmethod
+    def run(self):
+        """
+        Runs an iteration of the benchmark (measured), and returns the number
+        of the items processed by it.
+        """
+        pass
+
+    def report(self):
+        """
+        Returns the more values for the report of the benchmark, e.g. the
+        size of its output (not measured).
+        """
+        return {}
+
+    def tearDown(self):
+        pass
+
+
+def _percentile(values, percent):
+    values = sorted(values)
+    idx = int(math.ceil(percent / 100.0 * len(values))) - 1
+    return values[max(idx, 0)]
+
+
+def measure(benchmark, iterations, warmup):
+    """
+    Runs the benchmark 'warmup' times (not measured), and then 'iterations'
+    times, and returns the statistics of the measured times (in seconds).
+    The garbage collector is disabled while measuring an iteration, so that
+    the collections triggered by the earlier iterations are not measured.
+    """
+    timings = []
+    items = 0
+
+    for iteration in range(warmup + iterations):
+        benchmark.prepare()
+        gc.collect()
+        gc.disable()
+        try:
+            start = timer()
+            items = benchmark.run()
+            elapsed = timer() - start
+        finally:
+            gc.enable()
+
+        if iteration >= warmup:
+            timings.append(elapsed)
+
+    mean = sum(timings) / len(timings)
+    median = _percentile(timings, 50)
+
+    result = {
+        'description': benchmark.description,
+        'iterations': iterations,
+        'items': items,
+        'unit': benchmark.unit,
+        'min': min(timings),
+        'max': max(timings),
+        'mean': mean,
+        'median': median,
+        'p95': _percentile(timings, 95),
+        'stdev': math.sqrt(
+            sum((t - mean) ** 2 for t in timings) / len(timings)
+        ),
+        'throughput': items / median if median and items else None
+    }
+    result.update(benchmark.report())
+
+    return result
+
+
+def run_benchmarks(benchmarks, context, iterations, warmup, output=None):
+    """
+    Runs the given benchmarks, and returns their results (by their names).
+    """
+    results = dict()
+
+    for benchmark_class in benchmarks:
+        benchmark = benchmark_class(context)
+        if output is not None:
+            output.write('{0}... '.format(benchmark.name))
+            output.flush()
+
+        benchmark.setUp()
+        try:
+            results[benchmark.name] = result = measure(
+                benchmark, iterations, warmup
+            )
+        finally:
+            benchmark.tearDown()
+
+        if output is not None:
+            output.write('{0:.6f}s (median of {1})\n'.format(
+                result['median'], iterations
+            ))
+
+    return results
+
+
+def compare_results(baseline, current, threshold):
+    """
+    Compares the median times of the benchmarks of two reports, and returns
+    the lines of the comparison, and the names of the benchmarks slower than
+    the baseline by more than 'threshold' (a fraction, i.e. 0.1 for 10%).
+    """
+    lines = []
+    regressions = []
+
+    lines.append('{0:<24} {1:>12} {2:>12} {3:>8}'.format(
+        'Benchmark', 'Baseline', 'Current', 'Change'
+    ))
+
+    for name in sorted(current):
+        cur = current[name]['median']
+        if name not in baseline:
+            lines.append('{0:<24} {1:>12} {2:>12.6f} {3:>8}'.format(
+                name, '-', cur, '-'
+            ))
+            continue
+
+        base = baseline[name]['median']
+        change = (cur - base) / base if base else 0.0
+        flag = ''
+        if change > threshold:
+            regressions.append(name)
+            flag = ' (slower)'
+
+        lines.append('{0:<24} {1:>12.6f} {2:>12.6f} {3:>+7.1%}{4}'.format(
+            name, base, cur, change, flag
+        ))
+
+    return lines, regressions
@@ -0,0 +1,132 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""The server, the database, and the connections used by the benchmarks."""
+
+from flask_login import login_user
+
+from pgadmin.model import User
+from pgadmin.utils.crypto import encrypt
+from pgadmin.utils.driver import get_driver
+from pgadmin.utils.master_password import get_crypt_key
+from regression.python_test_utils import test_utils
+from config import PG_DEFAULT_DRIVER
+
+from . import dataset
+
+# Connection id of the query tool connection used by the benchmarks
+QUERY_TOOL_CONN_ID = 'benchmark'
+
+
+class BenchmarkContext(object):
+    """
+    class BenchmarkContext(object)
+
+    Creates the benchmark database (with the dataset) on the given server,
+    and provides the connections to it. The benchmarks are run within a
+    request context of the logged in user, as the driver (and the query
+    tool) expects.
+    """
+
+    def __init__(self, app, server, db_name, rows, tables):
+        self.app = app
+        self.server = server
+        self.db_name = db_name
+        self.rows = rows
+        self.tables = tables
+
+        self.sid = None
+        self.did = None
+        self.data_table_oid = None
+        self.save_table_oid = None
+        self.server_version = None
+
+        self._request_context = None
+        self._password = None
+        self._db_connections = []
+
+    def setUp(self):
+        self.sid = test_utils.create_server(self.server)
+        self.did = test_utils.create_database(self.server, self.db_name)
+
+        connection = self.db_connection()
+        self.server_version = connection.server_version
+        self.data_table_oid, self.save_table_oid = dataset.create_dataset(
+            connection, self.rows, self.tables
+        )
+
+        # The preferences are registered just before the first request
+        self.app.try_trigger_before_first_request_functions()
+
+        self._request_context = self.app.test_request_context('/')
+        self._request_context.push()
+        login_user(User.query.first())
+
+        crypt_key = get_crypt_key()[1]
+        self._password = encrypt(self.server['db_password'], crypt_key)
+
+        # Connect the maintenance database, which is used to find the
+        # benchmark database by its id.
+        self.manager().connection().connect(password=self._password)
+
+    def tearDown(self):
+        for connection in self._db_connections:
+            if not connection.closed:
+                connection.close()
+
+        if self._request_context is not None:
+            manager = self.manager()
+            if manager is not None:
+                manager.release()
+            self._request_context.pop()
+
+        connection = test_utils.get_db_connection(
+            self.server['db'],
+            self.server['username'],
+            self.server['db_password'],
+            self.server['host'],
+            self.server['port'],
+            self.server['sslmode']
+        )
+        test_utils.drop_database(connection, self.db_name)
+
+    def db_connection(self):
+        """Returns a new psycopg2 connection to the benchmark database."""
+        connection = test_utils.get_db_connection(
+            self.db_name,
+            self.server['username'],
+            self.server['db_password'],
+            self.server['host'],
+            self.server['port'],
+            self.server['sslmode']
+        )
+        self._db_connections.append(connection)
+        return connection
+
+    def manager(self):
+        return get_driver(PG_DEFAULT_DRIVER).connection_manager(self.sid)
+
+    def connection(self, conn_id=None):
+        """
+        Returns the connection of the driver to the benchmark database (the
+        query tool connection, when the connection id is given).
+        """
+        if conn_id is None:
+            conn = self.manager().connection(did=self.did)
+        else:
+            conn = self.manager().connection(
+                did=self.did, conn_id=conn_id, auto_reconnect=False,
+                use_binary_placeholder=True, array_to_string=True
+            )
+
+        status, errmsg = conn.connect(password=self._password)
+        if not status:
+            raise Exception(errmsg)
+
+        return conn
@@ -0,0 +1,96 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+The dataset used by the benchmarks.
+
+All the values are computed from the row number (no random values), so that
+the same dataset is created for the same number of rows on every run, and
+the reports of the different runs are comparable.
+"""
+
+SCHEMA_NAME = 'bench'
+DATA_TABLE = 'bench_data'
+SAVE_TABLE = 'bench_save'
+
+# name, type, not null, has default value
+DATASET_COLUMNS = [
+    ('id', 'integer', True, True),
+    ('name', 'text', True, False),
+    ('amount', 'numeric', False, False),
+    ('created', 'timestamp with time zone', False, False),
+    ('flag', 'boolean', False, False),
+    ('tags', 'text[]', False, False),
+    ('notes', 'text', False, False),
+]
+
+CREATE_TABLE_SQL = """
+CREATE TABLE {schema}.{table} (
+    id serial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2),
+    created timestamp with time zone,
+    flag boolean,
+    tags text[],
+    notes text
+)"""
+
+INSERT_ROWS_SQL = """
+INSERT INTO {schema}.{table} (name, amount, created, flag, tags, notes)
+SELECT
+    'name ' || md5(i::text),
+    (i * 7919 % 1000000) / 100.0,
+    '2019-01-01 00:00:00+00'::timestamptz + i * interval '1 minute',
+    i % 3 = 0,
+    ARRAY['tag ' || (i % 10), 'tag ' || (i % 7)],
+    CASE WHEN i % 5 = 0 THEN NULL
+    ELSE 'line, with "quotes", and ''' || repeat('x', i % 50) || '''' END
+FROM generate_series(1, {rows:d}) i"""
+
+
+def create_dataset(connection, rows, tables):
+    """
+    Creates the dataset in the database of the given connection (a psycopg2
+    connection), having 'rows' rows in the data table, and 'tables' more
+    tables (with 10 columns each) for the completions of the query tool.
+    """
+    cur = connection.cursor()
+
+    cur.execute('CREATE SCHEMA {0}'.format(SCHEMA_NAME))
+
+    for table in (DATA_TABLE, SAVE_TABLE):
+        cur.execute(CREATE_TABLE_SQL.format(schema=SCHEMA_NAME, table=table))
+
+    cur.execute(INSERT_ROWS_SQL.format(
+        schema=SCHEMA_NAME, table=DATA_TABLE, rows=rows
+    ))
+
+    for table in range(tables):
+        cur.execute('CREATE TABLE {0}.table_{1} ({2})'.format(
+            SCHEMA_NAME, table, ', '.join(
+                'column_{0} {1}'.format(
+                    column, ('integer', 'text', 'numeric')[column % 3]
+                ) for column in range(10)
+            )
+        ))
+
+    cur.execute('ANALYZE')
+    connection.commit()
+
+    cur.execute(
+        "SELECT '{0}.{1}'::regclass::oid".format(SCHEMA_NAME, DATA_TABLE)
+    )
+    data_table_oid = cur.fetchone()[0]
+    cur.execute(
+        "SELECT '{0}.{1}'::regclass::oid".format(SCHEMA_NAME, SAVE_TABLE)
+    )
+    save_table_oid = cur.fetchone()[0]
+    cur.close()
+
+    return data_table_oid, save_table_oid
@@ -0,0 +1,82 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Benchmarks of the driver."""
+
+import config
+from pgadmin.utils.driver.psycopg2.cursor import DictCursor
+from pgadmin.tools.sqleditor.utils.constant_definition import ASYNC_OK, \
+    ASYNC_READ_TIMEOUT, ASYNC_WRITE_TIMEOUT
+
+from . import BaseBenchmark
+from .context import QUERY_TOOL_CONN_ID
+from .dataset import SCHEMA_NAME, DATA_TABLE
+
+SELECT_ALL_SQL = 'SELECT * FROM {0}.{1}'.format(SCHEMA_NAME, DATA_TABLE)
+
+
+class DictCursorBenchmark(BaseBenchmark):
+    name = 'dict_cursor'
+    description = 'Conversion of the fetched rows to the dictionaries by ' \
+                  'DictCursor'
+
+    def setUp(self):
+        self.connection = self.context.db_connection()
+
+    def prepare(self):
+        # The rows are received by execute(), and only converted by
+        # fetchall().
+        self.cursor = self.connection.cursor(cursor_factory=DictCursor)
+        self.cursor.execute(SELECT_ALL_SQL)
+
+    def run(self):
+        rows = [dict(row) for row in self.cursor.fetchall()]
+        self.cursor.close()
+        return len(rows)
+
+    def tearDown(self):
+        self.connection.close()
+
+
+class AsyncFetchBenchmark(BaseBenchmark):
+    name = 'async_fetch'
+    description = 'Execution of a query using execute_async(), poll(), and ' \
+                  'async_fetchmany_2darray() (as the query tool does)'
+
+    def setUp(self):
+        self.conn = self.context.connection(QUERY_TOOL_CONN_ID)
+
+    def run(self):
+        status, res = self.conn.execute_async(SELECT_ALL_SQL)
+        if not status:
+            raise Exception(res)
+
+        while True:
+            status, res = self.conn.poll(
+                formatted_exception_msg=True, no_result=True
+            )
+            if not status:
+                raise Exception(res)
+            if status == ASYNC_OK:
+                break
+            if status not in (ASYNC_READ_TIMEOUT, ASYNC_WRITE_TIMEOUT):
+                raise Exception('The query was not completed.')
+
+        rows = 0
+        while True:
+            status, res = self.conn.async_fetchmany_2darray(
+                config.ON_DEMAND_RECORD_COUNT
+            )
+            if not status:
+                raise Exception(res)
+            if not res:
+                break
+            rows += len(res)
+
+        return rows
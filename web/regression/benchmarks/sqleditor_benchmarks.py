@@ -0,0 +1,124 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Benchmarks of the query tool, and the data grid."""
+
+from pgadmin.tools.sqleditor.command import TableCommand, VIEW_ALL_ROWS
+from pgadmin.utils.sqlautocomplete.autocomplete import SQLAutoComplete
+
+from . import BaseBenchmark
+from .context import QUERY_TOOL_CONN_ID
+from .dataset import SCHEMA_NAME, DATA_TABLE, SAVE_TABLE, DATASET_COLUMNS
+
+# The statements being completed (the text, and the text before the cursor)
+COMPLETIONS = [
+    ('SEL', 'SEL'),
+    ('SELECT * FROM {0}.'.format(SCHEMA_NAME),
+     'SELECT * FROM {0}.'.format(SCHEMA_NAME)),
+    ('SELECT  FROM {0}.{1}'.format(SCHEMA_NAME, DATA_TABLE), 'SELECT '),
+    ('SELECT * FROM {0}.{1} WHERE na'.format(SCHEMA_NAME, DATA_TABLE),
+     'SELECT * FROM {0}.{1} WHERE na'.format(SCHEMA_NAME, DATA_TABLE)),
+    ('SELECT * FROM {0}.table_1 t JOIN {0}.'.format(SCHEMA_NAME),
+     'SELECT * FROM {0}.table_1 t JOIN {0}.'.format(SCHEMA_NAME)),
+]
+
+# Number of the rows updated, and added by an iteration
+SAVE_ROWS = 100
+
+
+class AutoCompleteBenchmark(BaseBenchmark):
+    name = 'autocomplete'
+    description = 'Completions of the query tool using SQLAutoComplete ' \
+                  '(created for every request, as the query tool does)'
+    unit = 'completions'
+
+    def setUp(self):
+        self.conn = self.context.connection(QUERY_TOOL_CONN_ID)
+
+    def run(self):
+        for text, text_before_cursor in COMPLETIONS:
+            auto_complete_obj = SQLAutoComplete(
+                sid=self.context.sid, did=self.context.did, conn=self.conn
+            )
+            auto_complete_obj.get_completions(text, text_before_cursor)
+
+        return len(COMPLETIONS)
+
+
+class TableSaveBenchmark(BaseBenchmark):
+    name = 'table_save'
+    description = 'Saving the rows updated, and added in the data grid ' \
+                  'using TableCommand.save()'
+
+    def setUp(self):
+        # The connection used to find the name of the table
+        self.context.connection()
+        self.conn = self.context.connection(QUERY_TOOL_CONN_ID)
+        self.command = TableCommand(
+            sid=self.context.sid, did=self.context.did,
+            obj_id=self.context.save_table_oid, conn_id=QUERY_TOOL_CONN_ID,
+            cmd_type=VIEW_ALL_ROWS
+        )
+        self.columns_info = dict(
+            (name, {
+                'type_name': type_name, 'not_null': not_null,
+                'has_default_val': has_default_val
+            }) for name, type_name, not_null, has_default_val
+            in DATASET_COLUMNS
+        )
+        self.connection = self.context.db_connection()
+
+    def prepare(self):
+        cur = self.connection.cursor()
+        cur.execute('TRUNCATE {0}.{1} RESTART IDENTITY'.format(
+            SCHEMA_NAME, SAVE_TABLE
+        ))
+        cur.execute(
+            'INSERT INTO {0}.{1} (name, amount, created, flag, tags, notes) '
+            'SELECT name, amount, created, flag, tags, notes FROM {0}.{2} '
+            'ORDER BY id LIMIT {3:d}'.format(
+                SCHEMA_NAME, SAVE_TABLE, DATA_TABLE, SAVE_ROWS
+            )
+        )
+        self.connection.commit()
+        cur.close()
+
+        # The changes are modified by save(), and are created again for
+        # every iteration.
+        added = dict(
+            (str(row), {'data': {
+                '__temp_PK': str(row), 'name': 'added {0}'.format(row),
+                'amount': '{0}.50'.format(row), 'flag': 'true'
+            }}) for row in range(SAVE_ROWS)
+        )
+        self.changed_data = {
+            'updated': dict(
+                (str(row), {
+                    'data': {
+                        'name': 'updated {0}'.format(row),
+                        'amount': '{0}.25'.format(row)
+                    },
+                    'primary_keys': {'id': row + 1}
+                }) for row in range(SAVE_ROWS)
+            ),
+            'added': added,
+            'added_index': dict((row, row) for row in added)
+        }
+
+    def run(self):
+        status, res, query_res, _rowid = self.command.save(
+            self.changed_data, self.columns_info, default_conn=self.conn
+        )
+        if not status:
+            raise Exception(res)
+
+        return 2 * SAVE_ROWS
+
+    def tearDown(self):
+        self.connection.close()
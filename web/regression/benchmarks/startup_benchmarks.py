@@ -0,0 +1,112 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Benchmark of the startup of the application, i.e. the time taken by
+create_app() (including the import of the modules), and its first request.
+
+The modules are imported only once by a Python process, hence - every
+iteration starts the application in a new process (running this module),
+which reports its timings as JSON on the standard output.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+from . import BaseBenchmark, timer, _percentile
+
+# Path of the first request (the main page of the browser)
+FIRST_REQUEST_PATH = '/browser/'
+
+
+class StartupBenchmark(BaseBenchmark):
+    name = 'startup'
+    description = 'Starting the application in a new process: ' \
+                  'create_app(), and the first request'
+    unit = 'startups'
+
+    def setUp(self):
+        self.timings = []
+        self.root = os.path.dirname(os.path.dirname(
+            os.path.dirname(os.path.realpath(__file__))
+        ))
+
+    def run(self):
+        output = subprocess.check_output(
+            [sys.executable, '-m', 'regression.benchmarks.startup_benchmarks'],
+            cwd=self.root
+        )
+        # The timings are on the last line of the output
+        self.timings.append(
+            json.loads(output.decode('utf-8').strip().splitlines()[-1])
+        )
+
+        return 1
+
+    def report(self):
+        """
+        Returns the median times of create_app(), and the first request (the
+        warmup iterations are included).
+        """
+        return dict(
+            (key, _percentile([t[key] for t in self.timings], 50))
+            for key in ('create_app', 'first_request')
+        )
+
+
+def start():
+    """
+    Creates the application, and serves its first request, and returns the
+    time taken by each of them (in seconds).
+    """
+    if sys.version_info[0] >= 3:
+        import builtins
+    else:
+        import __builtin__ as builtins
+
+    # Ensure the global server mode is set.
+    builtins.SERVER_MODE = None
+
+    # Use the configuration database created by runbenchmarks.py
+    os.environ["PGADMIN_TESTING_MODE"] = "1"
+
+    start_time = timer()
+
+    import config
+    from logging import WARNING
+
+    config.SERVER_MODE = False
+    config.MASTER_PASSWORD_REQUIRED = False
+    config.UPGRADE_CHECK_ENABLED = False
+    config.CONSOLE_LOG_LEVEL = WARNING
+
+    from pgadmin import create_app
+
+    app = create_app()
+    app.PGADMIN_KEY = ''
+    created_time = timer()
+
+    response = app.test_client().get(FIRST_REQUEST_PATH)
+    if response.status_code != 200:
+        raise Exception(
+            'The first request failed with the status {0}'.format(
+                response.status_code
+            )
+        )
+
+    return {
+        'create_app': created_time - start_time,
+        'first_request': timer() - created_time
+    }
+
+
+if __name__ == '__main__':
+    print(json.dumps(start()))
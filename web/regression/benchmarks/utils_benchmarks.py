@@ -0,0 +1,198 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Benchmarks of the utilities used by the query tool."""
+
+import os
+import shutil
+import sys
+import tempfile
+
+from pgadmin.utils import csv
+from pgadmin.utils.ajax import make_json_response
+from pgadmin.utils.driver.psycopg2.cursor import DictCursor
+from pgadmin.utils.session import FileBackedSessionManager
+from pgadmin.tools.sqleditor.utils.columnar_result import \
+    encode_columnar_result
+
+from . import BaseBenchmark
+from .driver_benchmarks import SELECT_ALL_SQL
+from .dataset import SCHEMA_NAME, DATA_TABLE
+
+if sys.version_info < (3,):
+    from StringIO import StringIO
+else:
+    from io import StringIO
+
+# Number of the sessions stored, and retrieved in an iteration
+SESSIONS = 100
+# Number of the query tool transactions in a session
+SESSION_TRANSACTIONS = 5
+
+
+def fetch_rows(context):
+    """
+    Returns the names of the columns, and the rows (as dictionaries) of the
+    data table.
+    """
+    connection = context.db_connection()
+    cursor = connection.cursor(cursor_factory=DictCursor)
+    cursor.execute(SELECT_ALL_SQL)
+    columns = [c.to_dict()['name'] for c in cursor.ordered_description()]
+    rows = [dict(row) for row in cursor.fetchall()]
+    cursor.close()
+    connection.close()
+
+    return columns, rows
+
+
+class CSVWriterBenchmark(BaseBenchmark):
+    name = 'csv_writer'
+    description = 'Writing the rows as CSV (as the download of the query ' \
+                  'tool does)'
+
+    def setUp(self):
+        self.columns, self.rows = fetch_rows(self.context)
+
+    def run(self):
+        res_io = StringIO()
+        csv_writer = csv.DictWriter(
+            res_io, fieldnames=self.columns, delimiter=',',
+            quoting=csv.QUOTE_NONNUMERIC, quotechar="'",
+            replace_nulls_with=None
+        )
+        csv_writer.writeheader()
+        csv_writer.writerows(self.rows)
+        res_io.getvalue()
+
+        return len(self.rows)
+
+
+class JSONResponseBenchmark(BaseBenchmark):
+    name = 'json_response'
+    description = 'Encoding the rows of the data grid by make_json_response()'
+
+    def setUp(self):
+        columns, rows = fetch_rows(self.context)
+        self.data = {
+            'colinfo': [{'name': c} for c in columns],
+            'result': [[row[c] for c in columns] for row in rows]
+        }
+
+    def run(self):
+        response = make_json_response(data=self.data)
+        response.get_data()
+
+        return len(self.data['result'])
+
+
+class JSONResponseStreamBenchmark(JSONResponseBenchmark):
+    name = 'json_response_stream'
+    description = 'Encoding the rows of the data grid by ' \
+                  'make_json_response() in the chunks (as the query tool ' \
+                  'does)'
+
+    def run(self):
+        response = make_json_response(data=self.data, stream_rows='result')
+        response.get_data()
+
+        return len(self.data['result'])
+
+
+class ColumnarResultBenchmark(BaseBenchmark):
+    name = 'columnar_result'
+    description = 'Encoding the rows of the data grid column by column, ' \
+                  'and by make_json_response() (as the query tool does ' \
+                  'for the clients asking for the columnar result)'
+    sql = SELECT_ALL_SQL
+
+    def setUp(self):
+        connection = self.context.db_connection()
+        cursor = connection.cursor()
+        cursor.execute(self.sql)
+        self.rows = [list(row) for row in cursor.fetchall()]
+        cursor.close()
+        connection.close()
+
+    def run(self):
+        response = make_json_response(
+            data={'result': encode_columnar_result(self.rows)}
+        )
+        self.size = len(response.get_data())
+
+        return len(self.rows)
+
+    def report(self):
+        # The size of the same rows sent as the array of the rows
+        row_size = len(make_json_response(
+            data={'result': self.rows}
+        ).get_data())
+
+        return {
+            'bytes': self.size,
+            'row_format_bytes': row_size,
+            'ratio': float(self.size) / row_size
+        }
+
+
+class NumericColumnarResultBenchmark(ColumnarResultBenchmark):
+    name = 'columnar_result_numeric'
+    description = 'Encoding the rows of a wide result (having mostly ' \
+                  'the numbers) column by column'
+    sql = 'SELECT i AS id, ' + ', '.join(
+        '(i * {0} % 100000) / 100.0 AS amount_{0}, '
+        '(i * {0} % 1000)::bigint AS count_{0}, '
+        'i % {0} = 0 AS flag_{0}'.format(prime)
+        for prime in (7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+    ) + ' FROM generate_series(1, (SELECT count(*) FROM {0}.{1})) i'.format(
+        SCHEMA_NAME, DATA_TABLE
+    )
+
+
+class SessionManagerBenchmark(BaseBenchmark):
+    name = 'session_manager'
+    description = 'Storing, and retrieving the sessions by ' \
+                  'FileBackedSessionManager'
+    unit = 'sessions'
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.manager = FileBackedSessionManager(
+            os.path.join(self.path, 'sessions'), 'secret', 0
+        )
+
+        # The sessions of the users having the query tool open
+        self.sessions = []
+        for _ in range(SESSIONS):
+            session = self.manager.new_session()
+            session['gridData'] = dict(
+                (str(trans_id), {
+                    'command_obj': os.urandom(2048),
+                    'primary_keys': {'id': 'integer'},
+                    'columns_info': dict(
+                        ('column_{0}'.format(c), {'type_code': 23})
+                        for c in range(20)
+                    )
+                }) for trans_id in range(SESSION_TRANSACTIONS)
+            )
+            self.sessions.append(session)
+
+    def prepare(self):
+        for session in self.sessions:
+            session.force_write = True
+
+    def run(self):
+        for session in self.sessions:
+            self.manager.put(session)
+            self.manager.get(session.sid, session.hmac_digest)
+
+        return len(self.sessions)
+
+    def tearDown(self):
+        shutil.rmtree(self.path, ignore_errors=True)
@@ -0,0 +1,81 @@
+/////////////////////////////////////////////////////////////
+//
+// pgAdmin 4 - PostgreSQL Tools
+//
+// Copyright (C) 2013 - 2019, The pgAdmin Development Team
+// This software is released under the PostgreSQL Licence
+//
+//////////////////////////////////////////////////////////////
+
+import {decodeResult} from '../../../pgadmin/static/js/sqleditor/columnar_result';
+
+describe('#decodeResult', () => {
+  describe('when the result is not columnar', () => {
+    it('returns the rows as they are', () => {
+      let rows = [[1, 'a'], [2, 'b']];
+      expect(decodeResult(rows)).toBe(rows);
+    });
+
+    it('returns the message as it is', () => {
+      expect(decodeResult('SELECT 1')).toEqual('SELECT 1');
+      expect(decodeResult(null)).toBe(null);
+    });
+  });
+
+  describe('when the result is columnar', () => {
+    it('returns no rows when the result is empty', () => {
+      expect(decodeResult({
+        format: 'columnar', rows: 0, columns: [],
+      })).toEqual([]);
+    });
+
+    it('returns the rows of the columns', () => {
+      expect(decodeResult({
+        format: 'columnar',
+        rows: 2,
+        columns: [
+          {type: 'int', values: [1, 2]},
+          {type: 'bool', values: '10'},
+          {type: 'float', values: [1.5, 2]},
+          {type: 'joined', values: '-12.50,1e10'},
+          {type: 'text', values: ['a,b', 'c']},
+        ],
+      })).toEqual([
+        [1, true, 1.5, '-12.50', 'a,b'],
+        [2, false, 2, '1e10', 'c'],
+      ]);
+    });
+
+    it('returns the nulls, and the values of the dictionary', () => {
+      let rows = [[null, null, 'x']];
+      for (let idx = 0; idx < 8; idx++) {
+        rows.push([1, null, 'y']);
+      }
+      rows.push([null, null, 'x']);
+
+      expect(decodeResult({
+        format: 'columnar',
+        rows: 10,
+        columns: [
+          {type: 'int', values: [1, 1, 1, 1, 1, 1, 1, 1], nulls: 'AQI='},
+          {type: 'null', nulls: '/wM='},
+          {
+            type: 'dict', values: [0, 1, 1, 1, 1, 1, 1, 1, 1, 0],
+            dictionary: ['x', 'y'],
+          },
+        ],
+      })).toEqual(rows);
+    });
+
+    it('returns the values of any other type as they are', () => {
+      expect(decodeResult({
+        format: 'columnar',
+        rows: 2,
+        columns: [
+          {type: 'json', values: ['1', 2]},
+          {type: 'json', values: [{a: 1}, ['b']]},
+        ],
+      })).toEqual([['1', {a: 1}], [2, ['b']]]);
+    });
+  });
+});
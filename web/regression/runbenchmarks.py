@@ -0,0 +1,215 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+""" This file runs the benchmarks of the driver, and the query tool against
+the servers of the test configuration, and writes the results as JSON. """
+from __future__ import print_function
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import sys
+
+if sys.version_info[0] >= 3:
+    import builtins
+else:
+    import __builtin__ as builtins
+
+# Ensure the global server mode is set.
+builtins.SERVER_MODE = None
+
+CURRENT_PATH = os.path.dirname(os.path.realpath(__file__))
+
+# Set sys path to current directory so that we can import pgadmin package
+root = os.path.dirname(CURRENT_PATH)
+
+if sys.path[0] != root:
+    sys.path.insert(0, root)
+    os.chdir(root)
+
+from pgadmin import create_app
+import config
+
+# The benchmarks are run in the desktop mode (the driver, and the query tool
+# do the same work in the server mode).
+config.SERVER_MODE = False
+config.MASTER_PASSWORD_REQUIRED = False
+
+# Disable upgrade checks - no need during benchmarking
+config.UPGRADE_CHECK_ENABLED = False
+
+# Delete SQLite db file if exists
+if os.path.isfile(config.TEST_SQLITE_PATH):
+    os.remove(config.TEST_SQLITE_PATH)
+
+os.environ["PGADMIN_TESTING_MODE"] = "1"
+
+# Execute the setup file
+exec(open("setup.py").read())
+
+# Get the config database schema version. We store this in pgadmin.model
+# as it turns out that putting it in the config files isn't a great idea
+from pgadmin.model import SCHEMA_VERSION
+
+# Delay the import test_utils as it needs updated config.SQLITE_PATH
+from regression.python_test_utils import test_utils
+from regression.benchmarks import BenchmarkRegistry, run_benchmarks, \
+    compare_results
+from regression.benchmarks.context import BenchmarkContext
+
+config.SETTINGS_SCHEMA_VERSION = SCHEMA_VERSION
+
+# Override some other defaults
+from logging import WARNING
+
+config.CONSOLE_LOG_LEVEL = WARNING
+
+# Create the app
+app = create_app()
+app.PGADMIN_KEY = ''
+
+
+def add_arguments():
+    """
+    This function parses the command line arguments.
+
+    :return args: command line arguments
+    :rtype: argparse namespace
+    """
+
+    parser = argparse.ArgumentParser(description='Benchmarks for pgAdmin4')
+    parser.add_argument(
+        '--benchmarks',
+        help='Comma separated names of the benchmarks to run (all by default)'
+    )
+    parser.add_argument(
+        '--iterations', type=int, default=10,
+        help='Number of the measured iterations of each benchmark'
+    )
+    parser.add_argument(
+        '--warmup', type=int, default=2,
+        help='Number of the iterations run before measuring'
+    )
+    parser.add_argument(
+        '--rows', type=int, default=100000,
+        help='Number of the rows of the dataset'
+    )
+    parser.add_argument(
+        '--tables', type=int, default=200,
+        help='Number of the tables of the dataset (for the completions)'
+    )
+    parser.add_argument(
+        '--output', default=os.path.join(CURRENT_PATH, 'benchmarks.json'),
+        help='File to write the results to'
+    )
+    parser.add_argument(
+        '--compare', metavar='BASELINE',
+        help='Compare the results with the results in the given file, and '
+             'fail if any benchmark is slower'
+    )
+    parser.add_argument(
+        '--threshold', type=float, default=0.1,
+        help='Fraction by which a benchmark may be slower than the baseline '
+             '(default: 0.1)'
+    )
+    arg, extra = parser.parse_known_args()
+
+    return arg
+
+
+if __name__ == '__main__':
+    args = add_arguments()
+
+    try:
+        benchmarks = BenchmarkRegistry.load_benchmarks(
+            args.benchmarks.split(',') if args.benchmarks else None
+        )
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        sys.exit(1)
+
+    servers_info = test_utils.get_config_data()
+    if not servers_info:
+        print("No servers are configured in test_config.json.",
+              file=sys.stderr)
+        sys.exit(1)
+
+    report = {
+        'version': config.APP_VERSION,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'created': datetime.datetime.utcnow().isoformat(),
+        'settings': {
+            'iterations': args.iterations,
+            'warmup': args.warmup,
+            'rows': args.rows,
+            'tables': args.tables
+        },
+        'servers': {}
+    }
+
+    for server in servers_info:
+        print("\n=============Running the benchmarks for '%s'============="
+              % server['name'], file=sys.stderr)
+
+        # Create the benchmark database with random number to avoid conflict
+        # in parallel execution.
+        context = BenchmarkContext(
+            app, server,
+            "benchmark_db" + str(random.randint(10000, 65535)),
+            args.rows, args.tables
+        )
+        try:
+            context.setUp()
+            results = run_benchmarks(
+                benchmarks, context, args.iterations, args.warmup,
+                output=sys.stderr
+            )
+        finally:
+            context.tearDown()
+
+        report['servers'][server['name']] = {
+            'server_version': context.server_version,
+            'benchmarks': results
+        }
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+
+    print("\nThe results are written to %s" % args.output, file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+        if baseline.get('settings') != report['settings']:
+            print("\nThe baseline was run with different settings: %s" %
+                  baseline.get('settings'), file=sys.stderr)
+
+        failure = False
+        for name, server_report in report['servers'].items():
+            if name not in baseline.get('servers', {}):
+                print("\nThe server '%s' is not in the baseline." % name,
+                      file=sys.stderr)
+                continue
+
+            lines, regressions = compare_results(
+                baseline['servers'][name]['benchmarks'],
+                server_report['benchmarks'], args.threshold
+            )
+            print("\n=============Comparison for '%s'=============" % name)
+            print('\n'.join(lines))
+
+            if regressions:
+                failure = True
+
+        sys.exit(1 if failure else 0)
@@ -0,0 +1,638 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+""" This file generates the load of many users on a running pgAdmin server
+(in the server mode). The users are created by the administrator, log in,
+and repeatedly expand the browser tree, run queries in the query tool
+(polling, fetching, and downloading the results), and refresh the
+dashboard, while the latencies of the requests, and the memory used by the
+server are recorded. """
+from __future__ import print_function
+
+import argparse
+import datetime
+import json
+import math
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+
+import psutil
+from six.moves import http_cookiejar
+from six.moves.urllib.error import HTTPError, URLError
+from six.moves.urllib.parse import urlencode
+from six.moves.urllib.request import build_opener, HTTPCookieProcessor, \
+    Request
+
+CURRENT_PATH = os.path.dirname(os.path.realpath(__file__))
+
+CSRF_HEADER = 'X-pgA-CSRFToken'
+CSRF_TOKEN_RE = re.compile(
+    b'<input id="csrf_token" name="csrf_token" type="hidden"'
+    b' value="([^"]*)">'
+)
+
+DASHBOARD_CHARTS = 'session_stats,tps_stats,ti_stats,to_stats,bio_stats'
+
+# The flows of a user, and their weights
+FLOWS = [
+    ('expand_tree', 3),
+    ('query_tool', 2),
+    ('dashboard', 5),
+]
+
+
+class LoadTestError(Exception):
+    pass
+
+
+class Stats(object):
+    """
+    class Stats(object)
+
+    The latencies (in seconds), and the errors of the requests by their names
+    (thread safe).
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = dict()
+        self.errors = dict()
+
+    def add(self, name, latency, error=False):
+        with self.lock:
+            self.latencies.setdefault(name, []).append(latency)
+            if error:
+                self.errors[name] = self.errors.get(name, 0) + 1
+
+    @staticmethod
+    def _summary(latencies, errors, duration):
+        latencies = sorted(latencies)
+
+        def percentile(percent):
+            idx = int(math.ceil(percent / 100.0 * len(latencies))) - 1
+            return latencies[max(idx, 0)]
+
+        return {
+            'requests': len(latencies),
+            'errors': errors,
+            'throughput': len(latencies) / duration,
+            'mean': sum(latencies) / len(latencies),
+            'p50': percentile(50),
+            'p90': percentile(90),
+            'p95': percentile(95),
+            'p99': percentile(99),
+            'max': latencies[-1]
+        }
+
+    def summary(self, duration):
+        with self.lock:
+            res = dict(
+                (name, self._summary(
+                    latencies, self.errors.get(name, 0), duration
+                )) for name, latencies in self.latencies.items()
+            )
+            all_latencies = [
+                latency for latencies in self.latencies.values()
+                for latency in latencies
+            ]
+            if all_latencies:
+                res['all'] = self._summary(
+                    all_latencies, sum(self.errors.values()), duration
+                )
+            return res
+
+
+class MemorySampler(threading.Thread):
+    """
+    class MemorySampler(threading.Thread)
+
+    Samples the resident memory of the pgAdmin server process (including its
+    child processes, i.e. the workers of the web server).
+    """
+
+    def __init__(self, pid, interval=1.0):
+        super(MemorySampler, self).__init__()
+        self.daemon = True
+        self.process = psutil.Process(pid)
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.baseline = self.rss()
+        self.peak = self.baseline
+        self.last = self.baseline
+
+    def rss(self):
+        processes = [self.process] + self.process.children(recursive=True)
+        rss = 0
+        for process in processes:
+            try:
+                rss += process.memory_info().rss
+            except psutil.NoSuchProcess:
+                pass
+        return rss
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.last = self.rss()
+            self.peak = max(self.peak, self.last)
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+        self.last = self.rss()
+        self.peak = max(self.peak, self.last)
+
+
+class Client(object):
+    """
+    class Client(object)
+
+    A HTTP client of the pgAdmin server keeping the cookies (the session),
+    and the CSRF token of a user, and recording the latencies of the
+    requests.
+    """
+
+    def __init__(self, base_url, stats=None):
+        self.base_url = base_url.rstrip('/')
+        self.stats = stats
+        self.csrf_token = None
+        self.opener = build_opener(
+            HTTPCookieProcessor(http_cookiejar.CookieJar())
+        )
+
+    def request(self, name, path, method='GET', json_data=None, form=None):
+        """
+        Sends the request, and returns the content of the response (decoded
+        from JSON, when the response is JSON).
+        """
+        headers = {}
+        data = None
+        if json_data is not None:
+            data = json.dumps(json_data).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+        elif form is not None:
+            data = urlencode(form).encode('utf-8')
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+        if self.csrf_token is not None:
+            headers[CSRF_HEADER] = self.csrf_token
+
+        req = Request(self.base_url + path, data=data, headers=headers)
+        req.get_method = lambda: method
+
+        start = time.time()
+        try:
+            response = self.opener.open(req)
+            content = response.read()
+            content_type = response.headers.get('Content-Type', '')
+            url = response.geturl()
+        except HTTPError as e:
+            if self.stats is not None:
+                self.stats.add(name, time.time() - start, error=True)
+            raise LoadTestError('{0} {1}: {2}'.format(method, path, e))
+        except URLError as e:
+            raise LoadTestError('{0} {1}: {2}'.format(method, path, e))
+
+        if self.stats is not None:
+            self.stats.add(name, time.time() - start)
+
+        if content_type.startswith('application/json'):
+            return json.loads(content.decode('utf-8'))
+        if name == 'login':
+            return url, content
+        return content
+
+    def login(self, email, password):
+        content = self.request('login_page', '/login')
+        match = CSRF_TOKEN_RE.search(content)
+        if match is None:
+            raise LoadTestError('The login page has no CSRF token.')
+        csrf_token = match.group(1).decode('utf-8')
+
+        url, content = self.request(
+            'login', '/login', 'POST',
+            form={'email': email, 'password': password,
+                  'csrf_token': csrf_token}
+        )
+        if url.rstrip('/').endswith('/login'):
+            raise LoadTestError('Failed to login as {0}.'.format(email))
+
+        self.csrf_token = csrf_token
+
+    def logout(self):
+        self.request('logout', '/logout')
+        self.csrf_token = None
+
+
+class SimulatedUser(threading.Thread):
+    """
+    class SimulatedUser(threading.Thread)
+
+    A user registering the database server, and running the flows (chosen
+    randomly by their weights) until the deadline.
+    """
+
+    def __init__(self, args, index, email, password, server, stats,
+                 deadline):
+        super(SimulatedUser, self).__init__()
+        self.daemon = True
+        self.args = args
+        self.index = index
+        self.email = email
+        self.password = password
+        self.server = server
+        self.deadline = deadline
+        self.client = Client(args.url, stats)
+        self.random = random.Random(args.seed + index)
+        self.flows = 0
+        self.errors = []
+
+        self.gid = self.sid = self.did = self.scid = None
+
+    def run(self):
+        # Spread the logins of the users over the ramp up time
+        time.sleep(self.args.ramp_up * self.index / max(self.args.users, 1))
+
+        try:
+            self.setUp()
+        except LoadTestError as e:
+            self.errors.append(str(e))
+            return
+
+        flows = [name for name, weight in FLOWS for _ in range(weight)]
+        while time.time() < self.deadline:
+            flow = self.random.choice(flows)
+            try:
+                getattr(self, flow)()
+                self.flows += 1
+            except LoadTestError as e:
+                self.errors.append(str(e))
+
+            # Think time of the user between the flows
+            time.sleep(self.random.uniform(0, 2 * self.args.think_time))
+
+        try:
+            self.tearDown()
+        except LoadTestError as e:
+            self.errors.append(str(e))
+
+    def setUp(self):
+        client = self.client
+        client.login(self.email, self.password)
+
+        self.gid = client.request(
+            'server_group.nodes', '/browser/server_group/nodes/'
+        )['data'][0]['_id']
+
+        res = client.request(
+            'server.create', '/browser/server/obj/{0}/'.format(self.gid),
+            'POST', json_data={
+                'name': 'Load test', 'host': self.server['host'],
+                'port': self.server['db_port'],
+                'db': self.server['maintenance_db'],
+                'username': self.server['db_username'], 'role': '',
+                'sslmode': self.server['sslmode'], 'comment': ''
+            }
+        )
+        self.sid = res['node']['_id']
+
+        client.request(
+            'server.connect',
+            '/browser/server/connect/{0}/{1}'.format(self.gid, self.sid),
+            'POST', form={'password': self.server['db_password']}
+        )
+
+        for node in client.request(
+            'database.nodes',
+            '/browser/database/nodes/{0}/{1}/'.format(self.gid, self.sid)
+        )['data']:
+            if node['label'] == self.server['maintenance_db']:
+                self.did = node['_id']
+        if self.did is None:
+            raise LoadTestError('The maintenance database was not found.')
+
+        client.request(
+            'database.connect', '/browser/database/connect/{0}/{1}/{2}'.format(
+                self.gid, self.sid, self.did
+            ), 'POST'
+        )
+
+        schemas = client.request(
+            'schema.nodes', '/browser/schema/nodes/{0}/{1}/{2}/'.format(
+                self.gid, self.sid, self.did
+            )
+        )['data']
+        for node in schemas:
+            if node['label'] == 'public':
+                self.scid = node['_id']
+        if self.scid is None and schemas:
+            self.scid = schemas[0]['_id']
+
+    def tearDown(self):
+        self.client.request(
+            'server.delete', '/browser/server/obj/{0}/{1}'.format(
+                self.gid, self.sid
+            ), 'DELETE'
+        )
+        self.client.logout()
+
+    def expand_tree(self):
+        """Expands the server, the database, and the schema."""
+        request = self.client.request
+        ids = (self.gid, self.sid, self.did, self.scid)
+
+        request('server.children',
+                '/browser/server/children/{0}/{1}'.format(*ids))
+        request('database.nodes',
+                '/browser/database/nodes/{0}/{1}/'.format(*ids))
+        request('database.children',
+                '/browser/database/children/{0}/{1}/{2}'.format(*ids))
+        if self.scid is None:
+            return
+        request('schema.nodes',
+                '/browser/schema/nodes/{0}/{1}/{2}/'.format(*ids))
+        request('schema.children',
+                '/browser/schema/children/{0}/{1}/{2}/{3}'.format(*ids))
+        request('table.nodes',
+                '/browser/table/nodes/{0}/{1}/{2}/{3}/'.format(*ids))
+
+    def query_tool(self):
+        """
+        Opens the query tool, executes the query, polls for its results,
+        fetches the more rows (as when scrolling the grid), downloads the
+        results, and closes the query tool.
+        """
+        request = self.client.request
+
+        trans_id = request(
+            'datagrid.initialize_query_tool',
+            '/datagrid/initialize/query_tool/{0}/{1}/{2}'.format(
+                self.gid, self.sid, self.did
+            ), 'POST'
+        )['data']['gridTransId']
+
+        try:
+            request('sqleditor.query_tool_start',
+                    '/sqleditor/query_tool/start/{0}'.format(trans_id),
+                    'POST', json_data={'sql': self.args.sql})
+
+            while True:
+                res = request('sqleditor.poll',
+                              '/sqleditor/poll/{0}'.format(trans_id))
+                if res['data']['status'] != 'Busy':
+                    break
+                time.sleep(self.args.poll_interval)
+
+            if res['data']['status'] != 'Success':
+                raise LoadTestError(
+                    'The query failed: {0}'.format(res['data']['result'])
+                )
+
+            has_more_rows = res['data']['has_more_rows']
+            fetches = 0
+            while has_more_rows and fetches < self.args.fetches:
+                res = request('sqleditor.fetch',
+                              '/sqleditor/fetch/{0}'.format(trans_id))
+                has_more_rows = res['data']['has_more_rows']
+                fetches += 1
+
+            request('sqleditor.query_tool_download',
+                    '/sqleditor/query_tool/download/{0}'.format(trans_id),
+                    'POST', form={'query': self.args.sql,
+                                  'filename': 'load_test.csv'})
+        finally:
+            request('datagrid.close',
+                    '/datagrid/close/{0}'.format(trans_id), 'DELETE')
+
+    def dashboard(self):
+        """Refreshes the graphs of the database dashboard."""
+        self.client.request(
+            'dashboard.dashboard_stats',
+            '/dashboard/dashboard_stats/{0}/{1}?chart_names={2}'.format(
+                self.sid, self.did, DASHBOARD_CHARTS
+            )
+        )
+
+
+def read_config(args):
+    """
+    Returns the database server (the first enabled one), and the credentials
+    of the administrator from the test configuration.
+    """
+    path = os.path.join(CURRENT_PATH, 'test_config.json')
+    if not os.path.exists(path):
+        path += '.in'
+    with open(path) as f:
+        config_data = json.load(f)
+
+    servers = [
+        srv for srv in config_data['server_credentials']
+        if 'enabled' not in srv or srv['enabled']
+    ]
+    if not servers:
+        raise LoadTestError('No servers are configured in test_config.json.')
+
+    credentials = config_data['pgAdmin4_login_credentials']
+    return servers[0], args.admin_email or credentials['login_username'], \
+        args.admin_password or credentials['login_password']
+
+
+def create_users(admin, count):
+    """Creates the users (having the 'User' role), and returns them."""
+    role = None
+    for res in admin.request('roles', '/user_management/role/'):
+        if res['name'] == 'User':
+            role = res['id']
+
+    users = []
+    for _ in range(count):
+        email = 'load_test_{0}@example.com'.format(str(uuid.uuid4())[:8])
+        password = str(uuid.uuid4())
+        res = admin.request(
+            'create_user', '/user_management/user/', 'POST', json_data={
+                'email': email, 'role': role, 'active': True,
+                'newPassword': password, 'confirmPassword': password
+            }
+        )
+        users.append((res['id'], email, password))
+
+    return users
+
+
+def add_arguments():
+    """
+    This function parses the command line arguments.
+
+    :return args: command line arguments
+    :rtype: argparse namespace
+    """
+
+    parser = argparse.ArgumentParser(description='Load test for pgAdmin4')
+    parser.add_argument(
+        '--url', default='http://127.0.0.1:5050',
+        help='URL of the pgAdmin server (running in the server mode)'
+    )
+    parser.add_argument(
+        '--admin-email',
+        help='Email of the administrator creating the users (the login '
+             'credentials of test_config.json by default)'
+    )
+    parser.add_argument(
+        '--admin-password', help='Password of the administrator'
+    )
+    parser.add_argument(
+        '--users', type=int, default=10, help='Number of the users'
+    )
+    parser.add_argument(
+        '--duration', type=int, default=60,
+        help='Duration of the test (in seconds)'
+    )
+    parser.add_argument(
+        '--ramp-up', type=float, default=10,
+        help='Time over which the users log in (in seconds)'
+    )
+    parser.add_argument(
+        '--think-time', type=float, default=1,
+        help='Average time a user waits between the flows (in seconds)'
+    )
+    parser.add_argument(
+        '--sql', default="SELECT i, md5(i::text) FROM generate_series(1, "
+                         "5000) i",
+        help='Query executed in the query tool'
+    )
+    parser.add_argument(
+        '--fetches', type=int, default=2,
+        help='Number of the times the more rows are fetched for a query'
+    )
+    parser.add_argument(
+        '--poll-interval', type=float, default=0.1,
+        help='Time between the polls for the results of a query'
+    )
+    parser.add_argument(
+        '--server-pid', type=int,
+        help='Process id of the pgAdmin server (to measure its memory)'
+    )
+    parser.add_argument(
+        '--seed', type=int, default=0,
+        help='Seed for choosing the flows of the users'
+    )
+    parser.add_argument(
+        '--output', default=os.path.join(CURRENT_PATH, 'loadtest.json'),
+        help='File to write the results to'
+    )
+
+    return parser.parse_args()
+
+
+def print_summary(summary):
+    print('{0:<36} {1:>8} {2:>6} {3:>9} {4:>9} {5:>9} {6:>9}'.format(
+        'Request', 'Count', 'Errors', 'p50 (ms)', 'p95 (ms)', 'p99 (ms)',
+        'Req/s'
+    ))
+    for name in sorted(summary):
+        res = summary[name]
+        print('{0:<36} {1:>8} {2:>6} {3:>9.1f} {4:>9.1f} {5:>9.1f} '
+              '{6:>9.2f}'.format(
+                  name, res['requests'], res['errors'], res['p50'] * 1000,
+                  res['p95'] * 1000, res['p99'] * 1000, res['throughput']
+              ))
+
+
+if __name__ == '__main__':
+    args = add_arguments()
+
+    try:
+        server, admin_email, admin_password = read_config(args)
+
+        admin = Client(args.url)
+        admin.login(admin_email, admin_password)
+        users = create_users(admin, args.users)
+    except LoadTestError as e:
+        print(str(e), file=sys.stderr)
+        sys.exit(1)
+
+    sampler = None
+    if args.server_pid:
+        sampler = MemorySampler(args.server_pid)
+        sampler.start()
+
+    stats = Stats()
+    start = time.time()
+    simulated_users = [
+        SimulatedUser(args, index, email, password, server, stats,
+                      start + args.ramp_up + args.duration)
+        for index, (uid, email, password) in enumerate(users)
+    ]
+
+    print("Running the load test with %d users for %d seconds..." %
+          (args.users, args.ramp_up + args.duration), file=sys.stderr)
+
+    try:
+        for user in simulated_users:
+            user.start()
+        for user in simulated_users:
+            user.join()
+    finally:
+        duration = time.time() - start
+        if sampler is not None:
+            sampler.stop()
+
+        for uid, email, password in users:
+            try:
+                admin.request('delete_user',
+                              '/user_management/user/{0}'.format(uid),
+                              'DELETE')
+            except LoadTestError as e:
+                print(str(e), file=sys.stderr)
+
+    summary = stats.summary(duration)
+    errors = [error for user in simulated_users for error in user.errors]
+
+    report = {
+        'created': datetime.datetime.utcnow().isoformat(),
+        'settings': {
+            'users': args.users,
+            'duration': args.duration,
+            'ramp_up': args.ramp_up,
+            'think_time': args.think_time,
+            'sql': args.sql,
+            'fetches': args.fetches,
+            'seed': args.seed
+        },
+        'duration': duration,
+        'flows': sum(user.flows for user in simulated_users),
+        'requests': summary,
+        'errors': errors[:100]
+    }
+    if sampler is not None:
+        report['memory'] = {
+            'baseline': sampler.baseline,
+            'peak': sampler.peak,
+            'final': sampler.last,
+            'per_user': (sampler.peak - sampler.baseline) / args.users
+        }
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+
+    print_summary(summary)
+    print("\n%d flows, %d errors in %.1f seconds." %
+          (report['flows'], len(errors), duration))
+    if sampler is not None:
+        print("Server memory: %.1f MB (baseline), %.1f MB (peak), "
+              "%.1f MB per user." % (
+                  sampler.baseline / 1048576.0, sampler.peak / 1048576.0,
+                  report['memory']['per_user'] / 1048576.0
+              ))
+    print("The results are written to %s" % args.output)
+
+    sys.exit(1 if errors else 0)
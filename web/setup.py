@@ -373,11 +373,29 @@ def setup_db():
             os.chmod(config.SQLITE_PATH, 0o600)
 
 
+def compile_sql_templates():
+    """Compile the SQL templates into the bytecode cache."""
+
+    if config.TEMPLATE_BYTECODE_CACHE_DIR is None:
+        print(u"TEMPLATE_BYTECODE_CACHE_DIR is not set, there is no cache "
+              u"directory to compile the templates into.")
+        return
+
+    app = create_app()
+
+    with app.app_context():
+        count = compile_templates(app)
+
+    print(u"Compiled %d SQL template(s) into %s." %
+          (count, config.TEMPLATE_BYTECODE_CACHE_DIR))
+
+
 if __name__ == '__main__':
     # Configuration settings
     import config
     from pgadmin.model import SCHEMA_VERSION
     from pgadmin.setup import db_upgrade, create_app_data_directory
+    from pgadmin.utils.versioned_template_loader import compile_templates
 
     parser = argparse.ArgumentParser(description='Setup the pgAdmin config DB')
 
@@ -397,6 +415,11 @@ if __name__ == '__main__':
                                help='Dump/load servers for the specified '
                                     'username', required=False)
 
+    imp_exp_group.add_argument('--compile-templates', action='store_true',
+                               help='Compile the SQL templates into the '
+                                    'template bytecode cache directory',
+                               required=False)
+
     args, extra = parser.parse_known_args()
 
     config.SETTINGS_SCHEMA_VERSION = SCHEMA_VERSION
@@ -409,5 +432,7 @@ if __name__ == '__main__':
         dump_servers(args)
     elif args.load_servers is not None:
         load_servers(args)
+    elif args.compile_templates:
+        compile_sql_templates()
     else:
         setup_db()